@@ -0,0 +1,121 @@
+"""Micro-benchmark for the JSON codecs on realistic transaction pages.
+
+Builds ``/transactions`` pages shaped like Firefly III's ``TransactionArray``
+responses and compares every available codec for decoding the raw body,
+decoding plus validating into ``TransactionArray``, and encoding the dumped
+result again.
+
+Run with ``python benchmarks/bench_json_codec.py`` or ``make bench``.
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict
+
+from firefly_mcp.lib.json_codec import CODECS
+from firefly_mcp.models.model import TransactionArray
+
+SPLIT: Dict[str, Any] = {
+    "user": "1",
+    "transaction_journal_id": "1",
+    "type": "withdrawal",
+    "date": "2024-03-14T12:00:00+01:00",
+    "order": 0,
+    "currency_id": "1",
+    "currency_code": "EUR",
+    "currency_symbol": "€",
+    "currency_name": "Euro",
+    "currency_decimal_places": 2,
+    "foreign_currency_id": None,
+    "foreign_currency_code": None,
+    "amount": "42.17",
+    "foreign_amount": None,
+    "description": "Groceries at the corner supermarket",
+    "source_id": "1",
+    "source_name": "Checking account",
+    "source_iban": "NL01BANK0123456789",
+    "source_type": "Asset account",
+    "destination_id": "57",
+    "destination_name": "Corner Supermarket",
+    "destination_iban": None,
+    "destination_type": "Expense account",
+    "budget_id": "3",
+    "budget_name": "Household",
+    "category_id": "12",
+    "category_name": "Groceries",
+    "bill_id": None,
+    "bill_name": None,
+    "reconciled": False,
+    "notes": "Weekly shopping",
+    "tags": ["weekly", "food"],
+    "internal_reference": None,
+    "external_id": None,
+    "original_source": "ff3-v6.1.0",
+    "recurrence_id": None,
+    "bunq_payment_id": None,
+    "import_hash_v2": "f0d8c2b9c6a1e4d3b2a1f0e9d8c7b6a5f4e3d2c1b0a9f8e7d6c5b4a3f2e1d0c9",
+    "interest_date": None,
+    "book_date": None,
+    "process_date": None,
+    "due_date": None,
+    "payment_date": None,
+    "invoice_date": None,
+    "latitude": None,
+    "longitude": None,
+    "zoom_level": None,
+    "has_attachments": False,
+}
+
+
+def transaction_page(groups: int, splits: int = 2) -> Dict[str, Any]:
+    return {
+        "data": [
+            {
+                "type": "transactions",
+                "id": str(group),
+                "attributes": {
+                    "created_at": "2024-03-14T12:00:00+01:00",
+                    "updated_at": "2024-03-14T12:00:00+01:00",
+                    "user": "1",
+                    "group_title": None,
+                    "transactions": [{**SPLIT, "transaction_journal_id": f"{group}{split}"} for split in range(splits)],
+                },
+                "links": {"self": f"https://firefly.example/api/v1/transactions/{group}"},
+            }
+            for group in range(1, groups + 1)
+        ],
+        "meta": {"pagination": {"total": groups, "count": groups, "per_page": groups, "current_page": 1, "total_pages": 1}},
+        "links": {"self": "https://firefly.example/api/v1/transactions?page=1"},
+    }
+
+
+def _ms_per_call(fn: Callable[[], Any], iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e3
+
+
+def bench_codecs(groups: int, iterations: int) -> None:
+    page = transaction_page(groups)
+    body = json.dumps(page).encode()
+    dumped = TransactionArray.model_validate(page).model_dump(mode="json")
+    print(f"{groups} transaction groups, {len(body) / 1e6:.1f} MB body")
+
+    baseline: Dict[str, float] = {}
+    for name, codec in CODECS.items():
+        timings = {
+            "decode": _ms_per_call(lambda: codec.loads(body), iterations),
+            "decode+validate": _ms_per_call(lambda: TransactionArray.model_validate(codec.loads(body)), iterations),
+            "encode": _ms_per_call(lambda: codec.dumps(dumped), iterations),
+        }
+        baseline = baseline or timings
+        print(f"  {name:9}" + "".join(
+            f"  {label} {ms:7.1f} ms ({baseline[label] / ms:.1f}x)" for label, ms in timings.items()
+        ))
+
+
+if __name__ == "__main__":
+    bench_codecs(groups=50, iterations=50)
+    bench_codecs(groups=2000, iterations=5)
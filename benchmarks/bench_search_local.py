@@ -0,0 +1,67 @@
+"""Query latency of ``transaction.search_local`` on a large local mirror.
+
+Fills an in-memory mirror with synthetic splits (a few thousand distinct
+merchants, notes on one split in ten), then times FTS5/BM25 searches for
+common and rare words and the ``LIKE`` fallback for comparison. BM25 scores
+every matching split, so latency grows with the number of matches rather
+than with the size of the mirror.
+
+Run with ``python benchmarks/bench_search_local.py`` or ``make bench``.
+"""
+
+import random
+import time
+from typing import Any, Dict, List
+
+from firefly_mcp.local.search import search
+from firefly_mcp.local.store import LocalStore
+
+WORDS = ["groceries", "coffee", "fuel", "rent", "insurance", "pharmacy", "books", "cinema", "train", "parking"]
+
+
+def _groups(count: int) -> List[Dict[str, Any]]:
+    generator = random.Random(42)
+    groups = []
+    for index in range(count):
+        merchant = f"Merchant {generator.randrange(3000)}"
+        if index % 500 == 0:
+            merchant = "Netflix International"
+        groups.append({
+            "id": str(index),
+            "attributes": {"updated_at": "1", "transactions": [{
+                "transaction_journal_id": str(index), "type": "withdrawal",
+                "date": f"20{18 + index % 7}-{1 + index % 12:02d}-{1 + index % 28:02d}T12:00:00+00:00",
+                "amount": f"{generator.randrange(100, 20000) / 100:.2f}", "currency_code": "EUR",
+                "currency_decimal_places": 2, "description": f"{generator.choice(WORDS).title()} at {merchant}",
+                "notes": " ".join(generator.sample(WORDS, 3)) if index % 10 == 0 else None, "source_name": "Checking",
+                "destination_name": merchant, "external_id": f"EXT-{index:08d}", "tags": [],
+            }]},
+        })
+    return groups
+
+
+def _ms(fn: Any, iterations: int = 50) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e3
+
+
+def bench_search(count: int = 50000) -> None:
+    store = LocalStore()
+    started = time.perf_counter()
+    groups = _groups(count)
+    for first in range(0, count, 500):
+        store.upsert_groups(groups[first:first + 500])
+    print(f"{count} splits indexed in {time.perf_counter() - started:.1f} s")
+
+    for query in ("netflix", "coffee merchant 12", "groc", "ext 00012345"):
+        print(f"  bm25  {query!r:22} {_ms(lambda: search(store, query)):6.2f} ms")
+    store.fts = False
+    for query in ("netflix", "coffee merchant 12"):
+        print(f"  like  {query!r:22} {_ms(lambda: search(store, query), iterations=5):6.2f} ms")
+
+
+if __name__ == "__main__":
+    bench_search()
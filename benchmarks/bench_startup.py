@@ -0,0 +1,46 @@
+"""Startup-time benchmark: import ``firefly_mcp.main`` (which builds the server).
+
+Each run uses a fresh interpreter so nothing is cached in ``sys.modules``.
+Reports the median wall time of the import and how many generated model
+modules and model classes were loaded, for the entity set given by
+``FIREFLY_ENABLED_ENTITIES`` (default: account) and for ``all``.
+
+Run with ``python benchmarks/bench_startup.py`` or ``make bench``.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import firefly_mcp.main
+elapsed = time.perf_counter() - started
+modules = [m for m in sys.modules if m.startswith("firefly_mcp.models.generated.") or m == "firefly_mcp.models.model"]
+classes = sum(
+    1 for m in modules for v in vars(sys.modules[m]).values()
+    if isinstance(v, type) and v.__module__ == m
+)
+print(json.dumps({"seconds": elapsed, "model_modules": len(modules), "model_classes": classes}))
+"""
+
+
+def measure(entities: str) -> None:
+    env = {**os.environ, "FIREFLY_ENABLED_ENTITIES": entities}
+    samples = [
+        json.loads(subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True).stdout)
+        for _ in range(RUNS)
+    ]
+    seconds = statistics.median(sample["seconds"] for sample in samples)
+    print(f"entities={entities:<12} startup {seconds * 1000:8.1f} ms  "
+          f"model modules {samples[0]['model_modules']:3d}  model classes {samples[0]['model_classes']:4d}")
+
+
+if __name__ == "__main__":
+    measure(os.environ.get("FIREFLY_ENABLED_ENTITIES", "account"))
+    measure("all")
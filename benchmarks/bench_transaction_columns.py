@@ -0,0 +1,66 @@
+"""Memory and speed of ``TransactionColumns`` versus validated models.
+
+Loads the same ``/transactions`` pages once as ``TransactionArray`` models and
+once into the columnar container, measuring the memory each retains with
+``tracemalloc``, then times a month x category grouping on the columns.
+
+Run with ``python benchmarks/bench_transaction_columns.py`` or ``make bench``.
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from bench_json_codec import transaction_page
+
+from firefly_mcp.local.columns import TransactionColumns
+from firefly_mcp.models.model import TransactionArray
+
+
+def _pages(groups: int, per_page: int = 500) -> List[Dict[str, Any]]:
+    pages = []
+    for first in range(0, groups, per_page):
+        page = transaction_page(per_page)
+        for offset, group in enumerate(page["data"]):
+            day = 1 + (first + offset) % 28
+            month = 1 + ((first + offset) // 28) % 12
+            for split in group["attributes"]["transactions"]:
+                split["date"] = f"2024-{month:02d}-{day:02d}T12:00:00+01:00"
+                split["category_name"] = ("Groceries", "Dining", "Transport", "Rent")[(first + offset) % 4]
+        pages.append(page)
+    return pages
+
+
+def _retained(build: Callable[[], Any]) -> Tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, after - before
+
+
+def bench_memory(groups: int = 5000) -> None:
+    pages = _pages(groups)
+    models, model_bytes = _retained(lambda: [TransactionArray.model_validate(page) for page in pages])
+    columns, column_bytes = _retained(lambda: TransactionColumns.from_pages(pages))
+    splits = len(columns)
+    print(f"{splits} splits")
+    print(f"  TransactionArray models:  {model_bytes / 1e6:8.1f} MB  ({model_bytes / splits:7.0f} B/split)")
+    print(f"  TransactionColumns:       {column_bytes / 1e6:8.1f} MB  ({column_bytes / splits:7.0f} B/split, "
+          f"{model_bytes / column_bytes:.0f}x smaller)")
+    del models
+
+    started = time.perf_counter()
+    rows = columns.group_sum("category", "month")
+    print(f"  group_sum(category, month): {(time.perf_counter() - started) * 1e3:6.1f} ms, {len(rows)} rows")
+    started = time.perf_counter()
+    selected = columns.filter(start="2024-03-01", end="2024-05-31", category="groceries")
+    print(f"  filter(date range, category): {(time.perf_counter() - started) * 1e3:6.1f} ms, {len(selected)} splits")
+
+
+if __name__ == "__main__":
+    bench_memory()
@@ -0,0 +1,80 @@
+"""Micro-benchmark for per-call request validation overhead.
+
+Compares building a fresh ``TypeAdapter`` per request (the previous
+behaviour) with the cached adapter used by ``SchemaConverter``, and measures
+the end-to-end overhead of ``Registry.execute_operation`` for a no-op
+operation whose request type is not a ``BaseModel``.
+
+Run with ``python benchmarks/bench_validate_request.py`` or ``make bench``.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from firefly_mcp.models.model import TransactionSplitStore
+from firefly_mcp.tools.registry import (
+    EntityType,
+    Registry,
+    RegistryConfig,
+    SchemaConverter,
+    create_provider_from_config,
+)
+
+REQUEST_TYPE = List[TransactionSplitStore]
+PAYLOAD: List[Dict[str, Any]] = [
+    {
+        "type": "withdrawal",
+        "date": "2024-01-01",
+        "amount": "12.50",
+        "description": "Groceries",
+        "source_id": "1",
+        "destination_name": "Supermarket",
+    }
+]
+
+
+def _time_per_call(fn: Callable[[], Any], iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def bench_validation(iterations: int = 200) -> None:
+    uncached = _time_per_call(lambda: TypeAdapter(REQUEST_TYPE).validate_python(PAYLOAD), iterations)
+    cached = _time_per_call(lambda: SchemaConverter.validate_request(PAYLOAD, REQUEST_TYPE), iterations)
+    print(f"validate_request  fresh TypeAdapter: {uncached:10.1f} µs/call")
+    print(f"validate_request  cached adapter:    {cached:10.1f} µs/call  ({uncached / cached:.0f}x faster)")
+
+
+def bench_execute_operation(iterations: int = 2000) -> None:
+    async def noop(_: Any) -> Dict[str, Any]:
+        return {}
+
+    registry = Registry(RegistryConfig(enabled_entities={EntityType.TRANSACTION}))
+    registry.register_provider(create_provider_from_config(EntityType.TRANSACTION, {
+        "store_splits": {
+            "description": "Benchmark operation",
+            "request_model": REQUEST_TYPE,
+            "response_model": None,
+            "core_function": noop,
+        }
+    }))
+
+    async def run() -> float:
+        await registry.execute_operation("transaction", "store_splits", PAYLOAD)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await registry.execute_operation("transaction", "store_splits", PAYLOAD)
+        return (time.perf_counter() - started) / iterations * 1e6
+
+    print(f"execute_operation overhead:          {asyncio.run(run()):10.1f} µs/call")
+
+
+if __name__ == "__main__":
+    bench_validation()
+    bench_execute_operation()
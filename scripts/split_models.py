@@ -0,0 +1,145 @@
+"""Split the datamodel-codegen output into lazily imported model modules.
+
+Usage::
+
+    datamodel-codegen --input swagger.yaml --output /tmp/model.py ...
+    python scripts/split_models.py /tmp/model.py
+
+Classes are grouped per entity family (``account``, ``transaction``, ...)
+into ``src/firefly_mcp/models/generated/<family>.py``. Every class that is
+referenced from another family moves, with everything it depends on, into
+``common.py``, so family modules only ever import from ``common`` and never
+from each other. Small families are merged into ``misc``.
+``src/firefly_mcp/models/model.py`` is rewritten as a facade that imports a
+family module on first attribute access.
+"""
+
+import ast
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Set
+
+ROOT = Path(__file__).resolve().parent.parent
+MODELS_DIR = ROOT / "src" / "firefly_mcp" / "models"
+GENERATED_DIR = MODELS_DIR / "generated"
+PACKAGE = "firefly_mcp.models.generated"
+
+# Multi-word entity prefixes; other classes use their first CamelCase word.
+FAMILY_PREFIXES = [
+    ("PiggyBank", "piggy_bank"),
+    ("RuleGroup", "rule_group"),
+    ("AvailableBudget", "available_budget"),
+    ("ObjectGroup", "object_group"),
+    ("LinkType", "link_type"),
+]
+MIN_FAMILY_SIZE = 4
+
+
+def family_of(name: str) -> str:
+    for prefix, family in FAMILY_PREFIXES:
+        if name.startswith(prefix):
+            return family
+    return re.match(r"[A-Z][a-z0-9]*", name).group(0).lower()
+
+
+def main(source_path: str) -> None:
+    source = Path(source_path).read_text()
+    lines = source.splitlines()
+    tree = ast.parse(source)
+
+    header = [line for line in lines[: tree.body[0].lineno - 1] if line.startswith("#")]
+    import_nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    imports = lines[import_nodes[0].lineno - 1:import_nodes[-1].end_lineno]
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    order = list(classes)
+    deps = {
+        name: {sub.id for sub in ast.walk(node) if isinstance(sub, ast.Name) and sub.id in classes and sub.id != name}
+        for name, node in classes.items()
+    }
+
+    family = {name: family_of(name) for name in classes}
+    sizes: Dict[str, int] = defaultdict(int)
+    for name in classes:
+        sizes[family[name]] += 1
+    family = {name: fam if sizes[fam] >= MIN_FAMILY_SIZE else "misc" for name, fam in family.items()}
+
+    # Anything referenced across families (and its dependencies) goes to common.
+    changed = True
+    while changed:
+        changed = False
+        for name in order:
+            for dep in deps[name]:
+                if family[dep] not in ("common", family[name]):
+                    family[dep] = "common"
+                    changed = True
+
+    modules: Dict[str, List[str]] = defaultdict(list)
+    for name in order:
+        modules[family[name]].append(name)
+
+    GENERATED_DIR.mkdir(exist_ok=True)
+    for stale in GENERATED_DIR.glob("*.py"):
+        stale.unlink()
+    (GENERATED_DIR / "__init__.py").write_text(
+        '"""Generated Firefly III API models, split per entity family (see scripts/split_models.py)."""\n'
+    )
+
+    for module, names in sorted(modules.items()):
+        common_imports: Set[str] = {dep for name in names for dep in deps[name] if family[dep] != module}
+        parts = [*header, f"#   split:     {module} (scripts/split_models.py)", "", *imports]
+        if common_imports:
+            parts += ["", f"from {PACKAGE}.common import (", *(f"    {dep}," for dep in sorted(common_imports)), ")"]
+        body = "\n\n\n".join(ast.get_source_segment(source, classes[name]) for name in names)
+        (GENERATED_DIR / f"{module}.py").write_text("\n".join(parts) + "\n\n\n" + body + "\n")
+
+    facade = [
+        *header,
+        "#   split:     scripts/split_models.py",
+        "",
+        '"""Generated Firefly III API models, imported lazily per entity family.',
+        "",
+        "The classes live in ``firefly_mcp.models.generated.<family>``. Importing a",
+        "name from this module loads only the family module defining it, so",
+        "entities that are never used never pay for building their models.",
+        '"""',
+        "",
+        "from importlib import import_module",
+        "from typing import TYPE_CHECKING, Any, Dict, List",
+        "",
+        "# Model name -> generated family module defining it.",
+        "MODEL_MODULES: Dict[str, str] = {",
+        *(f'    "{name}": "{family[name]}",' for name in sorted(classes)),
+        "}",
+        "",
+        "__all__ = sorted(MODEL_MODULES)",
+        "",
+        "",
+        "def __getattr__(name: str) -> Any:",
+        "    module = MODEL_MODULES.get(name)",
+        "    if module is None:",
+        '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+        f'    value = getattr(import_module(f"{PACKAGE}.{{module}}"), name)',
+        "    globals()[name] = value",
+        "    return value",
+        "",
+        "",
+        "def __dir__() -> List[str]:",
+        "    return sorted({*globals(), *MODEL_MODULES})",
+        "",
+        "",
+        "if TYPE_CHECKING:",
+    ]
+    for module, names in sorted(modules.items()):
+        facade += [f"    from {PACKAGE}.{module} import (", *(f"        {name}," for name in sorted(names)), "    )"]
+    (MODELS_DIR / "model.py").write_text("\n".join(facade) + "\n")
+
+    print(f"Wrote {len(classes)} models into {len(modules)} modules: "
+          + ", ".join(f"{module} ({len(names)})" for module, names in sorted(modules.items())))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit(__doc__)
+    main(sys.argv[1])
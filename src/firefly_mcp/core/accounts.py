@@ -1,11 +1,16 @@
+from typing import AsyncIterator
 
-from firefly_mcp.models.model import AccountArray, AccountSingle, AccountStore, TransactionArray, AttachmentArray, PiggyBankArray
-from firefly_mcp.models.requests import AccountDeleteRequest, AccountDeleteResponse, AccountGetRequest, AccountListRequest, AccountUpdateRequest, AccountTransactionsRequest, AccountAttachmentsRequest, AccountPiggyBanksRequest
+from firefly_mcp.models.model import AccountArray, AccountSingle, AccountStore, TransactionArray, TransactionRead, AttachmentArray, PiggyBankArray
+from firefly_mcp.models.requests import AccountDeleteRequest, AccountDeleteResponse, AccountGetRequest, AccountListRequest, AccountUpdateRequest, AccountTransactionsRequest, AccountAttachmentsRequest, AccountPiggyBanksRequest, NameResolveRequest, NameResolveResponse
 from firefly_mcp.lib.http_client import client
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.cache import cached_get_json
+from firefly_mcp.core.pagination import fetch_list, iter_items
+from firefly_mcp.core.passthrough import to_model
+from firefly_mcp.core.resolver import resolve_names
 
 
-def list_accounts(request: AccountListRequest) -> AccountArray:
+async def list_accounts(request: AccountListRequest) -> AccountArray:
     """List all accounts wrapped in AccountArray.
     
     Args:
@@ -15,11 +20,9 @@ def list_accounts(request: AccountListRequest) -> AccountArray:
         date: Balance date.
     """
     params = request.model_dump(exclude_none=True, mode='json')
-    response = client.get("/accounts", params=params)
-    raise_api_error_if_any(response)
-    return AccountArray.model_validate(response.json())
+    return await fetch_list(client, "/accounts", params, AccountArray, cache_entity="account")
 
-def get_account(request: AccountGetRequest) -> AccountSingle:
+async def get_account(request: AccountGetRequest) -> AccountSingle:
     """Get a single account. Can include balance on specific date.
     
     Returns:
@@ -28,11 +31,10 @@ def get_account(request: AccountGetRequest) -> AccountSingle:
 
     params = request.model_dump(exclude_none=True, mode='json')
     account_id = params.pop("id")
-    response = client.get(f"/accounts/{account_id}", params=params)
-    raise_api_error_if_any(response)
-    return AccountSingle.model_validate(response.json())
+    payload = await cached_get_json(client, "account", f"/accounts/{account_id}", params)
+    return to_model(AccountSingle, payload)
 
-def create_account(request: AccountStore) -> AccountSingle:
+async def create_account(request: AccountStore) -> AccountSingle:
     """Create one account.
     
     Args:
@@ -42,12 +44,12 @@ def create_account(request: AccountStore) -> AccountSingle:
         AccountSingle: Properly typed account response.
     """
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/accounts", json=data)
+    response = await client.post("/accounts", json=data)
     raise_api_error_if_any(response)
     return AccountSingle.model_validate(response.json())
     
 
-def update_account(request: AccountUpdateRequest) -> AccountSingle:
+async def update_account(request: AccountUpdateRequest) -> AccountSingle:
     """Update one account.
     
     Args:
@@ -58,12 +60,12 @@ def update_account(request: AccountUpdateRequest) -> AccountSingle:
     """
     data = request.model_dump(exclude_none=True, mode='json')
     account_id = data.pop("id")
-    response = client.put(f"/accounts/{account_id}", json=data.get("account_update", {}))
+    response = await client.put(f"/accounts/{account_id}", json=data.get("account_update", {}))
     raise_api_error_if_any(response)
     return AccountSingle.model_validate(response.json())
 
 
-def delete_account(
+async def delete_account(
     request: AccountDeleteRequest
 ) -> AccountDeleteResponse:
     """Delete one account.
@@ -75,12 +77,12 @@ def delete_account(
         str: Success message
     """
     account_id = request.id
-    response = client.delete(f"/accounts/{account_id}")
+    response = await client.delete(f"/accounts/{account_id}")
     raise_api_error_if_any(response)
     return AccountDeleteResponse(message="Account deleted successfully")
 
 
-def list_account_transactions(request: AccountTransactionsRequest) -> TransactionArray:
+async def list_account_transactions(request: AccountTransactionsRequest) -> TransactionArray:
     """List all transactions for a specific account.
     
     Args:
@@ -91,12 +93,10 @@ def list_account_transactions(request: AccountTransactionsRequest) -> Transactio
     """
     params = request.model_dump(exclude_none=True, mode='json')
     account_id = params.pop("id")
-    response = client.get(f"/accounts/{account_id}/transactions", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, f"/accounts/{account_id}/transactions", params, TransactionArray)
 
 
-def list_account_attachments(request: AccountAttachmentsRequest) -> AttachmentArray:
+async def list_account_attachments(request: AccountAttachmentsRequest) -> AttachmentArray:
     """List all attachments for a specific account.
     
     Args:
@@ -107,12 +107,10 @@ def list_account_attachments(request: AccountAttachmentsRequest) -> AttachmentAr
     """
     params = request.model_dump(exclude_none=True, mode='json')
     account_id = params.pop("id")
-    response = client.get(f"/accounts/{account_id}/attachments", params=params)
-    raise_api_error_if_any(response)
-    return AttachmentArray.model_validate(response.json())
+    return await fetch_list(client, f"/accounts/{account_id}/attachments", params, AttachmentArray)
 
 
-def list_account_piggy_banks(request: AccountPiggyBanksRequest) -> PiggyBankArray:
+async def list_account_piggy_banks(request: AccountPiggyBanksRequest) -> PiggyBankArray:
     """List all piggy banks for a specific account.
     
     Args:
@@ -123,6 +121,30 @@ def list_account_piggy_banks(request: AccountPiggyBanksRequest) -> PiggyBankArra
     """
     params = request.model_dump(exclude_none=True, mode='json')
     account_id = params.pop("id")
-    response = client.get(f"/accounts/{account_id}/piggy-banks", params=params)
-    raise_api_error_if_any(response)
-    return PiggyBankArray.model_validate(response.json())
\ No newline at end of file
+    return await fetch_list(client, f"/accounts/{account_id}/piggy-banks", params, PiggyBankArray)
+
+
+def iter_account_transactions(request: AccountTransactionsRequest) -> AsyncIterator[TransactionRead]:
+    """Iterate over all transactions for a specific account page by page.
+    
+    The next page is prefetched while the current one is consumed, so large
+    scans run with flat memory use instead of one big TransactionArray.
+    
+    Args:
+        request: AccountTransactionsRequest containing filters; page/max_items bound the scan
+        
+    Returns:
+        AsyncIterator[TransactionRead]: Transactions in API order
+    """
+    params = request.model_dump(exclude_none=True, mode='json')
+    account_id = params.pop("id")
+    return iter_items(client, f"/accounts/{account_id}/transactions", params, TransactionRead)
+
+
+async def resolve_accounts(request: NameResolveRequest) -> NameResolveResponse:
+    """Find accounts by name: exact matches first, then near misses by trigram similarity.
+
+    Returns:
+        NameResolveResponse: Matching accounts with their IDs and scores
+    """
+    return await resolve_names("account", request)
@@ -1,4 +1,6 @@
-from firefly_mcp.models.model import BillArray, BillSingle, BillStore, TransactionArray, AttachmentArray, RuleArray
+from typing import AsyncIterator
+
+from firefly_mcp.models.model import BillArray, BillSingle, BillStore, TransactionArray, TransactionRead, AttachmentArray, RuleArray
 from firefly_mcp.models.requests import (
     BillGetRequest, 
     BillListRequest, 
@@ -7,76 +9,89 @@ from firefly_mcp.models.requests import (
     BillAttachmentsRequest,
     BillRulesRequest,
     BillDeleteRequest,
-    BillDeleteResponse
+    BillDeleteResponse,
+    NameResolveRequest,
+    NameResolveResponse
 )
 from firefly_mcp.lib.http_client import client
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.cache import cached_get_json
+from firefly_mcp.core.pagination import fetch_list, iter_items
+from firefly_mcp.core.passthrough import to_model
+from firefly_mcp.core.resolver import resolve_names
 
 
-def list_bills(params: BillListRequest) -> BillArray:
+async def list_bills(params: BillListRequest) -> BillArray:
     """List all bills wrapped in BillArray."""
-    response = client.get("/bills", params=params.model_dump(exclude_none=True, mode='json'))
-    raise_api_error_if_any(response)
-    return BillArray.model_validate(response.json())
+    return await fetch_list(client, "/bills", params.model_dump(exclude_none=True, mode='json'), BillArray, cache_entity="bill")
 
 
-def get_bill(request: BillGetRequest) -> BillSingle:
+async def get_bill(request: BillGetRequest) -> BillSingle:
     """Get a single bill."""
     params = request.model_dump(exclude_none=True, mode='json')
     bill_id = params.pop("id")
-    response = client.get(f"/bills/{bill_id}", params=params)
-    raise_api_error_if_any(response)
-    return BillSingle.model_validate(response.json())
+    payload = await cached_get_json(client, "bill", f"/bills/{bill_id}", params)
+    return to_model(BillSingle, payload)
 
 
-def create_bill(request: BillStore) -> BillSingle:
+async def create_bill(request: BillStore) -> BillSingle:
     """Create one bill."""
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/bills", json=data)
+    response = await client.post("/bills", json=data)
     raise_api_error_if_any(response)
     return BillSingle.model_validate(response.json())
 
 
-def update_bill(request: BillUpdateRequest) -> BillSingle:
+async def update_bill(request: BillUpdateRequest) -> BillSingle:
     """Update one bill."""
     data = request.model_dump(exclude_none=True, mode='json')
     bill_id = data.pop("id")
     bill_data = data.pop("bill_update")
-    response = client.put(f"/bills/{bill_id}", json=bill_data)
+    response = await client.put(f"/bills/{bill_id}", json=bill_data)
     raise_api_error_if_any(response)
     return BillSingle.model_validate(response.json())
 
 
-def delete_bill(request: BillDeleteRequest) -> BillDeleteResponse:
+async def delete_bill(request: BillDeleteRequest) -> BillDeleteResponse:
     """Delete one bill."""
     bill_id = request.id
-    response = client.delete(f"/bills/{bill_id}")
+    response = await client.delete(f"/bills/{bill_id}")
     raise_api_error_if_any(response)
     return BillDeleteResponse(message="Bill deleted successfully")
 
 
-def list_bill_transactions(request: BillTransactionsRequest) -> TransactionArray:
+async def list_bill_transactions(request: BillTransactionsRequest) -> TransactionArray:
     """List all transactions associated with a bill."""
     params = request.model_dump(exclude_none=True, mode='json')
     bill_id = params.pop("id")
-    response = client.get(f"/bills/{bill_id}/transactions", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, f"/bills/{bill_id}/transactions", params, TransactionArray)
 
 
-def list_bill_attachments(request: BillAttachmentsRequest) -> AttachmentArray:
+async def list_bill_attachments(request: BillAttachmentsRequest) -> AttachmentArray:
     """List all attachments for a bill."""
     params = request.model_dump(exclude_none=True, mode='json')
     bill_id = params.pop("id")
-    response = client.get(f"/bills/{bill_id}/attachments", params=params)
-    raise_api_error_if_any(response)
-    return AttachmentArray.model_validate(response.json())
+    return await fetch_list(client, f"/bills/{bill_id}/attachments", params, AttachmentArray)
 
 
-def list_bill_rules(request: BillRulesRequest) -> RuleArray:
+async def list_bill_rules(request: BillRulesRequest) -> RuleArray:
     """List all rules associated with a bill."""
     params = request.model_dump(exclude_none=True, mode='json')
     bill_id = params.pop("id")
-    response = client.get(f"/bills/{bill_id}/rules", params=params)
-    raise_api_error_if_any(response)
-    return RuleArray.model_validate(response.json())
+    return await fetch_list(client, f"/bills/{bill_id}/rules", params, RuleArray)
+
+
+def iter_bill_transactions(request: BillTransactionsRequest) -> AsyncIterator[TransactionRead]:
+    """Iterate page by page over all transactions associated with a bill, prefetching the next page."""
+    params = request.model_dump(exclude_none=True, mode='json')
+    bill_id = params.pop("id")
+    return iter_items(client, f"/bills/{bill_id}/transactions", params, TransactionRead)
+
+
+async def resolve_bills(request: NameResolveRequest) -> NameResolveResponse:
+    """Find bills by name: exact matches first, then near misses by trigram similarity.
+
+    Returns:
+        NameResolveResponse: Matching bills with their IDs and scores
+    """
+    return await resolve_names("bill", request)
@@ -1,7 +1,14 @@
+import asyncio
+import calendar
+import time
+from datetime import date
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
 from firefly_mcp.models.model import (
     BudgetArray, BudgetSingle, BudgetStore, 
     BudgetLimitArray, BudgetLimitSingle,
-    TransactionArray, AttachmentArray
+    TransactionArray, TransactionRead, AttachmentArray
 )
 from firefly_mcp.models.requests import (
     BudgetGetRequest, 
@@ -17,127 +24,246 @@ from firefly_mcp.models.requests import (
     BudgetDeleteRequest,
     BudgetDeleteResponse,
     BudgetLimitDeleteRequest,
-    BudgetLimitDeleteResponse
+    BudgetLimitDeleteResponse,
+    BudgetOverviewRequest,
+    BudgetOverviewResponse,
+    NameResolveRequest,
+    NameResolveResponse
 )
+from firefly_mcp.lib.env import parse_int_env
 from firefly_mcp.lib.http_client import client
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.cache import cached_get_json
+from firefly_mcp.core.pagination import fetch_all_pages, fetch_list, iter_items
+from firefly_mcp.core.passthrough import to_model
+from firefly_mcp.core.resolver import resolve_names
+from firefly_mcp.local.store import from_minor_units, to_minor_units
+
+# Budgets whose limits are fetched concurrently by one overview call.
+OVERVIEW_CONCURRENCY = parse_int_env("FIREFLY_OVERVIEW_CONCURRENCY", 8)
 
 
-def list_budgets(params: BudgetListRequest) -> BudgetArray:
+async def list_budgets(params: BudgetListRequest) -> BudgetArray:
     """List all budgets wrapped in BudgetArray."""
-    response = client.get("/budgets", params=params.model_dump(exclude_none=True, mode='json'))
-    raise_api_error_if_any(response)
-    return BudgetArray.model_validate(response.json())
+    return await fetch_list(client, "/budgets", params.model_dump(exclude_none=True, mode='json'), BudgetArray, cache_entity="budget")
 
 
-def get_budget(request: BudgetGetRequest) -> BudgetSingle:
+async def get_budget(request: BudgetGetRequest) -> BudgetSingle:
     """Get a single budget."""
     params = request.model_dump(exclude_none=True, mode='json')
     budget_id = params.pop("id")
-    response = client.get(f"/budgets/{budget_id}?", params=params)
-    raise_api_error_if_any(response)
-    return BudgetSingle.model_validate(response.json())
+    payload = await cached_get_json(client, "budget", f"/budgets/{budget_id}", params)
+    return to_model(BudgetSingle, payload)
 
 
-def create_budget(request: BudgetStore) -> BudgetSingle:
+async def create_budget(request: BudgetStore) -> BudgetSingle:
     """Create one budget."""
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/budgets", json=data)
+    response = await client.post("/budgets", json=data)
     raise_api_error_if_any(response)
     return BudgetSingle.model_validate(response.json())
 
 
-def update_budget(request: BudgetUpdateRequest) -> BudgetSingle:
+async def update_budget(request: BudgetUpdateRequest) -> BudgetSingle:
     """Update one budget."""
     data = request.model_dump(exclude_none=True, mode='json')
     budget_id = data.pop("id")
     # Extract the budget_update data
     budget_update_data = data.pop("budget_update")
-    response = client.put(f"/budgets/{budget_id}", json=budget_update_data)
+    response = await client.put(f"/budgets/{budget_id}", json=budget_update_data)
     raise_api_error_if_any(response)
     return BudgetSingle.model_validate(response.json())
 
 
-def delete_budget(request: BudgetDeleteRequest) -> BudgetDeleteResponse:
+async def delete_budget(request: BudgetDeleteRequest) -> BudgetDeleteResponse:
     """Delete one budget."""
     budget_id = request.id
-    response = client.delete(f"/budgets/{budget_id}")
+    response = await client.delete(f"/budgets/{budget_id}")
     raise_api_error_if_any(response)
     return BudgetDeleteResponse(message="Budget deleted successfully")
 
 
-def list_limits(request: BudgetLimitsRequest) -> BudgetLimitArray:
+async def list_limits(request: BudgetLimitsRequest) -> BudgetLimitArray:
     """List all budget limits for a specific budget."""
     params = request.model_dump(exclude_none=True, mode='json')
     budget_id = params.pop("id")
-    response = client.get(f"/budgets/{budget_id}/limits", params=params)
-    raise_api_error_if_any(response)
-    return BudgetLimitArray.model_validate(response.json())
+    return await fetch_list(client, f"/budgets/{budget_id}/limits", params, BudgetLimitArray, cache_entity="budget")
 
 
-def get_limit(request: BudgetLimitGetRequest) -> BudgetLimitSingle:
+async def get_limit(request: BudgetLimitGetRequest) -> BudgetLimitSingle:
     """Get a single budget limit."""
     params = request.model_dump(exclude_none=True, mode='json')
     budget_id = params.pop("budget_id")
     limit_id = params.pop("limit_id")
-    response = client.get(f"/budgets/{budget_id}/limits/{limit_id}", params=params)
-    raise_api_error_if_any(response)
-    return BudgetLimitSingle.model_validate(response.json())
+    payload = await cached_get_json(client, "budget", f"/budgets/{budget_id}/limits/{limit_id}", params)
+    return to_model(BudgetLimitSingle, payload)
 
 
-def create_limit(request: BudgetLimitCreateRequest) -> BudgetLimitSingle:
+async def create_limit(request: BudgetLimitCreateRequest) -> BudgetLimitSingle:
     """Create one budget limit."""
     data = request.model_dump(exclude_none=True, mode='json')
     budget_id = data.pop("budget_id")
     # Extract the budget_limit_store data
     budget_limit_data = data.pop("budget_limit_store")
-    response = client.post(f"/budgets/{budget_id}/limits", json=budget_limit_data)
+    response = await client.post(f"/budgets/{budget_id}/limits", json=budget_limit_data)
     raise_api_error_if_any(response)
     return BudgetLimitSingle.model_validate(response.json())
 
 
-def update_limit(request: BudgetLimitUpdateRequest) -> BudgetLimitSingle:
+async def update_limit(request: BudgetLimitUpdateRequest) -> BudgetLimitSingle:
     """Update one budget limit."""
     data = request.model_dump(exclude_none=True, mode='json')
     budget_id = data.pop("budget_id")
     limit_id = data.pop("limit_id")
     # Extract the budget_limit data
     budget_limit_data = data.pop("budget_limit")
-    response = client.put(f"/budgets/{budget_id}/limits/{limit_id}", json=budget_limit_data)
+    response = await client.put(f"/budgets/{budget_id}/limits/{limit_id}", json=budget_limit_data)
     raise_api_error_if_any(response)
     return BudgetLimitSingle.model_validate(response.json())
 
 
-def delete_limit(request: BudgetLimitDeleteRequest) -> BudgetLimitDeleteResponse:
+async def delete_limit(request: BudgetLimitDeleteRequest) -> BudgetLimitDeleteResponse:
     """Delete one budget limit."""
     budget_id = request.budget_id
     limit_id = request.limit_id
-    response = client.delete(f"/budgets/{budget_id}/limits/{limit_id}")
+    response = await client.delete(f"/budgets/{budget_id}/limits/{limit_id}")
     raise_api_error_if_any(response)
     return BudgetLimitDeleteResponse(message="Budget limit deleted successfully")
 
 
-def list_budget_transactions(request: BudgetTransactionsRequest) -> TransactionArray:
+async def budget_overview(request: BudgetOverviewRequest) -> BudgetOverviewResponse:
+    """All budgets with their limits and spending for a date range in one call.
+
+    Budgets are listed first, with the amount spent in the range; the limits
+    of every budget are then fetched concurrently, at most
+    ``OVERVIEW_CONCURRENCY`` at a time, and merged into one row per budget
+    and currency. Amounts spent are reported as positive numbers.
+    """
+    started = time.perf_counter()
+    start, end = _overview_range(request.start, request.end)
+    params = {"start": start, "end": end}
+    budgets = (await fetch_all_pages(client, "/budgets", params, cache_entity="budget")).get("data") or []
+    if not request.include_inactive:
+        budgets = [budget for budget in budgets if (budget.get("attributes") or {}).get("active") is not False]
+
+    semaphore = asyncio.Semaphore(OVERVIEW_CONCURRENCY)
+
+    async def _limits(budget_id: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            payload = await fetch_all_pages(client, f"/budgets/{budget_id}/limits", params, cache_entity="budget")
+        return payload.get("data") or []
+
+    limits = await asyncio.gather(*(_limits(str(budget["id"])) for budget in budgets))
+    rows = [row for budget, budget_limits in zip(budgets, limits) for row in _overview_rows(budget, budget_limits)]
+    return BudgetOverviewResponse(
+        data=rows,
+        meta={
+            "start": start,
+            "end": end,
+            "budgets": len(budgets),
+            "totals": _overview_totals(rows),
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        },
+    )
+
+
+def _overview_range(start: Optional[str], end: Optional[str]) -> Tuple[str, str]:
+    """Requested range, defaulting to the current calendar month."""
+    today = date.today()
+    last_day = calendar.monthrange(today.year, today.month)[1]
+    return start or today.replace(day=1).isoformat(), end or today.replace(day=last_day).isoformat()
+
+
+def _overview_rows(budget: Dict[str, Any], limits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge a budget's spending and limits into one row per currency."""
+    attributes = budget.get("attributes") or {}
+    # currency code -> [decimal places, summed limit or None, spent], in minor units
+    figures: Dict[str, List[Any]] = {}
+
+    def _figures(entry: Dict[str, Any]) -> List[Any]:
+        places = entry.get("currency_decimal_places")
+        return figures.setdefault(entry.get("currency_code"), [2 if places is None else places, None, 0])
+
+    for limit in limits:
+        limit_attributes = limit.get("attributes") or {}
+        entry = _figures(limit_attributes)
+        entry[1] = (entry[1] or 0) + to_minor_units(limit_attributes.get("amount") or 0, entry[0])
+        # Older Firefly III versions only report spending per limit
+        if not attributes.get("spent") and limit_attributes.get("spent"):
+            entry[2] -= to_minor_units(limit_attributes["spent"], entry[0])
+    for spent in attributes.get("spent") or []:
+        entry = _figures(spent)
+        entry[2] -= to_minor_units(spent.get("sum") or 0, entry[0])
+
+    row = {"budget_id": str(budget["id"]), "budget": attributes.get("name")}
+    if not figures:
+        return [{**row, "currency_code": None, "limit": None, "spent": None, "remaining": None, "percent_spent": None}]
+    return [
+        {
+            **row,
+            "currency_code": currency_code,
+            "limit": None if limit is None else from_minor_units(limit, places),
+            "spent": from_minor_units(spent, places),
+            "remaining": None if limit is None else from_minor_units(limit - spent, places),
+            "percent_spent": round(spent * 100 / limit, 1) if limit else None,
+        }
+        for currency_code, (places, limit, spent) in sorted(figures.items(), key=lambda item: item[0] or "")
+    ]
+
+
+def _overview_totals(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Limits and spending summed per currency."""
+    totals: Dict[str, List[Optional[Decimal]]] = {}
+    for row in rows:
+        if row["currency_code"] is None:
+            continue
+        total = totals.setdefault(row["currency_code"], [None, Decimal(0)])
+        if row["limit"] is not None:
+            total[0] = (total[0] or Decimal(0)) + Decimal(row["limit"])
+        total[1] += Decimal(row["spent"])
+    return [
+        {"currency_code": currency_code, "limit": None if limit is None else str(limit), "spent": str(spent)}
+        for currency_code, (limit, spent) in sorted(totals.items())
+    ]
+
+
+async def list_budget_transactions(request: BudgetTransactionsRequest) -> TransactionArray:
     """List all transactions for a specific budget."""
     params = request.model_dump(exclude_none=True, mode='json')
     budget_id = params.pop("id")
-    response = client.get(f"/budgets/{budget_id}/transactions", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, f"/budgets/{budget_id}/transactions", params, TransactionArray)
 
 
-def list_budget_attachments(request: BudgetAttachmentsRequest) -> AttachmentArray:
+async def list_budget_attachments(request: BudgetAttachmentsRequest) -> AttachmentArray:
     """List all attachments for a specific budget."""
     params = request.model_dump(exclude_none=True, mode='json')
     budget_id = params.pop("id")
-    response = client.get(f"/budgets/{budget_id}/attachments", params=params)
-    raise_api_error_if_any(response)
-    return AttachmentArray.model_validate(response.json())
+    return await fetch_list(client, f"/budgets/{budget_id}/attachments", params, AttachmentArray)
 
 
-def list_transactions_without_budget(request: BudgetTransactionsWithoutBudgetRequest) -> TransactionArray:
+async def list_transactions_without_budget(request: BudgetTransactionsWithoutBudgetRequest) -> TransactionArray:
     """List all transactions not linked to any budget."""
     params = request.model_dump(exclude_none=True, mode='json')
-    response = client.get("/budgets/transactions-without-budget", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, "/budgets/transactions-without-budget", params, TransactionArray)
+
+
+def iter_budget_transactions(request: BudgetTransactionsRequest) -> AsyncIterator[TransactionRead]:
+    """Iterate page by page over all transactions for a specific budget, prefetching the next page."""
+    params = request.model_dump(exclude_none=True, mode='json')
+    budget_id = params.pop("id")
+    return iter_items(client, f"/budgets/{budget_id}/transactions", params, TransactionRead)
+
+
+def iter_transactions_without_budget(request: BudgetTransactionsWithoutBudgetRequest) -> AsyncIterator[TransactionRead]:
+    """Iterate page by page over all transactions not linked to any budget, prefetching the next page."""
+    params = request.model_dump(exclude_none=True, mode='json')
+    return iter_items(client, "/budgets/transactions-without-budget", params, TransactionRead)
+
+
+async def resolve_budgets(request: NameResolveRequest) -> NameResolveResponse:
+    """Find budgets by name: exact matches first, then near misses by trigram similarity.
+
+    Returns:
+        NameResolveResponse: Matching budgets with their IDs and scores
+    """
+    return await resolve_names("budget", request)
@@ -0,0 +1,236 @@
+"""In-process TTL/LRU cache for rarely changing Firefly III reference data.
+
+Accounts, categories, tags, budgets and bills are re-listed on almost every
+conversation turn but change rarely. Their GET payloads are cached here, keyed
+on endpoint path plus normalized query parameters, with a per-entity TTL and a
+size-bounded LRU eviction policy.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import httpx
+
+from firefly_mcp.lib import http_client as http_client_module
+from firefly_mcp.lib.env import parse_float_env, parse_int_env
+from firefly_mcp.lib.http_client import get_json
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_MISSING = object()
+
+# Entities whose read payloads are cached, with their default TTL in seconds.
+DEFAULT_TTLS: Dict[str, float] = {
+    "account": 300.0,
+    "category": 300.0,
+    "tag": 300.0,
+    "budget": 300.0,
+    "bill": 300.0,
+}
+
+# Paths whose payloads embed transaction-derived data (balances, spent/earned
+# amounts, paid dates, names on splits). Writes that create, change or remove
+# transactions invalidate all of them.
+TRANSACTION_DEPENDENT_PATHS: Tuple[str, ...] = (
+    "/transactions*",
+    "/accounts*",
+    "/budgets*",
+    "/categories*",
+    "/tags*",
+    "/bills*",
+)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for one entity."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+def make_key(path: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+    """Build a cache key from an endpoint path and its query parameters.
+
+    Parameters are normalized so that ordering, ``None`` values and list vs
+    tuple values do not produce different keys for the same request.
+    """
+    normalized = []
+    for name, value in (params or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(item) for item in value)
+        normalized.append((name, str(value)))
+    return path, tuple(sorted(normalized))
+
+
+class ReferenceCache:
+    """Size-bounded LRU cache with per-entity TTLs and hit/miss statistics."""
+
+    def __init__(self, max_entries: int = 512, ttls: Optional[Dict[str, float]] = None):
+        self.max_entries = max_entries
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, str, Any]]" = OrderedDict()
+        self._stats: Dict[str, CacheStats] = {}
+        self.generation = 0
+
+    @classmethod
+    def from_environment(cls) -> "ReferenceCache":
+        """Create a cache configured from environment variables."""
+        ttls: Dict[str, float] = {}
+        for entity, ttl in DEFAULT_TTLS.items():
+            default_ttl = parse_float_env("FIREFLY_CACHE_TTL", ttl)
+            ttls[entity] = parse_float_env(f"FIREFLY_CACHE_TTL_{entity.upper()}", default_ttl)
+        return cls(max_entries=parse_int_env("FIREFLY_CACHE_MAX_ENTRIES", 512, minimum=0), ttls=ttls)
+
+    def is_enabled(self, entity: str) -> bool:
+        """Whether payloads of this entity are cached at all."""
+        return self.ttls.get(entity, 0) > 0 and self.max_entries > 0
+
+    def get(self, entity: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Return the cached payload, or ``_MISSING`` when absent or expired."""
+        stats = self._stats.setdefault(entity, CacheStats())
+        key = make_key(path, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            stats.misses += 1
+            return _MISSING
+
+        expires_at, _, payload = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            stats.expirations += 1
+            stats.misses += 1
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        stats.hits += 1
+        return payload
+
+    def set(
+        self,
+        entity: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        payload: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a payload, evicting the least recently used entries if full.
+
+        ``generation`` is the value of :attr:`generation` when the fetch
+        started; if an invalidation happened since, the payload may predate a
+        write and is not stored.
+        """
+        if not self.is_enabled(entity):
+            return
+        if generation is not None and generation != self.generation:
+            return
+        key = make_key(path, params)
+        self._entries[key] = (time.monotonic() + self.ttls[entity], entity, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            _, (_, evicted_entity, _) = self._entries.popitem(last=False)
+            self._stats.setdefault(evicted_entity, CacheStats()).evictions += 1
+
+    def invalidate(self, pattern: str) -> int:
+        """Drop entries for a path pattern and return how many were removed.
+
+        A plain pattern matches every cached query of exactly that path; a
+        trailing ``*`` matches every path starting with the given prefix.
+        """
+        self.generation += 1
+        if pattern.endswith("*"):
+            prefix = pattern[:-1]
+            stale = [key for key in self._entries if key[0].startswith(prefix)]
+        else:
+            stale = [key for key in self._entries if key[0] == pattern]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        self._entries.clear()
+        self._stats.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size plus per-entity hit/miss counters."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "entities": {entity: asdict(stats) for entity, stats in self._stats.items()},
+        }
+
+
+reference_cache = ReferenceCache.from_environment()
+
+
+async def cached_get_json(
+    http_client: httpx.AsyncClient,
+    entity: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """GET ``path`` through the reference cache for ``entity``.
+
+    The returned payload may be shared with other callers and must not be
+    mutated.
+    """
+    if not reference_cache.is_enabled(entity):
+        return await get_json(http_client, path, params)
+
+    payload = reference_cache.get(entity, path, params)
+    if payload is _MISSING:
+        generation = reference_cache.generation
+        payload = await get_json(http_client, path, params)
+        reference_cache.set(entity, path, params, payload, generation)
+    return payload
+
+
+_invalidation_listeners: List[Callable[[str], None]] = []
+
+
+def add_invalidation_listener(listener: Callable[[str], None]) -> None:
+    """Call ``listener`` with every path pattern that a write invalidates.
+
+    Lets caches kept outside this module, such as the local transaction
+    mirror, notice writes without this module importing them.
+    """
+    _invalidation_listeners.append(listener)
+
+
+def format_invalidation(template: str, values: Mapping[str, Any]) -> str:
+    """Fill a path template such as ``/budgets/{budget_id}/limits``.
+
+    When a placeholder has no value, the template is cut at that placeholder
+    and turned into a prefix pattern, so the invalidation errs on the side of
+    dropping too much rather than serving stale data.
+    """
+    try:
+        return template.format_map(values)
+    except (KeyError, IndexError):
+        return template[:template.index("{")] + "*"
+
+
+def invalidate_paths(templates: Iterable[str], values: Optional[Mapping[str, Any]] = None) -> int:
+    """Invalidate cached entries for the declared path templates of a write."""
+    removed = 0
+    response_store = http_client_module.response_store
+    for template in templates:
+        pattern = format_invalidation(template, values or {})
+        http_client_module.forget_in_flight(pattern)
+        for listener in _invalidation_listeners:
+            listener(pattern)
+        removed += reference_cache.invalidate(pattern)
+        if response_store is not None:
+            removed += response_store.invalidate(pattern)
+    if removed:
+        logger.debug(f"Invalidated {removed} cached responses")
+    return removed
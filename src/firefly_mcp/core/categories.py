@@ -1,4 +1,6 @@
-from firefly_mcp.models.model import CategoryArray, CategorySingle, Category, TransactionArray, AttachmentArray
+from typing import AsyncIterator
+
+from firefly_mcp.models.model import CategoryArray, CategorySingle, Category, TransactionArray, TransactionRead, AttachmentArray
 from firefly_mcp.models.requests import (
     CategoryGetRequest, 
     CategoryListRequest, 
@@ -6,67 +8,82 @@ from firefly_mcp.models.requests import (
     CategoryTransactionsRequest,
     CategoryAttachmentsRequest,
     CategoryDeleteRequest,
-    CategoryDeleteResponse
+    CategoryDeleteResponse,
+    NameResolveRequest,
+    NameResolveResponse
 )
 from firefly_mcp.lib.http_client import client
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.cache import cached_get_json
+from firefly_mcp.core.pagination import fetch_list, iter_items
+from firefly_mcp.core.passthrough import to_model
+from firefly_mcp.core.resolver import resolve_names
 
 
-def list_categories(params: CategoryListRequest) -> CategoryArray:
+async def list_categories(params: CategoryListRequest) -> CategoryArray:
     """List all categories wrapped in CategoryArray."""
-    response = client.get("/categories", params=params.model_dump(exclude_none=True, mode='json'))
-    raise_api_error_if_any(response)
-    return CategoryArray.model_validate(response.json())
+    return await fetch_list(client, "/categories", params.model_dump(exclude_none=True, mode='json'), CategoryArray, cache_entity="category")
 
 
-def get_category(request: CategoryGetRequest) -> CategorySingle:
+async def get_category(request: CategoryGetRequest) -> CategorySingle:
     """Get a single category."""
     params = request.model_dump(exclude_none=True, mode='json')
     category_id = params.pop("id")
-    response = client.get(f"/categories/{category_id}", params=params)
-    raise_api_error_if_any(response)
-    return CategorySingle.model_validate(response.json())
+    payload = await cached_get_json(client, "category", f"/categories/{category_id}", params)
+    return to_model(CategorySingle, payload)
 
 
-def create_category(request: Category) -> CategorySingle:
+async def create_category(request: Category) -> CategorySingle:
     """Create one category."""
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/categories", json=data)
+    response = await client.post("/categories", json=data)
     raise_api_error_if_any(response)
     return CategorySingle.model_validate(response.json())
 
 
-def update_category(request: CategoryUpdateRequest) -> CategorySingle:
+async def update_category(request: CategoryUpdateRequest) -> CategorySingle:
     """Update one category."""
     data = request.model_dump(exclude_none=True, mode='json')
     category_id = data.pop("id")
     category_data = data.pop("category_update")
-    response = client.put(f"/categories/{category_id}", json=category_data)
+    response = await client.put(f"/categories/{category_id}", json=category_data)
     raise_api_error_if_any(response)
     return CategorySingle.model_validate(response.json())
 
 
-def delete_category(request: CategoryDeleteRequest) -> CategoryDeleteResponse:
+async def delete_category(request: CategoryDeleteRequest) -> CategoryDeleteResponse:
     """Delete one category."""
     category_id = request.id
-    response = client.delete(f"/categories/{category_id}")
+    response = await client.delete(f"/categories/{category_id}")
     raise_api_error_if_any(response)
     return CategoryDeleteResponse(message="Category deleted successfully")
 
 
-def list_category_transactions(request: CategoryTransactionsRequest) -> TransactionArray:
+async def list_category_transactions(request: CategoryTransactionsRequest) -> TransactionArray:
     """List all transactions in a category."""
     params = request.model_dump(exclude_none=True, mode='json')
     category_id = params.pop("id")
-    response = client.get(f"/categories/{category_id}/transactions", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, f"/categories/{category_id}/transactions", params, TransactionArray)
 
 
-def list_category_attachments(request: CategoryAttachmentsRequest) -> AttachmentArray:
+async def list_category_attachments(request: CategoryAttachmentsRequest) -> AttachmentArray:
     """List all attachments for a category."""
     params = request.model_dump(exclude_none=True, mode='json')
     category_id = params.pop("id")
-    response = client.get(f"/categories/{category_id}/attachments", params=params)
-    raise_api_error_if_any(response)
-    return AttachmentArray.model_validate(response.json())
+    return await fetch_list(client, f"/categories/{category_id}/attachments", params, AttachmentArray)
+
+
+def iter_category_transactions(request: CategoryTransactionsRequest) -> AsyncIterator[TransactionRead]:
+    """Iterate page by page over all transactions in a category, prefetching the next page."""
+    params = request.model_dump(exclude_none=True, mode='json')
+    category_id = params.pop("id")
+    return iter_items(client, f"/categories/{category_id}/transactions", params, TransactionRead)
+
+
+async def resolve_categories(request: NameResolveRequest) -> NameResolveResponse:
+    """Find categories by name: exact matches first, then near misses by trigram similarity.
+
+    Returns:
+        NameResolveResponse: Matching categories with their IDs and scores
+    """
+    return await resolve_names("category", request)
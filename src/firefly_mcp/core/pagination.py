@@ -0,0 +1,160 @@
+"""Transparent auto-pagination for Firefly III list endpoints."""
+
+import asyncio
+import math
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+from firefly_mcp.core.cache import cached_get_json
+from firefly_mcp.core.passthrough import to_model
+from firefly_mcp.lib.env import parse_int_env
+from firefly_mcp.lib.http_client import get_json
+
+ArrayT = TypeVar("ArrayT", bound=BaseModel)
+ItemT = TypeVar("ItemT", bound=BaseModel)
+
+# Maximum number of pages requested concurrently by a single fetch_all call.
+PAGINATION_CONCURRENCY = parse_int_env("FIREFLY_PAGINATION_CONCURRENCY", 4)
+
+
+def _page_fetcher(
+    http_client: httpx.AsyncClient,
+    cache_entity: Optional[str],
+) -> Callable[[str, Dict[str, Any]], Awaitable[Any]]:
+    """Return the GET function for pages, going through the cache if requested."""
+    if cache_entity is None:
+        return lambda path, params: get_json(http_client, path, params)
+    return lambda path, params: cached_get_json(http_client, cache_entity, path, params)
+
+
+async def fetch_list(
+    http_client: httpx.AsyncClient,
+    path: str,
+    params: Dict[str, Any],
+    model: Type[ArrayT],
+    cache_entity: Optional[str] = None,
+) -> ArrayT:
+    """Fetch a list endpoint, following pagination when requested.
+
+    ``params`` is the dumped request model. The ``fetch_all`` and
+    ``max_items`` control fields are consumed here and never sent to Firefly.
+    Without them a single page is fetched exactly as requested.
+
+    Args:
+        http_client: Client used for the requests
+        path: Endpoint path, e.g. ``/transactions``
+        params: Query parameters including the pagination controls
+        model: ``*Array`` model the (merged) payload is validated into
+        cache_entity: Reference-cache entity for the pages, if cacheable
+
+    Returns:
+        ArrayT: One page, or all requested pages merged into one array
+    """
+    fetch_all = params.pop("fetch_all", False)
+    max_items = params.pop("max_items", None)
+    if not fetch_all and max_items is None:
+        fetch = _page_fetcher(http_client, cache_entity)
+        return to_model(model, await fetch(path, params))
+    payload = await fetch_all_pages(http_client, path, params, max_items=max_items, cache_entity=cache_entity)
+    return to_model(model, payload)
+
+
+async def fetch_all_pages(
+    http_client: httpx.AsyncClient,
+    path: str,
+    params: Dict[str, Any],
+    max_items: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    cache_entity: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Fetch every page of a list endpoint and merge them into one payload.
+
+    The first page is fetched on its own to read ``meta.pagination``; the
+    remaining pages are then fetched concurrently, bounded by
+    ``concurrency``. Items keep page order and are truncated to
+    ``max_items`` when given.
+    """
+    fetch = _page_fetcher(http_client, cache_entity)
+    first_page = int(params.get("page") or 1)
+    first = await fetch(path, {**params, "page": first_page})
+
+    meta: Dict[str, Any] = first.get("meta") or {}
+    pagination: Dict[str, Any] = meta.get("pagination") or {}
+    items: List[Any] = list(first.get("data") or [])
+
+    last_page = max(int(pagination.get("total_pages") or first_page), first_page)
+    if max_items is not None:
+        per_page = int(pagination.get("per_page") or len(items) or 1)
+        last_page = min(last_page, first_page + max(math.ceil(max_items / per_page), 1) - 1)
+
+    semaphore = asyncio.Semaphore(concurrency or PAGINATION_CONCURRENCY)
+
+    async def _fetch_page(page: int) -> Dict[str, Any]:
+        async with semaphore:
+            return await fetch(path, {**params, "page": page})
+
+    pages = await asyncio.gather(*(_fetch_page(page) for page in range(first_page + 1, last_page + 1)))
+    for page_payload in pages:
+        items.extend(page_payload.get("data") or [])
+
+    if max_items is not None:
+        items = items[:max_items]
+
+    merged: Dict[str, Any] = {
+        **first,
+        "data": items,
+        "meta": {**meta, "pagination": {**pagination, "count": len(items), "current_page": last_page}},
+    }
+    if pages and "links" in pages[-1]:
+        merged["links"] = pages[-1]["links"]
+    return merged
+
+
+async def iter_pages(http_client: httpx.AsyncClient, path: str, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """Yield raw page payloads one by one, prefetching the next page.
+
+    While the caller consumes a page, the request for the following page is
+    already in flight, so at most two pages are held in memory at a time.
+    """
+    params = {key: value for key, value in params.items() if key not in ("fetch_all", "max_items")}
+    page = int(params.get("page") or 1)
+    pending: Optional[asyncio.Task[Any]] = asyncio.create_task(get_json(http_client, path, {**params, "page": page}))
+    try:
+        while pending is not None:
+            payload: Dict[str, Any] = await pending
+            pagination: Dict[str, Any] = (payload.get("meta") or {}).get("pagination") or {}
+            total_pages = int(pagination.get("total_pages") or page)
+            pending = None
+            if page < total_pages and payload.get("data"):
+                pending = asyncio.create_task(get_json(http_client, path, {**params, "page": page + 1}))
+            yield payload
+            page += 1
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+async def iter_items(
+    http_client: httpx.AsyncClient,
+    path: str,
+    params: Dict[str, Any],
+    item_model: Type[ItemT],
+) -> AsyncIterator[ItemT]:
+    """Yield validated items of a list endpoint across all pages.
+
+    Items are validated page by page, so memory use stays flat regardless of
+    the total number of results. ``max_items`` in ``params`` stops the scan
+    early.
+    """
+    max_items: Optional[int] = params.get("max_items")
+    yielded = 0
+    async with aclosing(iter_pages(http_client, path, params)) as pages:
+        async for payload in pages:
+            for raw_item in payload.get("data") or []:
+                if max_items is not None and yielded >= max_items:
+                    return
+                yield item_model.model_validate(raw_item)
+                yielded += 1
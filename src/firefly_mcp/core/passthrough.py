@@ -0,0 +1,39 @@
+"""Raw-JSON passthrough for read operations.
+
+Reads normally validate the decoded payload into generated models, which the
+registry then dumps straight back into dicts. For large list results that
+round trip dominates CPU and allocations. While passthrough is active (set by
+the registry for read operations when enabled), ``to_model`` returns the
+decoded JSON unchanged instead.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+raw_reads: ContextVar[bool] = ContextVar("firefly_raw_reads", default=False)
+
+
+@contextmanager
+def passthrough(enabled: bool = True) -> Iterator[None]:
+    """Return decoded JSON from reads performed inside this block."""
+    token = raw_reads.set(enabled)
+    try:
+        yield
+    finally:
+        raw_reads.reset(token)
+
+
+def to_model(model: Type[ModelT], payload: Any) -> ModelT:
+    """Validate ``payload`` into ``model``, or return it as-is in passthrough mode.
+
+    In passthrough mode the return value is the decoded JSON (typically a
+    dict), which may be shared with caches and must not be mutated.
+    """
+    if raw_reads.get():
+        return payload
+    return model.model_validate(payload)
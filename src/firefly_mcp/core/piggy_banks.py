@@ -8,65 +8,60 @@ from firefly_mcp.models.requests import (
     PiggyBankDeleteRequest,
     PiggyBankDeleteResponse
 )
-from firefly_mcp.lib.http_client import client
+from firefly_mcp.lib.http_client import client, get_json
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.pagination import fetch_list
+from firefly_mcp.core.passthrough import to_model
 
 
-def list_piggy_banks(params: PiggyBankListRequest) -> PiggyBankArray:
+async def list_piggy_banks(params: PiggyBankListRequest) -> PiggyBankArray:
     """List all piggy banks wrapped in PiggyBankArray."""
-    response = client.get("/piggy-banks", params=params.model_dump(exclude_none=True, mode='json'))
-    raise_api_error_if_any(response)
-    return PiggyBankArray.model_validate(response.json())
+    return await fetch_list(client, "/piggy-banks", params.model_dump(exclude_none=True, mode='json'), PiggyBankArray)
 
 
-def get_piggy_bank(request: PiggyBankGetRequest) -> PiggyBankSingle:
+async def get_piggy_bank(request: PiggyBankGetRequest) -> PiggyBankSingle:
     """Get a single piggy bank."""
     params = request.model_dump(exclude_none=True, mode='json')
     piggy_bank_id = params.pop("id")
-    response = client.get(f"/piggy-banks/{piggy_bank_id}", params=params)
-    raise_api_error_if_any(response)
-    return PiggyBankSingle.model_validate(response.json())
+    payload = await get_json(client, f"/piggy-banks/{piggy_bank_id}", params)
+    return to_model(PiggyBankSingle, payload)
 
 
-def create_piggy_bank(request: PiggyBankStore) -> PiggyBankSingle:
+async def create_piggy_bank(request: PiggyBankStore) -> PiggyBankSingle:
     """Create one piggy bank."""
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/piggy-banks", json=data)
+    response = await client.post("/piggy-banks", json=data)
     raise_api_error_if_any(response)
     return PiggyBankSingle.model_validate(response.json())
 
 
-def update_piggy_bank(request: PiggyBankUpdateRequest) -> PiggyBankSingle:
+async def update_piggy_bank(request: PiggyBankUpdateRequest) -> PiggyBankSingle:
     """Update one piggy bank."""
     data = request.model_dump(exclude_none=True, mode='json')
     piggy_bank_id = data.pop("id")
     piggy_bank_data = data.pop("piggy_bank_update")
-    response = client.put(f"/piggy-banks/{piggy_bank_id}", json=piggy_bank_data)
+    response = await client.put(f"/piggy-banks/{piggy_bank_id}", json=piggy_bank_data)
     raise_api_error_if_any(response)
     return PiggyBankSingle.model_validate(response.json())
 
 
-def delete_piggy_bank(request: PiggyBankDeleteRequest) -> PiggyBankDeleteResponse:
+async def delete_piggy_bank(request: PiggyBankDeleteRequest) -> PiggyBankDeleteResponse:
     """Delete one piggy bank."""
     piggy_bank_id = request.id
-    response = client.delete(f"/piggy-banks/{piggy_bank_id}")
+    response = await client.delete(f"/piggy-banks/{piggy_bank_id}")
     raise_api_error_if_any(response)
     return PiggyBankDeleteResponse(message="Piggy bank deleted successfully")
 
 
-def list_piggy_bank_events(request: PiggyBankEventsRequest) -> PiggyBankEventArray:
+async def list_piggy_bank_events(request: PiggyBankEventsRequest) -> PiggyBankEventArray:
     """List all events linked to a piggy bank (adding and removing money)."""
     params = request.model_dump(exclude_none=True, mode='json')
     piggy_bank_id = params.pop("id")
-    response = client.get(f"/piggy-banks/{piggy_bank_id}/events", params=params)
-    raise_api_error_if_any(response)
-    return PiggyBankEventArray.model_validate(response.json())
+    return await fetch_list(client, f"/piggy-banks/{piggy_bank_id}/events", params, PiggyBankEventArray)
 
 
-def list_piggy_bank_attachments(request: PiggyBankAttachmentsRequest) -> AttachmentArray:
+async def list_piggy_bank_attachments(request: PiggyBankAttachmentsRequest) -> AttachmentArray:
     """List all attachments for a piggy bank."""
     params = request.model_dump(exclude_none=True, mode='json')
     piggy_bank_id = params.pop("id")
-    response = client.get(f"/piggy-banks/{piggy_bank_id}/attachments", params=params)
-    raise_api_error_if_any(response)
-    return AttachmentArray.model_validate(response.json())
+    return await fetch_list(client, f"/piggy-banks/{piggy_bank_id}/attachments", params, AttachmentArray)
@@ -0,0 +1,289 @@
+"""Name to ID resolution for accounts, categories, budgets, tags and bills.
+
+Agents know reference data by name ("Checking", "Groceries") while the API
+addresses it by ID. :class:`NameIndex` maps names to IDs ignoring case,
+accents and extra whitespace, and ranks near misses by trigram similarity.
+One index per entity is built from the entity's list endpoint, whose pages go
+through the reference cache, and is rebuilt when that entity's cache TTL
+expires or a write invalidates cached responses. A name missing from an index
+older than ``MISS_REFRESH_SECONDS`` triggers one rebuild from fresh data, so
+names created outside this server are found without waiting for the TTL.
+
+All-digit values are sent as IDs without building an index, so a plain
+``get`` by ID costs a single request. They are only treated as names (a tag
+called "2024") when an index already built and still fresh has no such ID but
+one such name, or when Firefly III answers 404 for the ID.
+"""
+
+import logging
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from firefly_mcp.core.cache import reference_cache
+from firefly_mcp.core.pagination import fetch_all_pages
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.lib.http_client import client
+from firefly_mcp.models.requests import NameResolveRequest, NameResolveResponse
+
+logger = logging.getLogger(__name__)
+
+# List endpoint and name attribute of each resolvable entity.
+RESOLVABLE: Dict[str, Tuple[str, str]] = {
+    "account": ("/accounts", "name"),
+    "category": ("/categories", "name"),
+    "budget": ("/budgets", "name"),
+    "tag": ("/tags", "tag"),
+    "bill": ("/bills", "name"),
+}
+
+MISS_REFRESH_SECONDS = 10.0
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize(name: str) -> str:
+    """Case-folded name without accents and with single spaces."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def trigrams(text: str) -> frozenset:
+    """Trigrams of every word, padded like PostgreSQL's pg_trgm."""
+    grams = set()
+    for word in _WORD.findall(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+@dataclass(frozen=True)
+class NameEntry:
+    """One named resource."""
+    id: str
+    name: str
+    type: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"id": self.id, "name": self.name}
+        if self.type is not None:
+            entry["type"] = self.type
+        return entry
+
+
+class NameIndex:
+    """Exact (normalized) and trigram-similarity lookup of IDs by name."""
+
+    def __init__(self, entries: Iterable[NameEntry]):
+        self.entries: List[NameEntry] = list(entries)
+        self._ids = {entry.id for entry in self.entries}
+        self._exact: Dict[str, List[int]] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._sizes: List[int] = []
+        for position, entry in enumerate(self.entries):
+            key = normalize(entry.name)
+            self._exact.setdefault(key, []).append(position)
+            grams = trigrams(key)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any], attribute: str = "name") -> "NameIndex":
+        """Index the resources of a list payload by one of their attributes."""
+        entries = []
+        for resource in payload.get("data") or []:
+            attributes = resource.get("attributes") or {}
+            name = attributes.get(attribute)
+            if name:
+                entries.append(NameEntry(str(resource["id"]), str(name), attributes.get("type")))
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def has_id(self, id: str) -> bool:
+        """Whether a resource with this ID is indexed."""
+        return id in self._ids
+
+    def exact(self, name: str) -> List[NameEntry]:
+        """Entries whose name equals ``name`` ignoring case, accents and spacing."""
+        return [self.entries[position] for position in self._exact.get(normalize(name), ())]
+
+    def search(self, name: str, limit: int = 5, min_score: float = 0.3) -> List[Tuple[NameEntry, float]]:
+        """Best matches for ``name``: exact matches first, then by trigram similarity.
+
+        Similarity is shared trigrams over the union of both trigram sets
+        (1.0 for exact matches); matches scoring below ``min_score`` are
+        dropped.
+        """
+        key = normalize(name)
+        exact = set(self._exact.get(key, ()))
+        grams = trigrams(key)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+
+        scored = [(1.0, True, position) for position in exact]
+        for position, count in shared.items():
+            if position in exact:
+                continue
+            score = count / (len(grams) + self._sizes[position] - count)
+            if score >= min_score:
+                scored.append((score, False, position))
+        scored.sort(key=lambda item: (-item[0], not item[1], self.entries[item[2]].name))
+        return [(self.entries[position], round(score, 3)) for score, _, position in scored[:limit]]
+
+
+@dataclass
+class _CachedIndex:
+    index: NameIndex
+    generation: int
+    built_at: float
+
+
+_indexes: Dict[str, _CachedIndex] = {}
+
+
+def clear_name_indexes() -> None:
+    """Forget every built index."""
+    _indexes.clear()
+
+
+async def get_name_index(entity: str, refresh: bool = False) -> NameIndex:
+    """The name index of ``entity``, rebuilt when stale or when ``refresh`` is set.
+
+    A refresh fetches the list endpoint directly instead of through the
+    reference cache.
+    """
+    if entity not in RESOLVABLE:
+        raise ValidationError(f"Names of '{entity}' cannot be resolved; use one of {', '.join(RESOLVABLE)}")
+    cached = _indexes.get(entity)
+    if cached is not None and not refresh and _is_fresh(entity, cached):
+        return cached.index
+
+    path, attribute = RESOLVABLE[entity]
+    generation = reference_cache.generation
+    payload = await fetch_all_pages(client, path, {}, cache_entity=None if refresh else entity)
+    index = NameIndex.from_payload(payload, attribute)
+    _indexes[entity] = _CachedIndex(index, generation, time.monotonic())
+    logger.debug(f"Indexed {len(index)} {entity} names")
+    return index
+
+
+def _is_fresh(entity: str, cached: _CachedIndex) -> bool:
+    age = time.monotonic() - cached.built_at
+    return cached.generation == reference_cache.generation and age < reference_cache.ttls.get(entity, 0)
+
+
+def _may_refresh(entity: str) -> bool:
+    cached = _indexes.get(entity)
+    return cached is not None and time.monotonic() - cached.built_at >= MISS_REFRESH_SECONDS
+
+
+async def resolve_id(entity: str, value: str) -> str:
+    """ID for ``value``, which is either an ID already or an exact name.
+
+    Only exact matches (ignoring case, accents and spacing) are accepted;
+    fuzzy matches are offered as suggestions in the error instead, so a typo
+    never silently addresses a different resource. Digits are passed on as an
+    ID unless a fresh index already at hand shows them to be a name; no index
+    is built or refreshed just to confirm an ID.
+
+    Raises:
+        ValidationError: When no or more than one resource has that name
+    """
+    value = value.strip()
+    if value.isdigit():
+        cached = _indexes.get(entity)
+        if cached is None or not _is_fresh(entity, cached) or cached.index.has_id(value):
+            return value
+        matches = cached.index.exact(value)
+        return matches[0].id if len(matches) == 1 else value
+
+    index, matches = await _exact_matches(entity, value)
+    if len(matches) == 1:
+        return matches[0].id
+    if matches:
+        raise _ambiguous(entity, value, matches)
+    suggestions = [entry.name for entry, _ in index.search(value, limit=3)]
+    hint = f"; did you mean {', '.join(repr(name) for name in suggestions)}?" if suggestions else ""
+    raise ValidationError(f"No {entity} named '{value}'{hint}")
+
+
+async def _exact_matches(entity: str, name: str) -> Tuple[NameIndex, List[NameEntry]]:
+    index = await get_name_index(entity)
+    matches = index.exact(name)
+    if not matches and _may_refresh(entity):
+        index = await get_name_index(entity, refresh=True)
+        matches = index.exact(name)
+    return index, matches
+
+
+def _ambiguous(entity: str, name: str, matches: List[NameEntry]) -> ValidationError:
+    candidates = ", ".join(f"{entry.id} ({entry.type})" if entry.type else entry.id for entry in matches)
+    return ValidationError(f"{entity.capitalize()} name '{name}' is ambiguous, use one of the IDs {candidates}")
+
+
+async def resolve_params(params: Any, fields: Mapping[str, str]) -> Any:
+    """Replace names by IDs in the given fields of raw operation parameters.
+
+    ``fields`` maps parameter names to the entity their value refers to.
+    """
+    if not isinstance(params, dict) or not any(isinstance(params.get(name), str) for name in fields):
+        return params
+    resolved = dict(params)
+    for name, entity in fields.items():
+        if isinstance(resolved.get(name), str):
+            resolved[name] = await resolve_id(entity, resolved[name])
+    return resolved
+
+
+async def resolve_numeric_names(params: Any, fields: Mapping[str, str]) -> Optional[Any]:
+    """Retry all-digit values of ``fields`` as names after Firefly III found no such ID.
+
+    Returns:
+        Optional[Any]: The parameters with those names replaced by their IDs,
+        or None when none of the values names a resource
+
+    Raises:
+        ValidationError: When more than one resource has that name
+    """
+    if not isinstance(params, dict):
+        return None
+    resolved = dict(params)
+    for name, entity in fields.items():
+        value = params.get(name)
+        if not isinstance(value, str) or not value.strip().isdigit():
+            continue
+        _, matches = await _exact_matches(entity, value.strip())
+        if len(matches) > 1:
+            raise _ambiguous(entity, value.strip(), matches)
+        if matches:
+            resolved[name] = matches[0].id
+    return resolved if resolved != params else None
+
+
+async def resolve_names(entity: str, request: NameResolveRequest) -> NameResolveResponse:
+    """Find resources of ``entity`` by name, exact matches first.
+
+    Args:
+        entity: One of ``RESOLVABLE``
+        request: Name to look up, result limit and minimum similarity
+
+    Returns:
+        NameResolveResponse: Matches with their ID, name and score
+    """
+    index = await get_name_index(entity, refresh=request.refresh)
+    if not index.exact(request.name) and not request.refresh and _may_refresh(entity):
+        index = await get_name_index(entity, refresh=True)
+    exact = set(index.exact(request.name))
+    matches = index.search(request.name, request.limit, request.min_score)
+    return NameResolveResponse(
+        data=[{**entry.to_dict(), "score": score, "exact": entry in exact} for entry, score in matches],
+        meta={"entity": entity, "query": request.name, "indexed": len(index)},
+    )
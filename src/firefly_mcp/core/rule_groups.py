@@ -9,11 +9,13 @@ from firefly_mcp.models.requests import (
     RuleGroupDeleteRequest,
     RuleGroupDeleteResponse
 )
-from firefly_mcp.lib.http_client import client
+from firefly_mcp.lib.http_client import client, get_json
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.pagination import fetch_list
+from firefly_mcp.core.passthrough import to_model
 
 
-def list_rule_groups(request: RuleGroupListRequest) -> RuleGroupArray:
+async def list_rule_groups(request: RuleGroupListRequest) -> RuleGroupArray:
     """List all rule groups wrapped in RuleGroupArray.
     
     Args:
@@ -23,12 +25,10 @@ def list_rule_groups(request: RuleGroupListRequest) -> RuleGroupArray:
         RuleGroupArray: Array of rule groups
     """
     params = request.model_dump(exclude_none=True, mode='json')
-    response = client.get("/v1/rule-groups", params=params)
-    raise_api_error_if_any(response)
-    return RuleGroupArray.model_validate(response.json())
+    return await fetch_list(client, "/v1/rule-groups", params, RuleGroupArray)
 
 
-def get_rule_group(request: RuleGroupGetRequest) -> RuleGroupSingle:
+async def get_rule_group(request: RuleGroupGetRequest) -> RuleGroupSingle:
     """Get a single rule group.
     
     Args:
@@ -39,12 +39,11 @@ def get_rule_group(request: RuleGroupGetRequest) -> RuleGroupSingle:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     rule_group_id = params.pop("id")
-    response = client.get(f"/v1/rule-groups/{rule_group_id}", params=params)
-    raise_api_error_if_any(response)
-    return RuleGroupSingle.model_validate(response.json())
+    payload = await get_json(client, f"/v1/rule-groups/{rule_group_id}", params)
+    return to_model(RuleGroupSingle, payload)
 
 
-def create_rule_group(request: RuleGroupStore) -> RuleGroupSingle:
+async def create_rule_group(request: RuleGroupStore) -> RuleGroupSingle:
     """Create one rule group.
     
     Args:
@@ -54,12 +53,12 @@ def create_rule_group(request: RuleGroupStore) -> RuleGroupSingle:
         RuleGroupSingle: Properly typed rule group response
     """
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/v1/rule-groups", json=data)
+    response = await client.post("/v1/rule-groups", json=data)
     raise_api_error_if_any(response)
     return RuleGroupSingle.model_validate(response.json())
 
 
-def update_rule_group(request: RuleGroupUpdateRequest) -> RuleGroupSingle:
+async def update_rule_group(request: RuleGroupUpdateRequest) -> RuleGroupSingle:
     """Update one rule group.
     
     Args:
@@ -71,12 +70,12 @@ def update_rule_group(request: RuleGroupUpdateRequest) -> RuleGroupSingle:
     data = request.model_dump(exclude_none=True, mode='json')
     rule_group_id = data.pop("id")
     rule_group_data = data.pop("rule_group_update")
-    response = client.put(f"/v1/rule-groups/{rule_group_id}", json=rule_group_data)
+    response = await client.put(f"/v1/rule-groups/{rule_group_id}", json=rule_group_data)
     raise_api_error_if_any(response)
     return RuleGroupSingle.model_validate(response.json())
 
 
-def delete_rule_group(request: RuleGroupDeleteRequest) -> RuleGroupDeleteResponse:
+async def delete_rule_group(request: RuleGroupDeleteRequest) -> RuleGroupDeleteResponse:
     """Delete one rule group.
     
     Args:
@@ -86,12 +85,12 @@ def delete_rule_group(request: RuleGroupDeleteRequest) -> RuleGroupDeleteRespons
         RuleGroupDeleteResponse: Success message
     """
     rule_group_id = request.id
-    response = client.delete(f"/v1/rule-groups/{rule_group_id}")
+    response = await client.delete(f"/v1/rule-groups/{rule_group_id}")
     raise_api_error_if_any(response)
     return RuleGroupDeleteResponse(message="Rule group deleted successfully")
 
 
-def list_rule_group_rules(request: RuleGroupListRulesRequest) -> RuleArray:
+async def list_rule_group_rules(request: RuleGroupListRulesRequest) -> RuleArray:
     """List rules in a rule group.
     
     Args:
@@ -102,12 +101,10 @@ def list_rule_group_rules(request: RuleGroupListRulesRequest) -> RuleArray:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     rule_group_id = params.pop("id")
-    response = client.get(f"/v1/rule-groups/{rule_group_id}/rules", params=params)
-    raise_api_error_if_any(response)
-    return RuleArray.model_validate(response.json())
+    return await fetch_list(client, f"/v1/rule-groups/{rule_group_id}/rules", params, RuleArray)
 
 
-def test_rule_group(request: RuleGroupTestRequest) -> TransactionArray:
+async def test_rule_group(request: RuleGroupTestRequest) -> TransactionArray:
     """Test which transactions would be hit by the rule group. No changes will be made.
     
     Args:
@@ -118,12 +115,10 @@ def test_rule_group(request: RuleGroupTestRequest) -> TransactionArray:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     rule_group_id = params.pop("id")
-    response = client.get(f"/v1/rule-groups/{rule_group_id}/test", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, f"/v1/rule-groups/{rule_group_id}/test", params, TransactionArray)
 
 
-def trigger_rule_group(request: RuleGroupTriggerRequest) -> RuleGroupDeleteResponse:
+async def trigger_rule_group(request: RuleGroupTriggerRequest) -> RuleGroupDeleteResponse:
     """Fire the rule group on your transactions. Changes will be made by the rules in the rule group.
     
     Args:
@@ -134,6 +129,6 @@ def trigger_rule_group(request: RuleGroupTriggerRequest) -> RuleGroupDeleteRespo
     """
     params = request.model_dump(exclude_none=True, mode='json')
     rule_group_id = params.pop("id")
-    response = client.post(f"/v1/rule-groups/{rule_group_id}/trigger", params=params)
+    response = await client.post(f"/v1/rule-groups/{rule_group_id}/trigger", params=params)
     raise_api_error_if_any(response)
     return RuleGroupDeleteResponse(message="Rule group triggered successfully")
\ No newline at end of file
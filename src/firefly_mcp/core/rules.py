@@ -8,11 +8,13 @@ from firefly_mcp.models.requests import (
     RuleDeleteRequest,
     RuleDeleteResponse
 )
-from firefly_mcp.lib.http_client import client
+from firefly_mcp.lib.http_client import client, get_json
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.pagination import fetch_list
+from firefly_mcp.core.passthrough import to_model
 
 
-def list_rules(request: RuleListRequest) -> RuleArray:
+async def list_rules(request: RuleListRequest) -> RuleArray:
     """List all rules wrapped in RuleArray.
     
     Args:
@@ -22,12 +24,10 @@ def list_rules(request: RuleListRequest) -> RuleArray:
         RuleArray: Array of rules
     """
     params = request.model_dump(exclude_none=True, mode='json')
-    response = client.get("/v1/rules", params=params)
-    raise_api_error_if_any(response)
-    return RuleArray.model_validate(response.json())
+    return await fetch_list(client, "/v1/rules", params, RuleArray)
 
 
-def get_rule(request: RuleGetRequest) -> RuleSingle:
+async def get_rule(request: RuleGetRequest) -> RuleSingle:
     """Get a single rule.
     
     Args:
@@ -38,12 +38,11 @@ def get_rule(request: RuleGetRequest) -> RuleSingle:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     rule_id = params.pop("id")
-    response = client.get(f"/v1/rules/{rule_id}", params=params)
-    raise_api_error_if_any(response)
-    return RuleSingle.model_validate(response.json())
+    payload = await get_json(client, f"/v1/rules/{rule_id}", params)
+    return to_model(RuleSingle, payload)
 
 
-def create_rule(request: RuleStore) -> RuleSingle:
+async def create_rule(request: RuleStore) -> RuleSingle:
     """Create one rule.
     
     Args:
@@ -53,12 +52,12 @@ def create_rule(request: RuleStore) -> RuleSingle:
         RuleSingle: Properly typed rule response
     """
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/v1/rules", json=data)
+    response = await client.post("/v1/rules", json=data)
     raise_api_error_if_any(response)
     return RuleSingle.model_validate(response.json())
 
 
-def update_rule(request: RuleUpdateRequest) -> RuleSingle:
+async def update_rule(request: RuleUpdateRequest) -> RuleSingle:
     """Update one rule.
     
     Args:
@@ -70,12 +69,12 @@ def update_rule(request: RuleUpdateRequest) -> RuleSingle:
     data = request.model_dump(exclude_none=True, mode='json')
     rule_id = data.pop("id")
     rule_data = data.pop("rule_update")
-    response = client.put(f"/v1/rules/{rule_id}", json=rule_data)
+    response = await client.put(f"/v1/rules/{rule_id}", json=rule_data)
     raise_api_error_if_any(response)
     return RuleSingle.model_validate(response.json())
 
 
-def delete_rule(request: RuleDeleteRequest) -> RuleDeleteResponse:
+async def delete_rule(request: RuleDeleteRequest) -> RuleDeleteResponse:
     """Delete one rule.
     
     Args:
@@ -85,12 +84,12 @@ def delete_rule(request: RuleDeleteRequest) -> RuleDeleteResponse:
         RuleDeleteResponse: Success message
     """
     rule_id = request.id
-    response = client.delete(f"/v1/rules/{rule_id}")
+    response = await client.delete(f"/v1/rules/{rule_id}")
     raise_api_error_if_any(response)
     return RuleDeleteResponse(message="Rule deleted successfully")
 
 
-def test_rule(request: RuleTestRequest) -> TransactionArray:
+async def test_rule(request: RuleTestRequest) -> TransactionArray:
     """Test which transactions would be hit by the rule. No changes will be made.
     
     Args:
@@ -101,12 +100,10 @@ def test_rule(request: RuleTestRequest) -> TransactionArray:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     rule_id = params.pop("id")
-    response = client.get(f"/v1/rules/{rule_id}/test", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, f"/v1/rules/{rule_id}/test", params, TransactionArray)
 
 
-def trigger_rule(request: RuleTriggerRequest) -> RuleDeleteResponse:
+async def trigger_rule(request: RuleTriggerRequest) -> RuleDeleteResponse:
     """Fire the rule on your transactions. Changes will be made by the rule.
     
     Args:
@@ -117,6 +114,6 @@ def trigger_rule(request: RuleTriggerRequest) -> RuleDeleteResponse:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     rule_id = params.pop("id")
-    response = client.post(f"/v1/rules/{rule_id}/trigger", params=params)
+    response = await client.post(f"/v1/rules/{rule_id}/trigger", params=params)
     raise_api_error_if_any(response)
     return RuleDeleteResponse(message="Rule triggered successfully")
\ No newline at end of file
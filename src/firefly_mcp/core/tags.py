@@ -1,4 +1,6 @@
-from firefly_mcp.models.model import TagArray, TagSingle, TagModelStore, TransactionArray, AttachmentArray
+from typing import AsyncIterator
+
+from firefly_mcp.models.model import TagArray, TagSingle, TagModelStore, TransactionArray, TransactionRead, AttachmentArray
 from firefly_mcp.models.requests import (
     TagGetRequest, 
     TagListRequest, 
@@ -6,13 +8,19 @@ from firefly_mcp.models.requests import (
     TagTransactionsRequest,
     TagAttachmentsRequest,
     TagDeleteRequest,
-    TagDeleteResponse
+    TagDeleteResponse,
+    NameResolveRequest,
+    NameResolveResponse
 )
 from firefly_mcp.lib.http_client import client
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.cache import cached_get_json
+from firefly_mcp.core.pagination import fetch_list, iter_items
+from firefly_mcp.core.passthrough import to_model
+from firefly_mcp.core.resolver import resolve_names
 
 
-def list_tags(request: TagListRequest) -> TagArray:
+async def list_tags(request: TagListRequest) -> TagArray:
     """List all tags wrapped in TagArray.
     
     Args:
@@ -22,12 +30,10 @@ def list_tags(request: TagListRequest) -> TagArray:
         TagArray: Array of tags
     """
     params = request.model_dump(exclude_none=True, mode='json')
-    response = client.get("/tags", params=params)
-    raise_api_error_if_any(response)
-    return TagArray.model_validate(response.json())
+    return await fetch_list(client, "/tags", params, TagArray, cache_entity="tag")
 
 
-def get_tag(request: TagGetRequest) -> TagSingle:
+async def get_tag(request: TagGetRequest) -> TagSingle:
     """Get a single tag.
     
     Args:
@@ -38,12 +44,11 @@ def get_tag(request: TagGetRequest) -> TagSingle:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     tag_id = params.pop("id")
-    response = client.get(f"/tags/{tag_id}", params=params)
-    raise_api_error_if_any(response)
-    return TagSingle.model_validate(response.json())
+    payload = await cached_get_json(client, "tag", f"/tags/{tag_id}", params)
+    return to_model(TagSingle, payload)
 
 
-def create_tag(request: TagModelStore) -> TagSingle:
+async def create_tag(request: TagModelStore) -> TagSingle:
     """Create one tag.
     
     Args:
@@ -53,12 +58,12 @@ def create_tag(request: TagModelStore) -> TagSingle:
         TagSingle: Properly typed tag response
     """
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/tags", json=data)
+    response = await client.post("/tags", json=data)
     raise_api_error_if_any(response)
     return TagSingle.model_validate(response.json())
 
 
-def update_tag(request: TagUpdateRequest) -> TagSingle:
+async def update_tag(request: TagUpdateRequest) -> TagSingle:
     """Update one tag.
     
     Args:
@@ -70,12 +75,12 @@ def update_tag(request: TagUpdateRequest) -> TagSingle:
     data = request.model_dump(exclude_none=True, mode='json')
     tag_id = data.pop("id")
     tag_data = data.pop("tag_update")
-    response = client.put(f"/tags/{tag_id}", json=tag_data)
+    response = await client.put(f"/tags/{tag_id}", json=tag_data)
     raise_api_error_if_any(response)
     return TagSingle.model_validate(response.json())
 
 
-def delete_tag(request: TagDeleteRequest) -> TagDeleteResponse:
+async def delete_tag(request: TagDeleteRequest) -> TagDeleteResponse:
     """Delete one tag.
     
     Args:
@@ -85,12 +90,12 @@ def delete_tag(request: TagDeleteRequest) -> TagDeleteResponse:
         TagDeleteResponse: Success message
     """
     tag_id = request.id
-    response = client.delete(f"/tags/{tag_id}")
+    response = await client.delete(f"/tags/{tag_id}")
     raise_api_error_if_any(response)
     return TagDeleteResponse(message="Tag deleted successfully")
 
 
-def list_tag_transactions(request: TagTransactionsRequest) -> TransactionArray:
+async def list_tag_transactions(request: TagTransactionsRequest) -> TransactionArray:
     """List all transactions for a tag.
     
     Args:
@@ -101,12 +106,10 @@ def list_tag_transactions(request: TagTransactionsRequest) -> TransactionArray:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     tag_id = params.pop("id")
-    response = client.get(f"/tags/{tag_id}/transactions", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, f"/tags/{tag_id}/transactions", params, TransactionArray)
 
 
-def list_tag_attachments(request: TagAttachmentsRequest) -> AttachmentArray:
+async def list_tag_attachments(request: TagAttachmentsRequest) -> AttachmentArray:
     """List all attachments for a tag.
     
     Args:
@@ -117,6 +120,30 @@ def list_tag_attachments(request: TagAttachmentsRequest) -> AttachmentArray:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     tag_id = params.pop("id")
-    response = client.get(f"/tags/{tag_id}/attachments", params=params)
-    raise_api_error_if_any(response)
-    return AttachmentArray.model_validate(response.json())
\ No newline at end of file
+    return await fetch_list(client, f"/tags/{tag_id}/attachments", params, AttachmentArray)
+
+
+def iter_tag_transactions(request: TagTransactionsRequest) -> AsyncIterator[TransactionRead]:
+    """Iterate over all transactions for a tag page by page.
+    
+    The next page is prefetched while the current one is consumed, so large
+    scans run with flat memory use instead of one big TransactionArray.
+    
+    Args:
+        request: TagTransactionsRequest containing filters; page/max_items bound the scan
+        
+    Returns:
+        AsyncIterator[TransactionRead]: Transactions in API order
+    """
+    params = request.model_dump(exclude_none=True, mode='json')
+    tag_id = params.pop("id")
+    return iter_items(client, f"/tags/{tag_id}/transactions", params, TransactionRead)
+
+
+async def resolve_tags(request: NameResolveRequest) -> NameResolveResponse:
+    """Find tags by name: exact matches first, then near misses by trigram similarity.
+
+    Returns:
+        NameResolveResponse: Matching tags with their IDs and scores
+    """
+    return await resolve_names("tag", request)
@@ -1,4 +1,6 @@
-from firefly_mcp.models.model import TransactionArray, TransactionSingle, TransactionStore, AttachmentArray, PiggyBankEventArray
+from typing import AsyncIterator
+
+from firefly_mcp.models.model import TransactionArray, TransactionRead, TransactionSingle, TransactionStore, AttachmentArray, PiggyBankEventArray
 from firefly_mcp.models.requests import (
     TransactionGetRequest, 
     TransactionListRequest, 
@@ -8,13 +10,26 @@ from firefly_mcp.models.requests import (
     TransactionDeleteRequest,
     TransactionDeleteResponse,
     BulkCategorizeRequest,
-    BulkTagRequest
+    BulkTagRequest,
+    LocalSyncRequest,
+    LocalSyncResponse,
+    TransactionAggregateRequest,
+    TransactionAggregateResponse,
+    TransactionSearchLocalRequest,
+    TransactionSearchLocalResponse
 )
-from firefly_mcp.lib.http_client import client
+from firefly_mcp.lib.http_client import client, get_json
 from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.core.pagination import fetch_list, iter_items, iter_pages
+from firefly_mcp.core.passthrough import to_model
+from firefly_mcp.local.aggregate import aggregate
+from firefly_mcp.local.columns import TransactionColumns
+from firefly_mcp.local.search import search
+from firefly_mcp.local.store import get_local_store
+from firefly_mcp.local.sync import ensure_synced, sync_store
 
 
-def list_transactions(request: TransactionListRequest) -> TransactionArray:
+async def list_transactions(request: TransactionListRequest) -> TransactionArray:
     """List all transactions wrapped in TransactionArray.
     
     Args:
@@ -24,12 +39,10 @@ def list_transactions(request: TransactionListRequest) -> TransactionArray:
         TransactionArray: Array of transactions
     """
     params = request.model_dump(exclude_none=True, mode='json')
-    response = client.get("/transactions", params=params)
-    raise_api_error_if_any(response)
-    return TransactionArray.model_validate(response.json())
+    return await fetch_list(client, "/transactions", params, TransactionArray)
 
 
-def get_transaction(request: TransactionGetRequest) -> TransactionSingle:
+async def get_transaction(request: TransactionGetRequest) -> TransactionSingle:
     """Get a single transaction.
     
     Args:
@@ -40,12 +53,11 @@ def get_transaction(request: TransactionGetRequest) -> TransactionSingle:
     """
     params = request.model_dump(exclude_none=True, mode='json')
     transaction_id = params.pop("id")
-    response = client.get(f"/transactions/{transaction_id}", params=params)
-    raise_api_error_if_any(response)
-    return TransactionSingle.model_validate(response.json())
+    payload = await get_json(client, f"/transactions/{transaction_id}", params)
+    return to_model(TransactionSingle, payload)
 
 
-def create_transaction(request: TransactionStore) -> TransactionSingle:
+async def create_transaction(request: TransactionStore) -> TransactionSingle:
     """Create one transaction.
     
     Args:
@@ -55,12 +67,12 @@ def create_transaction(request: TransactionStore) -> TransactionSingle:
         TransactionSingle: Properly typed transaction response
     """
     data = request.model_dump(exclude_none=True, mode='json')
-    response = client.post("/transactions", json=data)
+    response = await client.post("/transactions", json=data)
     raise_api_error_if_any(response)
     return TransactionSingle.model_validate(response.json())
 
 
-def update_transaction(request: TransactionUpdateRequest) -> TransactionSingle:
+async def update_transaction(request: TransactionUpdateRequest) -> TransactionSingle:
     """Update one transaction.
     
     Args:
@@ -71,12 +83,12 @@ def update_transaction(request: TransactionUpdateRequest) -> TransactionSingle:
     """
     data = request.model_dump(exclude_none=True, mode='json')
     transaction_id = data.pop("id")
-    response = client.put(f"/transactions/{transaction_id}", json=data)
+    response = await client.put(f"/transactions/{transaction_id}", json=data)
     raise_api_error_if_any(response)
     return TransactionSingle.model_validate(response.json())
 
 
-def delete_transaction(request: TransactionDeleteRequest) -> TransactionDeleteResponse:
+async def delete_transaction(request: TransactionDeleteRequest) -> TransactionDeleteResponse:
     """Delete one transaction.
     
     Args:
@@ -86,12 +98,12 @@ def delete_transaction(request: TransactionDeleteRequest) -> TransactionDeleteRe
         TransactionDeleteResponse: Success message
     """
     transaction_id = request.id
-    response = client.delete(f"/transactions/{transaction_id}")
+    response = await client.delete(f"/transactions/{transaction_id}")
     raise_api_error_if_any(response)
     return TransactionDeleteResponse(message="Transaction deleted successfully")
 
 
-def list_transaction_attachments(request: TransactionAttachmentsRequest) -> AttachmentArray:
+async def list_transaction_attachments(request: TransactionAttachmentsRequest) -> AttachmentArray:
     """List all attachments for a specific transaction.
     
     Args:
@@ -102,12 +114,10 @@ def list_transaction_attachments(request: TransactionAttachmentsRequest) -> Atta
     """
     params = request.model_dump(exclude_none=True, mode='json')
     transaction_id = params.pop("id")
-    response = client.get(f"/transactions/{transaction_id}/attachments", params=params)
-    raise_api_error_if_any(response)
-    return AttachmentArray.model_validate(response.json())
+    return await fetch_list(client, f"/transactions/{transaction_id}/attachments", params, AttachmentArray)
 
 
-def list_transaction_piggy_bank_events(request: TransactionPiggyBankEventsRequest) -> PiggyBankEventArray:
+async def list_transaction_piggy_bank_events(request: TransactionPiggyBankEventsRequest) -> PiggyBankEventArray:
     """List all piggy bank events for a specific transaction.
     
     Args:
@@ -118,12 +128,10 @@ def list_transaction_piggy_bank_events(request: TransactionPiggyBankEventsReques
     """
     params = request.model_dump(exclude_none=True, mode='json')
     transaction_id = params.pop("id")
-    response = client.get(f"/transactions/{transaction_id}/piggy-bank-events", params=params)
-    raise_api_error_if_any(response)
-    return PiggyBankEventArray.model_validate(response.json())
+    return await fetch_list(client, f"/transactions/{transaction_id}/piggy-bank-events", params, PiggyBankEventArray)
 
 
-def bulk_categorize_transactions(request: BulkCategorizeRequest) -> TransactionDeleteResponse:
+async def bulk_categorize_transactions(request: BulkCategorizeRequest) -> TransactionDeleteResponse:
     """Bulk categorize multiple transactions.
     
     Args:
@@ -133,7 +141,7 @@ def bulk_categorize_transactions(request: BulkCategorizeRequest) -> TransactionD
         TransactionDeleteResponse: Success message (reusing for consistency)
     """
     # Use the bulk API endpoint with proper query format
-    response = client.post(
+    response = await client.post(
         "/data/bulk/transactions",
         params={"query": f"category_name={request.category_name}"},
         json={"transaction_ids": request.transaction_ids}
@@ -142,7 +150,7 @@ def bulk_categorize_transactions(request: BulkCategorizeRequest) -> TransactionD
     return TransactionDeleteResponse(message="Transactions categorized successfully")
 
 
-def bulk_tag_transactions(request: BulkTagRequest) -> TransactionDeleteResponse:
+async def bulk_tag_transactions(request: BulkTagRequest) -> TransactionDeleteResponse:
     """Bulk tag multiple transactions.
     
     Args:
@@ -152,10 +160,102 @@ def bulk_tag_transactions(request: BulkTagRequest) -> TransactionDeleteResponse:
         TransactionDeleteResponse: Success message (reusing for consistency)
     """
     # Use the bulk API endpoint with proper query format
-    response = client.post(
+    response = await client.post(
         "/data/bulk/transactions",
         params={"query": f"tags={','.join(request.tag_names)}"},
         json={"transaction_ids": request.transaction_ids}
     )
     raise_api_error_if_any(response)
-    return TransactionDeleteResponse(message="Transactions tagged successfully")
\ No newline at end of file
+    return TransactionDeleteResponse(message="Transactions tagged successfully")
+
+
+async def sync_local_transactions(request: LocalSyncRequest) -> LocalSyncResponse:
+    """Sync the local transaction mirror with Firefly III.
+    
+    Args:
+        request: LocalSyncRequest with the mirrored range and sync mode
+        
+    Returns:
+        LocalSyncResponse: Sync mode, fetched window and changed row counts
+    """
+    result = await sync_store(
+        client, get_local_store(), start=request.start, full=request.full, lookback_days=request.lookback_days
+    )
+    return LocalSyncResponse.model_validate(result)
+
+
+async def aggregate_transactions(request: TransactionAggregateRequest) -> TransactionAggregateResponse:
+    """Sum transaction amounts per category, budget, tag or account and period.
+    
+    Runs against the local mirror, which is synced first if it is empty.
+    
+    Args:
+        request: TransactionAggregateRequest with grouping, period and filters
+        
+    Returns:
+        TransactionAggregateResponse: Grouped totals and per-currency grand totals
+    """
+    store = get_local_store()
+    state = await ensure_synced(client, store, refresh=request.refresh)
+    result = aggregate(
+        store,
+        group_by=request.group_by,
+        period=request.period,
+        type=request.type,
+        start=request.start,
+        end=request.end,
+        filters={"category": request.category, "budget": request.budget, "tag": request.tag, "account": request.account},
+        limit=request.limit,
+    )
+    result["meta"]["synced_at"] = state.get("synced_at")
+    return TransactionAggregateResponse.model_validate(result)
+
+
+async def search_local_transactions(request: TransactionSearchLocalRequest) -> TransactionSearchLocalResponse:
+    """Full-text search over descriptions, notes and counterparties of mirrored transactions.
+    
+    Runs against the local mirror, which is synced first if it is empty.
+    
+    Args:
+        request: TransactionSearchLocalRequest with the query and filters
+        
+    Returns:
+        TransactionSearchLocalResponse: Matching splits ranked by relevance
+    """
+    store = get_local_store()
+    state = await ensure_synced(client, store, refresh=request.refresh)
+    result = search(store, request.query, start=request.start, end=request.end, type=request.type, limit=request.limit)
+    result["meta"]["synced_at"] = state.get("synced_at")
+    return TransactionSearchLocalResponse.model_validate(result)
+
+
+def iter_transactions(request: TransactionListRequest) -> AsyncIterator[TransactionRead]:
+    """Iterate over all transactions page by page.
+    
+    The next page is prefetched while the current one is consumed, so large
+    scans run with flat memory use instead of one big TransactionArray.
+    
+    Args:
+        request: TransactionListRequest containing filters; page/max_items bound the scan
+        
+    Returns:
+        AsyncIterator[TransactionRead]: Transactions in API order
+    """
+    params = request.model_dump(exclude_none=True, mode='json')
+    return iter_items(client, "/transactions", params, TransactionRead)
+
+
+async def load_transaction_columns(request: TransactionListRequest) -> TransactionColumns:
+    """Load transactions into a compact columnar container.
+    
+    Pages are streamed straight into typed arrays without building models,
+    so years of history fit in a few megabytes.
+    
+    Args:
+        request: TransactionListRequest with the date range and type to load
+        
+    Returns:
+        TransactionColumns: One entry per transaction split
+    """
+    params = request.model_dump(exclude_none=True, mode='json')
+    return await TransactionColumns.from_async_pages(iter_pages(client, "/transactions", params))
@@ -0,0 +1,48 @@
+"""Guarded parsing of numeric environment variables.
+
+Settings are read at import time, so a malformed value must not abort server
+startup: it is logged and the default is used instead.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def parse_int_env(key: str, default: int, minimum: int = 1) -> int:
+    """Integer from an environment variable, or ``default`` when unset or invalid.
+
+    Values below ``minimum`` are rejected like malformed ones.
+    """
+    raw_value = os.getenv(key, "").strip()
+    if not raw_value:
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError:
+        logger.warning(f"{key} must be an integer, got '{raw_value}'. Using {default}.")
+        return default
+    if value < minimum:
+        logger.warning(f"{key} must be at least {minimum}, got {value}. Using {default}.")
+        return default
+    return value
+
+
+def parse_float_env(key: str, default: float, minimum: float = 0.0) -> float:
+    """Number from an environment variable, or ``default`` when unset or invalid.
+
+    Values below ``minimum`` are rejected like malformed ones.
+    """
+    raw_value = os.getenv(key, "").strip()
+    if not raw_value:
+        return default
+    try:
+        value = float(raw_value)
+    except ValueError:
+        logger.warning(f"{key} must be a number, got '{raw_value}'. Using {default}.")
+        return default
+    if value < minimum:
+        logger.warning(f"{key} must be at least {minimum}, got {value}. Using {default}.")
+        return default
+    return value
@@ -1,9 +1,28 @@
+import asyncio
 import os
 import httpx
 import logging
+from typing import Any, Dict, Hashable, Optional, Tuple
 
-def create_client() -> httpx.Client:
-    """Create HTTP client with appropriate SSL settings for development."""
+from firefly_mcp.lib import json_codec
+from firefly_mcp.lib.env import parse_float_env, parse_int_env
+from firefly_mcp.lib.exceptions import raise_api_error_if_any
+from firefly_mcp.lib.response_cache import CachingTransport, MemoryResponseStore, ResponseStore, SQLiteResponseStore
+
+# GET response store used for conditional requests (None when disabled).
+response_store: Optional[ResponseStore] = None
+
+# In-flight GETs shared by identical concurrent get_json calls.
+_in_flight: Dict[Tuple[int, str, Hashable], "asyncio.Task[Any]"] = {}
+single_flight_stats: Dict[str, int] = {"requests": 0, "coalesced": 0}
+
+def create_client() -> httpx.AsyncClient:
+    """Create the async HTTP client with appropriate SSL settings for development.
+
+    A single ``httpx.AsyncClient`` is shared by every core function so that
+    concurrent tool calls overlap their network waits on the event loop and
+    reuse pooled connections.
+    """
     
     api_url = os.environ.get("FIREFLY_API_URL", "https://firefly.dev.nlocal/api/v1")
     api_token = os.environ.get("FIREFLY_API_TOKEN", "")
@@ -17,12 +36,43 @@ def create_client() -> httpx.Client:
     if api_token and api_token.strip():
         headers["Authorization"] = f"Bearer {api_token}"
     
+    transport = create_transport(httpx.URL(api_url).path)
 
-    return httpx.Client(
+    return httpx.AsyncClient(
         base_url=api_url, 
         headers=headers,
         verify=verify_ssl(),
-        timeout=30.0
+        timeout=30.0,
+        transport=transport,
+    )
+
+def create_transport(base_path: str = "") -> Optional[httpx.AsyncBaseTransport]:
+    """Create the response-caching transport for conditional GETs.
+
+    Bodies are kept in memory and always revalidated, unless
+    FIREFLY_HTTP_CACHE_PATH points at a SQLite file, in which case they persist
+    across sessions and are served without revalidation for
+    FIREFLY_HTTP_CACHE_TTL seconds. Returns ``None`` (httpx's default
+    transport) when FIREFLY_HTTP_CONDITIONAL is 'false' and no path is set.
+    """
+    global response_store
+
+    cache_path = os.environ.get("FIREFLY_HTTP_CACHE_PATH", "").strip()
+    conditional = os.environ.get("FIREFLY_HTTP_CONDITIONAL", "true").lower() != "false"
+    if not cache_path and not conditional:
+        return None
+
+    max_bytes = parse_int_env("FIREFLY_HTTP_CACHE_MAX_BYTES", 64 * 1024 * 1024, minimum=0)
+    ttl = parse_float_env("FIREFLY_HTTP_CACHE_TTL", 300.0 if cache_path else 0.0)
+    if cache_path:
+        response_store = SQLiteResponseStore(cache_path, max_bytes=max_bytes)
+    else:
+        response_store = MemoryResponseStore(max_bytes=max_bytes)
+    return CachingTransport(
+        httpx.AsyncHTTPTransport(verify=verify_ssl()),
+        response_store,
+        ttl=ttl,
+        base_path=base_path,
     )
 
 def verify_ssl() -> bool:
@@ -35,4 +85,54 @@ def verify_ssl() -> bool:
     return disable_ssl_verify == 'true'
 
 
-client = create_client()
\ No newline at end of file
+async def get_json(http_client: httpx.AsyncClient, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """GET ``path`` and return the decoded JSON body, raising on API errors.
+
+    Identical GETs (same client, path and parameters) issued while one is
+    already in flight share that request and its parsed result instead of
+    hitting Firefly III again. The returned payload may therefore be shared
+    with other callers and must not be mutated. Bodies are decoded with the
+    configured JSON codec (see :mod:`firefly_mcp.lib.json_codec`).
+    """
+    key = (id(http_client), path, _params_key(params))
+    single_flight_stats["requests"] += 1
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_json(http_client, path, params))
+        _in_flight[key] = task
+        task.add_done_callback(lambda done: _in_flight.pop(key) if _in_flight.get(key) is done else None)
+    else:
+        single_flight_stats["coalesced"] += 1
+    # Shielded so that one cancelled caller does not cancel the shared request
+    return await asyncio.shield(task)
+
+
+def forget_in_flight(pattern: str) -> int:
+    """Stop sharing in-flight GETs whose path matches ``pattern``.
+
+    Called when a write invalidates cached data: requests already in flight
+    may have been answered before the write, so later callers must start a
+    fresh request instead of joining them. Callers already waiting keep their
+    result. A trailing ``*`` matches every path with that prefix.
+    """
+    if pattern.endswith("*"):
+        stale = [key for key in _in_flight if key[1].startswith(pattern[:-1])]
+    else:
+        stale = [key for key in _in_flight if key[1] == pattern]
+    for key in stale:
+        del _in_flight[key]
+    return len(stale)
+
+
+async def _fetch_json(http_client: httpx.AsyncClient, path: str, params: Optional[Dict[str, Any]]) -> Any:
+    response = await http_client.get(path, params=params)
+    raise_api_error_if_any(response)
+    return json_codec.loads(response.content)
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> Hashable:
+    """Order-insensitive key for query parameters."""
+    return tuple(sorted((name, repr(value)) for name, value in (params or {}).items() if value is not None))
+
+
+client = create_client()
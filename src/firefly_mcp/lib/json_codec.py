@@ -0,0 +1,89 @@
+"""Pluggable JSON codec for Firefly III payloads.
+
+Transaction pages can be several megabytes, and decoding them with the stdlib
+``json`` module shows up in profiles. The codec used by ``get_json`` and the
+server's own JSON files is picked once at import time from
+``FIREFLY_JSON_CODEC``:
+
+- ``auto`` (default): ``orjson`` when installed (``pip install
+  firefly-mcp[speed]``), otherwise ``pydantic`` (always available)
+- ``orjson``: orjson; if it is not installed a warning is logged and
+  ``auto`` is used, as for unknown names
+- ``pydantic``: the Rust JSON parser/serializer bundled with pydantic-core
+- ``json``: the stdlib ``json`` module
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Union
+
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the optional "speed" extra
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A named pair of JSON ``loads``/``dumps`` functions; ``dumps`` returns UTF-8 bytes."""
+
+    name: str
+    loads: Callable[[JsonInput], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode()
+
+
+CODECS: Dict[str, JsonCodec] = {
+    "json": JsonCodec("json", json.loads, _stdlib_dumps),
+    "pydantic": JsonCodec("pydantic", pydantic_core.from_json, lambda value: pydantic_core.to_json(value, fallback=str)),
+}
+if orjson is not None:  # pragma: no cover - depends on the optional "speed" extra
+    CODECS["orjson"] = JsonCodec("orjson", orjson.loads, lambda value: orjson.dumps(value, default=str))
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Return the codec called ``name``; ``auto`` picks the fastest available one."""
+    name = (name or "auto").strip().lower()
+    if name == "auto":
+        return CODECS.get("orjson") or CODECS["pydantic"]
+    if name not in CODECS:
+        raise ValueError(f"Unknown or unavailable JSON codec '{name}', expected one of: auto, {', '.join(CODECS)}")
+    return CODECS[name]
+
+
+def codec_from_environment() -> JsonCodec:
+    """Codec named by ``FIREFLY_JSON_CODEC``, or the ``auto`` choice if that name is unusable.
+
+    Like the other settings, a bad value is logged instead of aborting server
+    startup; explicit callers of :func:`get_codec` still get the error.
+    """
+    try:
+        return get_codec(os.environ.get("FIREFLY_JSON_CODEC", "auto"))
+    except ValueError as e:
+        logger.warning(f"{e}. Using auto.")
+        return get_codec("auto")
+
+
+codec = codec_from_environment()
+logger.debug(f"Using JSON codec: {codec.name}")
+
+
+def loads(data: JsonInput) -> Any:
+    """Decode JSON with the configured codec."""
+    return codec.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON with the configured codec."""
+    return codec.dumps(value)
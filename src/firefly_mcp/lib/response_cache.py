@@ -0,0 +1,347 @@
+"""HTTP response cache and conditional GETs for Firefly III requests.
+
+``CachingTransport`` remembers GET bodies together with their
+``ETag``/``Last-Modified`` validators. Fresh entries are served directly;
+stale ones are revalidated with ``If-None-Match``/``If-Modified-Since`` so an
+unchanged payload costs a ``304`` instead of a full download.
+
+Bodies live in a ``MemoryResponseStore`` by default. The stdio server is
+restarted by the MCP host for every session, so ``SQLiteResponseStore`` can
+keep them on disk instead and make the first calls of a new session warm.
+Its calls block on disk I/O, so the transport runs them on a dedicated worker
+thread instead of the event loop.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+T = TypeVar("T")
+
+# Response headers that describe the stored (already decoded) body.
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """A cached GET response body and its validators."""
+    body: bytes
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counters for the response cache."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    revalidations: int = 0
+    not_modified: int = 0
+    bytes_saved: int = 0
+
+
+class MemoryResponseStore:
+    """In-process response store with LRU eviction by total body size."""
+
+    blocking = False
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[str, StoredResponse]]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        """Return the stored response for ``key`` and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, path: str, response: StoredResponse) -> None:
+        """Store a response, then evict least recently used entries over budget."""
+        size = len(response.body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous[1].body)
+            self._entries[key] = (path, response)
+            self._bytes += size
+            self.stats.stores += 1
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body)
+                self.stats.evictions += 1
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as freshly validated without rewriting its body."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                path, response = entry
+                self._entries[key] = (path, replace(response, stored_at=time.time()))
+                self._entries.move_to_end(key)
+
+    def invalidate(self, pattern: str) -> int:
+        """Drop entries for a path pattern (trailing ``*`` = prefix match)."""
+        with self._lock:
+            if pattern.endswith("*"):
+                prefix = pattern[:-1]
+                stale = [key for key, (path, _) in self._entries.items() if path.startswith(prefix)]
+            else:
+                stale = [key for key, (path, _) in self._entries.items() if path == pattern]
+            for key in stale:
+                _, response = self._entries.pop(key)
+                self._bytes -= len(response.body)
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def total_bytes(self) -> int:
+        """Total size of all stored bodies."""
+        return self._bytes
+
+    def summary(self) -> Dict[str, Any]:
+        """Store size and counters."""
+        with self._lock:
+            entries = len(self._entries)
+        return {"backend": "memory", "entries": entries, "bytes": self._bytes, "max_bytes": self.max_bytes, **asdict(self.stats)}
+
+    def close(self) -> None:
+        """Nothing to release for the in-memory store."""
+
+
+class SQLiteResponseStore:
+    """SQLite-backed response store with LRU eviction by total body size.
+
+    The total body size is read once when the file is opened and then kept
+    up to date by this instance, so writes never sum the whole table.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_path ON responses (path)")
+        self._bytes: int = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        """Return the stored response for ``key`` and mark it recently used."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, content_type, etag, last_modified, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return StoredResponse(body=row[0], content_type=row[1], etag=row[2], last_modified=row[3], stored_at=row[4])
+
+    def put(self, key: str, path: str, response: StoredResponse) -> None:
+        """Store a response, then evict least recently used entries over budget."""
+        size = len(response.body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, path, body, size, content_type, etag, last_modified, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, path, response.body, size, response.content_type, response.etag,
+                 response.last_modified, response.stored_at, time.time()),
+            )
+            self._bytes += size - (previous[0] if previous else 0)
+            self.stats.stores += 1
+            self._evict()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as freshly validated without rewriting its body."""
+        with self._lock:
+            now = time.time()
+            self._db.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+
+    def invalidate(self, pattern: str) -> int:
+        """Drop entries for a path pattern (trailing ``*`` = prefix match)."""
+        if pattern.endswith("*"):
+            prefix = pattern[:-1]
+            where, params = "substr(path, 1, ?) = ?", (len(prefix), prefix)
+        else:
+            where, params = "path = ?", (pattern,)
+        with self._lock:
+            removed = self._db.execute(f"SELECT COALESCE(SUM(size), 0) FROM responses WHERE {where}", params).fetchone()[0]
+            cursor = self._db.execute(f"DELETE FROM responses WHERE {where}", params)
+            self._bytes -= removed
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._bytes = 0
+
+    def total_bytes(self) -> int:
+        """Total size of all stored bodies."""
+        return self._bytes
+
+    def summary(self) -> Dict[str, Any]:
+        """Store size and counters."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"backend": "sqlite", "entries": entries, "bytes": self._bytes, "max_bytes": self.max_bytes, **asdict(self.stats)}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes:
+            row = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at LIMIT 1").fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (row[0],))
+            self._bytes -= row[1]
+            self.stats.evictions += 1
+
+
+ResponseStore = Union[MemoryResponseStore, SQLiteResponseStore]
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that serves and revalidates GET responses from a store.
+
+    Entries younger than ``ttl`` are served without a request. Older entries
+    that carry an ``ETag`` or ``Last-Modified`` header are revalidated with a
+    conditional GET; a ``304`` refreshes the entry and its stored body is
+    returned as a regular ``200``.
+
+    Entries are keyed on the full URL and a hash of the ``Authorization``
+    header, so several Firefly users can never read each other's responses.
+    Paths are stored relative to ``base_path`` so they can be invalidated
+    with the same patterns as the in-memory reference cache. Calls to a
+    blocking store run one at a time on a worker thread owned by the
+    transport, so reading or writing large bodies never stalls other requests.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, store: ResponseStore, ttl: float, base_path: str = ""):
+        self._transport = transport
+        self.store = store
+        self.ttl = ttl
+        self.base_path = base_path.rstrip("/")
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="response-cache") if store.blocking else None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        key = self._key(request)
+        entry = await self._call(self.store.get, key)
+        if entry is not None and time.time() - entry.stored_at < self.ttl:
+            self.store.stats.hits += 1
+            return self._build_response(request, entry)
+
+        if entry is not None and (entry.etag or entry.last_modified):
+            self.store.stats.revalidations += 1
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+        else:
+            self.store.stats.misses += 1
+
+        response = await self._transport.handle_async_request(request)
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            await self._call(self.store.touch, key)
+            self.store.stats.not_modified += 1
+            self.store.stats.bytes_saved += len(entry.body)
+            return self._build_response(request, entry)
+        if response.status_code != 200:
+            return response
+
+        body = await response.aread()
+        stored = StoredResponse(
+            body=body,
+            content_type=response.headers.get("content-type"),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            stored_at=time.time(),
+        )
+        # Without a TTL, bodies are only worth keeping if they can be revalidated
+        if self.ttl > 0 or stored.etag or stored.last_modified:
+            await self._call(self.store.put, key, self._relative_path(request), stored)
+        return self._build_response(request, stored)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+        await self._call(self.store.close)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    async def _call(self, method: Callable[..., T], *args: Any) -> T:
+        """Call a store method, on the store's worker thread if it blocks."""
+        if self._executor is None:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, method, *args)
+
+    def _key(self, request: httpx.Request) -> str:
+        authorization = request.headers.get("authorization", "")
+        return hashlib.sha256(f"{authorization}\n{request.url}".encode()).hexdigest()
+
+    def _relative_path(self, request: httpx.Request) -> str:
+        path = request.url.path
+        if self.base_path and path.startswith(self.base_path):
+            return path[len(self.base_path):] or "/"
+        return path
+
+    @staticmethod
+    def _build_response(request: httpx.Request, entry: StoredResponse) -> httpx.Response:
+        headers = {
+            name: value
+            for name, value in zip(_STORED_HEADERS, (entry.content_type, entry.etag, entry.last_modified))
+            if value is not None
+        }
+        return httpx.Response(200, headers=headers, content=entry.body, request=request)
@@ -0,0 +1,178 @@
+"""Spend/earn aggregation over the local transaction mirror.
+
+Sums are computed by SQLite ``GROUP BY`` over the integer minor-unit
+``amount`` column, so grouping a few years of splits by category and month
+never materialises per-transaction Python objects and the totals are exact.
+Amounts are only converted back to decimal strings for the grouped rows.
+
+Category and budget names are copied into each split when it is synced, so a
+rename would leave old splits under the old name. Those dimensions are grouped
+on their IDs instead and labelled with the current name from the mirrored
+entities.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.local.store import LocalStore, from_minor_units
+
+
+
+def _current_name(entity: str) -> str:
+    """SQL for the current name of the split's ``entity``, or the name stored with the split."""
+    return (
+        f"COALESCE((SELECT e.name FROM entities e WHERE e.entity = '{entity}' AND e.id = s.{entity}_id), "
+        f"s.{entity}_name)"
+    )
+
+
+# Grouping dimension -> SQL expression over the ``splits`` table (``s``) and
+# the optional tag join (``t``). "account" is the asset side of the split.
+DIMENSIONS: Dict[str, str] = {
+    "category": _current_name("category"),
+    "budget": _current_name("budget"),
+    "tag": "t.tag",
+    "account": "CASE WHEN s.type = 'deposit' THEN s.destination_name ELSE s.source_name END",
+    "counterparty": "CASE WHEN s.type = 'deposit' THEN s.source_name ELSE s.destination_name END",
+}
+
+# Dimensions grouped on a key other than their label. Splits without an ID
+# fall back to their stored name.
+_GROUP_KEYS: Dict[str, str] = {
+    "category": "COALESCE(s.category_id, s.category_name)",
+    "budget": "COALESCE(s.budget_id, s.budget_name)",
+}
+
+# Period -> SQL expression producing its label from the ISO ``date`` column.
+PERIODS: Dict[str, str] = {
+    "day": "s.date",
+    "week": "date(s.date, '-6 days', 'weekday 1')",
+    "month": "substr(s.date, 1, 7)",
+    "quarter": "substr(s.date, 1, 4) || '-Q' || ((CAST(substr(s.date, 6, 2) AS INTEGER) + 2) / 3)",
+    "year": "substr(s.date, 1, 4)",
+}
+
+# Transaction type filter -> (SQL condition, signed amount expression).
+TYPES: Dict[str, Tuple[str, str]] = {
+    "withdrawal": ("s.type = 'withdrawal'", "s.amount"),
+    "deposit": ("s.type = 'deposit'", "s.amount"),
+    "transfer": ("s.type = 'transfer'", "s.amount"),
+    # Net flow: deposits count positive, withdrawals negative, transfers are ignored
+    "net": ("s.type IN ('withdrawal', 'deposit')", "CASE WHEN s.type = 'deposit' THEN s.amount ELSE -s.amount END"),
+}
+
+# Name filters -> column compared case-insensitively.
+_FILTERS: Dict[str, str] = {
+    "category": DIMENSIONS["category"],
+    "budget": DIMENSIONS["budget"],
+    "account": DIMENSIONS["account"],
+}
+
+
+def aggregate(
+    store: LocalStore,
+    group_by: Sequence[str] = ("category",),
+    period: Optional[str] = None,
+    type: str = "withdrawal",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    filters: Optional[Dict[str, str]] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Sum split amounts per group and period.
+
+    Args:
+        store: Mirror to aggregate
+        group_by: Dimensions to group by (see ``DIMENSIONS``)
+        period: Optional time bucket (see ``PERIODS``)
+        type: Transaction type to sum, or ``net`` for deposits minus withdrawals
+        start: First date (YYYY-MM-DD) included
+        end: Last date (YYYY-MM-DD) included
+        filters: Case-insensitive name filters on ``category``, ``budget``, ``account`` or ``tag``
+        limit: Keep only the largest ``limit`` rows of each period
+
+    Returns:
+        Dict[str, Any]: ``{"data": rows, "meta": {..., "totals": per-currency totals}}``
+    """
+    unknown = [dimension for dimension in group_by if dimension not in DIMENSIONS]
+    if unknown:
+        raise ValidationError(f"Cannot group by {unknown}, expected some of: {', '.join(DIMENSIONS)}")
+    if period is not None and period not in PERIODS:
+        raise ValidationError(f"Unknown period '{period}', expected one of: {', '.join(PERIODS)}")
+    if type not in TYPES:
+        raise ValidationError(f"Unknown type '{type}', expected one of: {', '.join(TYPES)}")
+    filters = {name: value for name, value in (filters or {}).items() if value}
+
+    condition, amount = TYPES[type]
+    where, params = [condition], []
+    for bound, operator in ((start, ">="), (end, "<=")):
+        if bound:
+            where.append(f"s.date {operator} ?")
+            params.append(bound)
+    for name, value in filters.items():
+        if name == "tag":
+            where.append("EXISTS (SELECT 1 FROM split_tags f WHERE f.journal_id = s.journal_id AND f.tag = ? COLLATE NOCASE)")
+        elif name in _FILTERS:
+            where.append(f"{_FILTERS[name]} = ? COLLATE NOCASE")
+        else:
+            raise ValidationError(f"Cannot filter on '{name}', expected some of: {', '.join([*_FILTERS, 'tag'])}")
+        params.append(value)
+
+    keys = ([("period", PERIODS[period])] if period else []) + [(dimension, DIMENSIONS[dimension]) for dimension in group_by]
+    keys.append(("currency_code", "s.currency_code"))
+    columns = [f"MAX({expression})" if name in _GROUP_KEYS else expression for name, expression in keys]
+    grouping = [_GROUP_KEYS.get(name, str(index)) for index, (name, _) in enumerate(keys, 1)]
+    # Splits without tags still count once, under a null tag
+    join = "LEFT JOIN split_tags t ON t.journal_id = s.journal_id" if "tag" in group_by else ""
+    rows = store.query(
+        f"SELECT {', '.join(columns)}, SUM({amount}), COUNT(*), MAX(s.decimal_places) "
+        f"FROM splits s {join} WHERE {' AND '.join(where)} GROUP BY {', '.join(grouping)}",
+        params,
+    )
+
+    # Each period in order, largest amounts first
+    rows.sort(key=lambda row: (row[0] or "" if period else "", -row[len(keys)]))
+    data = [_row(keys, row) for row in rows]
+    if limit is not None:
+        data = _top_per_period(data, limit)
+
+    # Totals come from the splits themselves, so tagged splits are not double counted
+    totals = store.query(
+        f"SELECT s.currency_code, SUM({amount}), COUNT(*), MAX(s.decimal_places) FROM splits s "
+        f"WHERE {' AND '.join(where)} GROUP BY 1 ORDER BY 1",
+        params,
+    )
+
+    return {
+        "data": data,
+        "meta": {
+            "group_by": list(group_by),
+            "period": period,
+            "type": type,
+            "start": start,
+            "end": end,
+            "filters": filters,
+            "totals": [
+                {"currency_code": currency, "total": from_minor_units(minor, places), "count": count}
+                for currency, minor, count, places in totals
+            ],
+        },
+    }
+
+
+def _row(keys: List[Tuple[str, str]], values: Tuple[Any, ...]) -> Dict[str, Any]:
+    row = {name: value for (name, _), value in zip(keys, values)}
+    minor, count, places = values[len(keys):]
+    row.update(total=from_minor_units(minor, places), count=count)
+    return row
+
+
+def _top_per_period(data: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    kept: List[Dict[str, Any]] = []
+    seen: Dict[Any, int] = {}
+    for item in data:
+        period = item.get("period")
+        seen[period] = seen.get(period, 0) + 1
+        if seen[period] <= limit:
+            kept.append(item)
+    return kept
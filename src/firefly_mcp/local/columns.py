@@ -0,0 +1,297 @@
+"""Compact column-oriented container for transaction splits.
+
+A validated ``TransactionRead`` with its ``TransactionSplit`` objects costs
+kilobytes per transaction, which rules out holding years of history in
+memory. ``TransactionColumns`` keeps one typed ``array`` per attribute
+instead:
+
+- ids, dates (proleptic ordinals) and amounts (integer minor units) as
+  machine integers
+- repeated strings (type, currency, names) as integer codes into a per-column
+  ``StringPool`` (source and destination names share one pool of accounts)
+- tags as a flattened code array with per-split offsets
+
+That is well under a hundred bytes per split. The container is built straight
+from ``/transactions`` JSON pages, so no models are created at all, and it
+supports the filter/group operations needed for analysis. ``to_numpy`` exposes
+the columns as NumPy arrays without copying when NumPy is installed.
+"""
+
+from array import array
+from datetime import date
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.local.store import decimal_places, from_minor_units, to_minor_units
+
+# Integer columns and their ``array`` typecodes; -1 marks a missing id.
+INT_COLUMNS: Dict[str, str] = {
+    "group_id": "q",
+    "journal_id": "q",
+    "date": "i",
+    "amount": "q",
+    "decimal_places": "b",
+    "source_id": "i",
+    "destination_id": "i",
+    "category_id": "i",
+    "budget_id": "i",
+}
+
+# String columns stored as codes into a per-column pool; -1 marks None.
+STRING_COLUMNS: Tuple[str, ...] = (
+    "type", "currency_code", "description", "source_name", "destination_name", "category_name", "budget_name",
+)
+
+# Period -> function mapping a date to its label (weeks start on Monday).
+PERIOD_LABELS: Dict[str, Callable[[date], str]] = {
+    "day": lambda day: day.isoformat(),
+    "week": lambda day: date.fromordinal(day.toordinal() - day.weekday()).isoformat(),
+    "month": lambda day: f"{day.year:04d}-{day.month:02d}",
+    "quarter": lambda day: f"{day.year:04d}-Q{(day.month + 2) // 3}",
+    "year": lambda day: f"{day.year:04d}",
+}
+
+GROUP_KEYS = ("category", "budget", "account", "counterparty", "tag", "type")
+
+
+class StringPool:
+    """Interns strings as dense integer codes."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        """Code for ``value`` (-1 for None), adding it to the pool if new."""
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: Optional[str], ignore_case: bool = False) -> List[int]:
+        """Codes matching ``value`` without adding it."""
+        if not ignore_case:
+            return [self._codes[value]] if value in self._codes else []
+        folded = (value or "").casefold()
+        return [code for code, candidate in enumerate(self.values) if candidate.casefold() == folded]
+
+    def get(self, code: int) -> Optional[str]:
+        """String for ``code``."""
+        return None if code < 0 else self.values[code]
+
+
+def _id(value: Any) -> int:
+    return -1 if value in (None, "") else int(value)
+
+
+class TransactionColumns:
+    """Column-oriented transaction splits backed by ``array.array``."""
+
+    def __init__(self, pools: Optional[Dict[str, StringPool]] = None):
+        self.columns: Dict[str, array] = {name: array(code) for name, code in INT_COLUMNS.items()}
+        self.columns.update((name, array("i")) for name in STRING_COLUMNS)
+        self.tag_offsets = array("I", [0])
+        self.tag_codes = array("i")
+        if pools is None:
+            pools = {name: StringPool() for name in (*STRING_COLUMNS, "tags")}
+            pools["source_name"] = pools["destination_name"] = StringPool()
+        self.pools: Dict[str, StringPool] = pools
+
+    def __len__(self) -> int:
+        return len(self.columns["amount"])
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Dict[str, Any]]) -> "TransactionColumns":
+        """Build the container from ``/transactions`` JSON:API payloads."""
+        columns = cls()
+        for page in pages:
+            columns.extend_page(page)
+        return columns
+
+    @classmethod
+    async def from_async_pages(cls, pages: AsyncIterator[Dict[str, Any]]) -> "TransactionColumns":
+        """Build the container while streaming pages, e.g. from ``iter_pages``."""
+        columns = cls()
+        async for page in pages:
+            columns.extend_page(page)
+        return columns
+
+    def extend_page(self, page: Dict[str, Any]) -> None:
+        """Append every split of a ``/transactions`` payload."""
+        for group in page.get("data") or []:
+            group_id = _id(group.get("id"))
+            for split in (group.get("attributes") or {}).get("transactions") or []:
+                self.append_split(group_id, split)
+
+    def append_split(self, group_id: int, split: Dict[str, Any]) -> None:
+        """Append one split of a transaction group."""
+        places = decimal_places(split)
+        values = {
+            "group_id": group_id,
+            "journal_id": _id(split.get("transaction_journal_id")),
+            "date": date.fromisoformat(str(split["date"])[:10]).toordinal(),
+            "amount": to_minor_units(split.get("amount"), places) or 0,
+            "decimal_places": places,
+            "source_id": _id(split.get("source_id")),
+            "destination_id": _id(split.get("destination_id")),
+            "category_id": _id(split.get("category_id")),
+            "budget_id": _id(split.get("budget_id")),
+        }
+        for name, value in values.items():
+            self.columns[name].append(value)
+        for name in STRING_COLUMNS:
+            self.columns[name].append(self.pools[name].code(split.get(name)))
+        tags = self.pools["tags"]
+        self.tag_codes.extend(tags.code(tag) for tag in dict.fromkeys(split.get("tags") or []))
+        self.tag_offsets.append(len(self.tag_codes))
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the column arrays (pools excluded)."""
+        arrays = [*self.columns.values(), self.tag_offsets, self.tag_codes]
+        return sum(len(column) * column.itemsize for column in arrays)
+
+    def tags(self, index: int) -> List[str]:
+        """Tag names of the split at ``index``."""
+        pool = self.pools["tags"]
+        return [pool.values[code] for code in self.tag_codes[self.tag_offsets[index]:self.tag_offsets[index + 1]]]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """The split at ``index`` as a plain dict."""
+        row: Dict[str, Any] = {name: self.columns[name][index] for name in INT_COLUMNS}
+        row["date"] = date.fromordinal(row["date"]).isoformat()
+        row["amount"] = from_minor_units(row["amount"], row.pop("decimal_places"))
+        row.update((name, self.pools[name].get(self.columns[name][index])) for name in STRING_COLUMNS)
+        row["tags"] = self.tags(index)
+        return row
+
+    def take(self, indices: Sequence[int]) -> "TransactionColumns":
+        """New container with the splits at ``indices``, sharing the string pools."""
+        taken = TransactionColumns(self.pools)
+        for name, column in self.columns.items():
+            taken.columns[name] = array(column.typecode, [column[index] for index in indices])
+        for index in indices:
+            taken.tag_codes.extend(self.tag_codes[self.tag_offsets[index]:self.tag_offsets[index + 1]])
+            taken.tag_offsets.append(len(taken.tag_codes))
+        return taken
+
+    def filter(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        type: Optional[str] = None,
+        category: Optional[str] = None,
+        budget: Optional[str] = None,
+        account: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> "TransactionColumns":
+        """Splits matching every given condition; names are compared case-insensitively."""
+        indices: Iterable[int] = range(len(self))
+        dates = self.columns["date"]
+        if start:
+            first = date.fromisoformat(start).toordinal()
+            indices = [index for index in indices if dates[index] >= first]
+        if end:
+            last = date.fromisoformat(end).toordinal()
+            indices = [index for index in indices if dates[index] <= last]
+        for column, value in (("type", type), ("category_name", category), ("budget_name", budget)):
+            if value:
+                codes, values = set(self.pools[column].lookup(value, ignore_case=True)), self.columns[column]
+                indices = [index for index in indices if values[index] in codes]
+        if account:
+            codes, accounts = set(self.pools["source_name"].lookup(account, ignore_case=True)), self._account_codes()
+            indices = [index for index in indices if accounts[index] in codes]
+        if tag:
+            codes = set(self.pools["tags"].lookup(tag, ignore_case=True))
+            offsets = self.tag_offsets
+            indices = [
+                index for index in indices
+                if codes.intersection(self.tag_codes[offsets[index]:offsets[index + 1]])
+            ]
+        return self.take(list(indices))
+
+    def group_sum(self, by: Optional[str] = "category", period: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Sum amounts per ``by`` key, period and currency.
+
+        ``by`` is one of ``GROUP_KEYS`` (or None for periods only); rows come
+        back per period, largest totals first. Splits with several tags count
+        once for each of them.
+        """
+        if by is not None and by not in GROUP_KEYS:
+            raise ValidationError(f"Cannot group by '{by}', expected one of: {', '.join(GROUP_KEYS)}")
+        if period is not None and period not in PERIOD_LABELS:
+            raise ValidationError(f"Unknown period '{period}', expected one of: {', '.join(PERIOD_LABELS)}")
+
+        amounts, currencies = self.columns["amount"], self.columns["currency_code"]
+        keys = self._key_codes(by)
+        labels = self._period_labels(period)
+        sums: Dict[Tuple[Optional[str], int, int], List[int]] = {}
+        for index in range(len(self)):
+            for key in keys(index):
+                bucket = sums.setdefault((labels(index), key, currencies[index]), [0, 0, self.columns["decimal_places"][index]])
+                bucket[0] += amounts[index]
+                bucket[1] += 1
+
+        rows = []
+        for (label, key, currency), (total, count, places) in sums.items():
+            row: Dict[str, Any] = {"period": label} if period else {}
+            if by is not None:
+                row[by] = self._key_name(by, key)
+            row.update(currency_code=self.pools["currency_code"].get(currency), total=from_minor_units(total, places),
+                       count=count, _minor=total)
+            rows.append(row)
+        rows.sort(key=lambda row: (row.get("period") or "", -row["_minor"]))
+        for row in rows:
+            del row["_minor"]
+        return rows
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Zero-copy NumPy views of every column (requires NumPy)."""
+        try:
+            import numpy
+        except ImportError as e:  # pragma: no cover - numpy is optional
+            raise ImportError("TransactionColumns.to_numpy requires numpy (pip install numpy)") from e
+        arrays = {**self.columns, "tag_offsets": self.tag_offsets, "tag_codes": self.tag_codes}
+        return {name: numpy.frombuffer(column, dtype=column.typecode) for name, column in arrays.items()}
+
+    def _account_codes(self, counterparty: bool = False) -> List[int]:
+        """Account name code of the asset side (or the other side) of every split."""
+        deposits = set(self.pools["type"].lookup("deposit"))
+        types, sources, destinations = self.columns["type"], self.columns["source_name"], self.columns["destination_name"]
+        return [
+            sources[i] if (types[i] in deposits) == counterparty else destinations[i]
+            for i in range(len(self))
+        ]
+
+    def _key_codes(self, by: Optional[str]) -> Callable[[int], Iterable[Any]]:
+        if by is None:
+            return lambda index: (None,)
+        if by == "tag":
+            offsets = self.tag_offsets
+            return lambda index: self.tag_codes[offsets[index]:offsets[index + 1]] or (-1,)
+        if by in ("account", "counterparty"):
+            accounts = self._account_codes(counterparty=by == "counterparty")
+            return lambda index: (accounts[index],)
+        column = self.columns[_KEY_COLUMNS[by]]
+        return lambda index: (column[index],)
+
+    def _key_name(self, by: str, key: int) -> Optional[str]:
+        return self.pools[_KEY_POOLS[by]].get(key)
+
+    def _period_labels(self, period: Optional[str]) -> Callable[[int], Optional[str]]:
+        if period is None:
+            return lambda index: None
+        dates, label, cache = self.columns["date"], PERIOD_LABELS[period], {}
+
+        def _label(index: int) -> str:
+            ordinal = dates[index]
+            if ordinal not in cache:
+                cache[ordinal] = label(date.fromordinal(ordinal))
+            return cache[ordinal]
+        return _label
+
+
+_KEY_COLUMNS = {"category": "category_name", "budget": "budget_name", "type": "type"}
+_KEY_POOLS = {**_KEY_COLUMNS, "tag": "tags", "account": "source_name", "counterparty": "source_name"}
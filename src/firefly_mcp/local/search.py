@@ -0,0 +1,118 @@
+"""Full-text search over the local transaction mirror.
+
+Descriptions, notes, external ids and the source/destination (counterparty)
+names of every split are indexed with SQLite FTS5. Each word of the query
+must match, as a whole word or a word prefix ("netfl" finds "Netflix"), and
+results are ranked with BM25, weighting description and counterparty matches
+above notes. When SQLite lacks FTS5 the same query runs as ``LIKE`` filters
+and results are ordered by date instead.
+"""
+
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.local.store import SEARCH_COLUMNS, LocalStore, from_minor_units
+
+# BM25 weight of each column in ``SEARCH_COLUMNS`` order.
+BM25_WEIGHTS: Tuple[float, ...] = (10.0, 2.0, 5.0, 4.0, 4.0)
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+_RESULT_COLUMNS = (
+    "s.journal_id", "s.group_id", "s.date", "s.type", "s.amount", "s.decimal_places", "s.currency_code",
+    "s.description", "s.source_name", "s.destination_name", "s.category_name", "s.notes", "s.external_id",
+)
+
+
+def match_expression(query: str) -> str:
+    """FTS5 query requiring every word of ``query`` as a word or prefix."""
+    words = _WORD.findall(query)
+    if not words:
+        raise ValidationError("Search query must contain at least one word")
+    # Quoting makes FTS5 operators and punctuation in user input literal
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def search(
+    store: LocalStore,
+    query: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    type: Optional[str] = None,
+    limit: int = 25,
+) -> Dict[str, Any]:
+    """Find splits matching ``query``, best matches first.
+
+    Args:
+        store: Mirror to search
+        query: Words to look for in descriptions, notes, external ids and counterparty names
+        start: First date (YYYY-MM-DD) included
+        end: Last date (YYYY-MM-DD) included
+        type: Only this transaction type (withdrawal, deposit, transfer)
+        limit: Maximum number of results
+
+    Returns:
+        Dict[str, Any]: ``{"data": matching splits, "meta": {"query", "ranking", "took_ms", ...}}``
+    """
+    started = time.perf_counter()
+    expression = match_expression(query)
+    where: List[str] = []
+    params: List[Any] = []
+    for condition, value in (("s.date >= ?", start), ("s.date <= ?", end), ("s.type = ?", type)):
+        if value:
+            where.append(condition)
+            params.append(value)
+
+    if store.fts:
+        ranking = "bm25"
+        sql = (
+            f"SELECT {', '.join(_RESULT_COLUMNS)}, bm25(splits_fts, {', '.join(map(str, BM25_WEIGHTS))}) AS score "
+            f"FROM splits_fts JOIN splits s ON s.rowid = splits_fts.rowid "
+            f"WHERE splits_fts MATCH ? {''.join(f' AND {condition}' for condition in where)} "
+            f"ORDER BY score LIMIT ?"
+        )
+        rows = store.query(sql, [expression, *params, limit])
+    else:
+        ranking = "date"
+        for word in _WORD.findall(query):
+            where.append("(" + " OR ".join(f"s.{column} LIKE ?" for column in SEARCH_COLUMNS) + ")")
+            params.extend([f"%{word}%"] * len(SEARCH_COLUMNS))
+        sql = (
+            f"SELECT {', '.join(_RESULT_COLUMNS)}, NULL FROM splits s WHERE {' AND '.join(where)} "
+            f"ORDER BY s.date DESC LIMIT ?"
+        )
+        rows = store.query(sql, [*params, limit])
+
+    return {
+        "data": [_result(row) for row in rows],
+        "meta": {
+            "query": query,
+            "match": expression,
+            "ranking": ranking,
+            "count": len(rows),
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        },
+    }
+
+
+def _result(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    (journal_id, group_id, day, type, amount, places, currency, description,
+     source, destination, category, notes, external_id, score) = row
+    return {
+        "journal_id": journal_id,
+        "group_id": group_id,
+        "date": day,
+        "type": type,
+        "amount": from_minor_units(amount, places),
+        "currency_code": currency,
+        "description": description,
+        "source_name": source,
+        "destination_name": destination,
+        "category_name": category,
+        "notes": notes,
+        "external_id": external_id,
+        # bm25() is lower for better matches; report higher-is-better scores
+        "score": None if score is None else float(f"{-score:.4g}"),
+    }
@@ -0,0 +1,352 @@
+"""Local SQLite mirror of Firefly III transactions and reference data.
+
+Analytical questions ("what did I spend on groceries each month?") would
+otherwise re-paginate ``/transactions`` on every call. The mirror keeps one
+row per transaction split, with amounts stored as integer minor units so sums
+are exact, plus the accounts, categories, budgets and tags they reference.
+It is filled and refreshed by :mod:`firefly_mcp.local.sync`.
+
+The database lives in memory for the lifetime of the server unless
+``FIREFLY_LOCAL_DB_PATH`` points at a file, in which case it survives
+restarts and later syncs only fetch recent changes.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from firefly_mcp.core.cache import add_invalidation_listener
+from firefly_mcp.lib import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Reference entities mirrored next to transactions, with their list endpoints.
+REFERENCE_PATHS: Dict[str, str] = {
+    "account": "/accounts",
+    "category": "/categories",
+    "budget": "/budgets",
+    "tag": "/tags",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transaction_groups (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    date TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS transaction_groups_date ON transaction_groups (date);
+
+CREATE TABLE IF NOT EXISTS splits (
+    journal_id TEXT PRIMARY KEY,
+    group_id TEXT NOT NULL REFERENCES transaction_groups (id) ON DELETE CASCADE,
+    type TEXT NOT NULL,
+    date TEXT NOT NULL,
+    datetime TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    decimal_places INTEGER NOT NULL,
+    currency_code TEXT,
+    foreign_amount INTEGER,
+    foreign_currency_code TEXT,
+    description TEXT,
+    notes TEXT,
+    source_id TEXT,
+    source_name TEXT,
+    source_type TEXT,
+    destination_id TEXT,
+    destination_name TEXT,
+    destination_type TEXT,
+    category_id TEXT,
+    category_name TEXT,
+    budget_id TEXT,
+    budget_name TEXT,
+    bill_id TEXT,
+    bill_name TEXT,
+    tags TEXT NOT NULL,
+    external_id TEXT,
+    internal_reference TEXT,
+    reconciled INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS splits_group ON splits (group_id);
+CREATE INDEX IF NOT EXISTS splits_date ON splits (date);
+CREATE INDEX IF NOT EXISTS splits_category ON splits (category_id);
+CREATE INDEX IF NOT EXISTS splits_budget ON splits (budget_id);
+
+CREATE TABLE IF NOT EXISTS split_tags (
+    journal_id TEXT NOT NULL REFERENCES splits (journal_id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (journal_id, tag)
+);
+CREATE INDEX IF NOT EXISTS split_tags_tag ON split_tags (tag);
+
+CREATE TABLE IF NOT EXISTS entities (
+    entity TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    type TEXT,
+    updated_at TEXT,
+    attributes TEXT NOT NULL,
+    PRIMARY KEY (entity, id)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Full-text index over split text, kept in sync with ``splits`` by triggers.
+# ``splits`` rows are only ever inserted and deleted, never updated.
+SEARCH_COLUMNS: Tuple[str, ...] = ("description", "notes", "external_id", "source_name", "destination_name")
+
+_FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS splits_fts USING fts5 (
+    {", ".join(SEARCH_COLUMNS)},
+    content='splits', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS splits_fts_insert AFTER INSERT ON splits BEGIN
+    INSERT INTO splits_fts (rowid, {", ".join(SEARCH_COLUMNS)})
+    VALUES (new.rowid, {", ".join(f"new.{column}" for column in SEARCH_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS splits_fts_delete AFTER DELETE ON splits BEGIN
+    INSERT INTO splits_fts (splits_fts, rowid, {", ".join(SEARCH_COLUMNS)})
+    VALUES ('delete', old.rowid, {", ".join(f"old.{column}" for column in SEARCH_COLUMNS)});
+END;
+"""
+
+# Split attributes copied verbatim into columns of the same name.
+_SPLIT_TEXT_COLUMNS = (
+    "currency_code", "foreign_currency_code", "description", "notes",
+    "source_id", "source_name", "source_type", "destination_id", "destination_name", "destination_type",
+    "category_id", "category_name", "budget_id", "budget_name", "bill_id", "bill_name",
+    "external_id", "internal_reference",
+)
+_SPLIT_COLUMNS = (
+    "journal_id", "group_id", "type", "date", "datetime", "amount", "decimal_places", "foreign_amount",
+    *_SPLIT_TEXT_COLUMNS, "tags", "reconciled",
+)
+
+
+def to_minor_units(amount: Any, decimal_places: int) -> Optional[int]:
+    """Convert a Firefly amount string such as ``"12.50"`` into integer minor units."""
+    if amount is None or amount == "":
+        return None
+    scaled = Decimal(str(amount)).scaleb(decimal_places)
+    return int(scaled.quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+
+def from_minor_units(amount: int, decimal_places: int) -> str:
+    """Format integer minor units back into a decimal amount string."""
+    return f"{Decimal(amount).scaleb(-decimal_places):.{decimal_places}f}"
+
+
+def decimal_places(split: Dict[str, Any], key: str = "currency_decimal_places", default: int = 2) -> int:
+    """Decimal places given under ``key`` of a split, or ``default`` when missing.
+
+    Zero is a valid value (JPY, KRW), so only a missing value falls back.
+    """
+    places = split.get(key)
+    return default if places is None else int(places)
+
+
+def split_row(group_id: str, split: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Column values of the ``splits`` table for one split of a transaction group."""
+    places = decimal_places(split)
+    datetime = str(split.get("date") or "")
+    values: Dict[str, Any] = {
+        "journal_id": str(split.get("transaction_journal_id")),
+        "group_id": group_id,
+        "type": split.get("type") or "",
+        "date": datetime[:10],
+        "datetime": datetime,
+        "amount": to_minor_units(split.get("amount"), places) or 0,
+        "decimal_places": places,
+        "foreign_amount": to_minor_units(split.get("foreign_amount"), decimal_places(split, "foreign_currency_decimal_places", places)),
+        "tags": json.dumps(split.get("tags") or []),
+        "reconciled": int(bool(split.get("reconciled"))),
+    }
+    for column in _SPLIT_TEXT_COLUMNS:
+        value = split.get(column)
+        values[column] = None if value is None else str(value)
+    return tuple(values[column] for column in _SPLIT_COLUMNS)
+
+
+class LocalStore:
+    """SQLite mirror of transaction splits and reference entities."""
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        # Set when a write through this server changed transactions since the last sync
+        self.dirty = False
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(_SCHEMA)
+        self.fts = self._create_search_index()
+
+    def group_versions(self, group_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Stored ``updated_at`` of the given transaction groups that exist locally."""
+        ids = list(group_ids)
+        if not ids:
+            return {}
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id, updated_at FROM transaction_groups WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+        return dict(rows)
+
+    def upsert_groups(self, groups: Sequence[Dict[str, Any]]) -> int:
+        """Store JSON:API transaction groups, rewriting only those whose ``updated_at`` changed.
+
+        Returns the number of groups written.
+        """
+        known = self.group_versions(str(group["id"]) for group in groups)
+        changed = [
+            group for group in groups
+            if str(group["id"]) not in known or known[str(group["id"])] != (group.get("attributes") or {}).get("updated_at")
+        ]
+        if not changed:
+            return 0
+
+        group_rows, split_rows, tag_rows = [], [], []
+        for group in changed:
+            group_id = str(group["id"])
+            attributes = group.get("attributes") or {}
+            splits = attributes.get("transactions") or []
+            group_rows.append((
+                group_id, attributes.get("group_title"), str((splits[0].get("date") if splits else "") or "")[:10],
+                attributes.get("created_at"), attributes.get("updated_at"),
+            ))
+            for split in splits:
+                row = split_row(group_id, split)
+                split_rows.append(row)
+                tag_rows.extend((row[0], tag) for tag in dict.fromkeys(split.get("tags") or []))
+
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            # Deleting the group cascades to its splits and tags, dropping removed splits too
+            self._db.executemany("DELETE FROM transaction_groups WHERE id = ?", [(row[0],) for row in group_rows])
+            self._db.executemany("INSERT INTO transaction_groups VALUES (?, ?, ?, ?, ?)", group_rows)
+            self._db.executemany(
+                f"INSERT INTO splits ({', '.join(_SPLIT_COLUMNS)}) VALUES ({', '.join('?' * len(_SPLIT_COLUMNS))})",
+                split_rows,
+            )
+            self._db.executemany("INSERT INTO split_tags VALUES (?, ?)", tag_rows)
+        return len(changed)
+
+    def delete_groups_missing(self, start: Optional[str], seen: Set[str]) -> int:
+        """Delete groups dated on or after ``start`` (or all groups) that are not in ``seen``."""
+        return self.delete_groups(self.missing_groups(start, seen))
+
+    def missing_groups(self, start: Optional[str], seen: Set[str]) -> List[str]:
+        """IDs of stored groups dated on or after ``start`` (or of all groups) that are not in ``seen``."""
+        with self._lock:
+            if start is None:
+                stored = self._db.execute("SELECT id FROM transaction_groups").fetchall()
+            else:
+                stored = self._db.execute("SELECT id FROM transaction_groups WHERE date >= ?", (start,)).fetchall()
+        return [group_id for (group_id,) in stored if group_id not in seen]
+
+    def delete_groups(self, group_ids: Sequence[str]) -> int:
+        """Delete the given groups with their splits and tags."""
+        if not group_ids:
+            return 0
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany("DELETE FROM transaction_groups WHERE id = ?", [(group_id,) for group_id in group_ids])
+        return len(group_ids)
+
+    def replace_entities(self, entity: str, resources: Sequence[Dict[str, Any]]) -> int:
+        """Replace every stored resource of ``entity`` with the given JSON:API resources."""
+        rows = []
+        for resource in resources:
+            attributes = resource.get("attributes") or {}
+            rows.append((
+                entity, str(resource["id"]), attributes.get("name") or attributes.get("tag"),
+                attributes.get("type"), attributes.get("updated_at"), json_codec.dumps(attributes).decode(),
+            ))
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.execute("DELETE FROM entities WHERE entity = ?", (entity,))
+            self._db.executemany("INSERT INTO entities VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def get_state(self, name: str) -> Optional[Dict[str, Any]]:
+        """Stored sync state called ``name``, if any."""
+        with self._lock:
+            row = self._db.execute("SELECT value FROM sync_state WHERE name = ?", (name,)).fetchone()
+        return json_codec.loads(row[0]) if row else None
+
+    def set_state(self, name: str, value: Dict[str, Any]) -> None:
+        """Persist sync state under ``name``."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (name, json_codec.dumps(value).decode())
+            )
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        """Run a read-only query against the mirror and return all rows."""
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def summary(self) -> Dict[str, Any]:
+        """Row counts, covered date range and sync state."""
+        with self._lock:
+            groups, splits, first, last = self._db.execute(
+                "SELECT (SELECT COUNT(*) FROM transaction_groups), COUNT(*), MIN(date), MAX(date) FROM splits"
+            ).fetchone()
+            entities = dict(self._db.execute("SELECT entity, COUNT(*) FROM entities GROUP BY entity").fetchall())
+        return {
+            "path": self.path,
+            "transaction_groups": groups,
+            "splits": splits,
+            "first_date": first,
+            "last_date": last,
+            "entities": entities,
+            "sync": self.get_state("transactions"),
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def _create_search_index(self) -> bool:
+        """Create the FTS5 index, returning False if SQLite was built without FTS5."""
+        exists = self._db.execute("SELECT 1 FROM sqlite_master WHERE name = 'splits_fts'").fetchone()
+        try:
+            self._db.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 unavailable, local search falls back to LIKE: {e}")
+            return False
+        if not exists:
+            # Index splits stored before the index existed
+            self._db.execute("INSERT INTO splits_fts (splits_fts) VALUES ('rebuild')")
+        return True
+
+
+_store: Optional[LocalStore] = None
+
+
+def get_local_store() -> LocalStore:
+    """The process-wide mirror, opened on first use from ``FIREFLY_LOCAL_DB_PATH``."""
+    global _store
+    if _store is None:
+        _store = LocalStore(os.environ.get("FIREFLY_LOCAL_DB_PATH", "").strip() or ":memory:")
+    return _store
+
+
+def _mark_dirty(pattern: str) -> None:
+    """Flag the open mirror as stale when a write invalidates transaction paths."""
+    if _store is not None and pattern.startswith("/transactions"):
+        _store.dirty = True
+
+
+add_invalidation_listener(_mark_dirty)
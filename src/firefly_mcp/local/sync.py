@@ -0,0 +1,193 @@
+"""Incremental synchronisation of the local mirror with Firefly III.
+
+The first sync (or one with ``full=True``) pages through ``/transactions``
+from an optional start date. Later syncs only re-fetch a window that begins
+``lookback_days`` before the previous sync, which covers new transactions and
+recent edits. Within the fetched window, groups whose ``updated_at`` did not
+change are not rewritten. Stored groups that Firefly no longer returns for the
+window are fetched one by one: deleted ones are removed, while groups whose
+date was moved before the window are stored with their new date.
+
+The window is date-based, so edits and deletions of transactions dated before
+it are missed by incremental syncs. Every ``RECONCILE_DAYS`` an incremental
+sync is therefore promoted to a full one. Reference entities are small and are
+re-listed in full on every sync, concurrently with the transaction pages.
+
+Store writes, including the search index triggers they fire, run in a worker
+thread one batch at a time. The event loop therefore keeps serving other tool
+calls while a large history is mirrored.
+"""
+
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from firefly_mcp.core.pagination import fetch_all_pages, iter_pages
+from firefly_mcp.lib.env import parse_float_env, parse_int_env
+from firefly_mcp.lib.exceptions import FireflyAPIError
+from firefly_mcp.lib.http_client import get_json
+from firefly_mcp.local.store import REFERENCE_PATHS, LocalStore
+
+# Days re-fetched before the previous sync date to pick up late edits.
+DEFAULT_LOOKBACK_DAYS = 30
+
+# Transaction groups requested per page while syncing.
+SYNC_PAGE_SIZE = 200
+
+# Days after which an incremental sync becomes a full one, picking up edits
+# and deletions of transactions dated before the lookback window.
+RECONCILE_DAYS = parse_int_env("FIREFLY_LOCAL_RECONCILE_DAYS", 7)
+
+# Seconds after which operations reading the mirror run an incremental sync first.
+MAX_AGE_SECONDS = parse_float_env("FIREFLY_LOCAL_MAX_AGE", 300.0)
+
+# Groups missing from a windowed fetch that are re-fetched concurrently.
+RECHECK_CONCURRENCY = 4
+
+_STATE = "transactions"
+
+
+async def sync_store(
+    http_client: httpx.AsyncClient,
+    store: LocalStore,
+    start: Optional[str] = None,
+    full: bool = False,
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+    today: Optional[date] = None,
+) -> Dict[str, Any]:
+    """Bring ``store`` up to date with Firefly III and report what changed.
+
+    Args:
+        http_client: Client used for the requests
+        store: Mirror to update
+        start: Oldest date (YYYY-MM-DD) to mirror on a full sync; everything if omitted
+        full: Re-fetch the whole mirrored range instead of the recent window
+        lookback_days: Days before the previous sync that an incremental sync re-fetches
+        today: Sync date, for tests
+
+    Returns:
+        Dict[str, Any]: Sync mode, fetched window and row counts
+    """
+    started = time.perf_counter()
+    today = today or date.today()
+    # Writes made while this sync runs mark the mirror dirty again
+    store.dirty = False
+    state = store.get_state(_STATE)
+    if full or state is None:
+        mode, mirror_start, window_start = "full", start, start
+    elif _reconcile_due(state, today):
+        mode, mirror_start = "full", state.get("start")
+        window_start = mirror_start
+    else:
+        mode, mirror_start = "incremental", state.get("start")
+        window_start = (date.fromisoformat(state["synced_on"]) - timedelta(days=lookback_days)).isoformat()
+        if mirror_start is not None and window_start < mirror_start:
+            window_start = mirror_start
+
+    transactions, entities = await asyncio.gather(
+        _sync_transactions(http_client, store, window_start, mirror_start),
+        _sync_entities(http_client, store),
+    )
+    await asyncio.to_thread(store.set_state, _STATE, {
+        "synced_on": today.isoformat(),
+        "synced_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "start": mirror_start,
+        "reconciled_on": today.isoformat() if mode == "full" else state.get("reconciled_on"),
+    })
+    return {
+        "mode": mode,
+        "window_start": window_start,
+        **transactions,
+        "entities": entities,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+async def ensure_synced(http_client: httpx.AsyncClient, store: LocalStore, refresh: bool = False) -> Dict[str, Any]:
+    """Sync ``store`` when it is stale and return its sync state.
+
+    The mirror is stale when it was never synced, when ``refresh`` is set,
+    when a write through this server changed transactions since the last
+    sync, or when that sync is older than ``MAX_AGE_SECONDS``.
+    """
+    state = store.get_state(_STATE)
+    if refresh or state is None or store.dirty or _age_seconds(state) >= MAX_AGE_SECONDS:
+        await sync_store(http_client, store)
+        state = store.get_state(_STATE)
+    return state or {}
+
+
+def _age_seconds(state: Dict[str, Any]) -> float:
+    synced_at = datetime.fromisoformat(state["synced_at"])
+    return (datetime.now(timezone.utc) - synced_at).total_seconds()
+
+
+def _reconcile_due(state: Dict[str, Any], today: date) -> bool:
+    reconciled_on = state.get("reconciled_on")
+    return reconciled_on is None or (today - date.fromisoformat(reconciled_on)).days >= RECONCILE_DAYS
+
+
+async def _sync_transactions(
+    http_client: httpx.AsyncClient, store: LocalStore, window_start: Optional[str], mirror_start: Optional[str]
+) -> Dict[str, int]:
+    params: Dict[str, Any] = {"limit": SYNC_PAGE_SIZE}
+    if window_start is not None:
+        params["start"] = window_start
+
+    seen: Set[str] = set()
+    changed = 0
+    async for page in iter_pages(http_client, "/transactions", params):
+        groups = page.get("data") or []
+        seen.update(str(group["id"]) for group in groups)
+        changed += await asyncio.to_thread(store.upsert_groups, groups)
+    missing = await asyncio.to_thread(store.missing_groups, window_start, seen)
+    if missing and window_start is not None:
+        missing, moved = await _recheck_groups(http_client, store, missing, mirror_start)
+        changed += moved
+    deleted = await asyncio.to_thread(store.delete_groups, missing)
+    return {"groups_fetched": len(seen), "groups_changed": changed, "groups_deleted": deleted}
+
+
+async def _recheck_groups(
+    http_client: httpx.AsyncClient, store: LocalStore, group_ids: List[str], mirror_start: Optional[str]
+) -> Tuple[List[str], int]:
+    """Tell deleted groups apart from groups whose date moved out of the window.
+
+    Returns the IDs of groups that no longer exist or now predate the mirror,
+    and the number of moved groups that were stored with their new date.
+    """
+    semaphore = asyncio.Semaphore(RECHECK_CONCURRENCY)
+
+    async def fetch(group_id: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                return (await get_json(http_client, f"/transactions/{group_id}"))["data"]
+            except FireflyAPIError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+
+    groups = await asyncio.gather(*(fetch(group_id) for group_id in group_ids))
+    gone, moved = [], []
+    for group_id, group in zip(group_ids, groups):
+        if group is None or (mirror_start is not None and _group_date(group) < mirror_start):
+            gone.append(group_id)
+        else:
+            moved.append(group)
+    return gone, await asyncio.to_thread(store.upsert_groups, moved)
+
+
+def _group_date(group: Dict[str, Any]) -> str:
+    splits = (group.get("attributes") or {}).get("transactions") or [{}]
+    return str(splits[0].get("date") or "")[:10]
+
+
+async def _sync_entities(http_client: httpx.AsyncClient, store: LocalStore) -> Dict[str, int]:
+    payloads = await asyncio.gather(*(fetch_all_pages(http_client, path, {}) for path in REFERENCE_PATHS.values()))
+    return {
+        entity: await asyncio.to_thread(store.replace_entities, entity, payload.get("data") or [])
+        for entity, payload in zip(REFERENCE_PATHS, payloads)
+    }
@@ -1,9 +1,12 @@
+import asyncio
 import logging
 
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from fastmcp import FastMCP
+from firefly_mcp.lib.http_client import client
+from firefly_mcp.tools.executor import shutdown_executors
 from firefly_mcp.tools.main import create_mcp_server
 from firefly_mcp.models.app import AppContext
 
@@ -16,6 +19,9 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
         yield AppContext()
     finally:
         logging.info("Shutting down...")
+        await client.aclose()
+        # Let running synchronous core functions finish without blocking the loop
+        await asyncio.to_thread(shutdown_executors)
 
 mcp = create_mcp_server(app_lifespan)
 
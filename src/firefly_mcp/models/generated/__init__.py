@@ -0,0 +1 @@
+"""Generated Firefly III API models, split per entity family (see scripts/split_models.py)."""
@@ -0,0 +1,197 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     account (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Account,
+    AccountRoleProperty,
+    CreditCardTypeProperty,
+    InterestPeriodProperty,
+    LiabilityDirectionProperty,
+    LiabilityTypeProperty,
+    Meta,
+    ShortAccountTypeProperty,
+)
+
+
+class AccountSearchFieldFilter(Enum):
+    all = 'all'
+    iban = 'iban'
+    name = 'name'
+    number = 'number'
+    id = 'id'
+
+
+class AccountTypeFilter(Enum):
+    all = 'all'
+    asset = 'asset'
+    cash = 'cash'
+    expense = 'expense'
+    revenue = 'revenue'
+    special = 'special'
+    hidden = 'hidden'
+    liability = 'liability'
+    liabilities = 'liabilities'
+    Default_account = 'Default account'
+    Cash_account = 'Cash account'
+    Asset_account = 'Asset account'
+    Expense_account = 'Expense account'
+    Revenue_account = 'Revenue account'
+    Initial_balance_account = 'Initial balance account'
+    Beneficiary_account = 'Beneficiary account'
+    Import_account = 'Import account'
+    Reconciliation_account = 'Reconciliation account'
+    Loan = 'Loan'
+    Debt = 'Debt'
+    Mortgage = 'Mortgage'
+
+
+class AccountStore(BaseModel):
+    name: str = Field(..., examples=['My checking account'])
+    type: ShortAccountTypeProperty
+    iban: Optional[str] = Field(None, examples=['GB98MIDL07009312345678'])
+    bic: Optional[str] = Field(None, examples=['BOFAUS3N'])
+    account_number: Optional[str] = Field(None, examples=['7009312345678'])
+    opening_balance: Optional[str] = Field(
+        None,
+        description='Represents the opening balance, the initial amount this account holds.',
+        examples=['-1012.12'],
+    )
+    opening_balance_date: Optional[datetime] = Field(
+        None,
+        description='Represents the date of the opening balance.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    virtual_balance: Optional[str] = Field(None, examples=['123.45'])
+    currency_id: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['EUR'],
+    )
+    active: Optional[bool] = Field(
+        True, description='If omitted, defaults to true.', examples=[False]
+    )
+    order: Optional[int] = Field(None, description='Order of the account', examples=[1])
+    include_net_worth: Optional[bool] = Field(
+        True, description='If omitted, defaults to true.', examples=[True]
+    )
+    account_role: Optional[AccountRoleProperty] = None
+    credit_card_type: Optional[CreditCardTypeProperty] = None
+    monthly_payment_date: Optional[datetime] = Field(
+        None,
+        description='Mandatory when the account_role is ccAsset. Moment at which CC payment installments are asked for by the bank.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    liability_type: Optional[LiabilityTypeProperty] = None
+    liability_direction: Optional[LiabilityDirectionProperty] = None
+    interest: Optional[str] = Field(
+        '0',
+        description='Mandatory when type is liability. Interest percentage.',
+        examples=['5.3'],
+    )
+    interest_period: Optional[InterestPeriodProperty] = None
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    latitude: Optional[float] = Field(
+        None,
+        description="Latitude of the accounts's location, if applicable. Can be used to draw a map.",
+        examples=[51.983333],
+    )
+    longitude: Optional[float] = Field(
+        None,
+        description="Latitude of the accounts's location, if applicable. Can be used to draw a map.",
+        examples=[5.916667],
+    )
+    zoom_level: Optional[int] = Field(
+        None,
+        description='Zoom level for the map, if drawn. This to set the box right. Unfortunately this is a proprietary value because each map provider has different zoom levels.',
+        examples=[6],
+    )
+
+
+class AccountUpdate(BaseModel):
+    name: str = Field(..., examples=['My checking account'])
+    iban: Optional[str] = Field(None, examples=['GB98MIDL07009312345678'])
+    bic: Optional[str] = Field(None, examples=['BOFAUS3N'])
+    account_number: Optional[str] = Field(None, examples=['7009312345678'])
+    opening_balance: Optional[str] = Field(None, examples=['-1012.12'])
+    opening_balance_date: Optional[datetime] = Field(
+        None, examples=['2018-09-17T12:46:47+01:00']
+    )
+    virtual_balance: Optional[str] = Field(None, examples=['123.45'])
+    currency_id: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['EUR'],
+    )
+    active: Optional[bool] = Field(
+        True, description='If omitted, defaults to true.', examples=[False]
+    )
+    order: Optional[int] = Field(None, description='Order of the account', examples=[1])
+    include_net_worth: Optional[bool] = Field(
+        True, description='If omitted, defaults to true.', examples=[True]
+    )
+    account_role: Optional[AccountRoleProperty] = None
+    credit_card_type: Optional[CreditCardTypeProperty] = None
+    monthly_payment_date: Optional[datetime] = Field(
+        None,
+        description='Mandatory when the account_role is ccAsset. Moment at which CC payment installments are asked for by the bank.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    liability_type: Optional[LiabilityTypeProperty] = None
+    interest: Optional[str] = Field(
+        None,
+        description='Mandatory when type is liability. Interest percentage.',
+        examples=['5.3'],
+    )
+    interest_period: Optional[InterestPeriodProperty] = None
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    latitude: Optional[float] = Field(
+        None,
+        description="Latitude of the account's location, if applicable. Can be used to draw a map. If omitted, the existing location will be kept. If submitted as NULL, the current location will be removed.",
+        examples=[51.983333],
+    )
+    longitude: Optional[float] = Field(
+        None,
+        description="Latitude of the account's location, if applicable. Can be used to draw a map. If omitted, the existing location will be kept. If submitted as NULL, the current location will be removed.",
+        examples=[5.916667],
+    )
+    zoom_level: Optional[int] = Field(
+        None,
+        description='Zoom level for the map, if drawn. This to set the box right. Unfortunately this is a proprietary value because each map provider has different zoom levels. If omitted, the existing location will be kept. If submitted as NULL, the current location will be removed.',
+        examples=[6],
+    )
+
+
+class AccountRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['accounts'])
+    id: str = Field(..., examples=['2'])
+    attributes: Account
+
+
+class AccountSingle(BaseModel):
+    data: AccountRead
+
+
+class AccountArray(BaseModel):
+    data: List[AccountRead]
+    meta: Meta
@@ -0,0 +1,85 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     attachment (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    AttachableType,
+    Meta,
+    ObjectLink,
+)
+
+
+class AttachmentUpdate(BaseModel):
+    filename: Optional[str] = Field(None, examples=['file.pdf'])
+    title: Optional[str] = Field(None, examples=['Some PDF file'])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+
+
+class Attachment(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    attachable_type: AttachableType
+    attachable_id: str = Field(
+        ...,
+        description='ID of the model this attachment is linked to.',
+        examples=['134'],
+    )
+    md5: Optional[str] = Field(
+        None,
+        description='MD5 hash of the file for basic duplicate detection. This field is deprecated.',
+        examples=['0c3f95f34370baa88f9fd9a671fea305'],
+    )
+    hash: Optional[str] = Field(
+        None,
+        description="Hash of the file for basic duplicate detection. It's still md5 lol.",
+        examples=['0c3f95f34370baa88f9fd9a671fea305'],
+    )
+    filename: str = Field(..., examples=['file.pdf'])
+    download_url: Optional[str] = Field(
+        None, examples=['https://demo.firefly-iii.org/api/v1/attachments/191/download']
+    )
+    upload_url: Optional[str] = Field(
+        None, examples=['https://demo.firefly-iii.org/api/v1/attachments/191/download']
+    )
+    title: Optional[str] = Field(None, examples=['Some PDF file'])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    mime: Optional[str] = Field(None, examples=['application/pdf'])
+    size: Optional[int] = Field(None, examples=[48211])
+
+
+class AttachmentStore(BaseModel):
+    filename: str = Field(..., examples=['file.pdf'])
+    attachable_type: AttachableType
+    attachable_id: str = Field(
+        ...,
+        description='ID of the model this attachment is linked to.',
+        examples=['134'],
+    )
+    title: Optional[str] = Field(None, examples=['Some PDF file'])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+
+
+class AttachmentRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['attachments'])
+    id: str = Field(..., examples=['2'])
+    attributes: Attachment
+    links: ObjectLink
+
+
+class AttachmentSingle(BaseModel):
+    data: AttachmentRead
+
+
+class AttachmentArray(BaseModel):
+    data: List[AttachmentRead]
+    meta: Meta
@@ -0,0 +1,402 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     autocomplete (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+
+class AutocompleteAccount(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the account found by an auto-complete search.',
+        examples=['Checking Account'],
+    )
+    name_with_balance: str = Field(
+        ...,
+        description="Asset accounts and liabilities have a second field with the given date's account balance in the account currency or native currency.",
+        examples=['Checking Account ($123.45)'],
+    )
+    type: str = Field(
+        ...,
+        description='Account type of the account found by the auto-complete search.',
+        examples=['Asset account'],
+    )
+    currency_id: str = Field(
+        ...,
+        description='ID for the currency used by this account. If the user prefers amounts converted to their native currency, this native currency is used instead.',
+        examples=['12'],
+    )
+    currency_name: str = Field(
+        ...,
+        description='Currency name for the currency used by this account. If the user prefers amounts converted to their native currency, this native currency is used instead.',
+        examples=['Euro'],
+    )
+    currency_code: str = Field(
+        ...,
+        description='Currency code for the currency used by this account. If the user prefers amounts converted to their native currency, this native currency is used instead.',
+        examples=['EUR'],
+    )
+    currency_symbol: str = Field(
+        ...,
+        description='Currency symbol for the currency used by this account. If the user prefers amounts converted to their native currency, this native currency is used instead.',
+        examples=['$'],
+    )
+    currency_decimal_places: int = Field(
+        ...,
+        description='Number of decimal places for the currency used by this account. If the user prefers amounts converted to their native currency, this native currency is used instead.',
+        examples=[2],
+    )
+    account_currency_id: Optional[str] = Field(
+        None,
+        description='ID for the currency used by this account. Even if "convertToNative" is on, the account currency ID is displayed here.',
+        examples=['2'],
+    )
+    account_currency_name: Optional[str] = Field(
+        None,
+        description='Name for the currency used by this account. Even if "convertToNative" is on, the account currency name is displayed here.',
+        examples=['US Dollar'],
+    )
+    account_currency_code: Optional[str] = Field(
+        None,
+        description='Code for the currency used by this account. Even if "convertToNative" is on, the account currency code is displayed here.',
+        examples=['USD'],
+    )
+    account_currency_symbol: Optional[str] = Field(
+        None,
+        description='Code for the currency used by this account. Even if "convertToNative" is on, the account currency code is displayed here.',
+        examples=['$'],
+    )
+    account_currency_decimal_places: Optional[int] = Field(
+        None,
+        description='Number of decimal places for the currency used by this account. Even if "convertToNative" is on, the account currency code is displayed here.',
+        examples=[2],
+    )
+
+
+class AutocompleteBill(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the bill found by an auto-complete search.',
+        examples=['Yearly bill'],
+    )
+    active: Optional[bool] = Field(
+        None, description='Is the bill active or not?', examples=[True]
+    )
+
+
+class AutocompleteBudget(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the budget found by an auto-complete search.',
+        examples=['Groceries'],
+    )
+
+
+class AutocompleteCategory(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the category found by an auto-complete search.',
+        examples=['Category X'],
+    )
+
+
+class AutocompleteCurrency(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(..., description='Currency name.', examples=['Currency name'])
+    code: str = Field(..., description='Currency code.', examples=['EUR'])
+    symbol: str = Field(..., examples=['$'])
+    decimal_places: int = Field(..., examples=[2])
+
+
+class AutocompleteCurrencyCode(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Currency name with the code between brackets.',
+        examples=['Currency name (XCN)'],
+    )
+    code: str = Field(..., description='Currency code.', examples=['EUR'])
+    symbol: str = Field(..., examples=['$'])
+    decimal_places: int = Field(..., examples=[2])
+
+
+class AutocompleteObjectGroup(BaseModel):
+    id: str = Field(..., examples=['2'])
+    title: str = Field(
+        ...,
+        description='Title of the object group found by an auto-complete search.',
+        examples=['Object Group one'],
+    )
+    name: str = Field(
+        ...,
+        description='Title of the object group found by an auto-complete search.',
+        examples=['Object Group one'],
+    )
+
+
+class AutocompletePiggy(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the piggy bank found by an auto-complete search.',
+        examples=['New couch'],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description="Currency ID for this piggy bank. This will always be the currency of the piggy bank, never the user's native currency.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Currency code for this piggy bank. This will always be the currency of the piggy bank, never the user's native currency.",
+        examples=['EUR'],
+    )
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_name: Optional[str] = Field(
+        None,
+        description="Currency name for the currency used by this piggy bank. This will always be the currency of the piggy bank, never the user's native currency.",
+        examples=['Euro'],
+    )
+    currency_decimal_places: Optional[int] = Field(
+        None,
+        description="Number of decimal places for the currency used by this piggy bank. This will always be the currency of the piggy bank, never the user's native currency.",
+        examples=[2],
+    )
+    object_group_id: Optional[str] = Field(
+        None,
+        description='The group ID of the group this object is part of. NULL if no group.',
+        examples=['5'],
+    )
+    object_group_title: Optional[str] = Field(
+        None,
+        description='The name of the group. NULL if no group.',
+        examples=['Example Group'],
+    )
+
+
+class AutocompletePiggyBalance(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the piggy bank found by an auto-complete search.',
+        examples=['New couch'],
+    )
+    name_with_balance: Optional[str] = Field(
+        None,
+        description='Name of the piggy bank found by an auto-complete search, including the currently saved amount and the target amount.',
+        examples=['New couch ($234.56 / $600)'],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description="Currency ID for the currency used by this piggy bank. This will always be the piggy bank's currency, never the native currency.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Currency code for the currency used by this piggy bank. This will always be the piggy bank's currency, never the native currency.",
+        examples=['EUR'],
+    )
+    currency_symbol: Optional[str] = Field(
+        None,
+        description="Currency symbol for the currency used by this piggy bank. This will always be the piggy bank's currency, never the native currency.",
+        examples=['$'],
+    )
+    currency_decimal_places: Optional[int] = Field(
+        None,
+        description="Currency decimal places for the currency used by this piggy bank. This will always be the piggy bank's currency, never the native currency.",
+        examples=[2],
+    )
+    object_group_id: Optional[str] = Field(
+        None,
+        description='The group ID of the group this object is part of. NULL if no group.',
+        examples=['5'],
+    )
+    object_group_title: Optional[str] = Field(
+        None,
+        description='The name of the group. NULL if no group.',
+        examples=['Example Group'],
+    )
+
+
+class AutocompleteRecurrence(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the recurrence found by an auto-complete search.',
+        examples=['Yearly bill'],
+    )
+    description: Optional[str] = Field(
+        None,
+        description='Description of the recurrence found by auto-complete.',
+        examples=['Should trigger daily.'],
+    )
+
+
+class AutocompleteRule(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the rule found by an auto-complete search.',
+        examples=['Rule one'],
+    )
+    description: Optional[str] = Field(
+        None,
+        description='Description of the rule found by auto-complete.',
+        examples=['Useful rule.'],
+    )
+
+
+class AutocompleteRuleGroup(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the rule group found by an auto-complete search.',
+        examples=['Rule group one'],
+    )
+    description: Optional[str] = Field(
+        None,
+        description='Description of the rule group found by auto-complete.',
+        examples=['Some rule group.'],
+    )
+
+
+class AutocompleteTag(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Name of the tag found by an auto-complete search.',
+        examples=['too-expensive-tag-example'],
+    )
+    tag: str = Field(
+        ...,
+        description='Name of the tag found by an auto-complete search.',
+        examples=['too-expensive-tag-example'],
+    )
+
+
+class AutocompleteTransaction(BaseModel):
+    id: str = Field(
+        ...,
+        description='The ID of a transaction journal (basically a single split).',
+        examples=['2'],
+    )
+    transaction_group_id: Optional[str] = Field(
+        None, description='The ID of the underlying transaction group.', examples=['2']
+    )
+    name: str = Field(
+        ..., description='Transaction description', examples=['Transaction']
+    )
+    description: str = Field(
+        ..., description='Transaction description', examples=['Transaction']
+    )
+
+
+class AutocompleteTransactionID(BaseModel):
+    id: str = Field(
+        ...,
+        description='The ID of a transaction journal (basically a single split).',
+        examples=['2'],
+    )
+    transaction_group_id: Optional[str] = Field(
+        None, description='The ID of the underlying transaction group.', examples=['2']
+    )
+    name: str = Field(
+        ...,
+        description='Transaction description with ID in the name.',
+        examples=['#12: Transaction'],
+    )
+    description: str = Field(
+        ...,
+        description='Transaction description with ID in the name.',
+        examples=['#12: Transaction'],
+    )
+
+
+class AutocompleteTransactionType(BaseModel):
+    id: str = Field(..., examples=['2'])
+    name: str = Field(
+        ...,
+        description='Type of the object found by an auto-complete search.',
+        examples=['Withdrawal'],
+    )
+    type: str = Field(
+        ...,
+        description='Name of the object found by an auto-complete search.',
+        examples=['Withdrawal'],
+    )
+
+
+class AutocompleteAccountArray(RootModel[List[AutocompleteAccount]]):
+    root: List[AutocompleteAccount]
+
+
+class AutocompleteBillArray(RootModel[List[AutocompleteBill]]):
+    root: List[AutocompleteBill]
+
+
+class AutocompleteBudgetArray(RootModel[List[AutocompleteBudget]]):
+    root: List[AutocompleteBudget]
+
+
+class AutocompleteCategoryArray(RootModel[List[AutocompleteCategory]]):
+    root: List[AutocompleteCategory]
+
+
+class AutocompleteCurrencyArray(RootModel[List[AutocompleteCurrency]]):
+    root: List[AutocompleteCurrency]
+
+
+class AutocompleteCurrencyCodeArray(RootModel[List[AutocompleteCurrencyCode]]):
+    root: List[AutocompleteCurrencyCode]
+
+
+class AutocompleteObjectGroupArray(RootModel[List[AutocompleteObjectGroup]]):
+    root: List[AutocompleteObjectGroup]
+
+
+class AutocompletePiggyArray(RootModel[List[AutocompletePiggy]]):
+    root: List[AutocompletePiggy]
+
+
+class AutocompletePiggyBalanceArray(RootModel[List[AutocompletePiggyBalance]]):
+    root: List[AutocompletePiggyBalance]
+
+
+class AutocompleteRecurrenceArray(RootModel[List[AutocompleteRecurrence]]):
+    root: List[AutocompleteRecurrence]
+
+
+class AutocompleteRuleArray(RootModel[List[AutocompleteRule]]):
+    root: List[AutocompleteRule]
+
+
+class AutocompleteRuleGroupArray(RootModel[List[AutocompleteRuleGroup]]):
+    root: List[AutocompleteRuleGroup]
+
+
+class AutocompleteTagArray(RootModel[List[AutocompleteTag]]):
+    root: List[AutocompleteTag]
+
+
+class AutocompleteTransactionArray(RootModel[List[AutocompleteTransaction]]):
+    root: List[AutocompleteTransaction]
+
+
+class AutocompleteTransactionIDArray(RootModel[List[AutocompleteTransactionID]]):
+    root: List[AutocompleteTransactionID]
+
+
+class AutocompleteTransactionTypeArray(RootModel[List[AutocompleteTransactionType]]):
+    root: List[AutocompleteTransactionType]
@@ -0,0 +1,86 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     available_budget (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    BudgetSpent,
+    Meta,
+)
+
+
+class AvailableBudget(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    currency_id: Optional[str] = Field(
+        None, description='Use either currency_id or currency_code.', examples=['5']
+    )
+    currency_code: Optional[str] = Field(
+        None, description='Use either currency_id or currency_code.', examples=['EUR']
+    )
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(None, examples=[2])
+    native_currency_id: Optional[str] = Field(
+        None,
+        description="The currency ID of the administration's native currency.",
+        examples=['5'],
+    )
+    native_currency_code: Optional[str] = Field(
+        None,
+        description="The currency code of the administration's native currency.",
+        examples=['EUR'],
+    )
+    native_currency_symbol: Optional[str] = Field(
+        None,
+        description="The currency symbol of the administration's native currency.",
+        examples=['$'],
+    )
+    native_currency_decimal_places: Optional[int] = Field(
+        None,
+        description="The currency decimal places of the administration's native currency.",
+        examples=[2],
+    )
+    amount: str = Field(..., examples=['123.45'])
+    native_amount: Optional[str] = Field(
+        None,
+        description='The amount of this available budget in the native currency of this administration.',
+        examples=['123.45'],
+    )
+    start: datetime = Field(
+        ...,
+        description='Start date of the available budget.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    end: datetime = Field(
+        ...,
+        description='End date of the available budget.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    spent_in_budgets: Optional[List[BudgetSpent]] = None
+    spent_outside_budget: Optional[List[BudgetSpent]] = None
+
+
+class AvailableBudgetRead(BaseModel):
+    type: str = Field(
+        ..., description='Immutable value', examples=['available_budgets']
+    )
+    id: str = Field(..., examples=['2'])
+    attributes: AvailableBudget
+
+
+class AvailableBudgetSingle(BaseModel):
+    data: AvailableBudgetRead
+
+
+class AvailableBudgetArray(BaseModel):
+    data: List[AvailableBudgetRead]
+    meta: Meta
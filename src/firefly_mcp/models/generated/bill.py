@@ -0,0 +1,120 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     bill (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Bill,
+    BillRepeatFrequency,
+    Meta,
+)
+
+
+class BillStore(BaseModel):
+    currency_id: Optional[str] = Field(
+        None, description='Use either currency_id or currency_code', examples=['5']
+    )
+    currency_code: Optional[str] = Field(
+        None, description='Use either currency_id or currency_code', examples=['EUR']
+    )
+    name: str = Field(..., examples=['Rent'])
+    amount_min: str = Field(..., examples=['123.45'])
+    amount_max: str = Field(..., examples=['123.45'])
+    date: datetime = Field(..., examples=['2018-09-17T12:46:47+01:00'])
+    end_date: Optional[datetime] = Field(
+        None,
+        description='The date after which this bill is no longer valid or applicable',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    extension_date: Optional[datetime] = Field(
+        None,
+        description='The date before which the bill must be renewed (or cancelled)',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    repeat_freq: BillRepeatFrequency
+    skip: Optional[int] = Field(
+        None,
+        description='How often the bill must be skipped. 1 means a bi-monthly bill.',
+        examples=[0],
+    )
+    active: Optional[bool] = Field(
+        None, description='If the bill is active.', examples=[True]
+    )
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    object_group_id: Optional[str] = Field(
+        None,
+        description='The group ID of the group this object is part of. NULL if no group.',
+        examples=['5'],
+    )
+    object_group_title: Optional[str] = Field(
+        None,
+        description='The name of the group. NULL if no group.',
+        examples=['Example Group'],
+    )
+
+
+class BillUpdate(BaseModel):
+    currency_id: Optional[str] = Field(
+        None, description='Use either currency_id or currency_code', examples=['5']
+    )
+    currency_code: Optional[str] = Field(
+        None, description='Use either currency_id or currency_code', examples=['EUR']
+    )
+    name: str = Field(..., examples=['Rent'])
+    amount_min: Optional[str] = Field(None, examples=['123.45'])
+    amount_max: Optional[str] = Field(None, examples=['123.45'])
+    date: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    end_date: Optional[datetime] = Field(
+        None,
+        description='The date after which this bill is no longer valid or applicable',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    extension_date: Optional[datetime] = Field(
+        None,
+        description='The date before which the bill must be renewed (or cancelled)',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    repeat_freq: Optional[BillRepeatFrequency] = None
+    skip: Optional[int] = Field(
+        None,
+        description='How often the bill must be skipped. 1 means a bi-monthly bill.',
+        examples=[0],
+    )
+    active: Optional[bool] = Field(
+        None, description='If the bill is active.', examples=[True]
+    )
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    object_group_id: Optional[str] = Field(
+        None,
+        description='The group ID of the group this object is part of. NULL if no group.',
+        examples=['5'],
+    )
+    object_group_title: Optional[str] = Field(
+        None,
+        description='The name of the group. NULL if no group.',
+        examples=['Example Group'],
+    )
+
+
+class BillRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['bills'])
+    id: str = Field(..., examples=['2'])
+    attributes: Bill
+
+
+class BillSingle(BaseModel):
+    data: BillRead
+
+
+class BillArray(BaseModel):
+    data: List[BillRead]
+    meta: Meta
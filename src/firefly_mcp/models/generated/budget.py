@@ -0,0 +1,189 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     budget (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    AutoBudgetPeriod,
+    AutoBudgetType,
+    Budget,
+    Meta,
+)
+
+
+class BudgetLimit(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    start: datetime = Field(
+        ...,
+        description='Start date of the budget limit.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    end: datetime = Field(
+        ...,
+        description='End date of the budget limit.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['5'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['EUR'],
+    )
+    currency_name: Optional[str] = Field(None, examples=['Euro'])
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(None, examples=[2])
+    native_currency_id: Optional[str] = Field(
+        None, description="The administration's native currency ID.", examples=['5']
+    )
+    native_currency_code: Optional[str] = Field(
+        None, description="The administration's native currency code.", examples=['EUR']
+    )
+    native_currency_symbol: Optional[str] = Field(
+        None, description="The administration's native currency symbol.", examples=['$']
+    )
+    native_currency_decimal_places: Optional[int] = Field(
+        None,
+        description="The administration's native currency decimal places.",
+        examples=[2],
+    )
+    budget_id: str = Field(
+        ..., description='The budget ID of the associated budget.', examples=['23']
+    )
+    period: Optional[str] = Field(
+        None,
+        description='Period of the budget limit. Only used when auto-generated by auto-budget.',
+        examples=['monthly'],
+    )
+    amount: str = Field(..., examples=['123.45'])
+    native_amount: Optional[str] = Field(
+        None,
+        description="The amount of this budget limit in the user's native currency, if the original amount is in a different currency.",
+        examples=['123.45'],
+    )
+    spent: Optional[str] = Field(
+        None,
+        description='Will be in the native currency if this is turned on by the user.',
+        examples=['-1012.12'],
+    )
+    notes: Optional[str] = Field(
+        None,
+        description='Some notes for this specific budget limit.',
+        examples=['Some example notes'],
+    )
+
+
+class BudgetLimitStore(BaseModel):
+    currency_id: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['5'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['EUR'],
+    )
+    budget_id: str = Field(
+        ..., description='The budget ID of the associated budget.', examples=['23']
+    )
+    start: date_aliased = Field(
+        ..., description='Start date of the budget limit.', examples=['2017-09-17']
+    )
+    period: Optional[str] = Field(
+        None,
+        description='Period of the budget limit. Only used when auto-generated by auto-budget.',
+        examples=['monthly'],
+    )
+    end: date_aliased = Field(
+        ..., description='End date of the budget limit.', examples=['2017-09-17']
+    )
+    amount: str = Field(..., examples=['123.45'])
+    notes: Optional[str] = Field(
+        None,
+        description='Some notes for this specific budget limit.',
+        examples=['Some example notes'],
+    )
+
+
+class BudgetLimitRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['budget_limits'])
+    id: str = Field(..., examples=['2'])
+    attributes: BudgetLimit
+
+
+class BudgetLimitSingle(BaseModel):
+    data: BudgetLimitRead
+
+
+class BudgetStore(BaseModel):
+    name: str = Field(..., examples=['Bills'])
+    active: Optional[bool] = Field(None, examples=[False])
+    order: Optional[int] = Field(None, examples=[5])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    auto_budget_type: Optional[AutoBudgetType] = None
+    auto_budget_currency_id: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['12'],
+    )
+    auto_budget_currency_code: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['EUR'],
+    )
+    auto_budget_amount: Optional[str] = Field(None, examples=['-1012.12'])
+    auto_budget_period: Optional[AutoBudgetPeriod] = None
+
+
+class BudgetUpdate(BaseModel):
+    name: str = Field(..., examples=['Bills'])
+    active: Optional[bool] = Field(None, examples=[False])
+    order: Optional[int] = Field(None, examples=[5])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    auto_budget_type: Optional[AutoBudgetType] = None
+    auto_budget_currency_id: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['12'],
+    )
+    auto_budget_currency_code: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['EUR'],
+    )
+    auto_budget_amount: Optional[str] = Field(None, examples=['-1012.12'])
+    auto_budget_period: Optional[AutoBudgetPeriod] = None
+
+
+class BudgetLimitArray(BaseModel):
+    data: List[BudgetLimitRead]
+    meta: Meta
+
+
+class BudgetRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['budgets'])
+    id: str = Field(..., examples=['2'])
+    attributes: Budget
+
+
+class BudgetSingle(BaseModel):
+    data: BudgetRead
+
+
+class BudgetArray(BaseModel):
+    data: List[BudgetRead]
+    meta: Meta
@@ -0,0 +1,84 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     category (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+)
+
+
+class CategoryUpdate(BaseModel):
+    name: str = Field(..., examples=['Lunch'])
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+
+
+class CategoryEarned(BaseModel):
+    currency_id: Optional[str] = Field(None, examples=['5'])
+    currency_code: Optional[str] = Field(None, examples=['USD'])
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals supported by the currency', examples=[2]
+    )
+    sum: Optional[str] = Field(
+        None, description='The amount earned.', examples=['123.45']
+    )
+
+
+class CategorySpent(BaseModel):
+    currency_id: Optional[str] = Field(None, examples=['5'])
+    currency_code: Optional[str] = Field(None, examples=['USD'])
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals supported by the currency', examples=[2]
+    )
+    sum: Optional[str] = Field(
+        None, description='The amount spent.', examples=['-12423.45']
+    )
+
+
+class Category(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    name: str = Field(..., examples=['Lunch'])
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    native_currency_id: Optional[str] = Field(
+        None, description="The administration's native currency ID.", examples=['5']
+    )
+    native_currency_code: Optional[str] = Field(
+        None, description="The administration's native currency code.", examples=['EUR']
+    )
+    native_currency_symbol: Optional[str] = Field(
+        None, description="The administration's native currency symbol.", examples=['$']
+    )
+    native_currency_decimal_places: Optional[int] = Field(
+        None,
+        description="The administration's native currency decimal places.",
+        examples=[2],
+    )
+    spent: Optional[List[CategorySpent]] = None
+    earned: Optional[List[CategoryEarned]] = None
+
+
+class CategoryRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['categories'])
+    id: str = Field(..., examples=['2'])
+    attributes: Category
+
+
+class CategorySingle(BaseModel):
+    data: CategoryRead
+
+
+class CategoryArray(BaseModel):
+    data: List[CategoryRead]
+    meta: Meta
@@ -0,0 +1,603 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     common (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+
+class ConfigValueFilter(Enum):
+    configuration_is_demo_site = 'configuration.is_demo_site'
+    configuration_permission_update_check = 'configuration.permission_update_check'
+    configuration_last_update_check = 'configuration.last_update_check'
+    configuration_single_user_mode = 'configuration.single_user_mode'
+    firefly_version = 'firefly.version'
+    firefly_default_location = 'firefly.default_location'
+    firefly_account_to_transaction = 'firefly.account_to_transaction'
+    firefly_allowed_opposing_types = 'firefly.allowed_opposing_types'
+    firefly_accountRoles = 'firefly.accountRoles'
+    firefly_valid_liabilities = 'firefly.valid_liabilities'
+    firefly_interest_periods = 'firefly.interest_periods'
+    firefly_enable_external_map = 'firefly.enable_external_map'
+    firefly_expected_source_types = 'firefly.expected_source_types'
+    app_timezone = 'app.timezone'
+    firefly_bill_periods = 'firefly.bill_periods'
+    firefly_credit_card_types = 'firefly.credit_card_types'
+    firefly_languages = 'firefly.languages'
+    firefly_valid_view_ranges = 'firefly.valid_view_ranges'
+
+
+class PaidDate(BaseModel):
+    transaction_group_id: Optional[str] = Field(
+        None, description='Transaction group ID of the paid bill.', examples=['123']
+    )
+    transaction_journal_id: Optional[str] = Field(
+        None, description='Transaction journal ID of the paid bill.', examples=['123']
+    )
+    date: Optional[datetime] = Field(
+        None,
+        description='Date the bill was paid.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+
+
+class BudgetSpent(BaseModel):
+    sum: Optional[str] = Field(
+        None,
+        description="The amount spent. This is in the administration's native currency, if the conversion is turned on.",
+        examples=['123.45'],
+    )
+    currency_id: Optional[str] = Field(None, examples=['5'])
+    currency_code: Optional[str] = Field(None, examples=['USD'])
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals supported by the currency', examples=[2]
+    )
+
+
+class Field0(BaseModel):
+    rel: Optional[str] = Field(None, examples=['self'])
+    uri: Optional[str] = Field(None, examples=['/OBJECTS/1'])
+
+
+class ObjectLink(BaseModel):
+    self: Optional[AnyUrl] = Field(
+        None, examples=['https://demo.firefly-iii.org/api/v1/OBJECTS/1']
+    )
+    field_0: Optional[Field0] = Field(None, alias='0')
+
+
+class PageLink(BaseModel):
+    self: Optional[AnyUrl] = Field(
+        None, examples=['https://demo.firefly-iii.org/api/v1/OBJECT?&page=4']
+    )
+    first: Optional[AnyUrl] = Field(
+        None, examples=['https://demo.firefly-iii.org/api/v1/OBJECT?&page=1']
+    )
+    next: Optional[AnyUrl] = Field(
+        None, examples=['https://demo.firefly-iii.org/api/v1/OBJECT?&page=3']
+    )
+    prev: Optional[AnyUrl] = Field(
+        None, examples=['https://demo.firefly-iii.org/api/v1/OBJECT?&page=2']
+    )
+    last: Optional[AnyUrl] = Field(
+        None, examples=['https://demo.firefly-iii.org/api/v1/OBJECT?&page=12']
+    )
+
+
+class PiggyBankAccountRead(BaseModel):
+    id: str = Field(..., description='The ID of the account.', examples=['3'])
+    name: str = Field(..., examples=['Checking account'])
+    current_amount: str = Field(..., examples=['123.45'])
+    native_current_amount: str = Field(
+        ...,
+        description='If convertToNative is on, this will show the amount in the native currency.',
+        examples=['123.45'],
+    )
+
+
+class Default(Enum):
+    boolean_True = True
+
+
+class AttachableType(Enum):
+    Account = 'Account'
+    Budget = 'Budget'
+    Bill = 'Bill'
+    TransactionJournal = 'TransactionJournal'
+    PiggyBank = 'PiggyBank'
+    Tag = 'Tag'
+
+
+class AutoBudgetPeriodEnum(Enum):
+    daily = 'daily'
+    weekly = 'weekly'
+    monthly = 'monthly'
+    quarterly = 'quarterly'
+    half_year = 'half-year'
+    yearly = 'yearly'
+
+
+class AutoBudgetPeriod(RootModel[Optional[AutoBudgetPeriodEnum]]):
+    root: Optional[AutoBudgetPeriodEnum] = Field(
+        None, description='Period for the auto budget', examples=['monthly']
+    )
+
+
+class AutoBudgetTypeEnum(Enum):
+    reset = 'reset'
+    rollover = 'rollover'
+    none = 'none'
+
+
+class AutoBudgetType(RootModel[Optional[AutoBudgetTypeEnum]]):
+    root: Optional[AutoBudgetTypeEnum] = Field(
+        None,
+        description='The type of auto-budget that Firefly III must create.',
+        examples=['reset'],
+    )
+
+
+class BillRepeatFrequency(Enum):
+    weekly = 'weekly'
+    monthly = 'monthly'
+    quarterly = 'quarterly'
+    half_year = 'half-year'
+    yearly = 'yearly'
+
+
+class StringArrayItem(RootModel[str]):
+    root: str = Field(
+        ..., description='The actual preference content.', examples=['EUR']
+    )
+
+
+class Pagination(BaseModel):
+    total: Optional[int] = Field(None, examples=[3])
+    count: Optional[int] = Field(None, examples=[20])
+    per_page: Optional[int] = Field(None, examples=[100])
+    current_page: Optional[int] = Field(None, examples=[1])
+    total_pages: Optional[int] = Field(None, examples=[1])
+
+
+class Meta(BaseModel):
+    pagination: Optional[Pagination] = None
+
+
+class AccountRolePropertyEnum(Enum):
+    defaultAsset = 'defaultAsset'
+    sharedAsset = 'sharedAsset'
+    savingAsset = 'savingAsset'
+    ccAsset = 'ccAsset'
+    cashWalletAsset = 'cashWalletAsset'
+
+
+class AccountRoleProperty(RootModel[Optional[AccountRolePropertyEnum]]):
+    root: Optional[AccountRolePropertyEnum] = Field(
+        None,
+        description='Is only mandatory when the type is asset.',
+        examples=['defaultAsset'],
+    )
+
+
+class AccountTypeProperty(Enum):
+    Default_account = 'Default account'
+    Cash_account = 'Cash account'
+    Asset_account = 'Asset account'
+    Expense_account = 'Expense account'
+    Revenue_account = 'Revenue account'
+    Initial_balance_account = 'Initial balance account'
+    Beneficiary_account = 'Beneficiary account'
+    Import_account = 'Import account'
+    Reconciliation_account = 'Reconciliation account'
+    Loan = 'Loan'
+    Debt = 'Debt'
+    Mortgage = 'Mortgage'
+
+
+class CreditCardTypePropertyEnum(Enum):
+    monthlyFull = 'monthlyFull'
+
+
+class CreditCardTypeProperty(RootModel[Optional[CreditCardTypePropertyEnum]]):
+    root: Optional[CreditCardTypePropertyEnum] = Field(
+        None,
+        description='Mandatory when the account_role is ccAsset. Can only be monthlyFull or null.',
+        examples=['monthlyFull'],
+    )
+
+
+class InterestPeriodPropertyEnum(Enum):
+    weekly = 'weekly'
+    monthly = 'monthly'
+    quarterly = 'quarterly'
+    half_year = 'half-year'
+    yearly = 'yearly'
+
+
+class InterestPeriodProperty(RootModel[Optional[InterestPeriodPropertyEnum]]):
+    root: Optional[InterestPeriodPropertyEnum] = Field(
+        None,
+        description='Mandatory when type is liability. Period over which the interest is calculated.',
+        examples=['monthly'],
+    )
+
+
+class LiabilityDirectionPropertyEnum(Enum):
+    credit = 'credit'
+    debit = 'debit'
+
+
+class LiabilityDirectionProperty(RootModel[Optional[LiabilityDirectionPropertyEnum]]):
+    root: Optional[LiabilityDirectionPropertyEnum] = Field(
+        None,
+        description="'credit' indicates somebody owes you the liability. 'debit' Indicates you owe this debt yourself. Works only for liabiltiies.",
+        examples=['credit'],
+    )
+
+
+class LiabilityTypePropertyEnum(Enum):
+    loan = 'loan'
+    debt = 'debt'
+    mortgage = 'mortgage'
+
+
+class LiabilityTypeProperty(RootModel[Optional[LiabilityTypePropertyEnum]]):
+    root: Optional[LiabilityTypePropertyEnum] = Field(
+        None,
+        description='Mandatory when type is liability. Specifies the exact type.',
+        examples=['loan'],
+    )
+
+
+class ShortAccountTypeProperty(Enum):
+    asset = 'asset'
+    expense = 'expense'
+    import_ = 'import'
+    revenue = 'revenue'
+    cash = 'cash'
+    liability = 'liability'
+    liabilities = 'liabilities'
+    initial_balance = 'initial-balance'
+    reconciliation = 'reconciliation'
+
+
+class Account(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    active: Optional[bool] = Field(
+        True, description='If omitted, defaults to true.', examples=[False]
+    )
+    order: Optional[int] = Field(
+        None,
+        description='Order of the account. Is NULL if account is not asset or liability.',
+        examples=[1],
+    )
+    name: str = Field(..., examples=['My checking account'])
+    type: ShortAccountTypeProperty
+    account_role: Optional[AccountRoleProperty] = None
+    currency_id: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Use either currency_id or currency_code. Defaults to the user's default currency.",
+        examples=['EUR'],
+    )
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(None, examples=[2])
+    native_currency_id: Optional[str] = Field(
+        None,
+        description='Returns the native currency ID of the administration.',
+        examples=['12'],
+    )
+    native_currency_code: Optional[str] = Field(
+        None,
+        description='Returns the native currency code of the administration.',
+        examples=['EUR'],
+    )
+    native_currency_symbol: Optional[str] = Field(
+        None,
+        description='Returns the native currency symbol of the administration.',
+        examples=['$'],
+    )
+    native_currency_decimal_places: Optional[int] = Field(
+        None,
+        description='Returns the native currency decimal places of the administration.',
+        examples=[2],
+    )
+    current_balance: Optional[str] = Field(
+        None,
+        description="The current balance of the account in the account's currency OR the native currency if the account has no currency.",
+        examples=['123.45'],
+    )
+    native_current_balance: Optional[str] = Field(
+        None,
+        description="The current balance of the account in the administration's native currency.",
+        examples=['123.45'],
+    )
+    current_balance_date: Optional[datetime] = Field(
+        None,
+        description="The timestamp for this date is always 23:59:59, to indicate it's the balance at the very END of that particular day.",
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    monthly_payment_date: Optional[datetime] = Field(
+        None,
+        description='Mandatory when the account_role is ccAsset. Moment at which CC payment installments are asked for by the bank.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    credit_card_type: Optional[CreditCardTypeProperty] = None
+    account_number: Optional[str] = Field(None, examples=['7009312345678'])
+    iban: Optional[str] = Field(None, examples=['GB98MIDL07009312345678'])
+    bic: Optional[str] = Field(None, examples=['BOFAUS3N'])
+    virtual_balance: Optional[str] = Field(
+        None,
+        description="The virtual balance of the account in the account's currency or the administration's native currency if the account has no currency.",
+        examples=['123.45'],
+    )
+    native_virtual_balance: Optional[str] = Field(
+        None,
+        description="The virtual balance of the account in administration's native currency.",
+        examples=['123.45'],
+    )
+    opening_balance: Optional[str] = Field(
+        None,
+        description="Represents the opening balance, the initial amount this account holds in the currency of the account or the administration's native currency if the account has no currency.",
+        examples=['-1012.12'],
+    )
+    native_opening_balance: Optional[str] = Field(
+        None,
+        description="Represents the opening balance, in the administration's native currency.",
+        examples=['-1012.12'],
+    )
+    opening_balance_date: Optional[datetime] = Field(
+        None,
+        description='Represents the date of the opening balance.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    liability_type: Optional[LiabilityTypeProperty] = None
+    liability_direction: Optional[LiabilityDirectionProperty] = None
+    interest: Optional[str] = Field(
+        None,
+        description='Mandatory when type is liability. Interest percentage.',
+        examples=['5.3'],
+    )
+    interest_period: Optional[InterestPeriodProperty] = None
+    current_debt: Optional[str] = Field(
+        None,
+        description='Represents the current debt for liabilities.',
+        examples=['1012.12'],
+    )
+    include_net_worth: Optional[bool] = Field(
+        True, description='If omitted, defaults to true.', examples=[True]
+    )
+    longitude: Optional[float] = Field(
+        None,
+        description="Latitude of the accounts's location, if applicable. Can be used to draw a map.",
+        examples=[5.916667],
+    )
+    latitude: Optional[float] = Field(
+        None,
+        description="Latitude of the accounts's location, if applicable. Can be used to draw a map.",
+        examples=[51.983333],
+    )
+    zoom_level: Optional[int] = Field(
+        None,
+        description='Zoom level for the map, if drawn. This to set the box right. Unfortunately this is a proprietary value because each map provider has different zoom levels.',
+        examples=[6],
+    )
+
+
+class Bill(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    currency_id: Optional[str] = Field(
+        None, description='Use either currency_id or currency_code', examples=['5']
+    )
+    currency_code: Optional[str] = Field(
+        None, description='Use either currency_id or currency_code', examples=['EUR']
+    )
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(None, examples=[2])
+    native_currency_id: Optional[str] = Field(
+        None, description="The administration's native currency ID.", examples=['5']
+    )
+    native_currency_code: Optional[str] = Field(
+        None, description="The administration's native currency code.", examples=['EUR']
+    )
+    native_currency_symbol: Optional[str] = Field(
+        None, description="The administration's native currency symbol.", examples=['$']
+    )
+    native_currency_decimal_places: Optional[int] = Field(
+        None,
+        description="The administration's native currency decimal places.",
+        examples=[2],
+    )
+    name: str = Field(..., examples=['Rent'])
+    amount_min: str = Field(..., examples=['123.45'])
+    amount_max: str = Field(..., examples=['123.45'])
+    native_amount_min: Optional[str] = Field(
+        None,
+        description="The max amount of this bill in the user's native currency, if the original amount is in a different currency.",
+        examples=['123.45'],
+    )
+    native_amount_max: Optional[str] = Field(
+        None,
+        description="The min amount of this bill in the user's native currency, if the original amount is in a different currency.",
+        examples=['123.45'],
+    )
+    date: datetime = Field(..., examples=['2018-09-17T12:46:47+01:00'])
+    end_date: Optional[datetime] = Field(
+        None,
+        description='The date after which this bill is no longer valid or applicable',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    extension_date: Optional[datetime] = Field(
+        None,
+        description='The date before which the bill must be renewed (or cancelled)',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    repeat_freq: BillRepeatFrequency
+    skip: Optional[int] = Field(
+        None,
+        description='How often the bill must be skipped. 1 means a bi-monthly bill.',
+        examples=[0],
+    )
+    active: Optional[bool] = Field(
+        None, description='If the bill is active.', examples=[True]
+    )
+    order: Optional[int] = Field(None, description='Order of the bill.', examples=[1])
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    next_expected_match: Optional[datetime] = Field(
+        None,
+        description='When the bill is expected to be due.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    next_expected_match_diff: Optional[str] = Field(
+        None,
+        description='Formatted (locally) when the bill is due.',
+        examples=['today'],
+    )
+    object_group_id: Optional[str] = Field(
+        None,
+        description='The group ID of the group this object is part of. NULL if no group.',
+        examples=['5'],
+    )
+    object_group_order: Optional[int] = Field(
+        None,
+        description='The order of the group. At least 1, for the highest sorting.',
+        examples=[5],
+    )
+    object_group_title: Optional[str] = Field(
+        None,
+        description='The name of the group. NULL if no group.',
+        examples=['Example Group'],
+    )
+    pay_dates: Optional[List[datetime]] = Field(
+        None,
+        description='Array of future dates when the bill is expected to be paid. Autogenerated.',
+    )
+    paid_dates: Optional[List[PaidDate]] = Field(
+        None, description='Array of past transactions when the bill was paid.'
+    )
+
+
+class Budget(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    name: str = Field(..., examples=['Bills'])
+    active: Optional[bool] = Field(None, examples=[False])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    order: Optional[int] = Field(None, examples=[5])
+    auto_budget_type: Optional[AutoBudgetType] = None
+    currency_id: Optional[str] = Field(
+        None,
+        description="The currency ID that is part of the budget's auto-budget settings, if any.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="The currency code that is part of the budget's auto-budget settings, if any.",
+        examples=['EUR'],
+    )
+    currency_symbol: Optional[str] = Field(
+        None,
+        description="The currency symbol that is part of the budget's auto-budget settings, if any.",
+        examples=['$'],
+    )
+    currency_decimal_places: Optional[int] = Field(
+        None,
+        description="The currency decimal places that is part of the budget's auto-budget settings, if any.",
+        examples=[2],
+    )
+    native_currency_id: Optional[str] = Field(
+        None, description="The administration's native currency ID.", examples=['5']
+    )
+    native_currency_code: Optional[str] = Field(
+        None, description="The administration's native currency code.", examples=['EUR']
+    )
+    native_currency_symbol: Optional[str] = Field(
+        None, description="The administration's native currency symbol.", examples=['$']
+    )
+    native_currency_decimal_places: Optional[int] = Field(
+        None,
+        description="The administration's native currency decimal places.",
+        examples=[2],
+    )
+    auto_budget_amount: Optional[str] = Field(
+        None,
+        description='The amount for the auto-budget, if set.',
+        examples=['-1012.12'],
+    )
+    native_auto_budget_amount: Optional[str] = Field(
+        None,
+        description='The native amount for the auto-budget, if set.',
+        examples=['-1012.12'],
+    )
+    auto_budget_period: Optional[AutoBudgetPeriod] = None
+    spent: Optional[List[BudgetSpent]] = Field(
+        None,
+        description='Information on how much was spent in this budget. Is only filled in when the start and end date are submitted.',
+    )
+
+
+class PiggyBank(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    name: str = Field(..., examples=['New digital camera'])
+    accounts: Optional[List[PiggyBankAccountRead]] = None
+    currency_id: Optional[str] = Field(None, examples=['5'])
+    currency_code: Optional[str] = Field(None, examples=['USD'])
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals supported by the currency', examples=[2]
+    )
+    target_amount: str = Field(..., examples=['123.45'])
+    percentage: Optional[float] = Field(None, examples=[12.5])
+    current_amount: Optional[str] = Field(None, examples=['123.45'])
+    left_to_save: Optional[str] = Field(None, examples=['700.00'])
+    save_per_month: Optional[str] = Field(None, examples=['12.45'])
+    start_date: Optional[date_aliased] = Field(
+        None,
+        description='The date you started with this piggy bank.',
+        examples=['2018-09-17'],
+    )
+    target_date: Optional[date_aliased] = Field(
+        None,
+        description='The date you intend to finish saving money.',
+        examples=['2018-09-17'],
+    )
+    order: Optional[int] = Field(None, examples=[5])
+    active: Optional[bool] = Field(None, examples=[True])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    object_group_id: Optional[str] = Field(
+        None,
+        description='The group ID of the group this object is part of. NULL if no group.',
+        examples=['5'],
+    )
+    object_group_order: Optional[int] = Field(
+        None,
+        description='The order of the group. At least 1, for the highest sorting.',
+        examples=[5],
+    )
+    object_group_title: Optional[str] = Field(
+        None,
+        description='The name of the group. NULL if no group.',
+        examples=['Example Group'],
+    )
+
+
+class PolymorphicProperty(
+    RootModel[Union[bool, str, Dict[str, Any], List[StringArrayItem]]]
+):
+    root: Union[bool, str, Dict[str, Any], List[StringArrayItem]]
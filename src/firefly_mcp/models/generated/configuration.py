@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     configuration (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    ConfigValueFilter,
+    PolymorphicProperty,
+)
+
+
+class Configuration(BaseModel):
+    title: ConfigValueFilter
+    value: PolymorphicProperty
+    editable: bool = Field(
+        ...,
+        description='If this config variable can be edited by the user',
+        examples=[True],
+    )
+
+
+class ConfigurationUpdate(BaseModel):
+    value: PolymorphicProperty
+
+
+class ConfigurationArray(RootModel[List[Configuration]]):
+    root: List[Configuration]
+
+
+class ConfigurationSingle(BaseModel):
+    data: Configuration
@@ -0,0 +1,200 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     currency (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Default,
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class CurrencyExchangeRateReadAttributes(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    from_currency_id: Optional[str] = Field(
+        None,
+        description='Base currency ID for this exchange rate entry.',
+        examples=['12'],
+    )
+    from_currency_code: Optional[str] = Field(
+        None,
+        description='Base currency code for this exchange rate entry.',
+        examples=['EUR'],
+    )
+    from_currency_symbol: Optional[str] = Field(
+        None,
+        description='Base currency symbol for this exchange rate entry.',
+        examples=['$'],
+    )
+    from_currency_decimal_places: Optional[int] = Field(
+        None,
+        description='Base currency decimal places for this exchange rate entry.',
+        examples=[2],
+    )
+    to_currency_id: Optional[str] = Field(
+        None,
+        description='Destination currency ID for this exchange rate entry.',
+        examples=['12'],
+    )
+    to_currency_code: Optional[str] = Field(
+        None,
+        description='Destination currency code for this exchange rate entry.',
+        examples=['EUR'],
+    )
+    to_currency_symbol: Optional[str] = Field(
+        None,
+        description='Destination currency symbol for this exchange rate entry.',
+        examples=['$'],
+    )
+    to_currency_decimal_places: Optional[int] = Field(
+        None,
+        description='Destination currency decimal places for this exchange rate entry.',
+        examples=[2],
+    )
+    rate: Optional[str] = Field(
+        None,
+        description="The actual exchange rate. How many 'to' currency will you get for 1 'from' currency?",
+        examples=['1.10340'],
+    )
+    date: Optional[datetime] = Field(
+        None,
+        description='Date and time of the exchange rate.',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+
+
+class CurrencyExchangeRateStore(BaseModel):
+    date: date_aliased = Field(
+        ...,
+        description='The date to which the exchange rate is applicable.',
+        examples=['2018-09-17'],
+    )
+    rate: str = Field(
+        ...,
+        description='The exchange rate from the base currency to the destination currency.',
+        examples=['2.3456'],
+    )
+    from_: str = Field(
+        ..., alias='from', description='The base currency code.', examples=['USD']
+    )
+    to: str = Field(..., description='The destination currency code.', examples=['EUR'])
+
+
+class CurrencyExchangeRateUpdate(BaseModel):
+    date: date_aliased = Field(
+        ...,
+        description='The date to which the exchange rate is applicable.',
+        examples=['2018-09-17'],
+    )
+    rate: str = Field(
+        ...,
+        description='The exchange rate from the base currency to the destination currency.',
+        examples=['2.3456'],
+    )
+
+
+class Currency(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    enabled: Optional[bool] = Field(
+        True, description='Defaults to true', examples=[True]
+    )
+    default: Optional[bool] = Field(
+        None, description='Make this currency the native currency.', examples=[False]
+    )
+    native: Optional[bool] = Field(
+        None, description='Make this currency the native currency.', examples=[False]
+    )
+    code: str = Field(..., examples=['AMS'])
+    name: str = Field(..., examples=['Ankh-Morpork dollar'])
+    symbol: str = Field(..., examples=['AM$'])
+    decimal_places: Optional[int] = Field(
+        None, description='Supports 0-16 decimals.', examples=[2]
+    )
+
+
+class CurrencyStore(BaseModel):
+    enabled: Optional[bool] = Field(
+        True, description='Defaults to true', examples=[True]
+    )
+    default: Optional[bool] = Field(
+        None,
+        description='Make this currency the default currency. You can set this value to FALSE, in which case nothing will change to the default currency. If you set it to TRUE, the current default currency will no longer be the default currency.',
+        examples=[True],
+    )
+    code: str = Field(..., examples=['AMS'])
+    name: str = Field(..., examples=['Ankh-Morpork dollar'])
+    symbol: str = Field(..., examples=['AM$'])
+    decimal_places: Optional[int] = Field(
+        None, description='Supports 0-16 decimals.', examples=[2]
+    )
+
+
+class CurrencyUpdate(BaseModel):
+    enabled: Optional[bool] = Field(
+        None, description='If the currency is enabled', examples=[True]
+    )
+    default: Optional[Default] = Field(
+        None,
+        description='If the currency must be the default for the user. You can only submit TRUE. Submitting FALSE will not drop this currency as the default currency, because then the system would be without one.',
+        examples=[True],
+    )
+    code: Optional[str] = Field(None, description='The currency code', examples=['AMS'])
+    name: Optional[str] = Field(
+        None, description='The currency name', examples=['Ankh-Morpork dollar']
+    )
+    symbol: Optional[str] = Field(
+        None, description='The currency symbol', examples=['AM$']
+    )
+    decimal_places: Optional[int] = Field(
+        None,
+        description='How many decimals to use when displaying this currency. Between 0 and 16.',
+        examples=[2],
+    )
+
+
+class CurrencyRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['currencies'])
+    id: str = Field(..., examples=['2'])
+    attributes: Currency
+
+
+class CurrencySingle(BaseModel):
+    data: CurrencyRead
+
+
+class CurrencyExchangeRateRead(BaseModel):
+    type: str = Field(
+        ..., description='Immutable value', examples=['currency_exchange_rates']
+    )
+    id: str = Field(..., examples=['2'])
+    attributes: CurrencyExchangeRateReadAttributes
+    links: ObjectLink
+
+
+class CurrencyExchangeRateSingle(BaseModel):
+    data: CurrencyExchangeRateRead
+
+
+class CurrencyArray(BaseModel):
+    data: List[CurrencyRead]
+    meta: Meta
+    links: PageLink
+
+
+class CurrencyExchangeRateArray(BaseModel):
+    data: List[CurrencyExchangeRateRead]
+    meta: Meta
+    links: PageLink
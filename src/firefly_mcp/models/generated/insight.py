@@ -0,0 +1,131 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     insight (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+
+class InsightGroupEntry(BaseModel):
+    id: Optional[str] = Field(
+        None,
+        description='This ID is a reference to the original object.',
+        examples=['123'],
+    )
+    name: Optional[str] = Field(
+        None, description='This is the name of the object.', examples=['Land lord']
+    )
+    difference: Optional[str] = Field(
+        None,
+        description='The amount spent or earned between start date and end date, a number defined as a string, for this object and all asset accounts.',
+        examples=['-123.45'],
+    )
+    difference_float: Optional[float] = Field(
+        None,
+        description='The amount spent or earned between start date and end date, a number as a float, for this object and all asset accounts. May have rounding errors.',
+        examples=[-123.45],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description='The currency ID of the expenses listed for this account.',
+        examples=['5'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description='The currency code of the expenses listed for this account.',
+        examples=['EUR'],
+    )
+
+
+class InsightTotalEntry(BaseModel):
+    difference: Optional[str] = Field(
+        None,
+        description='The amount spent between start date and end date, defined as a string, for this expense account and all asset accounts.',
+        examples=['123.45'],
+    )
+    difference_float: Optional[float] = Field(
+        None,
+        description='The amount spent between start date and end date, defined as a string, for this expense account and all asset accounts. This number is a float (double) and may have rounding errors.',
+        examples=[123.45],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description='The currency ID of the expenses listed for this expense account.',
+        examples=['5'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description='The currency code of the expenses listed for this expense account.',
+        examples=['EUR'],
+    )
+
+
+class InsightTransferEntry(BaseModel):
+    id: Optional[str] = Field(
+        None,
+        description='This ID is a reference to the original object.',
+        examples=['123'],
+    )
+    name: Optional[str] = Field(
+        None, description='This is the name of the object.', examples=['Land lord']
+    )
+    difference: Optional[str] = Field(
+        None,
+        description='The total amount transferred between start date and end date, a number defined as a string, for this asset account.',
+        examples=['-123.45'],
+    )
+    difference_float: Optional[float] = Field(
+        None,
+        description='The total amount transferred between start date and end date, a number as a float, for this asset account. May have rounding errors.',
+        examples=[-123.45],
+    )
+    in_: Optional[str] = Field(
+        None,
+        alias='in',
+        description='The total amount transferred TO this account between start date and end date, a number defined as a string, for this asset account.',
+        examples=['123.45'],
+    )
+    in_float: Optional[float] = Field(
+        None,
+        description='The total amount transferred FROM this account between start date and end date, a number as a float, for this asset account. May have rounding errors.',
+        examples=[123.45],
+    )
+    out: Optional[str] = Field(
+        None,
+        description='The total amount transferred FROM this account between start date and end date, a number defined as a string, for this asset account.',
+        examples=['123.45'],
+    )
+    out_float: Optional[float] = Field(
+        None,
+        description='The total amount transferred TO this account between start date and end date, a number as a float, for this asset account. May have rounding errors.',
+        examples=[123.45],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description='The currency ID of the expenses listed for this account.',
+        examples=['5'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description='The currency code of the expenses listed for this account.',
+        examples=['EUR'],
+    )
+
+
+class InsightGroup(RootModel[List[InsightGroupEntry]]):
+    root: List[InsightGroupEntry]
+
+
+class InsightTotal(RootModel[List[InsightTotalEntry]]):
+    root: List[InsightTotalEntry]
+
+
+class InsightTransfer(RootModel[List[InsightTransferEntry]]):
+    root: List[InsightTransferEntry]
@@ -0,0 +1,49 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     link_type (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class LinkType(BaseModel):
+    name: str = Field(..., examples=['Paid'])
+    inward: str = Field(..., examples=['is (partially) paid for by'])
+    outward: str = Field(..., examples=['(partially) pays for'])
+    editable: Optional[bool] = Field(None, examples=[False])
+
+
+class LinkTypeUpdate(BaseModel):
+    name: Optional[str] = Field(None, examples=['Paid'])
+    inward: Optional[str] = Field(None, examples=['is (partially) paid for by'])
+    outward: Optional[str] = Field(None, examples=['(partially) pays for'])
+
+
+class LinkTypeRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['link_types'])
+    id: str = Field(..., examples=['2'])
+    attributes: LinkType
+    links: ObjectLink
+
+
+class LinkTypeSingle(BaseModel):
+    data: LinkTypeRead
+
+
+class LinkTypeArray(BaseModel):
+    data: List[LinkTypeRead]
+    meta: Meta
+    links: PageLink
@@ -0,0 +1,230 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     misc (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+
+class ChartDataPoint(BaseModel):
+    key: Optional[str] = Field(
+        None,
+        description="The key is the label of the value, so for example: '2018-01-01' => 13 or 'Groceries' => -123.",
+        examples=['value'],
+    )
+
+
+class Entries(BaseModel):
+    pass
+
+
+class ChartDataSet(BaseModel):
+    label: Optional[str] = Field(
+        None,
+        description='This is the title of the current set. It can refer to an account, a budget or another object (by name).',
+        examples=['Checking account'],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description='The currency ID of the currency associated to the data in the entries. This may be the native currency of administration.',
+        examples=['5'],
+    )
+    currency_code: Optional[str] = Field(None, examples=['EUR'])
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(
+        None,
+        description='Number of decimals for the currency associated to the data in the entries.',
+        examples=[2],
+    )
+    start_date: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    end_date: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    type: Optional[str] = Field(
+        None,
+        description='Indicated the type of chart that is expected to be rendered. You can safely ignore this if you want.',
+        examples=['line'],
+    )
+    yAxisID: Optional[int] = Field(
+        None,
+        description='Used to indicate the Y axis for this data set. Is usually between 0 and 1 (left and right side of the chart).',
+        examples=[0],
+    )
+    entries: Optional[Union[List[ChartDataPoint], Entries]] = Field(
+        None,
+        description="The actual entries for this data set. They 'key' value is the label for the data point. The value is the actual (numerical) value.",
+    )
+
+
+class ChartLine(RootModel[List[ChartDataSet]]):
+    root: List[ChartDataSet]
+
+
+class DataDestroyObject(Enum):
+    not_assets_liabilities = 'not_assets_liabilities'
+    budgets = 'budgets'
+    bills = 'bills'
+    piggy_banks = 'piggy_banks'
+    rules = 'rules'
+    recurring = 'recurring'
+    categories = 'categories'
+    tags = 'tags'
+    object_groups = 'object_groups'
+    accounts = 'accounts'
+    asset_accounts = 'asset_accounts'
+    expense_accounts = 'expense_accounts'
+    revenue_accounts = 'revenue_accounts'
+    liabilities = 'liabilities'
+    transactions = 'transactions'
+    withdrawals = 'withdrawals'
+    deposits = 'deposits'
+    transfers = 'transfers'
+
+
+class ConfigValueUpdateFilter(Enum):
+    configuration_is_demo_site = 'configuration.is_demo_site'
+    configuration_permission_update_check = 'configuration.permission_update_check'
+    configuration_last_update_check = 'configuration.last_update_check'
+    configuration_single_user_mode = 'configuration.single_user_mode'
+
+
+class ExportFileFilter(Enum):
+    csv = 'csv'
+
+
+class BasicSummaryEntry(BaseModel):
+    key: Optional[str] = Field(
+        None,
+        description='This is a reference to the type of info shared, not influenced by translations or user preferences. The EUR value is a reference to the currency code. Possibilities are: balance-in-ABC, spent-in-ABC, earned-in-ABC, bills-paid-in-ABC, bills-unpaid-in-ABC, left-to-spend-in-ABC and net-worth-in-ABC.',
+        examples=['balance-in-EUR'],
+    )
+    title: Optional[str] = Field(
+        None,
+        description='A translated title for the information shared.',
+        examples=['Balance ($)'],
+    )
+    monetary_value: Optional[float] = Field(
+        None, description='The amount as a float.', examples=[123.45]
+    )
+    currency_id: Optional[str] = Field(
+        None, description='The currency ID of the associated currency.', examples=['5']
+    )
+    currency_code: Optional[str] = Field(None, examples=['EUR'])
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(
+        None,
+        description='Number of decimals for the associated currency.',
+        examples=[2],
+    )
+    no_available_budgets: Optional[bool] = Field(
+        None,
+        description='True if there are no available budgets available.',
+        examples=[False],
+    )
+    value_parsed: Optional[str] = Field(
+        None,
+        description='The amount formatted according to the users locale',
+        examples=['$ 12.45'],
+    )
+    local_icon: Optional[str] = Field(
+        None,
+        description='Reference to a font-awesome icon without the fa- part.',
+        examples=['balance-scale'],
+    )
+    sub_title: Optional[str] = Field(
+        None,
+        description='A short explanation of the amounts origin. Already formatted according to the locale of the user or translated, if relevant.',
+        examples=['$20 + $-40'],
+    )
+
+
+class CronResultRow(BaseModel):
+    job_fired: Optional[bool] = Field(
+        None,
+        description='This value tells you if this specific cron job actually fired. It may not fire. Some cron jobs\nonly fire every 24 hours, for example.\n',
+        examples=[True],
+    )
+    job_succeeded: Optional[bool] = Field(
+        None,
+        description='This value tells you if this specific cron job actually did something. The job may fire but not\nchange anything.\n',
+        examples=[True],
+    )
+    job_errored: Optional[bool] = Field(
+        None,
+        description='If the cron job ran into some kind of an error, this value will be true.',
+        examples=[False],
+    )
+    message: Optional[str] = Field(
+        None,
+        description='If the cron job ran into some kind of an error, this value will be the error message. The success message\nif the job actually ran OK.\n',
+        examples=['Cron result message'],
+    )
+
+
+class Data(BaseModel):
+    version: Optional[str] = Field(None, examples=['5.8.0-alpha.1'])
+    api_version: Optional[str] = Field(
+        None, description='Same value as the version field.', examples=['5.8.0-alpha.1']
+    )
+    php_version: Optional[str] = Field(None, examples=['8.1.5'])
+    os: Optional[str] = Field(None, examples=['Linux'])
+    driver: Optional[str] = Field(None, examples=['mysql'])
+
+
+class SystemInfo(BaseModel):
+    data: Optional[Data] = None
+
+
+class BadRequestResponse(BaseModel):
+    message: Optional[str] = Field(None, examples=['Bad Request'])
+    exception: Optional[str] = Field(None, examples=['BadRequestHttpException'])
+
+
+class InternalExceptionResponse(BaseModel):
+    message: Optional[str] = Field(None, examples=['Internal Exception'])
+    exception: Optional[str] = Field(None, examples=['InternalException'])
+
+
+class NotFoundResponse(BaseModel):
+    message: Optional[str] = Field(None, examples=['Resource not found'])
+    exception: Optional[str] = Field(None, examples=['NotFoundHttpException'])
+
+
+class UnauthenticatedResponse(BaseModel):
+    message: Optional[str] = Field(None, examples=['Unauthenticated'])
+    exception: Optional[str] = Field(None, examples=['AuthenticationException'])
+
+
+class Errors(BaseModel):
+    email: Optional[List[str]] = None
+    force: Optional[List[str]] = None
+    blocked: Optional[List[str]] = None
+    field: Optional[List[str]] = None
+    role: Optional[List[str]] = None
+    blocked_code: Optional[List[str]] = None
+    name: Optional[List[str]] = None
+    type: Optional[List[str]] = None
+    iban: Optional[List[str]] = None
+    start: Optional[List[str]] = None
+    end: Optional[List[str]] = None
+    date: Optional[List[str]] = None
+
+
+class ValidationErrorResponse(BaseModel):
+    message: Optional[str] = Field(None, examples=['The given data was invalid.'])
+    errors: Optional[Errors] = None
+
+
+class BasicSummary(RootModel[Optional[Dict[str, BasicSummaryEntry]]]):
+    root: Optional[Dict[str, BasicSummaryEntry]] = None
+
+
+class CronResult(BaseModel):
+    recurring_transactions: Optional[CronResultRow] = None
+    auto_budgets: Optional[CronResultRow] = None
+    telemetry: Optional[CronResultRow] = None
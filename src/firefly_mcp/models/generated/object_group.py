@@ -0,0 +1,46 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     object_group (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+)
+
+
+class ObjectGroup(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    title: str = Field(..., examples=['My object group'])
+    order: int = Field(..., description='Order of the object group', examples=[1])
+
+
+class ObjectGroupUpdate(BaseModel):
+    title: str = Field(..., examples=['My object group'])
+    order: Optional[int] = Field(
+        None, description='Order of the object group', examples=[1]
+    )
+
+
+class ObjectGroupRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['object_groups'])
+    id: str = Field(..., examples=['2'])
+    attributes: ObjectGroup
+
+
+class ObjectGroupSingle(BaseModel):
+    data: ObjectGroupRead
+
+
+class ObjectGroupArray(BaseModel):
+    data: List[ObjectGroupRead]
+    meta: Meta
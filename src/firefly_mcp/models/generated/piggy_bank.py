@@ -0,0 +1,153 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     piggy_bank (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+    ObjectLink,
+    PageLink,
+    PiggyBank,
+)
+
+
+class PiggyBankAccountStore(BaseModel):
+    id: str = Field(..., description='The ID of the account.', examples=['3'])
+    name: Optional[str] = Field(
+        None, description='The name of the account.', examples=['Checking account']
+    )
+    current_amount: Optional[str] = Field(
+        None, description='The amount saved currently.', examples=['123.45']
+    )
+
+
+class PiggyBankAccountUpdate(BaseModel):
+    account_id: Optional[str] = Field(
+        None, description='The ID of the account.', examples=['3']
+    )
+    name: Optional[str] = Field(
+        None, description='The name of the account.', examples=['Checking account']
+    )
+    current_amount: Optional[str] = Field(
+        None, description='The amount saved currently.', examples=['123.45']
+    )
+
+
+class PiggyBankStore(BaseModel):
+    name: str = Field(..., examples=['New digital camera'])
+    accounts: Optional[List[PiggyBankAccountStore]] = None
+    target_amount: str = Field(..., examples=['123.45'])
+    current_amount: Optional[str] = Field(None, examples=['123.45'])
+    start_date: Optional[date_aliased] = Field(
+        None,
+        description='The date you started with this piggy bank.',
+        examples=['2018-09-17'],
+    )
+    target_date: Optional[date_aliased] = Field(
+        None,
+        description='The date you intend to finish saving money.',
+        examples=['2018-09-17'],
+    )
+    order: Optional[int] = Field(None, examples=[5])
+    active: Optional[bool] = Field(None, examples=[True])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    object_group_id: Optional[str] = Field(
+        None,
+        description='The group ID of the group this object is part of. NULL if no group.',
+        examples=['5'],
+    )
+    object_group_title: Optional[str] = Field(
+        None,
+        description='The name of the group. NULL if no group.',
+        examples=['Example Group'],
+    )
+
+
+class PiggyBankUpdate(BaseModel):
+    name: Optional[str] = Field(None, examples=['New digital camera'])
+    accounts: Optional[List[PiggyBankAccountUpdate]] = None
+    currency_id: Optional[str] = Field(None, examples=['5'])
+    currency_code: Optional[str] = Field(None, examples=['USD'])
+    target_amount: Optional[str] = Field(None, examples=['123.45'])
+    start_date: Optional[date_aliased] = Field(
+        None,
+        description='The date you started with this piggy bank.',
+        examples=['2018-09-17'],
+    )
+    target_date: Optional[date_aliased] = Field(
+        None,
+        description='The date you intend to finish saving money.',
+        examples=['2018-09-17'],
+    )
+    order: Optional[int] = Field(None, examples=[5])
+    active: Optional[bool] = Field(None, examples=[True])
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    object_group_id: Optional[str] = Field(
+        None,
+        description='The group ID of the group this object is part of. NULL if no group.',
+        examples=['5'],
+    )
+    object_group_title: Optional[str] = Field(
+        None,
+        description='The name of the group. NULL if no group.',
+        examples=['Example Group'],
+    )
+
+
+class PiggyBankEvent(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    currency_id: Optional[str] = Field(None, examples=['5'])
+    currency_code: Optional[str] = Field(None, examples=['EUR'])
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_decimal_places: Optional[int] = Field(None, examples=[2])
+    amount: Optional[str] = Field(None, examples=['123.45'])
+    transaction_journal_id: Optional[str] = Field(
+        None, description='The journal associated with the event.', examples=['4291']
+    )
+    transaction_group_id: Optional[str] = Field(
+        None,
+        description='The transaction group associated with the event.',
+        examples=['4291'],
+    )
+
+
+class PiggyBankEventRead(BaseModel):
+    type: str = Field(
+        ..., description='Immutable value', examples=['piggy_bank_events']
+    )
+    id: str = Field(..., examples=['2'])
+    attributes: PiggyBankEvent
+    links: ObjectLink
+
+
+class PiggyBankEventArray(BaseModel):
+    data: List[PiggyBankEventRead]
+    meta: Meta
+    links: PageLink
+
+
+class PiggyBankRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['piggy_banks'])
+    id: str = Field(..., examples=['2'])
+    attributes: PiggyBank
+    links: ObjectLink
+
+
+class PiggyBankSingle(BaseModel):
+    data: PiggyBankRead
+
+
+class PiggyBankArray(BaseModel):
+    data: List[PiggyBankRead]
+    meta: Meta
+    links: PageLink
@@ -0,0 +1,46 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     preference (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+    PageLink,
+    PolymorphicProperty,
+)
+
+
+class Preference(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    name: str = Field(..., examples=['currencyPreference'])
+    data: PolymorphicProperty
+
+
+class PreferenceUpdate(BaseModel):
+    data: PolymorphicProperty
+
+
+class PreferenceRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['preferences'])
+    id: str = Field(..., examples=['2'])
+    attributes: Preference
+
+
+class PreferenceSingle(BaseModel):
+    data: PreferenceRead
+
+
+class PreferenceArray(BaseModel):
+    data: List[PreferenceRead]
+    meta: Meta
+    links: PageLink
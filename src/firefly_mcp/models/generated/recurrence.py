@@ -0,0 +1,434 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     recurrence (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    AccountTypeProperty,
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class RecurrenceTransactionStore(BaseModel):
+    description: str = Field(..., examples=['Rent for the current month'])
+    amount: str = Field(
+        ..., description='Amount of the transaction.', examples=['123.45']
+    )
+    foreign_amount: Optional[str] = Field(
+        None, description='Foreign amount of the transaction.', examples=['123.45']
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description='Submit either a currency_id or a currency_code.',
+        examples=['3'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description='Submit either a currency_id or a currency_code.',
+        examples=['EUR'],
+    )
+    foreign_currency_id: Optional[str] = Field(
+        None,
+        description='Submit either a foreign_currency_id or a foreign_currency_code, or neither.',
+        examples=['17'],
+    )
+    foreign_currency_code: Optional[str] = Field(
+        None,
+        description='Submit either a foreign_currency_id or a foreign_currency_code, or neither.',
+        examples=['GBP'],
+    )
+    budget_id: Optional[str] = Field(
+        None, description='The budget ID for this transaction.', examples=['4']
+    )
+    category_id: Optional[str] = Field(
+        None, description='Category ID for this transaction.', examples=['211']
+    )
+    source_id: str = Field(
+        ..., description='ID of the source account.', examples=['913']
+    )
+    destination_id: str = Field(
+        ..., description='ID of the destination account.', examples=['258']
+    )
+    tags: Optional[List[str]] = Field(
+        None, description='Array of tags.', examples=[None]
+    )
+    piggy_bank_id: Optional[str] = Field(
+        None, description='Optional.', examples=['123']
+    )
+    bill_id: Optional[str] = Field(None, description='Optional.', examples=['123'])
+
+
+class RecurrenceTransactionUpdate(BaseModel):
+    id: str = Field(
+        ...,
+        examples=[
+            'ID of the recurring transaction. Not to be confused with the ID of the recurrence itself. Is marked as REQUIRED but can be skipped when there is only ONE transaction.'
+        ],
+    )
+    description: Optional[str] = Field(None, examples=['Rent for the current month'])
+    amount: Optional[str] = Field(
+        None, description='Amount of the transaction.', examples=['123.45']
+    )
+    foreign_amount: Optional[str] = Field(
+        None, description='Foreign amount of the transaction.', examples=['123.45']
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description='Submit either a currency_id or a currency_code.',
+        examples=['3'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description='Submit either a currency_id or a currency_code.',
+        examples=['EUR'],
+    )
+    foreign_currency_id: Optional[str] = Field(
+        None,
+        description='Submit either a foreign_currency_id or a foreign_currency_code, or neither.',
+        examples=['17'],
+    )
+    budget_id: Optional[str] = Field(
+        None, description='The budget ID for this transaction.', examples=['4']
+    )
+    category_id: Optional[str] = Field(
+        None, description='Category ID for this transaction.', examples=['211']
+    )
+    source_id: Optional[str] = Field(
+        None,
+        description='ID of the source account. Submit either this or source_name.',
+        examples=['913'],
+    )
+    destination_id: Optional[str] = Field(
+        None,
+        description='ID of the destination account. Submit either this or destination_name.',
+        examples=['258'],
+    )
+    tags: Optional[List[str]] = Field(
+        None, description='Array of tags.', examples=[None]
+    )
+    piggy_bank_id: Optional[str] = Field(None, examples=['123'])
+    bill_id: Optional[str] = Field(None, description='Optional.', examples=['123'])
+
+
+class RecurrenceRepetitionType(Enum):
+    daily = 'daily'
+    weekly = 'weekly'
+    ndom = 'ndom'
+    monthly = 'monthly'
+    yearly = 'yearly'
+
+
+class RecurrenceTransactionType(Enum):
+    withdrawal = 'withdrawal'
+    transfer = 'transfer'
+    deposit = 'deposit'
+
+
+class RecurrenceRepetition(BaseModel):
+    id: Optional[str] = Field(None, examples=['2'])
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    type: RecurrenceRepetitionType
+    moment: str = Field(
+        ...,
+        description="Information that defined the type of repetition.\n- For 'daily', this is empty.\n- For 'weekly', it is day of the week between 1 and 7 (Monday - Sunday).\n- For 'ndom', it is '1,2' or '4,5' or something else, where the first number is the week in the month, and the second number is the day in the week (between 1 and 7). '2,3' means: the 2nd Wednesday of the month\n- For 'monthly' it is the day of the month (1 - 31)\n- For yearly, it is a full date, ie '2018-09-17'. The year you use does not matter.\n",
+        examples=['3'],
+    )
+    skip: Optional[int] = Field(
+        None,
+        description='How many occurrences to skip. 0 means skip nothing. 1 means every other.',
+        examples=[0],
+    )
+    weekend: Optional[int] = Field(
+        None,
+        description='How to respond when the recurring transaction falls in the weekend. Possible values:\n1. Do nothing, just create it\n2. Create no transaction.\n3. Skip to the previous Friday.\n4. Skip to the next Monday.\n',
+        examples=[1],
+    )
+    description: Optional[str] = Field(
+        None,
+        description='Auto-generated repetition description.',
+        examples=['Every week on Friday'],
+    )
+    occurrences: Optional[List[datetime]] = Field(
+        None,
+        description='Array of future dates when the repetition will apply to. Auto generated.',
+    )
+
+
+class RecurrenceRepetitionStore(BaseModel):
+    type: RecurrenceRepetitionType
+    moment: str = Field(
+        ...,
+        description="Information that defined the type of repetition.\n- For 'daily', this is empty.\n- For 'weekly', it is day of the week between 1 and 7 (Monday - Sunday).\n- For 'ndom', it is '1,2' or '4,5' or something else, where the first number is the week in the month, and the second number is the day in the week (between 1 and 7). '2,3' means: the 2nd Wednesday of the month\n- For 'monthly' it is the day of the month (1 - 31)\n- For yearly, it is a full date, ie '2018-09-17'. The year you use does not matter.\n",
+        examples=['3'],
+    )
+    skip: Optional[int] = Field(
+        None,
+        description='How many occurrences to skip. 0 means skip nothing. 1 means every other.',
+        examples=[0],
+    )
+    weekend: Optional[int] = Field(
+        None,
+        description='How to respond when the recurring transaction falls in the weekend. Possible values:\n1. Do nothing, just create it\n2. Create no transaction.\n3. Skip to the previous Friday.\n4. Skip to the next Monday.\n',
+        examples=[1],
+    )
+
+
+class RecurrenceRepetitionUpdate(BaseModel):
+    type: Optional[RecurrenceRepetitionType] = None
+    moment: Optional[str] = Field(
+        None,
+        description="Information that defined the type of repetition.\n- For 'daily', this is empty.\n- For 'weekly', it is day of the week between 1 and 7 (Monday - Sunday).\n- For 'ndom', it is '1,2' or '4,5' or something else, where the first number is the week in the month, and the second number is the day in the week (between 1 and 7). '2,3' means: the 2nd Wednesday of the month\n- For 'monthly' it is the day of the month (1 - 31)\n- For yearly, it is a full date, ie '2018-09-17'. The year you use does not matter.\n",
+        examples=['3'],
+    )
+    skip: Optional[int] = Field(
+        None,
+        description='How many occurrences to skip. 0 means skip nothing. 1 means every other.',
+        examples=[0],
+    )
+    weekend: Optional[int] = Field(
+        None,
+        description='How to respond when the recurring transaction falls in the weekend. Possible values:\n1. Do nothing, just create it\n2. Create no transaction.\n3. Skip to the previous Friday.\n4. Skip to the next Monday.\n',
+        examples=[1],
+    )
+
+
+class RecurrenceTransaction(BaseModel):
+    id: Optional[str] = Field(
+        None,
+        examples=[
+            'ID of the recurring transaction. Not to be confused with the ID of the recurrence itself.'
+        ],
+    )
+    description: str = Field(..., examples=['Rent for the current month'])
+    amount: str = Field(
+        ..., description='Amount of the transaction.', examples=['123.45']
+    )
+    foreign_amount: Optional[str] = Field(
+        None, description='Foreign amount of the transaction.', examples=['123.45']
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description='Submit either a currency_id or a currency_code.',
+        examples=['3'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description='Submit either a currency_id or a currency_code.',
+        examples=['EUR'],
+    )
+    currency_symbol: Optional[str] = Field(None, examples=['€'])
+    currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals in the currency', examples=[2]
+    )
+    foreign_currency_id: Optional[str] = Field(
+        None,
+        description='Submit either a foreign_currency_id or a foreign_currency_code, or neither.',
+        examples=['17'],
+    )
+    foreign_currency_code: Optional[str] = Field(
+        None,
+        description='Submit either a foreign_currency_id or a foreign_currency_code, or neither.',
+        examples=['GBP'],
+    )
+    foreign_currency_symbol: Optional[str] = Field(None, examples=['$'])
+    foreign_currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals in the currency', examples=[2]
+    )
+    budget_id: Optional[str] = Field(
+        None, description='The budget ID for this transaction.', examples=['4']
+    )
+    budget_name: Optional[str] = Field(
+        None,
+        description='The name of the budget to be used. If the budget name is unknown, the ID will be used or the value will be ignored.',
+        examples=['Groceries'],
+    )
+    category_id: Optional[str] = Field(
+        None, description='Category ID for this transaction.', examples=['211']
+    )
+    category_name: Optional[str] = Field(
+        None, description='Category name for this transaction.', examples=['Bills']
+    )
+    source_id: Optional[str] = Field(
+        None,
+        description='ID of the source account. Submit either this or source_name.',
+        examples=['913'],
+    )
+    source_name: Optional[str] = Field(
+        None,
+        description='Name of the source account. Submit either this or source_id.',
+        examples=['Checking account'],
+    )
+    source_iban: Optional[str] = Field(None, examples=['NL02ABNA0123456789'])
+    source_type: Optional[AccountTypeProperty] = None
+    destination_id: Optional[str] = Field(
+        None,
+        description='ID of the destination account. Submit either this or destination_name.',
+        examples=['258'],
+    )
+    destination_name: Optional[str] = Field(
+        None,
+        description='Name of the destination account. Submit either this or destination_id.',
+        examples=['Buy and Large'],
+    )
+    destination_iban: Optional[str] = Field(None, examples=['NL02ABNA0123456789'])
+    destination_type: Optional[AccountTypeProperty] = None
+    tags: Optional[List[str]] = Field(
+        None, description='Array of tags.', examples=[None]
+    )
+    piggy_bank_id: Optional[str] = Field(
+        None,
+        description='Optional. Use either this or the piggy_bank_name',
+        examples=['123'],
+    )
+    piggy_bank_name: Optional[str] = Field(
+        None, description='Optional. Use either this or the piggy_bank_id'
+    )
+    bill_id: Optional[str] = Field(
+        None, description='Optional. Use either this or the bill_name', examples=['123']
+    )
+    bill_name: Optional[str] = Field(
+        None, description='Optional. Use either this or the bill_id'
+    )
+
+
+class Recurrence(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    type: Optional[RecurrenceTransactionType] = None
+    title: Optional[str] = Field(None, examples=['Rent'])
+    description: Optional[str] = Field(
+        None,
+        description='Not to be confused with the description of the actual transaction(s) being created.',
+        examples=['Recurring transaction for the monthly rent'],
+    )
+    first_date: Optional[date_aliased] = Field(
+        None,
+        description='First time the recurring transaction will fire. Must be after today.',
+        examples=['2018-09-17'],
+    )
+    latest_date: Optional[date_aliased] = Field(
+        None,
+        description='Last time the recurring transaction has fired.',
+        examples=['2018-09-17'],
+    )
+    repeat_until: Optional[date_aliased] = Field(
+        None,
+        description='Date until the recurring transaction can fire. Use either this field or repetitions.',
+        examples=['2018-09-17'],
+    )
+    nr_of_repetitions: Optional[int] = Field(
+        None,
+        description='Max number of created transactions. Use either this field or repeat_until.',
+        examples=[5],
+    )
+    apply_rules: Optional[bool] = Field(
+        None,
+        description='Whether or not to fire the rules after the creation of a transaction.',
+        examples=[True],
+    )
+    active: Optional[bool] = Field(
+        None, description='If the recurrence is even active.', examples=[True]
+    )
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    repetitions: Optional[List[RecurrenceRepetition]] = None
+    transactions: Optional[List[RecurrenceTransaction]] = None
+
+
+class RecurrenceStore(BaseModel):
+    type: RecurrenceTransactionType
+    title: str = Field(..., examples=['Rent'])
+    description: Optional[str] = Field(
+        None,
+        description='Not to be confused with the description of the actual transaction(s) being created.',
+        examples=['Recurring transaction for the monthly rent'],
+    )
+    first_date: date_aliased = Field(
+        ...,
+        description='First time the recurring transaction will fire. Must be after today.',
+        examples=['2018-09-17'],
+    )
+    repeat_until: date_aliased = Field(
+        ...,
+        description='Date until the recurring transaction can fire. Use either this field or repetitions.',
+        examples=['2018-09-17'],
+    )
+    nr_of_repetitions: Optional[int] = Field(
+        None,
+        description='Max number of created transactions. Use either this field or repeat_until.',
+        examples=[5],
+    )
+    apply_rules: Optional[bool] = Field(
+        None,
+        description='Whether or not to fire the rules after the creation of a transaction.',
+        examples=[True],
+    )
+    active: Optional[bool] = Field(
+        None, description='If the recurrence is even active.', examples=[True]
+    )
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    repetitions: List[RecurrenceRepetitionStore]
+    transactions: List[RecurrenceTransactionStore]
+
+
+class RecurrenceUpdate(BaseModel):
+    title: Optional[str] = Field(None, examples=['Rent'])
+    description: Optional[str] = Field(
+        None,
+        description='Not to be confused with the description of the actual transaction(s) being created.',
+        examples=['Recurring transaction for the monthly rent'],
+    )
+    first_date: Optional[date_aliased] = Field(
+        None,
+        description='First time the recurring transaction will fire.',
+        examples=['2018-09-17'],
+    )
+    repeat_until: Optional[date_aliased] = Field(
+        None,
+        description="Date until the recurring transaction can fire. After that date, it's basically inactive. Use either this field or repetitions.",
+        examples=['2018-09-17'],
+    )
+    nr_of_repetitions: Optional[int] = Field(
+        None,
+        description='Max number of created transactions. Use either this field or repeat_until.',
+        examples=[5],
+    )
+    apply_rules: Optional[bool] = Field(
+        None,
+        description='Whether or not to fire the rules after the creation of a transaction.',
+        examples=[True],
+    )
+    active: Optional[bool] = Field(
+        None, description='If the recurrence is even active.', examples=[True]
+    )
+    notes: Optional[str] = Field(None, examples=['Some notes'])
+    repetitions: Optional[List[RecurrenceRepetitionUpdate]] = None
+    transactions: Optional[List[RecurrenceTransactionUpdate]] = None
+
+
+class RecurrenceRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['recurrences'])
+    id: str = Field(..., examples=['2'])
+    attributes: Recurrence
+    links: ObjectLink
+
+
+class RecurrenceSingle(BaseModel):
+    data: RecurrenceRead
+
+
+class RecurrenceArray(BaseModel):
+    data: List[RecurrenceRead]
+    meta: Meta
+    links: PageLink
@@ -0,0 +1,328 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     rule (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class RuleActionKeyword(Enum):
+    user_action = 'user_action'
+    set_category = 'set_category'
+    clear_category = 'clear_category'
+    set_budget = 'set_budget'
+    clear_budget = 'clear_budget'
+    add_tag = 'add_tag'
+    remove_tag = 'remove_tag'
+    remove_all_tags = 'remove_all_tags'
+    set_description = 'set_description'
+    append_description = 'append_description'
+    prepend_description = 'prepend_description'
+    set_source_account = 'set_source_account'
+    set_destination_account = 'set_destination_account'
+    set_notes = 'set_notes'
+    append_notes = 'append_notes'
+    prepend_notes = 'prepend_notes'
+    clear_notes = 'clear_notes'
+    link_to_bill = 'link_to_bill'
+    convert_withdrawal = 'convert_withdrawal'
+    convert_deposit = 'convert_deposit'
+    convert_transfer = 'convert_transfer'
+    delete_transaction = 'delete_transaction'
+
+
+class RuleTriggerKeyword(Enum):
+    from_account_starts = 'from_account_starts'
+    from_account_ends = 'from_account_ends'
+    from_account_is = 'from_account_is'
+    from_account_contains = 'from_account_contains'
+    to_account_starts = 'to_account_starts'
+    to_account_ends = 'to_account_ends'
+    to_account_is = 'to_account_is'
+    to_account_contains = 'to_account_contains'
+    amount_less = 'amount_less'
+    amount_exactly = 'amount_exactly'
+    amount_more = 'amount_more'
+    description_starts = 'description_starts'
+    description_ends = 'description_ends'
+    description_contains = 'description_contains'
+    description_is = 'description_is'
+    transaction_type = 'transaction_type'
+    category_is = 'category_is'
+    budget_is = 'budget_is'
+    tag_is = 'tag_is'
+    currency_is = 'currency_is'
+    has_attachments = 'has_attachments'
+    has_no_category = 'has_no_category'
+    has_any_category = 'has_any_category'
+    has_no_budget = 'has_no_budget'
+    has_any_budget = 'has_any_budget'
+    has_no_tag = 'has_no_tag'
+    has_any_tag = 'has_any_tag'
+    notes_contains = 'notes_contains'
+    notes_start = 'notes_start'
+    notes_end = 'notes_end'
+    notes_are = 'notes_are'
+    no_notes = 'no_notes'
+    any_notes = 'any_notes'
+    source_account_is = 'source_account_is'
+    destination_account_is = 'destination_account_is'
+    source_account_starts = 'source_account_starts'
+
+
+class RuleTriggerType(Enum):
+    store_journal = 'store-journal'
+    update_journal = 'update-journal'
+
+
+class RuleAction(BaseModel):
+    id: Optional[str] = Field(None, examples=['2'])
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    type: RuleActionKeyword
+    value: str = Field(
+        ...,
+        description='The accompanying value the action will set, change or update. Can be empty, but for some types this value is mandatory.',
+        examples=['Daily groceries'],
+    )
+    order: Optional[int] = Field(None, description='Order of the action', examples=[5])
+    active: Optional[bool] = Field(
+        True, description='If the action is active. Defaults to true.', examples=[True]
+    )
+    stop_processing: Optional[bool] = Field(
+        False,
+        description='When true, other actions will not be fired after this action has fired. Defaults to false.',
+        examples=[False],
+    )
+
+
+class RuleActionStore(BaseModel):
+    type: RuleActionKeyword
+    value: str = Field(
+        ...,
+        description='The accompanying value the action will set, change or update. Can be empty, but for some types this value is mandatory.',
+        examples=['Daily groceries'],
+    )
+    order: Optional[int] = Field(None, description='Order of the action', examples=[5])
+    active: Optional[bool] = Field(
+        True, description='If the action is active. Defaults to true.', examples=[True]
+    )
+    stop_processing: Optional[bool] = Field(
+        False,
+        description='When true, other actions will not be fired after this action has fired. Defaults to false.',
+        examples=[False],
+    )
+
+
+class RuleActionUpdate(BaseModel):
+    type: Optional[RuleActionKeyword] = None
+    value: Optional[str] = Field(
+        None,
+        description='The accompanying value the action will set, change or update. Can be empty, but for some types this value is mandatory.',
+        examples=['Daily groceries'],
+    )
+    order: Optional[int] = Field(None, description='Order of the action', examples=[5])
+    active: Optional[bool] = Field(
+        None, description='If the action is active.', examples=[True]
+    )
+    stop_processing: Optional[bool] = Field(
+        None,
+        description='When true, other actions will not be fired after this action has fired.',
+        examples=[False],
+    )
+
+
+class RuleTrigger(BaseModel):
+    id: Optional[str] = Field(None, examples=['2'])
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    type: RuleTriggerKeyword
+    value: str = Field(
+        ...,
+        description='The accompanying value the trigger responds to. This value is often mandatory, but this depends on the trigger.',
+        examples=['tag1'],
+    )
+    prohibited: Optional[bool] = Field(
+        False,
+        description="If 'prohibited' is true, this rule trigger will be negated. 'Description is' will become 'Description is NOT' etc.",
+        examples=[False],
+    )
+    order: Optional[int] = Field(None, description='Order of the trigger', examples=[5])
+    active: Optional[bool] = Field(
+        True, description='If the trigger is active. Defaults to true.', examples=[True]
+    )
+    stop_processing: Optional[bool] = Field(
+        False,
+        description='When true, other triggers will not be checked if this trigger was triggered. Defaults to false.',
+        examples=[False],
+    )
+
+
+class RuleTriggerStore(BaseModel):
+    type: RuleTriggerKeyword
+    value: str = Field(
+        ...,
+        description='The accompanying value the trigger responds to. This value is often mandatory, but this depends on the trigger.',
+        examples=['tag1'],
+    )
+    order: Optional[int] = Field(None, description='Order of the trigger', examples=[5])
+    active: Optional[bool] = Field(
+        True, description='If the trigger is active. Defaults to true.', examples=[True]
+    )
+    prohibited: Optional[bool] = Field(
+        False,
+        description="If 'prohibited' is true, this rule trigger will be negated. 'Description is' will become 'Description is NOT' etc.",
+        examples=[False],
+    )
+    stop_processing: Optional[bool] = Field(
+        False,
+        description='When true, other triggers will not be checked if this trigger was triggered. Defaults to false.',
+        examples=[False],
+    )
+
+
+class RuleTriggerUpdate(BaseModel):
+    type: Optional[RuleTriggerKeyword] = None
+    value: Optional[str] = Field(
+        None,
+        description="The accompanying value the trigger responds to. This value is often mandatory, but this depends on the trigger. If the rule trigger is something like 'has any tag', submit the string 'true'.",
+        examples=['tag1'],
+    )
+    order: Optional[int] = Field(None, description='Order of the trigger', examples=[5])
+    active: Optional[bool] = Field(
+        None, description='If the trigger is active.', examples=[True]
+    )
+    stop_processing: Optional[bool] = Field(
+        None,
+        description='When true, other triggers will not be checked if this trigger was triggered.',
+        examples=[False],
+    )
+
+
+class Rule(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    title: str = Field(..., examples=['First rule title.'])
+    description: Optional[str] = Field(None, examples=['First rule description'])
+    rule_group_id: str = Field(
+        ...,
+        description='ID of the rule group under which the rule must be stored. Either this field or rule_group_title is mandatory.',
+        examples=['81'],
+    )
+    rule_group_title: Optional[str] = Field(
+        None,
+        description='Title of the rule group under which the rule must be stored. Either this field or rule_group_id is mandatory.',
+        examples=['New rule group'],
+    )
+    order: Optional[int] = Field(None, examples=[5])
+    trigger: RuleTriggerType
+    active: Optional[bool] = Field(
+        True,
+        description='Whether or not the rule is even active. Default is true.',
+        examples=[True],
+    )
+    strict: Optional[bool] = Field(
+        None,
+        description='If the rule is set to be strict, ALL triggers must hit in order for the rule to fire. Otherwise, just one is enough. Default value is true.',
+        examples=[True],
+    )
+    stop_processing: Optional[bool] = Field(
+        False,
+        description='If this value is true and the rule is triggered, other rules  after this one in the group will be skipped. Default value is false.',
+        examples=[False],
+    )
+    triggers: List[RuleTrigger]
+    actions: List[RuleAction]
+
+
+class RuleStore(BaseModel):
+    title: str = Field(..., examples=['First rule title.'])
+    description: Optional[str] = Field(None, examples=['First rule description'])
+    rule_group_id: str = Field(
+        ...,
+        description='ID of the rule group under which the rule must be stored. Either this field or rule_group_title is mandatory.',
+        examples=['81'],
+    )
+    rule_group_title: Optional[str] = Field(
+        None,
+        description='Title of the rule group under which the rule must be stored. Either this field or rule_group_id is mandatory.',
+        examples=['New rule group'],
+    )
+    order: Optional[int] = Field(None, examples=[5])
+    trigger: RuleTriggerType
+    active: Optional[bool] = Field(
+        True,
+        description='Whether or not the rule is even active. Default is true.',
+        examples=[True],
+    )
+    strict: Optional[bool] = Field(
+        True,
+        description='If the rule is set to be strict, ALL triggers must hit in order for the rule to fire. Otherwise, just one is enough. Default value is true.',
+        examples=[True],
+    )
+    stop_processing: Optional[bool] = Field(
+        None,
+        description='If this value is true and the rule is triggered, other rules  after this one in the group will be skipped. Default value is false.',
+        examples=[False],
+    )
+    triggers: List[RuleTriggerStore]
+    actions: List[RuleActionStore]
+
+
+class RuleUpdate(BaseModel):
+    title: Optional[str] = Field(None, examples=['First rule title.'])
+    description: Optional[str] = Field(None, examples=['First rule description'])
+    rule_group_id: Optional[str] = Field(
+        None,
+        description='ID of the rule group under which the rule must be stored. Either this field or rule_group_title is mandatory.',
+        examples=['81'],
+    )
+    order: Optional[int] = Field(None, examples=[5])
+    trigger: Optional[RuleTriggerType] = None
+    active: Optional[bool] = Field(
+        True,
+        description='Whether or not the rule is even active. Default is true.',
+        examples=[True],
+    )
+    strict: Optional[bool] = Field(
+        None,
+        description='If the rule is set to be strict, ALL triggers must hit in order for the rule to fire. Otherwise, just one is enough. Default value is true.',
+        examples=[True],
+    )
+    stop_processing: Optional[bool] = Field(
+        False,
+        description='If this value is true and the rule is triggered, other rules  after this one in the group will be skipped. Default value is false.',
+        examples=[False],
+    )
+    triggers: Optional[List[RuleTriggerUpdate]] = None
+    actions: Optional[List[RuleActionUpdate]] = None
+
+
+class RuleRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['rules'])
+    id: str = Field(..., examples=['2'])
+    attributes: Rule
+    links: ObjectLink
+
+
+class RuleSingle(BaseModel):
+    data: RuleRead
+
+
+class RuleArray(BaseModel):
+    data: List[RuleRead]
+    meta: Meta
+    links: PageLink
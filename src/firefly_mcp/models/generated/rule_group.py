@@ -0,0 +1,65 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     rule_group (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class RuleGroup(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    title: str = Field(..., examples=['Default rule group'])
+    description: Optional[str] = Field(
+        None, examples=['Description of this rule group']
+    )
+    order: Optional[int] = Field(None, examples=[4])
+    active: Optional[bool] = Field(None, examples=[True])
+
+
+class RuleGroupStore(BaseModel):
+    title: str = Field(..., examples=['Default rule group'])
+    description: Optional[str] = Field(
+        None, examples=['Description of this rule group']
+    )
+    order: Optional[int] = Field(None, examples=[4])
+    active: Optional[bool] = Field(None, examples=[True])
+
+
+class RuleGroupUpdate(BaseModel):
+    title: Optional[str] = Field(None, examples=['Default rule group'])
+    description: Optional[str] = Field(
+        None, examples=['Description of this rule group']
+    )
+    order: Optional[int] = Field(None, examples=[4])
+    active: Optional[bool] = Field(None, examples=[True])
+
+
+class RuleGroupRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['rules_group'])
+    id: str = Field(..., examples=['2'])
+    attributes: RuleGroup
+    links: ObjectLink
+
+
+class RuleGroupSingle(BaseModel):
+    data: RuleGroupRead
+
+
+class RuleGroupArray(BaseModel):
+    data: List[RuleGroupRead]
+    meta: Meta
+    links: PageLink
@@ -0,0 +1,113 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     tag (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class TagModel(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    tag: str = Field(..., description='The tag', examples=['expensive'])
+    date: Optional[date_aliased] = Field(
+        None,
+        description='The date to which the tag is applicable.',
+        examples=['2018-09-17'],
+    )
+    description: Optional[str] = Field(None, examples=['Tag for expensive stuff'])
+    latitude: Optional[float] = Field(
+        None,
+        description="Latitude of the tag's location, if applicable. Can be used to draw a map.",
+        examples=[51.983333],
+    )
+    longitude: Optional[float] = Field(
+        None,
+        description="Latitude of the tag's location, if applicable. Can be used to draw a map.",
+        examples=[5.916667],
+    )
+    zoom_level: Optional[int] = Field(
+        None,
+        description='Zoom level for the map, if drawn. This to set the box right. Unfortunately this is a proprietary value because each map provider has different zoom levels.',
+        examples=[6],
+    )
+
+
+class TagModelStore(BaseModel):
+    tag: str = Field(..., description='The tag', examples=['expensive'])
+    date: Optional[date_aliased] = Field(
+        None,
+        description='The date to which the tag is applicable.',
+        examples=['2018-09-17'],
+    )
+    description: Optional[str] = Field(None, examples=['Tag for expensive stuff'])
+    latitude: Optional[float] = Field(
+        None,
+        description="Latitude of the tag's location, if applicable. Can be used to draw a map.",
+        examples=[51.983333],
+    )
+    longitude: Optional[float] = Field(
+        None,
+        description="Latitude of the tag's location, if applicable. Can be used to draw a map.",
+        examples=[5.916667],
+    )
+    zoom_level: Optional[int] = Field(
+        None,
+        description='Zoom level for the map, if drawn. This to set the box right. Unfortunately this is a proprietary value because each map provider has different zoom levels.',
+        examples=[6],
+    )
+
+
+class TagModelUpdate(BaseModel):
+    tag: Optional[str] = Field(None, description='The tag', examples=['expensive'])
+    date: Optional[date_aliased] = Field(
+        None,
+        description='The date to which the tag is applicable.',
+        examples=['2018-09-17'],
+    )
+    description: Optional[str] = Field(None, examples=['Tag for expensive stuff'])
+    latitude: Optional[float] = Field(
+        None,
+        description="Latitude of the tag's location, if applicable. Can be used to draw a map.",
+        examples=[51.983333],
+    )
+    longitude: Optional[float] = Field(
+        None,
+        description="Latitude of the tag's location, if applicable. Can be used to draw a map.",
+        examples=[5.916667],
+    )
+    zoom_level: Optional[int] = Field(
+        None,
+        description='Zoom level for the map, if drawn. This to set the box right. Unfortunately this is a proprietary value because each map provider has different zoom levels.',
+        examples=[6],
+    )
+
+
+class TagRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['tags'])
+    id: str = Field(..., examples=['2'])
+    attributes: TagModel
+    links: ObjectLink
+
+
+class TagSingle(BaseModel):
+    data: TagRead
+
+
+class TagArray(BaseModel):
+    data: List[TagRead]
+    meta: Meta
+    links: PageLink
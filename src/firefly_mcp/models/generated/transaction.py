@@ -0,0 +1,669 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     transaction (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    AccountTypeProperty,
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class TransactionLink(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    link_type_id: str = Field(
+        ...,
+        description='The link type ID to use. You can also use the link_type_name field.',
+        examples=['5'],
+    )
+    link_type_name: Optional[str] = Field(
+        None,
+        description='The link type name to use. You can also use the link_type_id field.',
+        examples=['Is paid by'],
+    )
+    inward_id: str = Field(
+        ...,
+        description="The inward transaction transaction_journal_id for the link. This becomes the 'is paid by' transaction of the set.",
+        examples=['131'],
+    )
+    outward_id: str = Field(
+        ...,
+        description="The outward transaction transaction_journal_id for the link. This becomes the 'pays for' transaction of the set.",
+        examples=['131'],
+    )
+    notes: Optional[str] = Field(
+        None, description='Optional. Some notes.', examples=['Some example notes']
+    )
+
+
+class TransactionLinkStore(BaseModel):
+    link_type_id: str = Field(
+        ...,
+        description='The link type ID to use. You can also use the link_type_name field.',
+        examples=['5'],
+    )
+    link_type_name: Optional[str] = Field(
+        None,
+        description='The link type name to use. You can also use the link_type_id field.',
+        examples=['Is paid by'],
+    )
+    inward_id: str = Field(
+        ...,
+        description="The inward transaction transaction_journal_id for the link. This becomes the 'is paid by' transaction of the set.",
+        examples=['131'],
+    )
+    outward_id: str = Field(
+        ...,
+        description="The outward transaction transaction_journal_id for the link. This becomes the 'pays for' transaction of the set.",
+        examples=['131'],
+    )
+    notes: Optional[str] = Field(
+        None, description='Optional. Some notes.', examples=['Some example notes']
+    )
+
+
+class TransactionLinkUpdate(BaseModel):
+    link_type_id: Optional[str] = Field(
+        None,
+        description='The link type ID to use. Use this field OR use the link_type_name field.',
+        examples=['5'],
+    )
+    link_type_name: Optional[str] = Field(
+        None,
+        description='The link type name to use. Use this field OR use the link_type_id field.',
+        examples=['Is paid by'],
+    )
+    inward_id: Optional[str] = Field(
+        None,
+        description="The inward transaction transaction_journal_id for the link. This becomes the 'is paid by' transaction of the set.",
+        examples=['131'],
+    )
+    outward_id: Optional[str] = Field(
+        None,
+        description="The outward transaction transaction_journal_id for the link. This becomes the 'pays for' transaction of the set.",
+        examples=['131'],
+    )
+    notes: Optional[str] = Field(
+        None,
+        description='Optional. Some notes. If you submit an empty string the current notes will be removed',
+        examples=['Some example notes'],
+    )
+
+
+class TransactionTypeFilter(Enum):
+    all = 'all'
+    withdrawal = 'withdrawal'
+    withdrawals = 'withdrawals'
+    expense = 'expense'
+    deposit = 'deposit'
+    deposits = 'deposits'
+    income = 'income'
+    transfer = 'transfer'
+    transfers = 'transfers'
+    opening_balance = 'opening_balance'
+    reconciliation = 'reconciliation'
+    special = 'special'
+    specials = 'specials'
+    default = 'default'
+
+
+class TransactionTypeProperty(Enum):
+    withdrawal = 'withdrawal'
+    deposit = 'deposit'
+    transfer = 'transfer'
+    reconciliation = 'reconciliation'
+    opening_balance = 'opening balance'
+
+
+class TransactionLinkRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['transactionLinks'])
+    id: str = Field(..., examples=['2'])
+    attributes: TransactionLink
+    links: ObjectLink
+
+
+class TransactionLinkSingle(BaseModel):
+    data: TransactionLinkRead
+
+
+class TransactionSplit(BaseModel):
+    user: Optional[str] = Field(None, description='User ID', examples=['3'])
+    transaction_journal_id: Optional[str] = Field(
+        None,
+        description='ID of the underlying transaction journal. Each transaction consists of a transaction group (see the top ID) and one or more journals\nmaking up the splits of the transaction.\n',
+        examples=['10421'],
+    )
+    type: TransactionTypeProperty
+    date: datetime = Field(
+        ...,
+        description='Date of the transaction',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    order: Optional[int] = Field(
+        None,
+        description='Order of this entry in the list of transactions.',
+        examples=[0],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description="Currency ID. Default is the source account's currency, or the user's default currency. Can be used instead of currency_code.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Currency code. Default is the source account's currency, or the user's default currency. Can be used instead of currency_id.",
+        examples=['EUR'],
+    )
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_name: Optional[str] = Field(None, examples=['Euro'])
+    currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals used in this currency.', examples=[2]
+    )
+    foreign_currency_id: Optional[str] = Field(
+        None,
+        description='Currency ID of the foreign currency. Default is null. Is required when you submit a foreign amount.',
+        examples=['17'],
+    )
+    foreign_currency_code: Optional[str] = Field(
+        None,
+        description='Currency code of the foreign currency. Default is NULL. Can be used instead of the foreign_currency_id, but this or the ID is required when submitting a foreign amount.',
+        examples=['USD'],
+    )
+    foreign_currency_symbol: Optional[str] = Field(None, examples=['$'])
+    foreign_currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals in the currency', examples=[2]
+    )
+    amount: str = Field(
+        ..., description='Amount of the transaction.', examples=['123.45']
+    )
+    foreign_amount: Optional[str] = Field(
+        None, description='The amount in a foreign currency.', examples=['123.45']
+    )
+    description: str = Field(
+        ..., description='Description of the transaction.', examples=['Vegetables']
+    )
+    source_id: str = Field(
+        ...,
+        description='ID of the source account. For a withdrawal or a transfer, this must always be an asset account. For deposits, this must be a revenue account.',
+        examples=['2'],
+    )
+    source_name: Optional[str] = Field(
+        None,
+        description='Name of the source account. For a withdrawal or a transfer, this must always be an asset account. For deposits, this must be a revenue account. Can be used instead of the source_id. If the transaction is a deposit, the source_name can be filled in freely: the account will be created based on the name.',
+        examples=['Checking account'],
+    )
+    source_iban: Optional[str] = Field(None, examples=['NL02ABNA0123456789'])
+    source_type: Optional[AccountTypeProperty] = None
+    destination_id: str = Field(
+        ...,
+        description='ID of the destination account. For a deposit or a transfer, this must always be an asset account. For withdrawals this must be an expense account.',
+        examples=['2'],
+    )
+    destination_name: Optional[str] = Field(
+        None,
+        description='Name of the destination account. You can submit the name instead of the ID. For everything except transfers, the account will be auto-generated if unknown, so submitting a name is enough.',
+        examples=['Buy and Large'],
+    )
+    destination_iban: Optional[str] = Field(None, examples=['NL02ABNA0123456789'])
+    destination_type: Optional[AccountTypeProperty] = None
+    budget_id: Optional[str] = Field(
+        None, description='The budget ID for this transaction.', examples=['4']
+    )
+    budget_name: Optional[str] = Field(
+        None,
+        description='The name of the budget to be used. If the budget name is unknown, the ID will be used or the value will be ignored.',
+        examples=['Groceries'],
+    )
+    category_id: Optional[str] = Field(
+        None, description='The category ID for this transaction.', examples=['43']
+    )
+    category_name: Optional[str] = Field(
+        None,
+        description='The name of the category to be used. If the category is unknown, it will be created. If the ID and the name point to different categories, the ID overrules the name.',
+        examples=['Groceries'],
+    )
+    bill_id: Optional[str] = Field(
+        None, description='Optional. Use either this or the bill_name', examples=['111']
+    )
+    bill_name: Optional[str] = Field(
+        None,
+        description='Optional. Use either this or the bill_id',
+        examples=['Monthly rent'],
+    )
+    reconciled: Optional[bool] = Field(
+        None,
+        description='If the transaction has been reconciled already. When you set this, the amount can no longer be edited by the user.',
+        examples=[False],
+    )
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    tags: Optional[List[str]] = Field(
+        None, description='Array of tags.', examples=[None]
+    )
+    internal_reference: Optional[str] = Field(
+        None, description='Reference to internal reference of other systems.'
+    )
+    external_id: Optional[str] = Field(
+        None, description='Reference to external ID in other systems.'
+    )
+    external_url: Optional[str] = Field(
+        None, description='External, custom URL for this transaction.'
+    )
+    original_source: Optional[str] = Field(
+        None,
+        description='System generated identifier for original creator of transaction.',
+    )
+    recurrence_id: Optional[str] = Field(
+        None, description='Reference to recurrence that made the transaction.'
+    )
+    recurrence_total: Optional[int] = Field(
+        None,
+        description='Total number of transactions expected to be created by this recurrence repetition. Will be 0 if infinite.',
+        examples=[0],
+    )
+    recurrence_count: Optional[int] = Field(
+        None,
+        description='The # of the current transaction created under this recurrence.',
+        examples=[12],
+    )
+    bunq_payment_id: Optional[str] = Field(
+        None, description='Internal ID of bunq transaction. DEPRECATED'
+    )
+    import_hash_v2: Optional[str] = Field(
+        None,
+        description='Hash value of original import transaction (for duplicate detection).',
+    )
+    sepa_cc: Optional[str] = Field(None, description='SEPA Clearing Code')
+    sepa_ct_op: Optional[str] = Field(
+        None, description='SEPA Opposing Account Identifier'
+    )
+    sepa_ct_id: Optional[str] = Field(None, description='SEPA end-to-end Identifier')
+    sepa_db: Optional[str] = Field(None, description='SEPA mandate identifier')
+    sepa_country: Optional[str] = Field(None, description='SEPA Country')
+    sepa_ep: Optional[str] = Field(None, description='SEPA External Purpose indicator')
+    sepa_ci: Optional[str] = Field(None, description='SEPA Creditor Identifier')
+    sepa_batch_id: Optional[str] = Field(None, description='SEPA Batch ID')
+    interest_date: Optional[datetime] = None
+    book_date: Optional[datetime] = None
+    process_date: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+    payment_date: Optional[datetime] = None
+    invoice_date: Optional[datetime] = None
+    latitude: Optional[float] = Field(
+        None,
+        description="Latitude of the transaction's location, if applicable. Can be used to draw a map.",
+        examples=[51.983333],
+    )
+    longitude: Optional[float] = Field(
+        None,
+        description="Latitude of the transaction's location, if applicable. Can be used to draw a map.",
+        examples=[5.916667],
+    )
+    zoom_level: Optional[int] = Field(
+        None,
+        description='Zoom level for the map, if drawn. This to set the box right. Unfortunately this is a proprietary value because each map provider has different zoom levels.',
+        examples=[6],
+    )
+    has_attachments: Optional[bool] = Field(
+        None, description='If the transaction has attachments.', examples=[False]
+    )
+
+
+class TransactionSplitStore(BaseModel):
+    type: TransactionTypeProperty
+    date: datetime = Field(
+        ...,
+        description='Date of the transaction',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    amount: str = Field(
+        ..., description='Amount of the transaction.', examples=['123.45']
+    )
+    description: str = Field(
+        ..., description='Description of the transaction.', examples=['Vegetables']
+    )
+    order: Optional[int] = Field(
+        None,
+        description='Order of this entry in the list of transactions.',
+        examples=[0],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description="Currency ID. Default is the source account's currency, or the user's default currency. The value you submit may be overruled by the source or destination account.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Currency code. Default is the source account's currency, or the user's default currency. The value you submit may be overruled by the source or destination account.",
+        examples=['EUR'],
+    )
+    foreign_amount: Optional[str] = Field(
+        None, description='The amount in a foreign currency.', examples=['123.45']
+    )
+    foreign_currency_id: Optional[str] = Field(
+        None,
+        description='Currency ID of the foreign currency. Default is null. Is required when you submit a foreign amount.',
+        examples=['17'],
+    )
+    foreign_currency_code: Optional[str] = Field(
+        None,
+        description='Currency code of the foreign currency. Default is NULL. Can be used instead of the foreign_currency_id, but this or the ID is required when submitting a foreign amount.',
+        examples=['USD'],
+    )
+    budget_id: Optional[str] = Field(
+        None, description='The budget ID for this transaction.', examples=['4']
+    )
+    budget_name: Optional[str] = Field(
+        None,
+        description='The name of the budget to be used. If the budget name is unknown, the ID will be used or the value will be ignored.',
+        examples=['Groceries'],
+    )
+    category_id: Optional[str] = Field(
+        None, description='The category ID for this transaction.', examples=['43']
+    )
+    category_name: Optional[str] = Field(
+        None,
+        description='The name of the category to be used. If the category is unknown, it will be created. If the ID and the name point to different categories, the ID overrules the name.',
+        examples=['Groceries'],
+    )
+    source_id: Optional[str] = Field(
+        None,
+        description='ID of the source account. For a withdrawal or a transfer, this must always be an asset account. For deposits, this must be a revenue account.',
+        examples=['2'],
+    )
+    source_name: Optional[str] = Field(
+        None,
+        description='Name of the source account. For a withdrawal or a transfer, this must always be an asset account. For deposits, this must be a revenue account. Can be used instead of the source_id. If the transaction is a deposit, the source_name can be filled in freely: the account will be created based on the name.',
+        examples=['Checking account'],
+    )
+    destination_id: Optional[str] = Field(
+        None,
+        description='ID of the destination account. For a deposit or a transfer, this must always be an asset account. For withdrawals this must be an expense account.',
+        examples=['2'],
+    )
+    destination_name: Optional[str] = Field(
+        None,
+        description='Name of the destination account. You can submit the name instead of the ID. For everything except transfers, the account will be auto-generated if unknown, so submitting a name is enough.',
+        examples=['Buy and Large'],
+    )
+    reconciled: Optional[bool] = Field(
+        None,
+        description='If the transaction has been reconciled already. When you set this, the amount can no longer be edited by the user.',
+        examples=[False],
+    )
+    piggy_bank_id: Optional[int] = Field(
+        None, description='Optional. Use either this or the piggy_bank_name'
+    )
+    piggy_bank_name: Optional[str] = Field(
+        None, description='Optional. Use either this or the piggy_bank_id'
+    )
+    bill_id: Optional[str] = Field(
+        None, description='Optional. Use either this or the bill_name', examples=['112']
+    )
+    bill_name: Optional[str] = Field(
+        None,
+        description='Optional. Use either this or the bill_id',
+        examples=['Monthly rent'],
+    )
+    tags: Optional[List[str]] = Field(
+        None, description='Array of tags.', examples=[None]
+    )
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    internal_reference: Optional[str] = Field(
+        None, description='Reference to internal reference of other systems.'
+    )
+    external_id: Optional[str] = Field(
+        None, description='Reference to external ID in other systems.'
+    )
+    external_url: Optional[str] = Field(
+        None, description='External, custom URL for this transaction.'
+    )
+    bunq_payment_id: Optional[str] = Field(
+        None,
+        description='Internal ID of bunq transaction. Field is no longer used but still works.',
+    )
+    sepa_cc: Optional[str] = Field(None, description='SEPA Clearing Code')
+    sepa_ct_op: Optional[str] = Field(
+        None, description='SEPA Opposing Account Identifier'
+    )
+    sepa_ct_id: Optional[str] = Field(None, description='SEPA end-to-end Identifier')
+    sepa_db: Optional[str] = Field(None, description='SEPA mandate identifier')
+    sepa_country: Optional[str] = Field(None, description='SEPA Country')
+    sepa_ep: Optional[str] = Field(None, description='SEPA External Purpose indicator')
+    sepa_ci: Optional[str] = Field(None, description='SEPA Creditor Identifier')
+    sepa_batch_id: Optional[str] = Field(None, description='SEPA Batch ID')
+    interest_date: Optional[datetime] = None
+    book_date: Optional[datetime] = None
+    process_date: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+    payment_date: Optional[datetime] = None
+    invoice_date: Optional[datetime] = None
+
+
+class TransactionSplitUpdate(BaseModel):
+    transaction_journal_id: Optional[str] = Field(
+        None,
+        description='Transaction journal ID of current transaction (split).',
+        examples=['123'],
+    )
+    type: Optional[TransactionTypeProperty] = None
+    date: Optional[datetime] = Field(
+        None,
+        description='Date of the transaction',
+        examples=['2018-09-17T12:46:47+01:00'],
+    )
+    amount: Optional[str] = Field(
+        None, description='Amount of the transaction.', examples=['123.45']
+    )
+    description: Optional[str] = Field(
+        None, description='Description of the transaction.', examples=['Vegetables']
+    )
+    order: Optional[int] = Field(
+        None,
+        description='Order of this entry in the list of transactions.',
+        examples=[0],
+    )
+    currency_id: Optional[str] = Field(
+        None,
+        description="Currency ID. Default is the source account's currency, or the user's default currency. Can be used instead of currency_code.",
+        examples=['12'],
+    )
+    currency_code: Optional[str] = Field(
+        None,
+        description="Currency code. Default is the source account's currency, or the user's default currency. Can be used instead of currency_id.",
+        examples=['EUR'],
+    )
+    currency_symbol: Optional[str] = Field(None, examples=['$'])
+    currency_name: Optional[str] = Field(None, examples=['Euro'])
+    currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals used in this currency.', examples=[2]
+    )
+    foreign_amount: Optional[str] = Field(
+        None, description='The amount in a foreign currency.', examples=['123.45']
+    )
+    foreign_currency_id: Optional[str] = Field(
+        None,
+        description='Currency ID of the foreign currency. Default is null. Is required when you submit a foreign amount.',
+        examples=['17'],
+    )
+    foreign_currency_code: Optional[str] = Field(
+        None,
+        description='Currency code of the foreign currency. Default is NULL. Can be used instead of the foreign_currency_id, but this or the ID is required when submitting a foreign amount.',
+        examples=['USD'],
+    )
+    foreign_currency_symbol: Optional[str] = Field(None, examples=['$'])
+    foreign_currency_decimal_places: Optional[int] = Field(
+        None, description='Number of decimals in the currency', examples=[2]
+    )
+    budget_id: Optional[str] = Field(
+        None, description='The budget ID for this transaction.', examples=['4']
+    )
+    budget_name: Optional[str] = Field(
+        None,
+        description='The name of the budget to be used. If the budget name is unknown, the ID will be used or the value will be ignored.',
+        examples=['Groceries'],
+    )
+    category_id: Optional[str] = Field(
+        None, description='The category ID for this transaction.', examples=['43']
+    )
+    category_name: Optional[str] = Field(
+        None,
+        description='The name of the category to be used. If the category is unknown, it will be created. If the ID and the name point to different categories, the ID overrules the name.',
+        examples=['Groceries'],
+    )
+    source_id: Optional[str] = Field(
+        None,
+        description='ID of the source account. For a withdrawal or a transfer, this must always be an asset account. For deposits, this must be a revenue account.',
+        examples=['2'],
+    )
+    source_name: Optional[str] = Field(
+        None,
+        description='Name of the source account. For a withdrawal or a transfer, this must always be an asset account. For deposits, this must be a revenue account. Can be used instead of the source_id. If the transaction is a deposit, the source_name can be filled in freely: the account will be created based on the name.',
+        examples=['Checking account'],
+    )
+    source_iban: Optional[str] = Field(None, examples=['NL02ABNA0123456789'])
+    destination_id: Optional[str] = Field(
+        None,
+        description='ID of the destination account. For a deposit or a transfer, this must always be an asset account. For withdrawals this must be an expense account.',
+        examples=['2'],
+    )
+    destination_name: Optional[str] = Field(
+        None,
+        description='Name of the destination account. You can submit the name instead of the ID. For everything except transfers, the account will be auto-generated if unknown, so submitting a name is enough.',
+        examples=['Buy and Large'],
+    )
+    destination_iban: Optional[str] = Field(None, examples=['NL02ABNA0123456789'])
+    reconciled: Optional[bool] = Field(
+        None,
+        description='If the transaction has been reconciled already. When you set this, the amount can no longer be edited by the user.',
+        examples=[False],
+    )
+    bill_id: Optional[str] = Field(
+        None, description='Optional. Use either this or the bill_name', examples=['111']
+    )
+    bill_name: Optional[str] = Field(
+        None,
+        description='Optional. Use either this or the bill_id',
+        examples=['Monthly rent'],
+    )
+    tags: Optional[List[str]] = Field(
+        None, description='Array of tags.', examples=[None]
+    )
+    notes: Optional[str] = Field(None, examples=['Some example notes'])
+    internal_reference: Optional[str] = Field(
+        None, description='Reference to internal reference of other systems.'
+    )
+    external_id: Optional[str] = Field(
+        None, description='Reference to external ID in other systems.'
+    )
+    external_url: Optional[str] = Field(
+        None, description='External, custom URL for this transaction.'
+    )
+    bunq_payment_id: Optional[str] = Field(
+        None, description='Internal ID of bunq transaction.'
+    )
+    sepa_cc: Optional[str] = Field(None, description='SEPA Clearing Code')
+    sepa_ct_op: Optional[str] = Field(
+        None, description='SEPA Opposing Account Identifier'
+    )
+    sepa_ct_id: Optional[str] = Field(None, description='SEPA end-to-end Identifier')
+    sepa_db: Optional[str] = Field(None, description='SEPA mandate identifier')
+    sepa_country: Optional[str] = Field(None, description='SEPA Country')
+    sepa_ep: Optional[str] = Field(None, description='SEPA External Purpose indicator')
+    sepa_ci: Optional[str] = Field(None, description='SEPA Creditor Identifier')
+    sepa_batch_id: Optional[str] = Field(None, description='SEPA Batch ID')
+    interest_date: Optional[datetime] = None
+    book_date: Optional[datetime] = None
+    process_date: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+    payment_date: Optional[datetime] = None
+    invoice_date: Optional[datetime] = None
+
+
+class TransactionLinkArray(BaseModel):
+    data: List[TransactionLinkRead]
+    meta: Meta
+    links: PageLink
+
+
+class Transaction(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    user: Optional[str] = Field(None, description='User ID', examples=['3'])
+    group_title: Optional[str] = Field(
+        None,
+        description='Title of the transaction if it has been split in more than one piece. Empty otherwise.',
+        examples=['Split transaction title.'],
+    )
+    transactions: List[TransactionSplit]
+
+
+class TransactionStore(BaseModel):
+    error_if_duplicate_hash: Optional[bool] = Field(
+        None,
+        description='Break if the submitted transaction exists already.',
+        examples=[False],
+    )
+    apply_rules: Optional[bool] = Field(
+        None,
+        description='Whether or not to apply rules when submitting transaction.',
+        examples=[False],
+    )
+    fire_webhooks: Optional[bool] = Field(
+        True,
+        description='Whether or not to fire the webhooks that are related to this event.',
+        examples=[True],
+    )
+    group_title: Optional[str] = Field(
+        None,
+        description='Title of the transaction if it has been split in more than one piece. Empty otherwise.',
+        examples=['Split transaction title.'],
+    )
+    transactions: List[TransactionSplitStore]
+
+
+class TransactionUpdate(BaseModel):
+    apply_rules: Optional[bool] = Field(
+        None,
+        description='Whether or not to apply rules when submitting transaction.',
+        examples=[False],
+    )
+    fire_webhooks: Optional[bool] = Field(
+        True,
+        description='Whether or not to fire the webhooks that are related to this event.',
+        examples=[True],
+    )
+    group_title: Optional[str] = Field(
+        None,
+        description='Title of the transaction if it has been split in more than one piece. Empty otherwise.',
+        examples=['Split transaction title.'],
+    )
+    transactions: Optional[List[TransactionSplitUpdate]] = None
+
+
+class TransactionRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['transactions'])
+    id: str = Field(..., examples=['2'])
+    attributes: Transaction
+    links: ObjectLink
+
+
+class TransactionSingle(BaseModel):
+    data: TransactionRead
+
+
+class TransactionArray(BaseModel):
+    data: List[TransactionRead]
+    meta: Meta
+    links: PageLink
@@ -0,0 +1,194 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     user (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class UserGroupReadRole(Enum):
+    owner = 'owner'
+    ro = 'ro'
+    mng_trx = 'mng_trx'
+    mng_meta = 'mng_meta'
+    read_budgets = 'read_budgets'
+    read_piggies = 'read_piggies'
+    read_subscriptions = 'read_subscriptions'
+    read_rules = 'read_rules'
+    read_recurring = 'read_recurring'
+    read_webhooks = 'read_webhooks'
+    read_currencies = 'read_currencies'
+    mng_budgets = 'mng_budgets'
+    mng_piggies = 'mng_piggies'
+    mng_subscriptions = 'mng_subscriptions'
+    mng_rules = 'mng_rules'
+    mng_recurring = 'mng_recurring'
+    mng_webhooks = 'mng_webhooks'
+    mng_currencies = 'mng_currencies'
+    view_reports = 'view_reports'
+    view_memberships = 'view_memberships'
+    full = 'full'
+    owner_1 = 'owner'
+
+
+class UserGroupUpdate(BaseModel):
+    title: str = Field(
+        ...,
+        description='A descriptive title for the user group.',
+        examples=['New user group title'],
+    )
+    native_currency_id: Optional[str] = Field(
+        None,
+        description="Use either native_currency_id or native_currency_code. This will set the native currency for the user group ('financial administration').",
+        examples=['1'],
+    )
+    native_currency_code: Optional[str] = Field(
+        None,
+        description="Use either native_currency_id or native_currency_code. This will set the native currency for the user group ('financial administration').",
+        examples=['EUR'],
+    )
+
+
+class UserBlockedCodePropertyEnum(Enum):
+    email_changed = 'email_changed'
+
+
+class UserBlockedCodeProperty(RootModel[Optional[UserBlockedCodePropertyEnum]]):
+    root: Optional[UserBlockedCodePropertyEnum] = Field(
+        None,
+        description='If you say the user must be blocked, this will be the reason code.',
+        examples=['email_changed'],
+    )
+
+
+class UserRolePropertyEnum(Enum):
+    owner = 'owner'
+    demo = 'demo'
+
+
+class UserRoleProperty(RootModel[Optional[UserRolePropertyEnum]]):
+    root: Optional[UserRolePropertyEnum] = Field(
+        None,
+        description='Role for the user. Can be empty or omitted.',
+        examples=['owner'],
+    )
+
+
+class User(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    email: EmailStr = Field(
+        ...,
+        description='The new users email address.',
+        examples=['james@firefly-iii.org'],
+    )
+    blocked: Optional[bool] = Field(
+        None,
+        description='Boolean to indicate if the user is blocked.',
+        examples=[False],
+    )
+    blocked_code: Optional[UserBlockedCodeProperty] = None
+    role: Optional[UserRoleProperty] = None
+
+
+class UserGroupReadMembers(BaseModel):
+    user_id: Optional[str] = Field(
+        None, description='The ID of the member.', examples=['5']
+    )
+    user_email: Optional[EmailStr] = Field(
+        None,
+        description='The email address of the member',
+        examples=['james@firefly-iii.org'],
+    )
+    you: Optional[bool] = Field(
+        None, description='Is this you? (the current user)', examples=[False]
+    )
+    roles: Optional[List[UserGroupReadRole]] = None
+
+
+class UserRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['users'])
+    id: str = Field(..., examples=['2'])
+    attributes: User
+    links: ObjectLink
+
+
+class UserGroupReadAttributes(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    in_use: Optional[bool] = Field(
+        None,
+        description="Is this user group ('financial administration') currently the active administration?",
+        examples=[False],
+    )
+    can_see_members: Optional[bool] = Field(
+        None,
+        description='Can the current user see the members of this user group?',
+        examples=[True],
+    )
+    title: Optional[str] = Field(
+        None,
+        description="Title of the user group. By default, it is the same as the user's email address.",
+        examples=['demo@firefly'],
+    )
+    native_currency_id: Optional[str] = Field(
+        None,
+        description='Returns the native currency ID of the user group.',
+        examples=['12'],
+    )
+    native_currency_code: Optional[str] = Field(
+        None,
+        description='Returns the native currency code of the user group.',
+        examples=['EUR'],
+    )
+    native_currency_symbol: Optional[str] = Field(
+        None,
+        description='Returns the native currency symbol of the user group.',
+        examples=['$'],
+    )
+    native_currency_decimal_places: Optional[int] = Field(
+        None,
+        description='Returns the native currency decimal places of the user group.',
+        examples=[2],
+    )
+    members: Optional[List[UserGroupReadMembers]] = None
+
+
+class UserSingle(BaseModel):
+    data: UserRead
+
+
+class UserArray(BaseModel):
+    data: List[UserRead]
+    meta: Meta
+    links: PageLink
+
+
+class UserGroupRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['user_groups'])
+    id: str = Field(..., examples=['2'])
+    attributes: UserGroupReadAttributes
+    links: ObjectLink
+
+
+class UserGroupSingle(BaseModel):
+    data: UserGroupRead
+
+
+class UserGroupArray(BaseModel):
+    data: List[UserGroupRead]
+    meta: Meta
+    links: PageLink
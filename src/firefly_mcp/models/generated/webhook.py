@@ -0,0 +1,206 @@
+# generated by datamodel-codegen:
+#   filename:  swagger.yaml
+#   timestamp: 2025-08-03T23:56:33+00:00
+#   split:     webhook (scripts/split_models.py)
+
+from __future__ import annotations
+
+from datetime import date as date_aliased
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import AnyUrl, BaseModel, EmailStr, Field, RootModel
+
+from firefly_mcp.models.generated.common import (
+    Meta,
+    ObjectLink,
+    PageLink,
+)
+
+
+class WebhookAttempt(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    webhook_message_id: Optional[str] = Field(
+        None,
+        description='The ID of the webhook message this attempt belongs to.',
+        examples=['5'],
+    )
+    status_code: Optional[int] = Field(
+        None, description='The HTTP status code of the error, if any.', examples=[404]
+    )
+    logs: Optional[str] = Field(
+        None,
+        description='Internal log for this attempt. May contain sensitive user data.',
+        examples=['Page not found'],
+    )
+    response: Optional[str] = Field(
+        None,
+        description='Webhook receiver response for this attempt, if any. May contain sensitive user data.',
+        examples=['Page not found'],
+    )
+
+
+class WebhookMessage(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    sent: Optional[bool] = Field(
+        None, description='If this message is sent yet.', examples=[False]
+    )
+    errored: Optional[bool] = Field(
+        None, description='If this message has errored out.', examples=[False]
+    )
+    webhook_id: Optional[str] = Field(
+        None,
+        description='The ID of the webhook this message belongs to.',
+        examples=['5'],
+    )
+    uuid: Optional[str] = Field(
+        None,
+        description='Long UUID string for identification of this webhook message.',
+        examples=['7a344c02-5b52-46b1-90e6-a437431dcf07'],
+    )
+    message: Optional[str] = Field(
+        None,
+        description='The actual message that is sent or will be sent as JSON string.',
+        examples=['{some:message}'],
+    )
+
+
+class WebhookDelivery(Enum):
+    JSON = 'JSON'
+
+
+class WebhookResponse(Enum):
+    TRANSACTIONS = 'TRANSACTIONS'
+    ACCOUNTS = 'ACCOUNTS'
+    NONE = 'NONE'
+
+
+class WebhookTrigger(Enum):
+    STORE_TRANSACTION = 'STORE_TRANSACTION'
+    UPDATE_TRANSACTION = 'UPDATE_TRANSACTION'
+    DESTROY_TRANSACTION = 'DESTROY_TRANSACTION'
+
+
+class WebhookAttemptRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['webhook_attempts'])
+    id: str = Field(..., examples=['2'])
+    attributes: WebhookAttempt
+
+
+class WebhookAttemptSingle(BaseModel):
+    data: WebhookAttemptRead
+
+
+class WebhookMessageRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['webhook_messages'])
+    id: str = Field(..., examples=['2'])
+    attributes: WebhookMessage
+
+
+class WebhookMessageSingle(BaseModel):
+    data: WebhookMessageRead
+
+
+class Webhook(BaseModel):
+    created_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    updated_at: Optional[datetime] = Field(None, examples=['2018-09-17T12:46:47+01:00'])
+    active: Optional[bool] = Field(
+        None,
+        description='Boolean to indicate if the webhook is active',
+        examples=[False],
+    )
+    title: str = Field(
+        ...,
+        description='A title for the webhook for easy recognition.',
+        examples=['Update magic mirror on new transaction'],
+    )
+    secret: Optional[str] = Field(
+        None,
+        description="A 24-character secret for the webhook. It's generated by Firefly III when saving a new webhook. If you submit a new secret through the PUT endpoint it will generate a new secret for the selected webhook, a new secret bearing no relation to whatever you just submitted.",
+        examples=['iMLZLtLx2JHWhK9Dtyuoqyir'],
+    )
+    trigger: WebhookTrigger
+    response: WebhookResponse
+    delivery: WebhookDelivery
+    url: str = Field(
+        ...,
+        description='The URL of the webhook. Has to start with `https`.',
+        examples=['https://example.com'],
+    )
+
+
+class WebhookStore(BaseModel):
+    active: Optional[bool] = Field(
+        None,
+        description='Boolean to indicate if the webhook is active',
+        examples=[False],
+    )
+    title: str = Field(
+        ...,
+        description='A title for the webhook for easy recognition.',
+        examples=['Update magic mirror on new transaction'],
+    )
+    trigger: WebhookTrigger
+    response: WebhookResponse
+    delivery: WebhookDelivery
+    url: str = Field(
+        ...,
+        description='The URL of the webhook. Has to start with `https`.',
+        examples=['https://example.com'],
+    )
+
+
+class WebhookUpdate(BaseModel):
+    active: Optional[bool] = Field(
+        None,
+        description='Boolean to indicate if the webhook is active',
+        examples=[False],
+    )
+    title: Optional[str] = Field(
+        None,
+        description='A title for the webhook for easy recognition.',
+        examples=['Update magic mirror on new transaction'],
+    )
+    secret: Optional[str] = Field(
+        None,
+        description="A 24-character secret for the webhook. It's generated by Firefly III when saving a new webhook. If you submit a new secret through the PUT endpoint it will generate a new secret for the selected webhook, a new secret bearing no relation to whatever you just submitted.",
+        examples=['iMLZLtLx2JHWhK9Dtyuoqyir'],
+    )
+    trigger: Optional[WebhookTrigger] = None
+    response: Optional[WebhookResponse] = None
+    delivery: Optional[WebhookDelivery] = None
+    url: Optional[str] = Field(
+        None,
+        description='The URL of the webhook. Has to start with `https`.',
+        examples=['https://example.com'],
+    )
+
+
+class WebhookAttemptArray(BaseModel):
+    data: List[WebhookAttemptRead]
+    meta: Meta
+
+
+class WebhookMessageArray(BaseModel):
+    data: List[WebhookMessageRead]
+    meta: Meta
+
+
+class WebhookRead(BaseModel):
+    type: str = Field(..., description='Immutable value', examples=['webhooks'])
+    id: str = Field(..., examples=['2'])
+    attributes: Webhook
+    links: ObjectLink
+
+
+class WebhookSingle(BaseModel):
+    data: WebhookRead
+
+
+class WebhookArray(BaseModel):
+    data: List[WebhookRead]
+    meta: Meta
+    links: PageLink
@@ -0,0 +1,225 @@
+"""Request and response models of the tools, imported lazily per entity family.
+
+The classes live in ``firefly_mcp.models.requests.<family>``. Importing a
+name from this package loads only the family module defining it, and with it
+only the generated models that family needs (see ``firefly_mcp.models.model``).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Model name -> family module defining it.
+REQUEST_MODULES: Dict[str, str] = {
+    "AccountAttachmentsRequest": "account",
+    "AccountDeleteRequest": "account",
+    "AccountDeleteResponse": "account",
+    "AccountGetRequest": "account",
+    "AccountListRequest": "account",
+    "AccountPiggyBanksRequest": "account",
+    "AccountTransactionsRequest": "account",
+    "AccountUpdateRequest": "account",
+    "BillAttachmentsRequest": "bill",
+    "BillDeleteRequest": "bill",
+    "BillDeleteResponse": "bill",
+    "BillGetRequest": "bill",
+    "BillListRequest": "bill",
+    "BillRulesRequest": "bill",
+    "BillTransactionsRequest": "bill",
+    "BillUpdateRequest": "bill",
+    "BudgetAttachmentsRequest": "budget",
+    "BudgetDeleteRequest": "budget",
+    "BudgetDeleteResponse": "budget",
+    "BudgetGetRequest": "budget",
+    "BudgetLimitCreateRequest": "budget",
+    "BudgetLimitDeleteRequest": "budget",
+    "BudgetLimitDeleteResponse": "budget",
+    "BudgetLimitGetRequest": "budget",
+    "BudgetLimitUpdateRequest": "budget",
+    "BudgetLimitsRequest": "budget",
+    "BudgetListRequest": "budget",
+    "BudgetOverviewRequest": "budget",
+    "BudgetOverviewResponse": "budget",
+    "BudgetTransactionsRequest": "budget",
+    "BudgetTransactionsWithoutBudgetRequest": "budget",
+    "BudgetUpdateRequest": "budget",
+    "BulkCategorizeRequest": "transaction",
+    "BulkTagRequest": "transaction",
+    "CategoryAttachmentsRequest": "category",
+    "CategoryDeleteRequest": "category",
+    "CategoryDeleteResponse": "category",
+    "CategoryGetRequest": "category",
+    "CategoryListRequest": "category",
+    "CategoryTransactionsRequest": "category",
+    "CategoryUpdateRequest": "category",
+    "LocalSyncRequest": "transaction",
+    "LocalSyncResponse": "transaction",
+    "NameResolveRequest": "names",
+    "NameResolveResponse": "names",
+    "PaginatedRequest": "common",
+    "PiggyBankAttachmentsRequest": "piggy_bank",
+    "PiggyBankDeleteRequest": "piggy_bank",
+    "PiggyBankDeleteResponse": "piggy_bank",
+    "PiggyBankEventsRequest": "piggy_bank",
+    "PiggyBankGetRequest": "piggy_bank",
+    "PiggyBankListRequest": "piggy_bank",
+    "PiggyBankUpdateRequest": "piggy_bank",
+    "RuleDeleteRequest": "rule",
+    "RuleDeleteResponse": "rule",
+    "RuleGetRequest": "rule",
+    "RuleGroupDeleteRequest": "rule_group",
+    "RuleGroupDeleteResponse": "rule_group",
+    "RuleGroupGetRequest": "rule_group",
+    "RuleGroupListRequest": "rule_group",
+    "RuleGroupListRulesRequest": "rule_group",
+    "RuleGroupTestRequest": "rule_group",
+    "RuleGroupTriggerRequest": "rule_group",
+    "RuleGroupUpdateRequest": "rule_group",
+    "RuleListRequest": "rule",
+    "RuleTestRequest": "rule",
+    "RuleTriggerRequest": "rule",
+    "RuleUpdateRequest": "rule",
+    "TagAttachmentsRequest": "tag",
+    "TagDeleteRequest": "tag",
+    "TagDeleteResponse": "tag",
+    "TagGetRequest": "tag",
+    "TagListRequest": "tag",
+    "TagTransactionsRequest": "tag",
+    "TagUpdateRequest": "tag",
+    "TransactionAggregateRequest": "transaction",
+    "TransactionAggregateResponse": "transaction",
+    "TransactionAttachmentsRequest": "transaction",
+    "TransactionDeleteRequest": "transaction",
+    "TransactionDeleteResponse": "transaction",
+    "TransactionGetRequest": "transaction",
+    "TransactionListRequest": "transaction",
+    "TransactionPiggyBankEventsRequest": "transaction",
+    "TransactionSearchLocalRequest": "transaction",
+    "TransactionSearchLocalResponse": "transaction",
+    "TransactionUpdateRequest": "transaction",
+}
+
+__all__ = sorted(REQUEST_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = REQUEST_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *REQUEST_MODULES})
+
+
+if TYPE_CHECKING:
+    from firefly_mcp.models.requests.account import (
+        AccountAttachmentsRequest,
+        AccountDeleteRequest,
+        AccountDeleteResponse,
+        AccountGetRequest,
+        AccountListRequest,
+        AccountPiggyBanksRequest,
+        AccountTransactionsRequest,
+        AccountUpdateRequest,
+    )
+    from firefly_mcp.models.requests.bill import (
+        BillAttachmentsRequest,
+        BillDeleteRequest,
+        BillDeleteResponse,
+        BillGetRequest,
+        BillListRequest,
+        BillRulesRequest,
+        BillTransactionsRequest,
+        BillUpdateRequest,
+    )
+    from firefly_mcp.models.requests.budget import (
+        BudgetAttachmentsRequest,
+        BudgetDeleteRequest,
+        BudgetDeleteResponse,
+        BudgetGetRequest,
+        BudgetLimitCreateRequest,
+        BudgetLimitDeleteRequest,
+        BudgetLimitDeleteResponse,
+        BudgetLimitGetRequest,
+        BudgetLimitUpdateRequest,
+        BudgetLimitsRequest,
+        BudgetListRequest,
+        BudgetOverviewRequest,
+        BudgetOverviewResponse,
+        BudgetTransactionsRequest,
+        BudgetTransactionsWithoutBudgetRequest,
+        BudgetUpdateRequest,
+    )
+    from firefly_mcp.models.requests.category import (
+        CategoryAttachmentsRequest,
+        CategoryDeleteRequest,
+        CategoryDeleteResponse,
+        CategoryGetRequest,
+        CategoryListRequest,
+        CategoryTransactionsRequest,
+        CategoryUpdateRequest,
+    )
+    from firefly_mcp.models.requests.common import (
+        PaginatedRequest,
+    )
+    from firefly_mcp.models.requests.names import (
+        NameResolveRequest,
+        NameResolveResponse,
+    )
+    from firefly_mcp.models.requests.piggy_bank import (
+        PiggyBankAttachmentsRequest,
+        PiggyBankDeleteRequest,
+        PiggyBankDeleteResponse,
+        PiggyBankEventsRequest,
+        PiggyBankGetRequest,
+        PiggyBankListRequest,
+        PiggyBankUpdateRequest,
+    )
+    from firefly_mcp.models.requests.rule import (
+        RuleDeleteRequest,
+        RuleDeleteResponse,
+        RuleGetRequest,
+        RuleListRequest,
+        RuleTestRequest,
+        RuleTriggerRequest,
+        RuleUpdateRequest,
+    )
+    from firefly_mcp.models.requests.rule_group import (
+        RuleGroupDeleteRequest,
+        RuleGroupDeleteResponse,
+        RuleGroupGetRequest,
+        RuleGroupListRequest,
+        RuleGroupListRulesRequest,
+        RuleGroupTestRequest,
+        RuleGroupTriggerRequest,
+        RuleGroupUpdateRequest,
+    )
+    from firefly_mcp.models.requests.tag import (
+        TagAttachmentsRequest,
+        TagDeleteRequest,
+        TagDeleteResponse,
+        TagGetRequest,
+        TagListRequest,
+        TagTransactionsRequest,
+        TagUpdateRequest,
+    )
+    from firefly_mcp.models.requests.transaction import (
+        BulkCategorizeRequest,
+        BulkTagRequest,
+        LocalSyncRequest,
+        LocalSyncResponse,
+        TransactionAggregateRequest,
+        TransactionAggregateResponse,
+        TransactionAttachmentsRequest,
+        TransactionDeleteRequest,
+        TransactionDeleteResponse,
+        TransactionGetRequest,
+        TransactionListRequest,
+        TransactionPiggyBankEventsRequest,
+        TransactionSearchLocalRequest,
+        TransactionSearchLocalResponse,
+        TransactionUpdateRequest,
+    )
@@ -0,0 +1,54 @@
+"""Account request models."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import AccountUpdate
+from firefly_mcp.models.requests.common import PaginatedRequest
+from typing import Literal
+
+
+class AccountListRequest(PaginatedRequest):
+    """Request model for listing accounts."""
+    type: Literal['all', 'asset', 'cash', 'expense', 'revenue', 'special', 'hidden', 'liability', 'liabilities', 'Default account', 'Cash account', 'Asset account', 'Expense account', 'Revenue account', 'Initial balance account', 'Beneficiary account', 'Import account', 'Reconciliation account', 'Loan', 'Debt', 'Mortgage'] = Field(default='all', description="Filter by account type")
+    limit: int | None = Field(default=None, description="Pagination limit")
+    page: int | None = Field(default=None, description="Page number")
+    date: str | None = Field(default=None, description="Balance date (ISO format)")
+
+
+class AccountGetRequest(BaseModel):
+    """Request model for getting a single account"""
+    id: str = Field(..., description="Id of the account")
+    date: str | None = Field(None, description="A date formatted YYYY-MM-DD. When added to the request, Firefly III will show the account's balance on that day.")
+
+class AccountUpdateRequest(BaseModel):
+    """Request model for updating an account"""
+    id: str = Field(..., description="The ID of the account.")
+    account_update: AccountUpdate = Field(..., description="The updated account data.")
+
+class AccountTransactionsRequest(PaginatedRequest):
+    """Request model for listing transactions for an account"""
+    id: str = Field(..., description="The ID of the account")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD")
+    type: Literal['all', 'withdrawal', 'withdrawals', 'expense', 'deposit', 'deposits', 'income', 'transfer', 'transfers', 'opening_balance', 'reconciliation', 'special', 'specials', 'default'] | None = Field(None, description="Optional filter on the transaction type(s) returned")
+
+class AccountAttachmentsRequest(PaginatedRequest):
+    """Request model for listing attachments for an account"""
+    id: str = Field(..., description="The ID of the account")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+class AccountPiggyBanksRequest(PaginatedRequest):
+    """Request model for listing piggy banks for an account"""
+    id: str = Field(..., description="The ID of the account")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+class AccountDeleteRequest(BaseModel):
+    """Request model for deleting an account"""
+    id: str = Field(..., description="The ID of the account to delete")
+
+class AccountDeleteResponse(BaseModel):
+    """Response model for account deletion"""
+    message: str = Field(..., description="Success message")
@@ -0,0 +1,61 @@
+"""Bill request models."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import BillUpdate
+from firefly_mcp.models.requests.common import PaginatedRequest
+from typing import Literal
+
+
+class BillListRequest(PaginatedRequest):
+    """Request model for listing bills."""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD to calculate payment and paid dates")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD to calculate payment and paid dates")
+
+
+class BillGetRequest(BaseModel):
+    """Request model for getting a single bill"""
+    id: str = Field(..., description="The ID of the bill")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD to calculate payment and paid dates")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD to calculate payment and paid dates")
+
+
+class BillUpdateRequest(BaseModel):
+    """Request model for updating a bill"""
+    id: str = Field(..., description="The ID of the bill")
+    bill_update: BillUpdate = Field(..., description="The updated bill data")
+
+
+class BillTransactionsRequest(PaginatedRequest):
+    """Request model for listing transactions for a bill"""
+    id: str = Field(..., description="The ID of the bill")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD")
+    type: Literal['all', 'withdrawal', 'withdrawals', 'expense', 'deposit', 'deposits', 'income', 'transfer', 'transfers', 'opening_balance', 'reconciliation', 'special', 'specials', 'default'] | None = Field(None, description="Optional filter on the transaction type(s) returned")
+
+
+class BillAttachmentsRequest(PaginatedRequest):
+    """Request model for listing attachments for a bill"""
+    id: str = Field(..., description="The ID of the bill")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class BillRulesRequest(PaginatedRequest):
+    """Request model for listing rules for a bill"""
+    id: str = Field(..., description="The ID of the bill")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class BillDeleteRequest(BaseModel):
+    """Request model for deleting a bill"""
+    id: str = Field(..., description="The ID of the bill to delete")
+
+
+class BillDeleteResponse(BaseModel):
+    """Response model for bill deletion"""
+    message: str = Field(..., description="Success message")
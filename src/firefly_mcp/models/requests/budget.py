@@ -0,0 +1,112 @@
+"""Budget and budget limit request models."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import BudgetUpdate, BudgetLimit, BudgetLimitStore
+from firefly_mcp.models.requests.common import PaginatedRequest
+from typing import Dict, List
+
+
+class BudgetListRequest(PaginatedRequest):
+    """Request model for listing budgets."""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date (YYYY-MM-DD) to get spending info")
+    end: str | None = Field(None, description="End date (YYYY-MM-DD) to get spending info")
+
+
+class BudgetGetRequest(BaseModel):
+    """Request model for getting a single budget"""
+    id: str = Field(..., description="The ID of the budget")
+    start: str | None = Field(None, description="Start date (YYYY-MM-DD) to get spending info")
+    end: str | None = Field(None, description="End date (YYYY-MM-DD) to get spending info")
+
+
+class BudgetUpdateRequest(BaseModel):
+    """Request model for updating a budget"""
+    id: str = Field(..., description="The ID of the budget")
+    budget_update: BudgetUpdate = Field(..., description="The updated budget data")
+
+
+class BudgetLimitsRequest(BaseModel):
+    """Request model for listing budget limits for a budget"""
+    id: str = Field(..., description="The ID of the budget")
+    start: str | None = Field(None, description="Start date (YYYY-MM-DD)")
+    end: str | None = Field(None, description="End date (YYYY-MM-DD)")
+
+
+class BudgetLimitGetRequest(BaseModel):
+    """Request model for getting a single budget limit"""
+    budget_id: str = Field(..., description="The ID of the budget")
+    limit_id: str = Field(..., description="The ID of the budget limit")
+
+
+class BudgetLimitCreateRequest(BaseModel):
+    """Request model for creating a budget limit"""
+    budget_id: str = Field(..., description="The ID of the budget")
+    budget_limit_store: BudgetLimitStore = Field(..., description="The budget limit data to create")
+
+
+class BudgetLimitUpdateRequest(BaseModel):
+    """Request model for updating a budget limit"""
+    budget_id: str = Field(..., description="The ID of the budget")
+    limit_id: str = Field(..., description="The ID of the budget limit")
+    budget_limit: BudgetLimit = Field(..., description="The updated budget limit data")
+
+
+class BudgetTransactionsRequest(PaginatedRequest):
+    """Request model for listing transactions for a budget"""
+    id: str = Field(..., description="The ID of the budget")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date (YYYY-MM-DD)")
+    end: str | None = Field(None, description="End date (YYYY-MM-DD)")
+    type: str | None = Field(None, description="Transaction type filter")
+
+
+class BudgetAttachmentsRequest(PaginatedRequest):
+    """Request model for listing attachments for a budget"""
+    id: str = Field(..., description="The ID of the budget")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class BudgetTransactionsWithoutBudgetRequest(PaginatedRequest):
+    """Request model for listing transactions without budget"""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date (YYYY-MM-DD)")
+    end: str | None = Field(None, description="End date (YYYY-MM-DD)")
+
+
+class BudgetDeleteRequest(BaseModel):
+    """Request model for deleting a budget"""
+    id: str = Field(..., description="The ID of the budget to delete")
+
+
+class BudgetDeleteResponse(BaseModel):
+    """Response model for budget deletion"""
+    message: str = Field(..., description="Success message")
+
+
+class BudgetLimitDeleteRequest(BaseModel):
+    """Request model for deleting a budget limit"""
+    budget_id: str = Field(..., description="The ID of the budget")
+    limit_id: str = Field(..., description="The ID of the budget limit to delete")
+
+
+class BudgetLimitDeleteResponse(BaseModel):
+    """Response model for budget limit deletion"""
+    message: str = Field(..., description="Success message")
+
+
+class BudgetOverviewRequest(BaseModel):
+    """Request model for the budget overview"""
+    start: str | None = Field(None, description="Start date (YYYY-MM-DD); defaults to the first day of the current month")
+    end: str | None = Field(None, description="End date (YYYY-MM-DD); defaults to the last day of the current month")
+    include_inactive: bool = Field(False, description="Also list inactive budgets")
+
+
+class BudgetOverviewResponse(BaseModel):
+    """Response model for the budget overview"""
+    data: List[Dict] = Field(..., description="One row per budget and currency with 'limit', 'spent' and 'remaining' as decimal strings and 'percent_spent'")
+    meta: Dict = Field(..., description="Date range, number of budgets, per-currency totals and timing")
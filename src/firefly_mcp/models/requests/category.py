@@ -0,0 +1,52 @@
+"""Category request models."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import CategoryUpdate
+from firefly_mcp.models.requests.common import PaginatedRequest
+from typing import Literal
+
+
+class CategoryListRequest(PaginatedRequest):
+    """Request model for listing categories."""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class CategoryGetRequest(BaseModel):
+    """Request model for getting a single category"""
+    id: str = Field(..., description="The ID of the category")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD, to show spent and earned info")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD, to show spent and earned info")
+
+
+class CategoryUpdateRequest(BaseModel):
+    """Request model for updating a category"""
+    id: str = Field(..., description="The ID of the category")
+    category_update: CategoryUpdate = Field(..., description="The updated category data")
+
+
+class CategoryTransactionsRequest(PaginatedRequest):
+    """Request model for listing transactions for a category"""
+    id: str = Field(..., description="The ID of the category")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD")
+    type: Literal['all', 'withdrawal', 'withdrawals', 'expense', 'deposit', 'deposits', 'income', 'transfer', 'transfers', 'opening_balance', 'reconciliation', 'special', 'specials', 'default'] | None = Field(None, description="Optional filter on the transaction type(s) returned")
+
+
+class CategoryAttachmentsRequest(PaginatedRequest):
+    """Request model for listing attachments for a category"""
+    id: str = Field(..., description="The ID of the category")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class CategoryDeleteRequest(BaseModel):
+    """Request model for deleting a category"""
+    id: str = Field(..., description="The ID of the category to delete")
+
+
+class CategoryDeleteResponse(BaseModel):
+    """Response model for category deletion"""
+    message: str = Field(..., description="Success message")
@@ -0,0 +1,9 @@
+"""Request models shared by every entity."""
+
+from pydantic import BaseModel, Field
+
+
+class PaginatedRequest(BaseModel):
+    """Base model for list requests that support transparent auto-pagination."""
+    fetch_all: bool = Field(False, description="Fetch every page and return them merged into one result")
+    max_items: int | None = Field(None, ge=1, description="Fetch pages until this many items are collected")
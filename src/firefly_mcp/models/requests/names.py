@@ -0,0 +1,18 @@
+"""Name resolution models."""
+
+from pydantic import BaseModel, Field
+from typing import Dict, List
+
+
+class NameResolveRequest(BaseModel):
+    """Request model for looking up resources by name"""
+    name: str = Field(..., min_length=1, description="Name to look up; case, accents and extra spaces are ignored and near misses are ranked by similarity")
+    limit: int = Field(5, ge=1, le=50, description="Maximum number of matches")
+    min_score: float = Field(0.3, ge=0, le=1, description="Minimum trigram similarity (0-1) of non-exact matches")
+    refresh: bool = Field(False, description="Rebuild the name index from Firefly III first")
+
+
+class NameResolveResponse(BaseModel):
+    """Response model for a name lookup"""
+    data: List[Dict] = Field(..., description="Matches, best first, with 'id', 'name', 'score' (1.0 for exact) and 'exact'; accounts also carry 'type'")
+    meta: Dict = Field(..., description="Entity, query echo and number of indexed names")
@@ -0,0 +1,46 @@
+"""Piggy bank request models."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import PiggyBankUpdate
+from firefly_mcp.models.requests.common import PaginatedRequest
+
+
+class PiggyBankListRequest(PaginatedRequest):
+    """Request model for listing piggy banks."""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class PiggyBankGetRequest(BaseModel):
+    """Request model for getting a single piggy bank"""
+    id: str = Field(..., description="The ID of the piggy bank")
+
+
+class PiggyBankUpdateRequest(BaseModel):
+    """Request model for updating a piggy bank"""
+    id: str = Field(..., description="The ID of the piggy bank")
+    piggy_bank_update: PiggyBankUpdate = Field(..., description="The updated piggy bank data")
+
+
+class PiggyBankEventsRequest(PaginatedRequest):
+    """Request model for listing events for a piggy bank"""
+    id: str = Field(..., description="The ID of the piggy bank")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class PiggyBankAttachmentsRequest(PaginatedRequest):
+    """Request model for listing attachments for a piggy bank"""
+    id: str = Field(..., description="The ID of the piggy bank")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class PiggyBankDeleteRequest(BaseModel):
+    """Request model for deleting a piggy bank"""
+    id: str = Field(..., description="The ID of the piggy bank to delete")
+
+
+class PiggyBankDeleteResponse(BaseModel):
+    """Response model for piggy bank deletion"""
+    message: str = Field(..., description="Success message")
@@ -0,0 +1,49 @@
+"""Rule request models."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import RuleUpdate
+from firefly_mcp.models.requests.common import PaginatedRequest
+from typing import List
+
+
+class RuleListRequest(PaginatedRequest):
+    """Request model for listing rules."""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class RuleGetRequest(BaseModel):
+    """Request model for getting a single rule"""
+    id: str = Field(..., description="The ID of the rule")
+
+
+class RuleUpdateRequest(BaseModel):
+    """Request model for updating a rule"""
+    id: str = Field(..., description="The ID of the rule")
+    rule_update: RuleUpdate = Field(..., description="The updated rule data")
+
+
+class RuleTestRequest(BaseModel):
+    """Request model for testing which transactions would be hit by a rule"""
+    id: str = Field(..., description="The ID of the rule")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD to limit transactions")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD to limit transactions")
+    accounts: List[int] | None = Field(None, description="Limit testing to these asset accounts or liabilities")
+
+
+class RuleTriggerRequest(BaseModel):
+    """Request model for firing a rule on transactions"""
+    id: str = Field(..., description="The ID of the rule")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD to limit transactions")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD to limit transactions")
+    accounts: List[int] | None = Field(None, description="Limit triggering to these asset accounts or liabilities")
+
+
+class RuleDeleteRequest(BaseModel):
+    """Request model for deleting a rule"""
+    id: str = Field(..., description="The ID of the rule to delete")
+
+
+class RuleDeleteResponse(BaseModel):
+    """Response model for rule deletion"""
+    message: str = Field(..., description="Success message")
@@ -0,0 +1,60 @@
+"""Rule group request models."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import RuleGroupUpdate
+from firefly_mcp.models.requests.common import PaginatedRequest
+from typing import List
+
+
+class RuleGroupListRequest(PaginatedRequest):
+    """Request model for listing rule groups."""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class RuleGroupGetRequest(BaseModel):
+    """Request model for getting a single rule group"""
+    id: str = Field(..., description="The ID of the rule group")
+
+
+class RuleGroupUpdateRequest(BaseModel):
+    """Request model for updating a rule group"""
+    id: str = Field(..., description="The ID of the rule group")
+    rule_group_update: RuleGroupUpdate = Field(..., description="The updated rule group data")
+
+
+class RuleGroupListRulesRequest(PaginatedRequest):
+    """Request model for listing rules in a rule group"""
+    id: str = Field(..., description="The ID of the rule group")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class RuleGroupTestRequest(PaginatedRequest):
+    """Request model for testing which transactions would be hit by a rule group"""
+    id: str = Field(..., description="The ID of the rule group")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD to limit transactions")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD to limit transactions")
+    search_limit: int | None = Field(None, description="Maximum number of transactions Firefly III will try")
+    triggered_limit: int | None = Field(None, description="Maximum number of transactions the rule group can trigger on")
+    accounts: List[int] | None = Field(None, description="Limit testing to these asset accounts or liabilities")
+
+
+class RuleGroupTriggerRequest(BaseModel):
+    """Request model for firing a rule group on transactions"""
+    id: str = Field(..., description="The ID of the rule group")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD to limit transactions")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD to limit transactions")
+    accounts: List[int] | None = Field(None, description="Limit triggering to these asset accounts or liabilities")
+
+
+class RuleGroupDeleteRequest(BaseModel):
+    """Request model for deleting a rule group"""
+    id: str = Field(..., description="The ID of the rule group to delete")
+
+
+class RuleGroupDeleteResponse(BaseModel):
+    """Response model for rule group deletion"""
+    message: str = Field(..., description="Success message")
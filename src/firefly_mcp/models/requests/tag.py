@@ -0,0 +1,52 @@
+"""Tag request models."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import TagModelUpdate
+from firefly_mcp.models.requests.common import PaginatedRequest
+from typing import Literal
+
+
+class TagListRequest(PaginatedRequest):
+    """Request model for listing tags."""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class TagGetRequest(BaseModel):
+    """Request model for getting a single tag"""
+    id: str = Field(..., description="The ID of the tag")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class TagUpdateRequest(BaseModel):
+    """Request model for updating a tag"""
+    id: str = Field(..., description="The ID of the tag")
+    tag_update: TagModelUpdate = Field(..., description="The updated tag data")
+
+
+class TagTransactionsRequest(PaginatedRequest):
+    """Request model for listing transactions for a tag"""
+    id: str = Field(..., description="The ID of the tag")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD")
+    type: Literal['all', 'withdrawal', 'withdrawals', 'expense', 'deposit', 'deposits', 'income', 'transfer', 'transfers', 'opening_balance', 'reconciliation', 'special', 'specials', 'default'] | None = Field(None, description="Optional filter on the transaction type(s) returned")
+
+
+class TagAttachmentsRequest(PaginatedRequest):
+    """Request model for listing attachments for a tag"""
+    id: str = Field(..., description="The ID of the tag")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class TagDeleteRequest(BaseModel):
+    """Request model for deleting a tag"""
+    id: str = Field(..., description="The ID of the tag to delete")
+
+
+class TagDeleteResponse(BaseModel):
+    """Response model for tag deletion"""
+    message: str = Field(..., description="Success message")
@@ -0,0 +1,117 @@
+"""Transaction request models, including the local mirror's."""
+
+from pydantic import BaseModel, Field
+from firefly_mcp.models.model import TransactionUpdate
+from firefly_mcp.models.requests.common import PaginatedRequest
+from typing import Dict, List, Literal
+
+
+class TransactionListRequest(PaginatedRequest):
+    """Request model for listing transactions."""
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD")
+    type: Literal['all', 'withdrawal', 'withdrawals', 'expense', 'deposit', 'deposits', 'income', 'transfer', 'transfers', 'opening_balance', 'reconciliation', 'special', 'specials', 'default'] | None = Field(None, description="Optional filter on the transaction type(s) returned")
+
+
+class TransactionGetRequest(BaseModel):
+    """Request model for getting a single transaction"""
+    id: str = Field(..., description="The ID of the transaction")
+
+
+class TransactionUpdateRequest(BaseModel):
+    """Request model for updating a transaction"""
+    id: str = Field(..., description="The ID of the transaction")
+    transaction_update: TransactionUpdate = Field(..., description="The updated transaction data")
+
+
+class TransactionAttachmentsRequest(PaginatedRequest):
+    """Request model for listing attachments for a transaction"""
+    id: str = Field(..., description="The ID of the transaction")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class TransactionPiggyBankEventsRequest(PaginatedRequest):
+    """Request model for listing piggy bank events for a transaction"""
+    id: str = Field(..., description="The ID of the transaction")
+    limit: int | None = Field(None, description="Number of items per page")
+    page: int | None = Field(None, description="Page number")
+
+
+class TransactionDeleteRequest(BaseModel):
+    """Request model for deleting a transaction"""
+    id: str = Field(..., description="The ID of the transaction to delete")
+
+
+class TransactionDeleteResponse(BaseModel):
+    """Response model for transaction deletion"""
+    message: str = Field(..., description="Success message")
+
+
+class BulkCategorizeRequest(BaseModel):
+    """Request model for bulk categorizing transactions"""
+    transaction_ids: List[int] = Field(..., description="List of transaction IDs to categorize")
+    category_name: str = Field(..., description="Name of the category to assign")
+
+
+class BulkTagRequest(BaseModel):
+    """Request model for bulk tagging transactions"""
+    transaction_ids: List[int] = Field(..., description="List of transaction IDs to tag")
+    tag_names: List[str] = Field(..., description="List of tag names to assign")
+
+
+class LocalSyncRequest(BaseModel):
+    """Request model for syncing the local transaction mirror"""
+    start: str | None = Field(None, description="Oldest date (YYYY-MM-DD) to mirror on the first or a full sync; all history if omitted")
+    full: bool = Field(False, description="Re-fetch the whole mirrored range instead of only recent changes")
+    lookback_days: int = Field(30, ge=0, description="Days before the previous sync that an incremental sync re-fetches")
+
+
+class LocalSyncResponse(BaseModel):
+    """Response model for a local mirror sync"""
+    mode: Literal['full', 'incremental'] = Field(..., description="Whether the whole range or only the recent window was fetched")
+    window_start: str | None = Field(None, description="First transaction date fetched (None = all history)")
+    groups_fetched: int = Field(..., description="Transaction groups returned by Firefly III")
+    groups_changed: int = Field(..., description="New or updated transaction groups written to the mirror")
+    groups_deleted: int = Field(..., description="Transaction groups removed from the mirror")
+    entities: Dict[str, int] = Field(..., description="Mirrored accounts, categories, budgets and tags")
+    duration_ms: float = Field(..., description="Sync duration in milliseconds")
+
+
+class TransactionAggregateRequest(BaseModel):
+    """Request model for aggregating mirrored transactions"""
+    group_by: List[Literal['category', 'budget', 'tag', 'account', 'counterparty']] = Field(default_factory=lambda: ['category'], description="Dimensions to group by; 'account' is the asset account, 'counterparty' the expense/revenue account")
+    period: Literal['day', 'week', 'month', 'quarter', 'year'] | None = Field(None, description="Optional time bucket; weeks are labelled by their Monday")
+    type: Literal['withdrawal', 'deposit', 'transfer', 'net'] = Field('withdrawal', description="Transaction type to sum; 'net' is deposits minus withdrawals")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD")
+    category: str | None = Field(None, description="Only include this category (name, case-insensitive)")
+    budget: str | None = Field(None, description="Only include this budget (name, case-insensitive)")
+    tag: str | None = Field(None, description="Only include splits with this tag (case-insensitive)")
+    account: str | None = Field(None, description="Only include this asset account (name, case-insensitive)")
+    limit: int | None = Field(None, ge=1, description="Keep only the largest N groups of each period")
+    refresh: bool = Field(False, description="Run an incremental sync of the local mirror first")
+
+
+class TransactionAggregateResponse(BaseModel):
+    """Response model for transaction aggregation"""
+    data: List[Dict] = Field(..., description="One row per group and period with 'total' (decimal string) and 'count'")
+    meta: Dict = Field(..., description="Query echo, per-currency totals and the mirror's last sync time")
+
+
+class TransactionSearchLocalRequest(BaseModel):
+    """Request model for searching mirrored transactions"""
+    query: str = Field(..., min_length=1, description="Words to find in descriptions, notes, external ids and counterparty names; prefixes match")
+    start: str | None = Field(None, description="Start date formatted YYYY-MM-DD")
+    end: str | None = Field(None, description="End date formatted YYYY-MM-DD")
+    type: Literal['withdrawal', 'deposit', 'transfer'] | None = Field(None, description="Optional filter on the transaction type")
+    limit: int = Field(25, ge=1, le=500, description="Maximum number of results")
+    refresh: bool = Field(False, description="Run an incremental sync of the local mirror first")
+
+
+class TransactionSearchLocalResponse(BaseModel):
+    """Response model for local transaction search"""
+    data: List[Dict] = Field(..., description="Matching splits, best first, with 'amount' as a decimal string and a relevance 'score'")
+    meta: Dict = Field(..., description="Query echo, ranking method, timing and the mirror's last sync time")
@@ -6,7 +6,8 @@ from typing import Dict, Any
 
 from firefly_mcp.core.accounts import (
     get_account, list_accounts, create_account, update_account, delete_account,
-    list_account_transactions, list_account_attachments, list_account_piggy_banks
+    list_account_transactions, list_account_attachments, list_account_piggy_banks,
+    resolve_accounts
 )
 from firefly_mcp.models.model import (
     AccountArray, AccountSingle, AccountStore, TransactionArray, 
@@ -15,8 +16,9 @@ from firefly_mcp.models.model import (
 from firefly_mcp.models.requests import (
     AccountGetRequest, AccountListRequest, AccountUpdateRequest,
     AccountTransactionsRequest, AccountAttachmentsRequest, AccountPiggyBanksRequest,
-    AccountDeleteRequest, AccountDeleteResponse
+    AccountDeleteRequest, AccountDeleteResponse, NameResolveRequest, NameResolveResponse
 )
+from firefly_mcp.core.cache import TRANSACTION_DEPENDENT_PATHS
 from firefly_mcp.tools.registry import EntityType, create_provider_from_config
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,7 @@ ACCOUNT_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": AccountGetRequest,
         "response_model": AccountSingle,
         "core_function": get_account,
+        "resolve_ids": {"id": "account"},
         "tags": {"read", "single"}
     },
     
@@ -45,7 +48,9 @@ ACCOUNT_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": AccountStore,
         "response_model": AccountSingle,
         "core_function": create_account,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        # An opening balance is booked as a transaction
+        "invalidates": ["/accounts*", "/transactions*"]
     },
     
     "update": {
@@ -53,7 +58,9 @@ ACCOUNT_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": AccountUpdateRequest,
         "response_model": AccountSingle,
         "core_function": update_account,
-        "tags": {"write", "update"}
+        "resolve_ids": {"id": "account"},
+        "tags": {"write", "update"},
+        "invalidates": ["/accounts", "/accounts/{id}", "/accounts/{id}/*", "/transactions*"]
     },
     
     "delete": {
@@ -61,7 +68,9 @@ ACCOUNT_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": AccountDeleteRequest,
         "response_model": AccountDeleteResponse,
         "core_function": delete_account,
-        "tags": {"write", "delete"}
+        "resolve_ids": {"id": "account"},
+        "tags": {"write", "delete"},
+        "invalidates": [*TRANSACTION_DEPENDENT_PATHS, "/piggy-banks*"]
     },
     
     "list_transactions": {
@@ -69,6 +78,7 @@ ACCOUNT_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": AccountTransactionsRequest,
         "response_model": TransactionArray,
         "core_function": list_account_transactions,
+        "resolve_ids": {"id": "account"},
         "tags": {"read", "list", "transactions", "pagination"}
     },
     
@@ -77,6 +87,7 @@ ACCOUNT_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": AccountAttachmentsRequest,
         "response_model": AttachmentArray,
         "core_function": list_account_attachments,
+        "resolve_ids": {"id": "account"},
         "tags": {"read", "list", "attachments", "pagination"}
     },
     
@@ -85,7 +96,16 @@ ACCOUNT_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": AccountPiggyBanksRequest,
         "response_model": PiggyBankArray,
         "core_function": list_account_piggy_banks,
+        "resolve_ids": {"id": "account"},
         "tags": {"read", "list", "piggy_banks", "pagination"}
+    },
+    
+    "resolve": {
+        "description": "Find accounts by name and get their IDs. Case and accents are ignored; near misses are ranked by similarity. Results include the account type, since e.g. an expense and a revenue account may share a name.",
+        "request_model": NameResolveRequest,
+        "response_model": NameResolveResponse,
+        "core_function": resolve_accounts,
+        "tags": {"read", "resolve"}
     }
 }
 
@@ -12,7 +12,8 @@ from firefly_mcp.core.bills import (
     update_bill,
     list_bill_transactions,
     list_bill_attachments,
-    list_bill_rules
+    list_bill_rules,
+    resolve_bills
 )
 from firefly_mcp.models.model import (
     BillArray, BillSingle, BillStore, TransactionArray, 
@@ -26,7 +27,9 @@ from firefly_mcp.models.requests import (
     BillAttachmentsRequest,
     BillRulesRequest,
     BillDeleteRequest,
-    BillDeleteResponse
+    BillDeleteResponse,
+    NameResolveRequest,
+    NameResolveResponse
 )
 from firefly_mcp.tools.registry import EntityType, create_provider_from_config
 
@@ -48,6 +51,7 @@ BILL_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BillGetRequest,
         "response_model": BillSingle,
         "core_function": get_bill,
+        "resolve_ids": {"id": "bill"},
         "tags": {"read", "single"}
     },
     
@@ -56,7 +60,8 @@ BILL_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BillStore,
         "response_model": BillSingle,
         "core_function": create_bill,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        "invalidates": ["/bills"]
     },
     
     "update": {
@@ -64,7 +69,9 @@ BILL_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BillUpdateRequest,
         "response_model": BillSingle,
         "core_function": update_bill,
-        "tags": {"write", "update"}
+        "resolve_ids": {"id": "bill"},
+        "tags": {"write", "update"},
+        "invalidates": ["/bills", "/bills/{id}", "/bills/{id}/*"]
     },
     
     "delete": {
@@ -72,7 +79,9 @@ BILL_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BillDeleteRequest,
         "response_model": BillDeleteResponse,
         "core_function": delete_bill,
-        "tags": {"write", "delete"}
+        "resolve_ids": {"id": "bill"},
+        "tags": {"write", "delete"},
+        "invalidates": ["/bills", "/bills/{id}", "/bills/{id}/*", "/transactions*"]
     },
     
     "list_transactions": {
@@ -80,6 +89,7 @@ BILL_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BillTransactionsRequest,
         "response_model": TransactionArray,
         "core_function": list_bill_transactions,
+        "resolve_ids": {"id": "bill"},
         "tags": {"read", "list", "transactions", "pagination"}
     },
     
@@ -88,6 +98,7 @@ BILL_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BillAttachmentsRequest,
         "response_model": AttachmentArray,
         "core_function": list_bill_attachments,
+        "resolve_ids": {"id": "bill"},
         "tags": {"read", "list", "attachments", "pagination"}
     },
     
@@ -96,7 +107,16 @@ BILL_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BillRulesRequest,
         "response_model": RuleArray,
         "core_function": list_bill_rules,
+        "resolve_ids": {"id": "bill"},
         "tags": {"read", "list", "rules", "pagination"}
+    },
+    
+    "resolve": {
+        "description": "Find bills by name and get their IDs. Case and accents are ignored; near misses are ranked by similarity.",
+        "request_model": NameResolveRequest,
+        "response_model": NameResolveResponse,
+        "core_function": resolve_bills,
+        "tags": {"read", "resolve"}
     }
 }
 
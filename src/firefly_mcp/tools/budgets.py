@@ -17,7 +17,9 @@ from firefly_mcp.core.budgets import (
     delete_limit,
     list_budget_transactions,
     list_budget_attachments,
-    list_transactions_without_budget
+    list_transactions_without_budget,
+    budget_overview,
+    resolve_budgets
 )
 from firefly_mcp.models.model import (
     BudgetArray, BudgetSingle, BudgetStore,
@@ -38,7 +40,11 @@ from firefly_mcp.models.requests import (
     BudgetDeleteRequest,
     BudgetDeleteResponse,
     BudgetLimitDeleteRequest,
-    BudgetLimitDeleteResponse
+    BudgetLimitDeleteResponse,
+    BudgetOverviewRequest,
+    BudgetOverviewResponse,
+    NameResolveRequest,
+    NameResolveResponse
 )
 from firefly_mcp.tools.registry import EntityType, create_provider_from_config
 
@@ -60,6 +66,7 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetGetRequest,
         "response_model": BudgetSingle,
         "core_function": get_budget,
+        "resolve_ids": {"id": "budget"},
         "tags": {"read", "single"}
     },
     
@@ -68,7 +75,8 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetStore,
         "response_model": BudgetSingle,
         "core_function": create_budget,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        "invalidates": ["/budgets"]
     },
     
     "update": {
@@ -76,7 +84,9 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetUpdateRequest,
         "response_model": BudgetSingle,
         "core_function": update_budget,
-        "tags": {"write", "update"}
+        "resolve_ids": {"id": "budget"},
+        "tags": {"write", "update"},
+        "invalidates": ["/budgets", "/budgets/{id}", "/budgets/{id}/*", "/transactions*"]
     },
     
     "delete": {
@@ -84,7 +94,9 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetDeleteRequest,
         "response_model": BudgetDeleteResponse,
         "core_function": delete_budget,
-        "tags": {"write", "delete"}
+        "resolve_ids": {"id": "budget"},
+        "tags": {"write", "delete"},
+        "invalidates": ["/budgets", "/budgets/{id}", "/budgets/{id}/*", "/transactions*"]
     },
     
     "list_limits": {
@@ -92,6 +104,7 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetLimitsRequest,
         "response_model": BudgetLimitArray,
         "core_function": list_limits,
+        "resolve_ids": {"id": "budget"},
         "tags": {"read", "list", "limits", "pagination"}
     },
     
@@ -100,6 +113,7 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetLimitGetRequest,
         "response_model": BudgetLimitSingle,
         "core_function": get_limit,
+        "resolve_ids": {"budget_id": "budget"},
         "tags": {"read", "single", "limits"}
     },
     
@@ -108,7 +122,9 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetLimitCreateRequest,
         "response_model": BudgetLimitSingle,
         "core_function": create_limit,
-        "tags": {"write", "create", "limits"}
+        "resolve_ids": {"budget_id": "budget"},
+        "tags": {"write", "create", "limits"},
+        "invalidates": ["/budgets", "/budgets/{budget_id}", "/budgets/{budget_id}/limits"]
     },
     
     "update_limit": {
@@ -116,7 +132,9 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetLimitUpdateRequest,
         "response_model": BudgetLimitSingle,
         "core_function": update_limit,
-        "tags": {"write", "update", "limits"}
+        "resolve_ids": {"budget_id": "budget"},
+        "tags": {"write", "update", "limits"},
+        "invalidates": ["/budgets", "/budgets/{budget_id}", "/budgets/{budget_id}/limits", "/budgets/{budget_id}/limits/{limit_id}"]
     },
     
     "delete_limit": {
@@ -124,7 +142,17 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetLimitDeleteRequest,
         "response_model": BudgetLimitDeleteResponse,
         "core_function": delete_limit,
-        "tags": {"write", "delete", "limits"}
+        "resolve_ids": {"budget_id": "budget"},
+        "tags": {"write", "delete", "limits"},
+        "invalidates": ["/budgets", "/budgets/{budget_id}", "/budgets/{budget_id}/limits", "/budgets/{budget_id}/limits/{limit_id}"]
+    },
+    
+    "overview": {
+        "description": "Overview of all budgets for a date range (default: current month): limit, spent, remaining and percent spent per budget and currency, in one call.",
+        "request_model": BudgetOverviewRequest,
+        "response_model": BudgetOverviewResponse,
+        "core_function": budget_overview,
+        "tags": {"read", "list", "limits", "overview"}
     },
     
     "list_transactions": {
@@ -132,6 +160,7 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetTransactionsRequest,
         "response_model": TransactionArray,
         "core_function": list_budget_transactions,
+        "resolve_ids": {"id": "budget"},
         "tags": {"read", "list", "transactions", "pagination"}
     },
     
@@ -140,6 +169,7 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BudgetAttachmentsRequest,
         "response_model": AttachmentArray,
         "core_function": list_budget_attachments,
+        "resolve_ids": {"id": "budget"},
         "tags": {"read", "list", "attachments", "pagination"}
     },
     
@@ -149,6 +179,14 @@ BUDGET_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "response_model": TransactionArray,
         "core_function": list_transactions_without_budget,
         "tags": {"read", "list", "transactions", "pagination", "unlinked"}
+    },
+    
+    "resolve": {
+        "description": "Find budgets by name and get their IDs. Case and accents are ignored; near misses are ranked by similarity.",
+        "request_model": NameResolveRequest,
+        "response_model": NameResolveResponse,
+        "core_function": resolve_budgets,
+        "tags": {"read", "resolve"}
     }
 }
 
@@ -11,7 +11,8 @@ from firefly_mcp.core.categories import (
     list_categories, 
     update_category,
     list_category_transactions,
-    list_category_attachments
+    list_category_attachments,
+    resolve_categories
 )
 from firefly_mcp.models.model import CategoryArray, CategorySingle, Category, TransactionArray, AttachmentArray
 from firefly_mcp.models.requests import (
@@ -21,7 +22,9 @@ from firefly_mcp.models.requests import (
     CategoryTransactionsRequest,
     CategoryAttachmentsRequest,
     CategoryDeleteRequest,
-    CategoryDeleteResponse
+    CategoryDeleteResponse,
+    NameResolveRequest,
+    NameResolveResponse
 )
 from firefly_mcp.tools.registry import EntityType, create_provider_from_config
 
@@ -43,6 +46,7 @@ CATEGORY_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": CategoryGetRequest,
         "response_model": CategorySingle,
         "core_function": get_category,
+        "resolve_ids": {"id": "category"},
         "tags": {"read", "single"}
     },
     
@@ -51,7 +55,8 @@ CATEGORY_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": Category,
         "response_model": CategorySingle,
         "core_function": create_category,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        "invalidates": ["/categories"]
     },
     
     "update": {
@@ -59,7 +64,9 @@ CATEGORY_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": CategoryUpdateRequest,
         "response_model": CategorySingle,
         "core_function": update_category,
-        "tags": {"write", "update"}
+        "resolve_ids": {"id": "category"},
+        "tags": {"write", "update"},
+        "invalidates": ["/categories", "/categories/{id}", "/categories/{id}/*", "/transactions*"]
     },
     
     "delete": {
@@ -67,7 +74,9 @@ CATEGORY_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": CategoryDeleteRequest,
         "response_model": CategoryDeleteResponse,
         "core_function": delete_category,
-        "tags": {"write", "delete"}
+        "resolve_ids": {"id": "category"},
+        "tags": {"write", "delete"},
+        "invalidates": ["/categories", "/categories/{id}", "/categories/{id}/*", "/transactions*"]
     },
     
     "list_transactions": {
@@ -75,6 +84,7 @@ CATEGORY_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": CategoryTransactionsRequest,
         "response_model": TransactionArray,
         "core_function": list_category_transactions,
+        "resolve_ids": {"id": "category"},
         "tags": {"read", "list", "transactions", "pagination"}
     },
     
@@ -83,7 +93,16 @@ CATEGORY_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": CategoryAttachmentsRequest,
         "response_model": AttachmentArray,
         "core_function": list_category_attachments,
+        "resolve_ids": {"id": "category"},
         "tags": {"read", "list", "attachments", "pagination"}
+    },
+    
+    "resolve": {
+        "description": "Find categories by name and get their IDs. Case and accents are ignored; near misses are ranked by similarity.",
+        "request_model": NameResolveRequest,
+        "response_model": NameResolveResponse,
+        "core_function": resolve_categories,
+        "tags": {"read", "resolve"}
     }
 }
 
@@ -0,0 +1,95 @@
+"""Bounded thread-pool execution for synchronous core functions."""
+
+import asyncio
+import contextvars
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# Every executor created in this process, so the server lifespan can stop them.
+_live_executors: "weakref.WeakSet[BoundedExecutor]" = weakref.WeakSet()
+
+
+class BoundedExecutor:
+    """Thread pool with a fixed worker count and queue/wait-time counters.
+
+    Synchronous core functions are offloaded here so the event loop keeps
+    serving other tool calls (e.g. discovery tools) while they run. The
+    counters make it possible to size ``max_workers`` under real load.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"firefly-{name}")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        _live_executors.add(self)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` on the pool and await its result."""
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+            self._submitted += 1
+
+        def _call() -> Any:
+            wait = time.perf_counter() - enqueued_at
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                return fn(*args)
+            except Exception:
+                with self._lock:
+                    self._failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        # Like asyncio.to_thread, carry context variables into the worker
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, context.run, _call)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the pool counters."""
+        with self._lock:
+            started = self._submitted - self._queued
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "active": self._active,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_wait_ms": round(self._total_wait / started * 1000, 3) if started else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work, drop queued calls and release the worker threads.
+
+        With ``wait`` the call blocks until calls already running finish.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def shutdown_executors(wait: bool = True) -> int:
+    """Shut down every live executor and return how many were stopped."""
+    executors = list(_live_executors)
+    for executor in executors:
+        executor.shutdown(wait=wait)
+    return len(executors)
@@ -0,0 +1,134 @@
+"""Compact tabular output formats for list results.
+
+JSON:API list payloads repeat every attribute key for every resource. List
+operations accept ``output_format`` to flatten the result into rows instead:
+
+- ``json`` (default): the regular nested payload
+- ``columnar``: ``{"columns": {name: [values...]}, "count": n, "meta": ...}``
+- ``csv``: ``{"csv": "<header + rows>", "count": n, "meta": ...}``
+
+Each resource becomes one row holding its ``id`` and scalar attributes, with
+nested objects flattened into dotted column names. Resources with a list of
+objects among their attributes (the splits of a transaction group) produce
+one row per element instead, carrying the resource's own columns along.
+"""
+
+import csv
+import io
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from firefly_mcp.lib.exceptions import ValidationError
+
+OUTPUT_FORMAT_PARAM = "output_format"
+OUTPUT_FORMATS = ("json", "columnar", "csv")
+
+OUTPUT_FORMAT_SCHEMA: Dict[str, Any] = {
+    "type": "string",
+    "enum": list(OUTPUT_FORMATS),
+    "default": "json",
+    "description": (
+        "Result layout: 'json' (nested, default), 'columnar' (one array per attribute) "
+        "or 'csv' (CSV text). Transactions produce one row per split."
+    ),
+}
+
+# Separator for lists of scalars (e.g. tags) inside a CSV cell.
+CSV_LIST_SEPARATOR = ";"
+
+
+def add_output_format_param(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of an operation schema that advertises ``output_format``."""
+    return {**schema, "properties": {**schema.get("properties", {}), OUTPUT_FORMAT_PARAM: OUTPUT_FORMAT_SCHEMA}}
+
+
+def pop_output_format(params: Any) -> Tuple[Any, str]:
+    """Split the ``output_format`` option off raw operation parameters."""
+    if not isinstance(params, dict) or OUTPUT_FORMAT_PARAM not in params:
+        return params, "json"
+    remaining = {key: value for key, value in params.items() if key != OUTPUT_FORMAT_PARAM}
+    output_format = params[OUTPUT_FORMAT_PARAM] or "json"
+    if output_format not in OUTPUT_FORMATS:
+        raise ValidationError(f"'output_format' must be one of {', '.join(OUTPUT_FORMATS)}")
+    return remaining, output_format
+
+
+def flatten_rows(result: Dict[str, Any]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Flatten the ``data`` of a list result into column names and rows."""
+    columns: Dict[str, None] = {}
+    rows: List[Dict[str, Any]] = []
+    for resource in result.get("data") or []:
+        for row in _resource_rows(resource):
+            columns.update(dict.fromkeys(row))
+            rows.append(row)
+    return list(columns), rows
+
+
+def format_result(result: Any, output_format: str) -> Any:
+    """Render a serialized list result in the requested output format."""
+    if output_format == "json" or not isinstance(result, dict) or not isinstance(result.get("data"), list):
+        return result
+
+    columns, rows = flatten_rows(result)
+    formatted: Dict[str, Any] = {"count": len(rows)}
+    if output_format == "columnar":
+        formatted["columns"] = {column: [row.get(column) for row in rows] for column in columns}
+    else:
+        formatted["csv"] = _to_csv(columns, rows)
+    if "meta" in result:
+        formatted["meta"] = result["meta"]
+    return formatted
+
+
+def _resource_rows(resource: Any) -> List[Dict[str, Any]]:
+    if not isinstance(resource, dict):
+        return [{"value": resource}]
+    attributes = resource.get("attributes", resource)
+    base: Dict[str, Any] = {"id": resource["id"]} if "id" in resource else {}
+    nested_lists = {
+        key: value for key, value in attributes.items()
+        if isinstance(value, list) and value and all(isinstance(item, dict) for item in value)
+    }
+    _flatten_into(base, {key: value for key, value in attributes.items() if key not in nested_lists})
+    if len(nested_lists) != 1:
+        for key, value in nested_lists.items():
+            base[key] = value
+        return [base]
+
+    rows = []
+    for item in next(iter(nested_lists.values())):
+        row = dict(base)
+        _flatten_into(row, item)
+        rows.append(row)
+    return rows
+
+
+def _flatten_into(row: Dict[str, Any], values: Dict[str, Any], prefix: str = "") -> None:
+    for key, value in values.items():
+        if isinstance(value, dict):
+            _flatten_into(row, value, f"{prefix}{key}.")
+        else:
+            row[f"{prefix}{key}"] = value
+
+
+def _to_csv(columns: List[str], rows: List[Dict[str, Any]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(_csv_cell(row.get(column)) for column in columns)
+    return buffer.getvalue()
+
+
+def _csv_cell(value: Optional[Any]) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
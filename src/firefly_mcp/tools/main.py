@@ -1,20 +1,13 @@
 """Main entry point for the Firefly III MCP server."""
 
+import logging
 from contextlib import AbstractAsyncContextManager
-from typing import Callable
+from importlib import import_module
+from typing import Callable, Dict, Iterable, List
 from fastmcp import FastMCP
 
 from firefly_mcp.models.app import AppContext
-from firefly_mcp.tools.accounts import account_provider
-from firefly_mcp.tools.bills import bill_provider
-from firefly_mcp.tools.budgets import budget_provider
-from firefly_mcp.tools.categories import category_provider
-from firefly_mcp.tools.piggy_banks import piggy_bank_provider
-from firefly_mcp.tools.rule_groups import rule_group_provider
-from firefly_mcp.tools.rules import rule_provider
-from firefly_mcp.tools.tags import tag_provider
-from firefly_mcp.tools.transactions import transaction_provider
-from firefly_mcp.tools.registry import setup_firefly_tools
+from firefly_mcp.tools.registry import EntityProvider, EntityType, RegistryConfig, setup_firefly_tools
 from firefly_mcp.tools.utils import register_version_tool, register_echo_tool
 # from fastmcp.server.middleware import Middleware, MiddlewareContext
 
@@ -24,6 +17,37 @@ from firefly_mcp.tools.utils import register_version_tool, register_echo_tool
 #         result = await call_next(context)
 #         print(f"<- Responded to {context.method}")
 #         return result
+
+logger = logging.getLogger(__name__)
+
+# Provider of each entity as "module:attribute". Modules are imported only for
+# enabled entities, so disabled ones never load their core functions or models.
+PROVIDER_PATHS: Dict[EntityType, str] = {
+    EntityType.ACCOUNT: "firefly_mcp.tools.accounts:account_provider",
+    EntityType.BILL: "firefly_mcp.tools.bills:bill_provider",
+    EntityType.BUDGET: "firefly_mcp.tools.budgets:budget_provider",
+    EntityType.CATEGORY: "firefly_mcp.tools.categories:category_provider",
+    EntityType.PIGGY_BANK: "firefly_mcp.tools.piggy_banks:piggy_bank_provider",
+    EntityType.RULE_GROUP: "firefly_mcp.tools.rule_groups:rule_group_provider",
+    EntityType.RULE: "firefly_mcp.tools.rules:rule_provider",
+    EntityType.TAG: "firefly_mcp.tools.tags:tag_provider",
+    EntityType.TRANSACTION: "firefly_mcp.tools.transactions:transaction_provider",
+}
+
+
+def load_providers(enabled_entities: Iterable[EntityType]) -> List[EntityProvider]:
+    """Import and return the providers of the enabled entities."""
+    providers: List[EntityProvider] = []
+    for entity_type, path in PROVIDER_PATHS.items():
+        if entity_type not in enabled_entities:
+            continue
+        module_name, attribute = path.split(":")
+        try:
+            providers.append(getattr(import_module(module_name), attribute))
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Failed to load provider for {entity_type.value} from {path}: {e}")
+    return providers
+
     
 def create_mcp_server(lifespan: Callable[[FastMCP], AbstractAsyncContextManager[AppContext, bool | None]] | None = None) -> FastMCP:
     """Create and configure the FastMCP server with consolidated Firefly III tools."""
@@ -32,9 +56,10 @@ def create_mcp_server(lifespan: Callable[[FastMCP], AbstractAsyncContextManager[
     else:
         mcp = FastMCP("Firefly MCP Server")
 
-    # Register the Firefly III tools
-    providers = [account_provider, bill_provider, budget_provider, category_provider, piggy_bank_provider, rule_group_provider, rule_provider, tag_provider, transaction_provider]
-    setup_firefly_tools(mcp, providers)
+    # Register the Firefly III tools of the enabled entities
+    config = RegistryConfig.from_environment()
+    providers = load_providers(config.enabled_entities)
+    setup_firefly_tools(mcp, providers, config)
     
     # Register utility tools
     register_version_tool(mcp)
@@ -51,7 +51,8 @@ PIGGY_BANK_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": PiggyBankStore,
         "response_model": PiggyBankSingle,
         "core_function": create_piggy_bank,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        "invalidates": ["/piggy-banks", "/accounts/*"]
     },
     
     "update": {
@@ -59,7 +60,8 @@ PIGGY_BANK_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": PiggyBankUpdateRequest,
         "response_model": PiggyBankSingle,
         "core_function": update_piggy_bank,
-        "tags": {"write", "update"}
+        "tags": {"write", "update"},
+        "invalidates": ["/piggy-banks", "/piggy-banks/{id}", "/piggy-banks/{id}/*", "/accounts/*"]
     },
     
     "delete": {
@@ -67,7 +69,8 @@ PIGGY_BANK_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": PiggyBankDeleteRequest,
         "response_model": PiggyBankDeleteResponse,
         "core_function": delete_piggy_bank,
-        "tags": {"write", "delete"}
+        "tags": {"write", "delete"},
+        "invalidates": ["/piggy-banks", "/piggy-banks/{id}", "/piggy-banks/{id}/*", "/accounts/*"]
     },
     
     "list_events": {
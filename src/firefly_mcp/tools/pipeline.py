@@ -0,0 +1,162 @@
+"""Dependency-aware execution of chained registry operations.
+
+A pipeline is a list of ``{"entity", "operation", "params"}`` steps. String
+values in ``params`` of the form ``$steps[N].path`` are replaced by data from
+the result of step ``N`` before the step runs, for example::
+
+    [
+        {"entity": "account", "operation": "list", "params": {"type": "asset"}},
+        {"entity": "account", "operation": "list_transactions",
+         "params": {"id": "$steps[0].data[0].id"}},
+    ]
+
+Paths use ``.field`` and ``[index]`` segments; ``[*]`` maps over a list and
+makes the reference resolve to a list of values. Steps are grouped into waves
+by their dependencies and the steps of one wave run concurrently, so the whole
+chain executes in a single tool call without intermediate payloads passing
+through the client.
+"""
+
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from firefly_mcp.lib.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from firefly_mcp.tools.registry import Registry
+
+_REFERENCE = re.compile(r"^\$steps\[(\d+)\]((?:\.[A-Za-z_][\w-]*|\[(?:\d+|\*)\])*)$")
+_SEGMENT = re.compile(r"\.([A-Za-z_][\w-]*)|\[(\d+|\*)\]")
+
+
+def _is_reference(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("$steps[")
+
+
+def find_dependencies(value: Any) -> Set[int]:
+    """Return the step indexes referenced anywhere inside ``value``."""
+    if _is_reference(value):
+        match = _REFERENCE.match(value)
+        if match is None:
+            raise ValidationError(f"Invalid step reference: {value}")
+        return {int(match.group(1))}
+    if isinstance(value, dict):
+        return set().union(*(find_dependencies(item) for item in value.values()))
+    if isinstance(value, list):
+        return set().union(*(find_dependencies(item) for item in value))
+    return set()
+
+
+def resolve_reference(reference: str, results: Dict[int, Any]) -> Any:
+    """Resolve one ``$steps[N].path`` reference against completed step results."""
+    match = _REFERENCE.match(reference)
+    if match is None:
+        raise ValidationError(f"Invalid step reference: {reference}")
+
+    values = [results[int(match.group(1))]]
+    wildcard = False
+    for field_name, index in _SEGMENT.findall(match.group(2)):
+        resolved: List[Any] = []
+        for value in values:
+            if field_name:
+                if not isinstance(value, dict) or field_name not in value:
+                    raise ValidationError(f"'{field_name}' not found while resolving {reference}")
+                resolved.append(value[field_name])
+            elif index == "*":
+                if not isinstance(value, list):
+                    raise ValidationError(f"[*] applied to a non-list while resolving {reference}")
+                resolved.extend(value)
+            else:
+                if not isinstance(value, list) or int(index) >= len(value):
+                    raise ValidationError(f"Index {index} out of range while resolving {reference}")
+                resolved.append(value[int(index)])
+        wildcard = wildcard or index == "*"
+        values = resolved
+    return values if wildcard else values[0]
+
+
+def resolve_params(value: Any, results: Dict[int, Any]) -> Any:
+    """Return a copy of ``value`` with every step reference substituted."""
+    if _is_reference(value):
+        return resolve_reference(value, results)
+    if isinstance(value, dict):
+        return {key: resolve_params(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_params(item, results) for item in value]
+    return value
+
+
+def plan_waves(steps: List[Dict[str, Any]]) -> List[List[int]]:
+    """Group step indexes into waves that can run concurrently.
+
+    A step may only reference earlier steps, which rules out cycles; it lands
+    in the wave after the latest wave of its dependencies.
+    """
+    levels: List[int] = []
+    for index, step in enumerate(steps):
+        if not isinstance(step, dict) or "entity" not in step or "operation" not in step:
+            raise ValidationError(f"Step {index} needs 'entity' and 'operation' keys")
+        dependencies = find_dependencies(step.get("params"))
+        invalid = [dependency for dependency in dependencies if dependency >= index]
+        if invalid:
+            raise ValidationError(f"Step {index} can only reference earlier steps, got {sorted(invalid)}")
+        levels.append(max((levels[dependency] + 1 for dependency in dependencies), default=0))
+
+    waves: List[List[int]] = [[] for _ in range(max(levels, default=-1) + 1)]
+    for index, level in enumerate(levels):
+        waves[level].append(index)
+    return waves
+
+
+async def execute_pipeline(
+    registry: "Registry",
+    steps: List[Dict[str, Any]],
+    return_steps: Optional[List[int]] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run a pipeline and return the outcome of every step.
+
+    Only the steps listed in ``return_steps`` (default: the last step) carry
+    their full result; the others report just their status. Indexes that do
+    not name a step are rejected before anything runs. A failed step
+    makes every step depending on it fail as well, while independent steps
+    keep running.
+    """
+    waves = plan_waves(steps)
+    selected = set(range(len(steps))[-1:] if return_steps is None else return_steps)
+    unknown = sorted(index for index in selected if not isinstance(index, int) or not 0 <= index < len(steps))
+    if unknown:
+        raise ValidationError(f"return_steps refers to unknown step(s) {unknown}; steps are numbered 0 to {len(steps) - 1}")
+    semaphore = asyncio.Semaphore(concurrency or 8)
+    results: Dict[int, Any] = {}
+    errors: Dict[int, str] = {}
+
+    async def _run(index: int) -> None:
+        step = steps[index]
+        failed = sorted(dependency for dependency in find_dependencies(step.get("params")) if dependency in errors)
+        if failed:
+            errors[index] = f"Skipped: depends on failed step(s) {failed}"
+            return
+        try:
+            params = resolve_params(step.get("params"), results)
+            async with semaphore:
+                results[index] = await registry.execute_operation(step["entity"], step["operation"], params)
+        except Exception as e:
+            errors[index] = str(e)
+
+    for wave in waves:
+        await asyncio.gather(*(_run(index) for index in wave))
+
+    outcomes: List[Dict[str, Any]] = []
+    for index, step in enumerate(steps):
+        outcome: Dict[str, Any] = {"step": index, "entity": step["entity"], "operation": step["operation"]}
+        if index in errors:
+            outcome["error"] = errors[index]
+        else:
+            outcome["status"] = "ok"
+            if index in selected:
+                outcome["result"] = results[index]
+        outcomes.append(outcome)
+
+    return {"waves": waves, "steps": outcomes}
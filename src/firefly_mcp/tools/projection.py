@@ -0,0 +1,94 @@
+"""Sparse field projection for read results.
+
+Read operations accept a ``fields`` parameter listing the attribute names the
+caller needs, e.g. ``["date", "amount", "description", "category_name"]``.
+Every resource in ``data`` then keeps only its ``id``, ``type`` and the
+requested attributes. Attributes nested in lists, such as the splits of a
+transaction group, are projected the same way, so requesting split fields
+returns ``attributes.transactions`` with just those fields.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from firefly_mcp.lib.exceptions import ValidationError
+
+FIELDS_PARAM = "fields"
+
+FIELDS_SCHEMA: Dict[str, Any] = {
+    "anyOf": [{"type": "array", "items": {"type": "string"}}, {"type": "null"}],
+    "default": None,
+    "description": (
+        "Only return these attributes of each result (e.g. [\"date\", \"amount\", \"description\"]). "
+        "Attributes of transaction splits can be requested directly."
+    ),
+}
+
+# Resource keys that are always kept.
+_RESOURCE_KEYS = ("id", "type")
+
+
+def add_fields_param(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of an operation schema that advertises ``fields``."""
+    return {**schema, "properties": {**schema.get("properties", {}), FIELDS_PARAM: FIELDS_SCHEMA}}
+
+
+def pop_fields(params: Any) -> Tuple[Any, Optional[List[str]]]:
+    """Split the ``fields`` option off raw operation parameters.
+
+    Returns the remaining parameters (a new dict, the caller's is untouched)
+    and the requested field names, accepting a list or a comma-separated
+    string.
+    """
+    if not isinstance(params, dict) or FIELDS_PARAM not in params:
+        return params, None
+    remaining = {key: value for key, value in params.items() if key != FIELDS_PARAM}
+    fields = params[FIELDS_PARAM]
+    if fields is None:
+        return remaining, None
+    if isinstance(fields, str):
+        fields = [name.strip() for name in fields.split(",") if name.strip()]
+    if not isinstance(fields, list) or not all(isinstance(name, str) for name in fields):
+        raise ValidationError("'fields' must be a list of attribute names")
+    return remaining, fields
+
+
+def project(result: Any, fields: List[str]) -> Any:
+    """Project a serialized read result onto the requested attribute names.
+
+    Only ``data`` is projected; envelope keys such as ``meta`` are kept. The
+    input is never mutated, so shared cached payloads stay intact.
+    """
+    if not isinstance(result, dict) or "data" not in result:
+        return _project_value(result, set(fields))
+    wanted = set(fields)
+    data = result["data"]
+    if isinstance(data, list):
+        projected: Any = [_project_resource(item, wanted) for item in data]
+    else:
+        projected = _project_resource(data, wanted)
+    return {**result, "data": projected}
+
+
+def _project_resource(resource: Any, wanted: Set[str]) -> Any:
+    if not isinstance(resource, dict) or "attributes" not in resource:
+        return _project_value(resource, wanted)
+    kept = {key: resource[key] for key in _RESOURCE_KEYS if key in resource}
+    kept["attributes"] = _project_value(resource["attributes"], wanted)
+    return kept
+
+
+def _project_value(value: Any, wanted: Set[str]) -> Any:
+    if isinstance(value, list):
+        return [_project_value(item, wanted) for item in value if isinstance(item, dict)]
+    if not isinstance(value, dict):
+        return value
+    projected: Dict[str, Any] = {}
+    for key, item in value.items():
+        if key in wanted:
+            projected[key] = item
+        elif isinstance(item, (dict, list)):
+            # Descend into nested objects (e.g. splits) for requested fields
+            nested = _project_value(item, wanted)
+            if any(nested) if isinstance(nested, list) else nested:
+                projected[key] = nested
+    return projected
@@ -1,16 +1,35 @@
 """Plugin-based tool registry for Firefly III MCP operations."""
 
+import asyncio
+import copy
+import inspect
 import logging
 import os
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import lru_cache
-from typing import Any, Callable, Dict, List, Optional, Set, Type
+from typing import Annotated, Any, Callable, Dict, List, Optional, Set, Tuple, Type
 
 from fastmcp import FastMCP
-from pydantic import BaseModel, ValidationError as PydanticValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError as PydanticValidationError
 
-from firefly_mcp.lib.exceptions import EntityNotAvailableError, OperationNotFoundError, RegistryError, ValidationError
+from firefly_mcp.core.cache import invalidate_paths, reference_cache
+from firefly_mcp.core.passthrough import passthrough
+from firefly_mcp.core.resolver import resolve_numeric_names, resolve_params
+from firefly_mcp.lib import http_client as http_client_module
+from firefly_mcp.lib.env import parse_int_env
+from firefly_mcp.lib.exceptions import (
+    EntityNotAvailableError,
+    FireflyAPIError,
+    OperationNotFoundError,
+    RegistryError,
+    ValidationError,
+)
+from firefly_mcp.tools.executor import BoundedExecutor
+from firefly_mcp.tools.formatting import add_output_format_param, format_result, pop_output_format
+from firefly_mcp.tools.pipeline import execute_pipeline
+from firefly_mcp.tools.projection import add_fields_param, pop_fields, project
+from firefly_mcp.tools.schema_cache import SchemaCache
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +56,8 @@ class OperationConfig:
     response_model: Optional[Type[Any]]
     core_function: Callable[..., Any]
     tags: Set[str] = field(default_factory=set)
+    invalidates: Tuple[str, ...] = ()
+    resolve_ids: Dict[str, str] = field(default_factory=dict)
     
     @property
     def tool_name(self) -> str:
@@ -50,6 +71,11 @@ class RegistryConfig:
     direct_mode: bool = False
     enabled_entities: Set[EntityType] = field(default_factory=set)
     log_level: str = "INFO"
+    executor_workers: int = 4
+    entity_executor_workers: Dict[EntityType, int] = field(default_factory=dict)
+    batch_concurrency: int = 8
+    schema_cache_path: Optional[str] = None
+    passthrough_reads: bool = False
     
     @classmethod
     def from_environment(cls) -> "RegistryConfig":
@@ -57,9 +83,22 @@ class RegistryConfig:
         return cls(
             direct_mode=_parse_bool_env("FIREFLY_DIRECT_MODE"),
             enabled_entities=_parse_entity_set_env("FIREFLY_ENABLED_ENTITIES"),
-            log_level=os.getenv("FIREFLY_LOG_LEVEL", "INFO")
+            log_level=os.getenv("FIREFLY_LOG_LEVEL", "INFO"),
+            executor_workers=_parse_int_env("FIREFLY_EXECUTOR_WORKERS", 4),
+            entity_executor_workers={
+                entity: _parse_int_env(f"FIREFLY_EXECUTOR_WORKERS_{entity.name}", 0)
+                for entity in EntityType
+                if os.getenv(f"FIREFLY_EXECUTOR_WORKERS_{entity.name}")
+            },
+            batch_concurrency=_parse_int_env("FIREFLY_BATCH_CONCURRENCY", 8),
+            schema_cache_path=os.getenv("FIREFLY_SCHEMA_CACHE_PATH") or None,
+            passthrough_reads=_parse_bool_env("FIREFLY_PASSTHROUGH_READS")
         )
 
+    def workers_for(self, entity_type: EntityType) -> int:
+        """Pool size for an entity type, falling back to the global default."""
+        return self.entity_executor_workers.get(entity_type) or self.executor_workers
+
 
 class EntityProvider:
     """Entity provider for a single entity type."""
@@ -76,7 +115,9 @@ class EntityProvider:
                 request_model=config["request_model"],
                 response_model=config["response_model"],
                 core_function=config["core_function"],
-                tags=set(config.get("tags", []))
+                tags=set(config.get("tags", [])),
+                invalidates=tuple(config.get("invalidates", ())),
+                resolve_ids=dict(config.get("resolve_ids", {}))
             )
     
     def get_operation(self, name: str) -> OperationConfig:
@@ -94,6 +135,25 @@ class EntityProvider:
         return True
 
 
+@lru_cache(maxsize=256)
+def _type_adapter(model: Any) -> TypeAdapter[Any]:
+    """Build (once per type) the TypeAdapter for a non-BaseModel request type.
+
+    Building an adapter compiles a pydantic core schema, which costs far more
+    than the validation it is used for.
+    """
+    return TypeAdapter(model)
+
+
+def get_type_adapter(model: Any) -> TypeAdapter[Any]:
+    """Cached TypeAdapter for ``model``, or a fresh one for unhashable types."""
+    try:
+        hash(model)
+    except TypeError:
+        return TypeAdapter(model)
+    return _type_adapter(model)
+
+
 class SchemaConverter:
     """Converts Pydantic models to JSON schemas for MCP tools."""
     
@@ -109,9 +169,7 @@ class SchemaConverter:
         
         # Handle generic types using TypeAdapter
         try:
-            from pydantic import TypeAdapter
-            adapter = TypeAdapter(model)
-            return adapter.json_schema()
+            return get_type_adapter(model).json_schema()
         except Exception as e:
             logger.warning(f"Failed to generate schema for {model}: {e}")
             return {"type": "object", "properties": {}}
@@ -136,8 +194,7 @@ class SchemaConverter:
             
             # Handle generic types using TypeAdapter
             else:
-                from pydantic import TypeAdapter
-                adapter = TypeAdapter(model)
+                adapter = get_type_adapter(model)
                 if isinstance(data, str):
                     return adapter.validate_json(data)
                 else:
@@ -153,7 +210,9 @@ class Registry:
     def __init__(self, config: RegistryConfig):
         self._config = config
         self._providers: Dict[EntityType, EntityProvider] = {}
+        self._executors: Dict[EntityType, BoundedExecutor] = {}
         self._converter = SchemaConverter()
+        self._schemas = SchemaCache(config.schema_cache_path)
         
         # Configure logging
         logging.getLogger().setLevel(self._config.log_level)
@@ -184,29 +243,90 @@ class Registry:
             return
         
         self._providers[provider.entity_type] = provider
+        self._precompute_schemas(provider)
         logger.info(f"Registered provider: {provider.entity_type}")
     
+    def _precompute_schemas(self, provider: EntityProvider) -> None:
+        """Build (or load from the schema cache) the schemas of all provider operations."""
+        for op_config in provider.list_operations():
+            self._schemas.get_or_build(
+                f"{provider.entity_type.value}.{op_config.name}",
+                op_config.request_model,
+                lambda op_config=op_config: self._build_schema(op_config),
+                _schema_options(op_config),
+            )
+    
+    def _build_schema(self, op_config: OperationConfig) -> Dict[str, Any]:
+        """JSON schema of an operation, including registry-level options."""
+        schema = self._converter.to_json_schema(op_config.request_model)
+        if "read" in op_config.tags:
+            schema = add_fields_param(schema)
+        if "list" in op_config.tags:
+            schema = add_output_format_param(schema)
+        if op_config.resolve_ids:
+            schema = _accept_names(schema, op_config.resolve_ids)
+        return schema
+    
+    def save_schema_cache(self) -> None:
+        """Persist newly built schemas when FIREFLY_SCHEMA_CACHE_PATH is set."""
+        self._schemas.save()
+    
     def get_provider(self, entity_type: EntityType) -> EntityProvider:
         """Get provider for entity type."""
         if entity_type not in self._providers:
             raise EntityNotAvailableError(f"No provider for: {entity_type}")
         return self._providers[entity_type]
     
-    def execute_operation(self, entity: str, operation: str, params: Any = None) -> Any:
-        """Direct operation execution with validation."""
+    def get_executor(self, entity_type: EntityType) -> BoundedExecutor:
+        """Get (lazily creating) the bounded executor for an entity type."""
+        if entity_type not in self._executors:
+            self._executors[entity_type] = BoundedExecutor(entity_type.value, self._config.workers_for(entity_type))
+        return self._executors[entity_type]
+    
+    async def execute_operation(self, entity: str, operation: str, params: Any = None) -> Any:
+        """Direct operation execution with validation.
+
+        Core functions are coroutines sharing the async HTTP client, so the
+        network wait of one call never blocks other in-flight tool calls.
+        Synchronous core functions are offloaded to the entity's bounded
+        executor instead of running on the event loop.
+        """
         try:
             entity_type = EntityType(entity)
             provider = self.get_provider(entity_type)
             op_config = provider.get_operation(operation)
             
-            # Validate parameters
-            validated_params = self._converter.validate_request(params, op_config.request_model)
+            # Registry-level options are not part of the request model
+            fields = None
+            output_format = "json"
+            if "read" in op_config.tags:
+                params, fields = pop_fields(params)
+            if "list" in op_config.tags:
+                params, output_format = pop_output_format(params)
             
-            # Execute operation
-            result: Any = op_config.core_function(validated_params)
+            # Reference-data names given in place of IDs
+            raw_params = params
+            if op_config.resolve_ids:
+                params = await resolve_params(params, op_config.resolve_ids)
+            
+            try:
+                validated_params, result = await self._run(entity_type, op_config, params)
+            except FireflyAPIError as e:
+                # Digits sent as an ID that does not exist may be a name ("2024")
+                renamed = None
+                if e.status_code == 404 and op_config.resolve_ids:
+                    renamed = await resolve_numeric_names(raw_params, op_config.resolve_ids)
+                if renamed is None:
+                    raise
+                renamed = await resolve_params(renamed, op_config.resolve_ids)
+                validated_params, result = await self._run(entity_type, op_config, renamed)
+            
+            # Drop cached reads made stale by this write
+            if op_config.invalidates:
+                invalidate_paths(op_config.invalidates, _template_values(validated_params))
             
             # Convert result for serialization
-            return self._serialize_result(result)
+            return self._serialize_result(result, fields, output_format)
             
         except (ValueError, OperationNotFoundError, EntityNotAvailableError, ValidationError):
             raise
@@ -214,6 +334,50 @@ class Registry:
             logger.exception(f"Operation execution failed: {entity}.{operation}")
             raise RegistryError(f"Execution error: {e}") from e
     
+    async def _run(self, entity_type: EntityType, op_config: OperationConfig, params: Any) -> Tuple[Any, Any]:
+        """Validate ``params`` and run the core function, returning both."""
+        validated_params = self._converter.validate_request(params, op_config.request_model)
+        
+        # Reads may skip model validation of the response
+        result: Any
+        with passthrough(self._config.passthrough_reads and "read" in op_config.tags):
+            if inspect.iscoroutinefunction(op_config.core_function):
+                result = await op_config.core_function(validated_params)
+            else:
+                result = await self.get_executor(entity_type).run(op_config.core_function, validated_params)
+        return validated_params, result
+    
+    async def execute_batch(self, items: List[Dict[str, Any]], concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Execute many operations concurrently and return their outcomes in order.
+
+        Each item is ``{"entity", "operation", "params"}``. At most
+        ``concurrency`` items (default ``FIREFLY_BATCH_CONCURRENCY``) run at a
+        time. A failing item yields ``{"error": ...}`` in its slot and never
+        aborts the rest of the batch.
+        """
+        limit = self._config.batch_concurrency
+        semaphore = asyncio.Semaphore(max(1, min(concurrency or limit, limit)))
+
+        async def _run(item: Dict[str, Any]) -> Dict[str, Any]:
+            if not isinstance(item, dict) or "entity" not in item or "operation" not in item:
+                return {"error": "Each batch item needs 'entity' and 'operation' keys"}
+            async with semaphore:
+                try:
+                    result = await self.execute_operation(item["entity"], item["operation"], item.get("params"))
+                except Exception as e:
+                    return {"entity": item["entity"], "operation": item["operation"], "error": str(e)}
+            return {"entity": item["entity"], "operation": item["operation"], "result": result}
+
+        return list(await asyncio.gather(*(_run(item) for item in items)))
+    
+    async def execute_pipeline(
+        self,
+        steps: List[Dict[str, Any]],
+        return_steps: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """Execute dependent steps server-side (see :mod:`firefly_mcp.tools.pipeline`)."""
+        return await execute_pipeline(self, steps, return_steps, self._config.batch_concurrency)
+    
     def list_operations(self, entity_type: Optional[EntityType] = None) -> List[Dict[str, Any]]:
         """List all operations, optionally filtered by entity type."""
         operations: List[Dict[str, Any]] = []
@@ -234,11 +398,17 @@ class Registry:
         return sorted(operations, key=lambda op: str(op.get("name", "")))
     
     def get_operation_schema(self, entity: str, operation: str) -> Dict[str, Any]:
-        """Get schema for a specific operation."""
+        """Get the precomputed schema for a specific operation.
+
+        The returned schema is shared and must not be mutated.
+        """
         entity_type = EntityType(entity)
         provider = self.get_provider(entity_type)
         op_config = provider.get_operation(operation)
-        return self._converter.to_json_schema(op_config.request_model)
+        schema = self._schemas.get(f"{entity_type.value}.{op_config.name}")
+        if schema is None:
+            schema = self._converter.to_json_schema(op_config.request_model)
+        return schema
     
     def get_stats(self) -> Dict[str, Any]:
         """Get registry statistics."""
@@ -247,19 +417,31 @@ class Registry:
             "providers": len(self._providers),
             "operations": total_operations,
             "entities": [entity.value for entity in self._providers.keys()],
+            "executors": {entity.value: executor.stats() for entity, executor in self._executors.items()},
+            "cache": reference_cache.stats(),
+            "http_cache": http_client_module.response_store.summary() if http_client_module.response_store else None,
+            "single_flight": dict(http_client_module.single_flight_stats),
             "config": {
                 "direct_mode": self._config.direct_mode,
+                "passthrough_reads": self._config.passthrough_reads,
+                "batch_concurrency": self._config.batch_concurrency,
                 "enabled_entities": [e.value for e in self._config.enabled_entities]
             }
         }
     
-    def _serialize_result(self, result: Any) -> Any:
-        """Convert result to serializable format."""
+    def _serialize_result(self, result: Any, fields: Optional[List[str]] = None, output_format: str = "json") -> Any:
+        """Convert result to serializable format.
+
+        Keeps only ``fields`` if given, then renders list results in
+        ``output_format`` (see :mod:`firefly_mcp.tools.formatting`).
+        """
         if isinstance(result, BaseModel):
-            return result.model_dump()
+            result = result.model_dump()
         elif hasattr(result, 'to_dict'):
-            return result.to_dict()
-        return result
+            result = result.to_dict()
+        if fields:
+            result = project(result, fields)
+        return format_result(result, output_format)
 
 
 def setup_firefly_tools(
@@ -291,6 +473,7 @@ def setup_firefly_tools(
             logger.error(f"Failed to register provider {provider.entity_type}: {e}")
     
     logger.info(f"Successfully registered {registered_count}/{len(providers)} providers")
+    registry.save_schema_cache()
     
     # Register tools based on mode
     if config.direct_mode:
@@ -310,7 +493,7 @@ def _register_consolidated_tools(mcp: FastMCP, registry: Registry) -> None:
     
     # 1. Main execution tool
     @mcp.tool(name="firefly_execute")
-    def execute_firefly_operation(
+    async def execute_firefly_operation(
         entity: str,
         operation: str, 
         params: Optional[Dict[str, Any]] = None
@@ -323,11 +506,52 @@ def _register_consolidated_tools(mcp: FastMCP, registry: Registry) -> None:
             params: Operation parameters as dictionary
         """
         try:
-            return registry.execute_operation(entity, operation, params)
+            return await registry.execute_operation(entity, operation, params)
         except Exception as e:
             logger.warning(f"Operation execution failed: {e}")
             return {"error": str(e)}
     
+    @mcp.tool(name="firefly_batch_execute")
+    async def batch_execute_firefly_operations(
+        operations: List[Dict[str, Any]],
+        concurrency: Annotated[Optional[int], Field(ge=1)] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute several Firefly III operations in one call.
+        
+        Operations run concurrently; results are returned in request order,
+        each as ``{"entity", "operation", "result"}`` or with an ``"error"``.
+        
+        Args:
+            operations: List of {"entity": ..., "operation": ..., "params": {...}} items
+            concurrency: Optional limit on parallel operations (capped by server config)
+        """
+        try:
+            return await registry.execute_batch(operations, concurrency)
+        except Exception as e:
+            logger.warning(f"Batch execution failed: {e}")
+            return [{"error": str(e)}]
+    
+    @mcp.tool(name="firefly_pipeline")
+    async def execute_firefly_pipeline(
+        steps: List[Dict[str, Any]],
+        return_steps: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """Execute a chain of Firefly III operations in one call.
+        
+        String params of the form ``$steps[N].path`` (e.g.
+        ``$steps[0].data[*].id``) are replaced by data from the result of an
+        earlier step N. Independent steps run concurrently.
+        
+        Args:
+            steps: List of {"entity": ..., "operation": ..., "params": {...}} items
+            return_steps: Indexes of steps whose full result is returned (default: last step)
+        """
+        try:
+            return await registry.execute_pipeline(steps, return_steps)
+        except Exception as e:
+            logger.warning(f"Pipeline execution failed: {e}")
+            return {"error": str(e)}
+    
     # 2. Discovery tools
     @mcp.tool(name="firefly_list_operations")
     def list_available_operations(entity: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -373,14 +597,13 @@ def _register_direct_mode_tools(mcp: FastMCP, registry: Registry) -> None:
                 # Create tool name
                 tool_name = f"{entity}_{operation}"
                 
-                # Get parameter schema
-                converter = registry.converter
-                parameters_schema = converter.to_json_schema(op_config.request_model)
+                # Get precomputed parameter schema
+                parameters_schema = copy.deepcopy(registry.get_operation_schema(entity, operation))
                 
                 # Create execution wrapper
                 def make_wrapper(entity_val: str, operation_val: str):
-                    def wrapper(**kwargs: Any) -> Any:
-                        return registry.execute_operation(entity_val, operation_val, kwargs if kwargs else None)
+                    async def wrapper(**kwargs: Any) -> Any:
+                        return await registry.execute_operation(entity_val, operation_val, kwargs if kwargs else None)
                     return wrapper
                 
                 # Register as function tool
@@ -408,12 +631,43 @@ def create_provider_from_config(entity_type: EntityType, operations_config: Dict
     return EntityProvider(entity_type, operations_config)
 
 # Utility functions
+def _schema_options(op_config: OperationConfig) -> Dict[str, Any]:
+    """Operation settings besides the request model that ``_build_schema`` depends on."""
+    return {
+        "fields": "read" in op_config.tags,
+        "output_format": "list" in op_config.tags,
+        "resolve_ids": dict(op_config.resolve_ids),
+    }
+
+
+def _accept_names(schema: Dict[str, Any], resolve_ids: Dict[str, str]) -> Dict[str, Any]:
+    """Return a copy of an operation schema noting which ID fields also take names."""
+    properties = dict(schema.get("properties", {}))
+    for name, entity in resolve_ids.items():
+        if name in properties:
+            description = properties[name].get("description", f"The ID of the {entity}")
+            properties[name] = {**properties[name], "description": f"{description}, or its exact name"}
+    return {**schema, "properties": properties}
+
+
+def _template_values(params: Any) -> Dict[str, Any]:
+    """Values available to invalidation path templates."""
+    if isinstance(params, BaseModel):
+        return params.model_dump(mode="json")
+    return dict(params) if isinstance(params, dict) else {}
+
+
 def _parse_bool_env(key: str, default: bool = False) -> bool:
     """Parse boolean from environment variable."""
     value = os.getenv(key, "").lower()
     return value in ("true", "1", "yes", "on") if value else default
 
 
+def _parse_int_env(key: str, default: int) -> int:
+    """Parse a positive integer from environment variable."""
+    return parse_int_env(key, default)
+
+
 @lru_cache(maxsize=1)
 def _parse_entity_set_env(key: str) -> Set[EntityType]:
     """Parse set of entities from environment variable."""
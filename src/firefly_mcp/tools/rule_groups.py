@@ -16,6 +16,7 @@ from firefly_mcp.models.requests import (
     RuleGroupListRulesRequest, RuleGroupTestRequest, RuleGroupTriggerRequest,
     RuleGroupDeleteRequest, RuleGroupDeleteResponse
 )
+from firefly_mcp.core.cache import TRANSACTION_DEPENDENT_PATHS
 from firefly_mcp.tools.registry import EntityType, create_provider_from_config
 
 logger = logging.getLogger(__name__)
@@ -44,7 +45,8 @@ RULE_GROUP_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": RuleGroupStore,
         "response_model": RuleGroupSingle,
         "core_function": create_rule_group,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        "invalidates": ["/v1/rule-groups"]
     },
     
     "update": {
@@ -52,7 +54,8 @@ RULE_GROUP_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": RuleGroupUpdateRequest,
         "response_model": RuleGroupSingle,
         "core_function": update_rule_group,
-        "tags": {"write", "update"}
+        "tags": {"write", "update"},
+        "invalidates": ["/v1/rule-groups", "/v1/rule-groups/{id}"]
     },
     
     "delete": {
@@ -60,7 +63,8 @@ RULE_GROUP_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": RuleGroupDeleteRequest,
         "response_model": RuleGroupDeleteResponse,
         "core_function": delete_rule_group,
-        "tags": {"write", "delete"}
+        "tags": {"write", "delete"},
+        "invalidates": ["/v1/rule-groups", "/v1/rule-groups/{id}", "/v1/rule-groups/{id}/*", "/v1/rules*", "/bills/*"]
     },
     
     "list_rules": {
@@ -84,7 +88,8 @@ RULE_GROUP_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": RuleGroupTriggerRequest,
         "response_model": RuleGroupDeleteResponse,
         "core_function": trigger_rule_group,
-        "tags": {"write", "trigger", "execute"}
+        "tags": {"write", "trigger", "execute"},
+        "invalidates": TRANSACTION_DEPENDENT_PATHS
     }
 }
 
@@ -15,6 +15,7 @@ from firefly_mcp.models.requests import (
     RuleGetRequest, RuleListRequest, RuleUpdateRequest,
     RuleTestRequest, RuleTriggerRequest, RuleDeleteRequest, RuleDeleteResponse
 )
+from firefly_mcp.core.cache import TRANSACTION_DEPENDENT_PATHS
 from firefly_mcp.tools.registry import EntityType, create_provider_from_config
 
 logger = logging.getLogger(__name__)
@@ -43,7 +44,8 @@ RULE_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": RuleStore,
         "response_model": RuleSingle,
         "core_function": create_rule,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        "invalidates": ["/v1/rules", "/v1/rule-groups/*", "/bills/*"]
     },
     
     "update": {
@@ -51,7 +53,8 @@ RULE_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": RuleUpdateRequest,
         "response_model": RuleSingle,
         "core_function": update_rule,
-        "tags": {"write", "update"}
+        "tags": {"write", "update"},
+        "invalidates": ["/v1/rules", "/v1/rules/{id}", "/v1/rule-groups/*", "/bills/*"]
     },
     
     "delete": {
@@ -59,7 +62,8 @@ RULE_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": RuleDeleteRequest,
         "response_model": RuleDeleteResponse,
         "core_function": delete_rule,
-        "tags": {"write", "delete"}
+        "tags": {"write", "delete"},
+        "invalidates": ["/v1/rules", "/v1/rules/{id}", "/v1/rule-groups/*", "/bills/*"]
     },
     
     "test": {
@@ -75,7 +79,8 @@ RULE_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": RuleTriggerRequest,
         "response_model": RuleDeleteResponse,
         "core_function": trigger_rule,
-        "tags": {"write", "trigger", "execute"}
+        "tags": {"write", "trigger", "execute"},
+        "invalidates": TRANSACTION_DEPENDENT_PATHS
     }
 }
 
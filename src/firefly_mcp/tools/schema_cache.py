@@ -0,0 +1,113 @@
+"""Precomputed JSON schemas for registry operations.
+
+Generating a JSON schema for the deep generated models (``TransactionStore``,
+``RuleStore``, ...) is measurable CPU work, so the registry builds each
+operation's schema once at registration and serves it from memory. With
+``FIREFLY_SCHEMA_CACHE_PATH`` set, the schemas are also written to a JSON file
+keyed by a hash of the model sources, so later server starts skip generation
+entirely until the models change.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import firefly_mcp.models as models_package
+from firefly_mcp.lib import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Sources whose content determines every generated request schema.
+_MODEL_SOURCES = ("model.py", "requests/*.py", "generated/*.py")
+
+# Bumped whenever the registry changes how schemas are built from models.
+SCHEMA_FORMAT = "5"
+
+
+def models_fingerprint() -> str:
+    """Hash of the model sources, used to detect a stale schema cache file."""
+    digest = hashlib.sha256(SCHEMA_FORMAT.encode())
+    models_dir = Path(models_package.__file__).parent
+    for pattern in _MODEL_SOURCES:
+        for source in sorted(models_dir.glob(pattern)):
+            digest.update(source.relative_to(models_dir).as_posix().encode())
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def model_name(model: Optional[type]) -> str:
+    """Stable identifier of a request model, stored next to its schema."""
+    if model is None:
+        return "None"
+    return f"{getattr(model, '__module__', '')}.{getattr(model, '__qualname__', repr(model))}"
+
+
+class SchemaCache:
+    """In-memory operation schema store with optional JSON file persistence."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.fingerprint = models_fingerprint() if path else ""
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._persisted: Dict[str, Dict[str, Any]] = self._load() if path else {}
+        self._dirty = False
+
+    def get_or_build(
+        self,
+        key: str,
+        model: Optional[type],
+        build: Callable[[], Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Return the schema for ``key``, building it only when not cached.
+
+        ``options`` are the JSON-serializable settings besides the model that
+        shape the schema; a cached entry is reused only if both match.
+        """
+        name = model_name(model)
+        options = options or {}
+        entry = self._persisted.get(key)
+        if entry is not None and entry.get("model") == name and entry.get("options", {}) == options:
+            schema = entry["schema"]
+        else:
+            schema = build()
+            self._persisted[key] = {"model": name, "options": options, "schema": schema}
+            self._dirty = True
+        self._schemas[key] = schema
+        return schema
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Precomputed schema for ``key``, if registered."""
+        return self._schemas.get(key)
+
+    def save(self) -> None:
+        """Write newly built schemas to the cache file, if one is configured."""
+        if not self.path or not self._dirty:
+            return
+        payload = {"fingerprint": self.fingerprint, "schemas": self._persisted}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False, suffix=".tmp") as handle:
+                handle.write(json_codec.dumps(payload))
+            os.replace(handle.name, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write schema cache {self.path}: {e}")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as handle:  # type: ignore[arg-type]
+                payload = json_codec.loads(handle.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable schema cache {self.path}: {e}")
+            return {}
+        if payload.get("fingerprint") != self.fingerprint:
+            logger.info("Schema cache is stale (models changed), rebuilding")
+            return {}
+        return payload.get("schemas") or {}
@@ -6,14 +6,15 @@ from typing import Dict, Any
 
 from firefly_mcp.core.tags import (
     get_tag, list_tags, create_tag, update_tag, delete_tag,
-    list_tag_transactions, list_tag_attachments
+    list_tag_transactions, list_tag_attachments, resolve_tags
 )
 from firefly_mcp.models.model import (
     TagArray, TagSingle, TagModelStore, TransactionArray, AttachmentArray
 )
 from firefly_mcp.models.requests import (
     TagGetRequest, TagListRequest, TagUpdateRequest,
-    TagTransactionsRequest, TagAttachmentsRequest, TagDeleteRequest, TagDeleteResponse
+    TagTransactionsRequest, TagAttachmentsRequest, TagDeleteRequest, TagDeleteResponse,
+    NameResolveRequest, NameResolveResponse
 )
 from firefly_mcp.tools.registry import EntityType, create_provider_from_config
 
@@ -35,6 +36,7 @@ TAG_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TagGetRequest,
         "response_model": TagSingle,
         "core_function": get_tag,
+        "resolve_ids": {"id": "tag"},
         "tags": {"read", "single"}
     },
     
@@ -43,7 +45,8 @@ TAG_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TagModelStore,
         "response_model": TagSingle,
         "core_function": create_tag,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        "invalidates": ["/tags"]
     },
     
     "update": {
@@ -51,7 +54,9 @@ TAG_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TagUpdateRequest,
         "response_model": TagSingle,
         "core_function": update_tag,
-        "tags": {"write", "update"}
+        "resolve_ids": {"id": "tag"},
+        "tags": {"write", "update"},
+        "invalidates": ["/tags", "/tags/{id}", "/tags/{id}/*", "/transactions*"]
     },
     
     "delete": {
@@ -59,7 +64,9 @@ TAG_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TagDeleteRequest,
         "response_model": TagDeleteResponse,
         "core_function": delete_tag,
-        "tags": {"write", "delete"}
+        "resolve_ids": {"id": "tag"},
+        "tags": {"write", "delete"},
+        "invalidates": ["/tags", "/tags/{id}", "/tags/{id}/*", "/transactions*"]
     },
     
     "list_transactions": {
@@ -67,6 +74,7 @@ TAG_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TagTransactionsRequest,
         "response_model": TransactionArray,
         "core_function": list_tag_transactions,
+        "resolve_ids": {"id": "tag"},
         "tags": {"read", "list", "transactions", "pagination"}
     },
     
@@ -75,7 +83,16 @@ TAG_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TagAttachmentsRequest,
         "response_model": AttachmentArray,
         "core_function": list_tag_attachments,
+        "resolve_ids": {"id": "tag"},
         "tags": {"read", "list", "attachments", "pagination"}
+    },
+    
+    "resolve": {
+        "description": "Find tags by name and get their IDs. Case and accents are ignored; near misses are ranked by similarity.",
+        "request_model": NameResolveRequest,
+        "response_model": NameResolveResponse,
+        "core_function": resolve_tags,
+        "tags": {"read", "resolve"}
     }
 }
 
@@ -7,7 +7,8 @@ from typing import Dict, Any
 from firefly_mcp.core.transactions import (
     get_transaction, list_transactions, create_transaction, update_transaction, delete_transaction,
     list_transaction_attachments, list_transaction_piggy_bank_events,
-    bulk_categorize_transactions, bulk_tag_transactions
+    bulk_categorize_transactions, bulk_tag_transactions, sync_local_transactions,
+    aggregate_transactions, search_local_transactions
 )
 from firefly_mcp.models.model import (
     TransactionArray, TransactionSingle, TransactionStore, AttachmentArray, PiggyBankEventArray
@@ -16,8 +17,11 @@ from firefly_mcp.models.requests import (
     TransactionGetRequest, TransactionListRequest, TransactionUpdateRequest,
     TransactionAttachmentsRequest, TransactionPiggyBankEventsRequest,
     TransactionDeleteRequest, TransactionDeleteResponse,
-    BulkCategorizeRequest, BulkTagRequest
+    BulkCategorizeRequest, BulkTagRequest, LocalSyncRequest, LocalSyncResponse,
+    TransactionAggregateRequest, TransactionAggregateResponse,
+    TransactionSearchLocalRequest, TransactionSearchLocalResponse
 )
+from firefly_mcp.core.cache import TRANSACTION_DEPENDENT_PATHS
 from firefly_mcp.tools.registry import EntityType, create_provider_from_config
 
 logger = logging.getLogger(__name__)
@@ -46,7 +50,8 @@ TRANSACTION_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TransactionStore,
         "response_model": TransactionSingle,
         "core_function": create_transaction,
-        "tags": {"write", "create"}
+        "tags": {"write", "create"},
+        "invalidates": TRANSACTION_DEPENDENT_PATHS
     },
     
     "update": {
@@ -54,7 +59,8 @@ TRANSACTION_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TransactionUpdateRequest,
         "response_model": TransactionSingle,
         "core_function": update_transaction,
-        "tags": {"write", "update"}
+        "tags": {"write", "update"},
+        "invalidates": TRANSACTION_DEPENDENT_PATHS
     },
     
     "delete": {
@@ -62,7 +68,8 @@ TRANSACTION_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": TransactionDeleteRequest,
         "response_model": TransactionDeleteResponse,
         "core_function": delete_transaction,
-        "tags": {"write", "delete"}
+        "tags": {"write", "delete"},
+        "invalidates": TRANSACTION_DEPENDENT_PATHS
     },
     
     "list_attachments": {
@@ -86,7 +93,8 @@ TRANSACTION_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BulkCategorizeRequest,
         "response_model": TransactionDeleteResponse,
         "core_function": bulk_categorize_transactions,
-        "tags": {"write", "bulk", "categorize"}
+        "tags": {"write", "bulk", "categorize"},
+        "invalidates": TRANSACTION_DEPENDENT_PATHS
     },
     
     "bulk_tag": {
@@ -94,7 +102,37 @@ TRANSACTION_OPERATIONS: Dict[str, Dict[str, Any]] = {
         "request_model": BulkTagRequest,
         "response_model": TransactionDeleteResponse,
         "core_function": bulk_tag_transactions,
-        "tags": {"write", "bulk", "tag"}
+        "tags": {"write", "bulk", "tag"},
+        "invalidates": TRANSACTION_DEPENDENT_PATHS
+    },
+    
+    "sync_local": {
+        "description": "Sync the local mirror of transactions, accounts, categories, budgets and tags. "
+                       "The first call fetches all history (or from 'start'), later calls only recent changes. "
+                       "Recent changes are selected by transaction date, so edits or deletions of older "
+                       "transactions are only picked up by a full sync (automatic every few days, or 'full': true).",
+        "request_model": LocalSyncRequest,
+        "response_model": LocalSyncResponse,
+        "core_function": sync_local_transactions,
+        "tags": {"local", "sync"}
+    },
+    
+    "aggregate": {
+        "description": "Sum spending/earnings by category, budget, tag, account or counterparty per day/week/month/quarter/year. "
+                       "Computed locally from the synced mirror; use instead of listing and summing transactions.",
+        "request_model": TransactionAggregateRequest,
+        "response_model": TransactionAggregateResponse,
+        "core_function": aggregate_transactions,
+        "tags": {"local", "list", "aggregate"}
+    },
+    
+    "search_local": {
+        "description": "Search transactions by words in their description, notes, external ID or counterparty "
+                       "(e.g. 'netflix'), ranked by relevance. Runs locally on the synced mirror.",
+        "request_model": TransactionSearchLocalRequest,
+        "response_model": TransactionSearchLocalResponse,
+        "core_function": search_local_transactions,
+        "tags": {"local", "list", "search"}
     }
 }
 
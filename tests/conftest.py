@@ -1,14 +1,27 @@
 """Common test fixtures and utilities for Firefly MCP tests."""
 
+import json
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 from typing import Dict, Any, Optional
 import httpx
 
+from firefly_mcp.core.cache import reference_cache
+from firefly_mcp.core.resolver import clear_name_indexes
 from firefly_mcp.main import get_mcp_server
 from firefly_mcp.models.model import AccountTypeFilter
 from firefly_mcp.models.requests import AccountGetRequest, AccountListRequest
 
+@pytest.fixture(autouse=True)
+def clear_reference_cache():
+    """Start every test with an empty reference-data cache and no name indexes."""
+    reference_cache.clear()
+    clear_name_indexes()
+    yield
+    reference_cache.clear()
+    clear_name_indexes()
+
+
 @pytest.fixture
 def mcp_server():
     return get_mcp_server()
@@ -21,6 +34,7 @@ def mock_http_response():
         response = Mock(spec=httpx.Response)
         response.status_code = status_code
         response.json.return_value = json_data or {}
+        response.content = json.dumps(json_data or {}).encode()
         response.text = str(json_data or {})
         response.is_error = status_code >= 400
         return response
@@ -130,7 +144,7 @@ def sample_account_list_request():
 @pytest.fixture 
 def mock_client(monkeypatch: pytest.MonkeyPatch):
     """Mock the HTTP client."""
-    mock = MagicMock()
+    mock = AsyncMock()
     monkeypatch.setattr("firefly_mcp.core.accounts.client", mock)
     return mock
 
@@ -171,18 +185,27 @@ def mock_http_client():
     from unittest.mock import patch, Mock
     import httpx
     
-    with patch("firefly_mcp.core.accounts.client") as mock_client:
-        # Configure the mock client to return proper httpx.Response objects
-        def create_mock_response(json_data: Optional[Dict[str, Any]] = None, status_code: int = 200, is_error: bool = False):
-            mock_response = Mock(spec=httpx.Response)
-            mock_response.json.return_value = json_data or {}
-            mock_response.status_code = status_code
-            mock_response.is_error = is_error
-            mock_response.text = str(json_data or "")
-            return mock_response
-        
+    # Configure the mock client to return proper httpx.Response objects
+    def create_mock_response(json_data: Optional[Dict[str, Any]] = None, status_code: int = 200, is_error: bool = False):
+        mock_response = Mock(spec=httpx.Response)
+        mock_response.json.return_value = json_data or {}
+        mock_response.content = json.dumps(json_data or {}).encode()
+        mock_response.status_code = status_code
+        mock_response.is_error = is_error
+        mock_response.text = str(json_data or "")
+        return mock_response
+
+    # Account IDs are checked against the name index, served separately so the
+    # tests see only the calls made by the operation itself
+    index = {"data": [{"id": "1", "attributes": {"name": "Test Checking Account", "type": "asset"}}],
+             "meta": {"pagination": {"total_pages": 1}}}
+    with patch("firefly_mcp.core.accounts.client", new_callable=AsyncMock) as mock_client, \
+            patch("firefly_mcp.core.resolver.client", new_callable=AsyncMock) as index_client:
+        index_client.get.return_value = create_mock_response(index)
         # Add helper method to mock client
         mock_client.create_response = create_mock_response
+        for method in ("get", "post", "put", "delete"):
+            getattr(mock_client, method).return_value = create_mock_response()
         yield mock_client
 
 
@@ -532,4 +532,33 @@ class TestAccountEdgeCases:
                     await client.call_tool("account_list", invalid_params)
             except Exception as e:
                 # Expect some kind of validation error
-                assert "validation" in str(e).lower() or "error" in str(e).lower()
\ No newline at end of file
+                assert "validation" in str(e).lower() or "error" in str(e).lower()
+
+class TestAccountCachingE2E:
+    """End-to-end tests for the reference-data cache on account reads."""
+
+    async def test_repeated_list_hits_cache(self, mcp_server_direct_mode: Any, mock_http_client: Any,
+                                            sample_account_array_data: Any) -> None:
+        """Listing the same accounts twice only calls Firefly once."""
+        mock_response = mock_http_client.create_response(json_data=sample_account_array_data, is_error=False)
+        mock_http_client.get.return_value = mock_response
+
+        async with Client(mcp_server_direct_mode) as client:
+            first = await client.call_tool("account_list", {"type": "asset"})
+            second = await client.call_tool("account_list", {"type": "asset"})
+
+            assert first.content[0].text == second.content[0].text
+            mock_http_client.get.assert_called_once_with("/accounts", params={"type": "asset"})
+
+    async def test_update_invalidates_cached_reads(self, mcp_server_direct_mode: Any, mock_http_client: Any,
+                                                   sample_account_array_data: Any, sample_account_data: Any) -> None:
+        """Updating an account drops the cached account list."""
+        mock_http_client.get.return_value = mock_http_client.create_response(json_data=sample_account_array_data)
+        mock_http_client.put.return_value = mock_http_client.create_response(json_data=sample_account_data)
+
+        async with Client(mcp_server_direct_mode) as client:
+            await client.call_tool("account_list", {"type": "asset"})
+            await client.call_tool("account_update", {"id": "1", "account_update": {"name": "Renamed"}})
+            await client.call_tool("account_list", {"type": "asset"})
+
+            assert mock_http_client.get.call_count == 2
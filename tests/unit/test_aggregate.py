@@ -0,0 +1,135 @@
+"""Unit tests for aggregation over the local transaction mirror."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from firefly_mcp.core import transactions as core_transactions
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.local.aggregate import aggregate
+from firefly_mcp.local.store import LocalStore
+from firefly_mcp.models.requests import TransactionAggregateRequest
+from firefly_mcp.tools.registry import EntityType, Registry, RegistryConfig, create_provider_from_config
+from firefly_mcp.tools.transactions import TRANSACTION_OPERATIONS
+
+
+def _split(journal_id: str, day: str, amount: str, category: str | None, type: str = "withdrawal",
+           tags: List[str] = (), currency: str = "EUR") -> Dict[str, Any]:
+    return {
+        "transaction_journal_id": journal_id, "type": type, "date": f"{day}T09:30:00+01:00", "amount": amount,
+        "currency_code": currency, "currency_decimal_places": 2, "category_name": category,
+        "source_name": "Employer" if type == "deposit" else "Checking",
+        "destination_name": "Checking" if type == "deposit" else "Shop", "tags": list(tags),
+    }
+
+
+@pytest.fixture
+def store() -> LocalStore:
+    store = LocalStore()
+    splits = [
+        _split("1", "2024-01-03", "10.10", "Groceries", tags=["food"]),
+        _split("2", "2024-01-17", "20.20", "Groceries", tags=["food", "weekly"]),
+        _split("3", "2024-01-20", "5.00", "Dining"),
+        _split("4", "2024-02-01", "0.10", "Groceries"),
+        _split("5", "2024-02-02", "0.20", "Groceries"),
+        _split("6", "2024-02-25", "1000.00", "Salary", type="deposit"),
+        _split("7", "2024-02-26", "7.00", "Groceries", currency="USD"),
+    ]
+    store.upsert_groups([
+        {"id": split["transaction_journal_id"], "attributes": {"updated_at": "x", "transactions": [split]}}
+        for split in splits
+    ])
+    return store
+
+
+class TestAggregate:
+    """Tests for the aggregate query builder."""
+
+    def test_category_by_month(self, store: LocalStore) -> None:
+        """Spending is summed exactly per month and category, largest first."""
+        result = aggregate(store, group_by=["category"], period="month")
+
+        assert result["data"] == [
+            {"period": "2024-01", "category": "Groceries", "currency_code": "EUR", "total": "30.30", "count": 2},
+            {"period": "2024-01", "category": "Dining", "currency_code": "EUR", "total": "5.00", "count": 1},
+            {"period": "2024-02", "category": "Groceries", "currency_code": "USD", "total": "7.00", "count": 1},
+            {"period": "2024-02", "category": "Groceries", "currency_code": "EUR", "total": "0.30", "count": 2},
+        ]
+        assert result["meta"]["totals"] == [
+            {"currency_code": "EUR", "total": "35.60", "count": 5},
+            {"currency_code": "USD", "total": "7.00", "count": 1},
+        ]
+
+    def test_tags_do_not_double_count_totals(self, store: LocalStore) -> None:
+        """Tag groups include untagged splits under null, totals count every split once."""
+        result = aggregate(store, group_by=["tag"], filters={"category": "groceries"}, start="2024-01-01", end="2024-01-31")
+
+        assert {row["tag"]: row["total"] for row in result["data"]} == {"food": "30.30", "weekly": "20.20"}
+        assert result["meta"]["totals"] == [{"currency_code": "EUR", "total": "30.30", "count": 2}]
+
+    def test_net_and_week(self, store: LocalStore) -> None:
+        """Net flow signs withdrawals negative; weeks are labelled by their Monday."""
+        result = aggregate(store, group_by=[], period="week", type="net", start="2024-02-01", filters={"tag": None})
+
+        assert [(row["period"], row["currency_code"], row["total"]) for row in result["data"]] == [
+            ("2024-01-29", "EUR", "-0.30"),
+            ("2024-02-19", "EUR", "1000.00"),
+            ("2024-02-26", "USD", "-7.00"),
+        ]
+
+    def test_limit_per_period(self, store: LocalStore) -> None:
+        """``limit`` keeps the largest groups of each period."""
+        result = aggregate(store, group_by=["category"], period="year", limit=1)
+
+        assert [(row["category"], row["total"]) for row in result["data"]] == [("Groceries", "30.60")]
+
+    def test_renamed_category_keeps_one_total(self) -> None:
+        """Splits synced before and after a rename are grouped on the category ID under its current name."""
+        store = LocalStore()
+        splits = [
+            {**_split("1", "2024-01-03", "10.00", "Groceries"), "category_id": "3"},
+            {**_split("2", "2024-01-20", "5.00", "Food"), "category_id": "3"},
+        ]
+        store.upsert_groups([
+            {"id": split["transaction_journal_id"], "attributes": {"updated_at": "x", "transactions": [split]}}
+            for split in splits
+        ])
+        store.replace_entities("category", [{"id": "3", "attributes": {"name": "Food"}}])
+
+        result = aggregate(store, group_by=["category"])
+        filtered = aggregate(store, group_by=[], filters={"category": "food"})
+
+        assert result["data"] == [{"category": "Food", "currency_code": "EUR", "total": "15.00", "count": 2}]
+        assert filtered["meta"]["totals"] == [{"currency_code": "EUR", "total": "15.00", "count": 2}]
+
+    def test_invalid_dimension(self, store: LocalStore) -> None:
+        """Unknown dimensions are rejected before querying."""
+        with pytest.raises(ValidationError):
+            aggregate(store, group_by=["payee"])
+
+
+class TestAggregateOperation:
+    """Tests for the ``transaction.aggregate`` operation."""
+
+    async def test_csv_output(self, store: LocalStore, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The operation reads the synced mirror and supports compact output formats."""
+        store.set_state("transactions", {"synced_on": "2024-03-01", "synced_at": "2024-03-01T00:00:00+00:00", "start": None})
+        monkeypatch.setattr(core_transactions, "get_local_store", lambda: store)
+        monkeypatch.setattr("firefly_mcp.local.sync.MAX_AGE_SECONDS", float("inf"))
+        registry = Registry(RegistryConfig(enabled_entities={EntityType.TRANSACTION}))
+        registry.register_provider(create_provider_from_config(
+            EntityType.TRANSACTION, {"aggregate": TRANSACTION_OPERATIONS["aggregate"]}
+        ))
+
+        result = await registry.execute_operation(
+            "transaction", "aggregate", {"group_by": ["category"], "end": "2024-01-31", "output_format": "csv"}
+        )
+
+        assert result["csv"].splitlines() == [
+            "category,currency_code,total,count", "Groceries,EUR,30.30,2", "Dining,EUR,5.00,1",
+        ]
+        assert result["meta"]["synced_at"] == "2024-03-01T00:00:00+00:00"
+
+    def test_default_groups_by_category(self) -> None:
+        """Requests group by category unless told otherwise."""
+        assert TransactionAggregateRequest().group_by == ["category"]
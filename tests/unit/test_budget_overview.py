@@ -0,0 +1,111 @@
+"""Unit tests for the budget overview."""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from firefly_mcp.core import budgets as core_budgets
+from firefly_mcp.models.requests import BudgetOverviewRequest
+from firefly_mcp.tools.budgets import BUDGET_OPERATIONS
+from firefly_mcp.tools.registry import EntityType, Registry, RegistryConfig, create_provider_from_config
+
+
+def _limit(amount: str, currency: str = "EUR", spent: str | None = None) -> Dict[str, Any]:
+    return {"attributes": {"amount": amount, "currency_code": currency, "currency_decimal_places": 2, "spent": spent}}
+
+
+def _spent(total: str, currency: str = "EUR") -> Dict[str, Any]:
+    return {"sum": total, "currency_code": currency, "currency_decimal_places": 2}
+
+
+BUDGETS = [
+    {"id": "1", "attributes": {"name": "Groceries", "active": True, "spent": [_spent("-250.50")]}},
+    {"id": "2", "attributes": {"name": "Travel", "active": True, "spent": [_spent("-80.00"), _spent("-20", "USD")]}},
+    {"id": "3", "attributes": {"name": "Hobbies", "active": True, "spent": []}},
+    {"id": "4", "attributes": {"name": "Old", "active": False, "spent": []}},
+    {"id": "5", "attributes": {"name": "Legacy", "active": True}},
+]
+
+LIMITS = {
+    "1": [_limit("200.00"), _limit("100.00")],
+    "2": [_limit("500.00")],
+    "3": [],
+    "4": [_limit("10.00")],
+    "5": [_limit("50.00", spent="-12.25")],
+}
+
+
+@pytest.fixture
+def api(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Client mock serving budgets and their limits, recording peak concurrency."""
+    state = {"active": 0, "peak": 0}
+
+    async def _get(path: str, params: Dict[str, Any]) -> Mock:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0)
+        state["active"] -= 1
+        if path == "/budgets":
+            data: List[Any] = BUDGETS
+        else:
+            data = LIMITS[path.split("/")[2]]
+        response = Mock(spec=httpx.Response)
+        response.is_error = False
+        response.content = json.dumps({"data": data, "meta": {"pagination": {"total_pages": 1}}}).encode()
+        return response
+
+    client = AsyncMock()
+    client.get.side_effect = _get
+    client.state = state
+    monkeypatch.setattr(core_budgets, "client", client)
+    return client
+
+
+async def test_overview_merges_limits_and_spending(api: AsyncMock) -> None:
+    """Limits are summed, spending is positive and each currency gets its own row."""
+    response = await core_budgets.budget_overview(BudgetOverviewRequest(start="2024-03-01", end="2024-03-31"))
+
+    assert [(row["budget"], row["currency_code"], row["limit"], row["spent"], row["remaining"], row["percent_spent"])
+            for row in response.data] == [
+        ("Groceries", "EUR", "300.00", "250.50", "49.50", 83.5),
+        ("Travel", "EUR", "500.00", "80.00", "420.00", 16.0),
+        ("Travel", "USD", None, "20.00", None, None),
+        ("Hobbies", None, None, None, None, None),
+        ("Legacy", "EUR", "50.00", "12.25", "37.75", 24.5),
+    ]
+    assert response.meta["totals"] == [
+        {"currency_code": "EUR", "limit": "850.00", "spent": "342.75"},
+        {"currency_code": "USD", "limit": None, "spent": "20.00"},
+    ]
+    assert response.meta["budgets"] == 4
+    assert {call.kwargs["params"]["start"] for call in api.get.call_args_list} == {"2024-03-01"}
+
+
+async def test_limits_are_fetched_concurrently_within_bound(api: AsyncMock, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Limit requests overlap but never exceed OVERVIEW_CONCURRENCY."""
+    monkeypatch.setattr(core_budgets, "OVERVIEW_CONCURRENCY", 2)
+
+    await core_budgets.budget_overview(BudgetOverviewRequest(start="2024-03-01", end="2024-03-31", include_inactive=True))
+
+    assert api.get.call_count == 6
+    assert api.state["peak"] == 2
+
+
+async def test_overview_operation_defaults_to_current_month(api: AsyncMock) -> None:
+    """Without dates the current month is used; the table can be returned as CSV."""
+    registry = Registry(RegistryConfig(enabled_entities={EntityType.BUDGET}))
+    registry.register_provider(create_provider_from_config(EntityType.BUDGET, {"overview": BUDGET_OPERATIONS["overview"]}))
+
+    result = await registry.execute_operation("budget", "overview", {"output_format": "csv"})
+
+    assert result["csv"].splitlines()[:2] == [
+        "budget_id,budget,currency_code,limit,spent,remaining,percent_spent",
+        "1,Groceries,EUR,300.00,250.50,49.50,83.5",
+    ]
+    start, end = core_budgets._overview_range(None, None)
+    assert result["meta"]["start"] == start and start.endswith("-01")
+    assert end > start
@@ -0,0 +1,188 @@
+"""Unit tests for the reference-data cache."""
+
+import json
+from typing import Any, Dict
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from firefly_mcp.core.cache import ReferenceCache, cached_get_json, make_key, reference_cache
+
+
+@pytest.fixture
+def json_client():
+    """Client mock returning a fresh payload per call."""
+    def _get(path: str, params: Dict[str, Any]) -> Mock:
+        response = Mock(spec=httpx.Response)
+        response.is_error = False
+        response.content = json.dumps({"data": [], "path": path}).encode()
+        return response
+
+    client = AsyncMock()
+    client.get.side_effect = _get
+    return client
+
+
+class TestReferenceCache:
+    """Tests for ReferenceCache."""
+
+    def test_key_normalizes_params(self) -> None:
+        """Parameter order, None values and sequence types do not matter."""
+        assert make_key("/accounts", {"type": "asset", "page": 1, "date": None}) == \
+            make_key("/accounts", {"page": "1", "type": "asset"})
+        assert make_key("/rules", {"accounts": [1, 2]}) == make_key("/rules", {"accounts": (1, 2)})
+
+    def test_ttl_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entries expire after the entity TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("firefly_mcp.core.cache.time.monotonic", lambda: now[0])
+        cache = ReferenceCache(ttls={"account": 10})
+
+        cache.set("account", "/accounts", {}, {"data": []})
+        assert cache.get("account", "/accounts", {}) == {"data": []}
+
+        now[0] += 11
+        assert cache.get("account", "/accounts", {}) != {"data": []}
+        assert cache.stats()["entities"]["account"] == {"hits": 1, "misses": 1, "evictions": 0, "expirations": 1}
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted when the cache is full."""
+        cache = ReferenceCache(max_entries=2, ttls={"tag": 60})
+        cache.set("tag", "/tags/1", {}, 1)
+        cache.set("tag", "/tags/2", {}, 2)
+        cache.get("tag", "/tags/1", {})
+        cache.set("tag", "/tags/3", {}, 3)
+
+        assert cache.get("tag", "/tags/1", {}) == 1
+        assert cache.get("tag", "/tags/3", {}) == 3
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["entities"]["tag"]["evictions"] == 1
+
+    def test_zero_ttl_disables_entity(self) -> None:
+        """Entities with a TTL of zero are never stored."""
+        cache = ReferenceCache(ttls={"bill": 0})
+        cache.set("bill", "/bills", {}, {"data": []})
+        assert cache.stats()["entries"] == 0
+
+    def test_environment_overrides_and_bad_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Per-entity TTLs override the global one; malformed values fall back."""
+        monkeypatch.setenv("FIREFLY_CACHE_TTL", "60")
+        monkeypatch.setenv("FIREFLY_CACHE_TTL_TAG", "0")
+        monkeypatch.setenv("FIREFLY_CACHE_TTL_BILL", "soon")
+        monkeypatch.setenv("FIREFLY_CACHE_MAX_ENTRIES", "lots")
+
+        cache = ReferenceCache.from_environment()
+
+        assert cache.ttls["account"] == 60.0
+        assert cache.ttls["tag"] == 0.0
+        assert cache.ttls["bill"] == 60.0
+        assert cache.max_entries == 512
+
+
+class TestCachedGetJson:
+    """Tests for cached_get_json."""
+
+    async def test_second_identical_request_is_served_from_cache(self, json_client: AsyncMock) -> None:
+        first = await cached_get_json(json_client, "account", "/accounts", {"type": "asset"})
+        second = await cached_get_json(json_client, "account", "/accounts", {"type": "asset"})
+
+        assert first is second
+        json_client.get.assert_called_once_with("/accounts", params={"type": "asset"})
+        assert reference_cache.stats()["entities"]["account"]["hits"] == 1
+
+    async def test_different_params_are_cached_separately(self, json_client: AsyncMock) -> None:
+        await cached_get_json(json_client, "account", "/accounts", {"type": "asset"})
+        await cached_get_json(json_client, "account", "/accounts", {"type": "expense"})
+
+        assert json_client.get.call_count == 2
+
+
+class TestInvalidation:
+    """Tests for write-through invalidation."""
+
+    def test_exact_and_prefix_patterns(self) -> None:
+        """Plain patterns match one path; a trailing * matches a prefix."""
+        cache = ReferenceCache(ttls={"budget": 60})
+        cache.set("budget", "/budgets", {"page": 1}, "list-1")
+        cache.set("budget", "/budgets", {"page": 2}, "list-2")
+        cache.set("budget", "/budgets/3", {}, "budget-3")
+        cache.set("budget", "/budgets/3/limits", {}, "limits-3")
+        cache.set("budget", "/budgets/4/limits", {}, "limits-4")
+
+        assert cache.invalidate("/budgets") == 2
+        assert cache.invalidate("/budgets/3*") == 2
+        assert cache.get("budget", "/budgets/4/limits", {}) == "limits-4"
+
+    def test_templates_are_filled_from_params(self) -> None:
+        """Placeholders are filled; missing ones widen to a prefix pattern."""
+        from firefly_mcp.core.cache import format_invalidation
+
+        assert format_invalidation("/budgets/{budget_id}/limits", {"budget_id": "7"}) == "/budgets/7/limits"
+        assert format_invalidation("/budgets/{budget_id}/limits", {}) == "/budgets/*"
+
+    async def test_fetch_racing_an_invalidation_is_not_stored(self, json_client: AsyncMock) -> None:
+        """A payload fetched before a write completed is not cached."""
+        from firefly_mcp.core.cache import invalidate_paths
+
+        original_get = json_client.get.side_effect
+
+        def _get_then_write(path: str, params: Dict[str, Any]) -> Mock:
+            invalidate_paths(["/accounts"])
+            return original_get(path, params)
+
+        json_client.get.side_effect = _get_then_write
+        await cached_get_json(json_client, "account", "/accounts", {})
+
+        assert reference_cache.stats()["entries"] == 0
+
+    async def test_registry_invalidates_declared_paths(self) -> None:
+        """Writes invalidate the paths declared in the operation config."""
+        from firefly_mcp.tools.registry import EntityType, Registry, RegistryConfig, create_provider_from_config
+        from firefly_mcp.models.requests import BudgetLimitDeleteRequest
+
+        async def delete_limit(_: Any) -> Dict[str, Any]:
+            return {"message": "deleted"}
+
+        registry = Registry(RegistryConfig(enabled_entities={EntityType.BUDGET}))
+        registry.register_provider(create_provider_from_config(EntityType.BUDGET, {
+            "delete_limit": {
+                "description": "Delete limit",
+                "request_model": BudgetLimitDeleteRequest,
+                "response_model": None,
+                "core_function": delete_limit,
+                "invalidates": ["/budgets/{budget_id}/limits", "/budgets/{budget_id}/limits/{limit_id}"],
+            }
+        }))
+        reference_cache.set("budget", "/budgets/1/limits", {}, "limits-1")
+        reference_cache.set("budget", "/budgets/1/limits/9", {}, "limit-9")
+        reference_cache.set("budget", "/budgets/2/limits", {}, "limits-2")
+
+        await registry.execute_operation("budget", "delete_limit", {"budget_id": "1", "limit_id": "9"})
+
+        assert reference_cache.stats()["entries"] == 1
+        assert reference_cache.get("budget", "/budgets/2/limits", {}) == "limits-2"
+
+    async def test_account_create_invalidates_transactions(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Creating an account drops account and transaction reads, since it may book an opening balance."""
+        from firefly_mcp.tools.accounts import ACCOUNT_OPERATIONS
+        from firefly_mcp.tools.registry import EntityType, Registry, RegistryConfig, create_provider_from_config
+
+        async def create_account(_: Any) -> Dict[str, Any]:
+            return {"data": {"id": "3"}}
+
+        invalidated = []
+        monkeypatch.setattr("firefly_mcp.core.cache._invalidation_listeners", [invalidated.append])
+        registry = Registry(RegistryConfig(enabled_entities={EntityType.ACCOUNT}))
+        registry.register_provider(create_provider_from_config(EntityType.ACCOUNT, {
+            "create": {**ACCOUNT_OPERATIONS["create"], "response_model": None, "core_function": create_account}
+        }))
+        reference_cache.set("account", "/accounts", {}, "accounts")
+        reference_cache.set("account", "/accounts/1/transactions", {}, "account-1-transactions")
+
+        await registry.execute_operation(
+            "account", "create", {"name": "Savings", "type": "asset", "opening_balance": "100", "opening_balance_date": "2024-01-01"}
+        )
+
+        assert reference_cache.stats()["entries"] == 0
+        assert "/transactions*" in invalidated
@@ -0,0 +1,138 @@
+"""Unit tests for the columnar transaction container."""
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from firefly_mcp.core import transactions as core_transactions
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.local.aggregate import aggregate
+from firefly_mcp.local.columns import TransactionColumns
+from firefly_mcp.local.store import LocalStore
+from firefly_mcp.models.requests import TransactionListRequest
+
+
+def _split(journal_id: int, day: str, amount: str, category: str, type: str = "withdrawal",
+           tags: List[str] = ()) -> Dict[str, Any]:
+    deposit = type == "deposit"
+    return {
+        "transaction_journal_id": str(journal_id), "type": type, "date": f"{day}T09:30:00+01:00", "amount": amount,
+        "currency_code": "EUR", "currency_decimal_places": 2, "description": f"Purchase {journal_id}",
+        "category_id": str(len(category)), "category_name": category,
+        "source_id": "9" if deposit else "1", "source_name": "Employer" if deposit else "Checking",
+        "destination_id": "1" if deposit else "5", "destination_name": "Checking" if deposit else "Shop",
+        "tags": list(tags),
+    }
+
+
+def _page(splits: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "data": [
+            {"type": "transactions", "id": split["transaction_journal_id"],
+             "attributes": {"updated_at": "x", "transactions": [split]}}
+            for split in splits
+        ],
+        "meta": {"pagination": {"total": len(splits), "total_pages": 1}},
+    }
+
+
+SPLITS = [
+    _split(1, "2024-01-03", "10.10", "Groceries", tags=["food"]),
+    _split(2, "2024-01-17", "20.20", "Groceries", tags=["food", "weekly"]),
+    _split(3, "2024-01-20", "5.00", "Dining"),
+    _split(4, "2024-02-01", "0.30", "Groceries"),
+    _split(5, "2024-02-25", "1000.00", "Salary", type="deposit"),
+]
+
+
+@pytest.fixture
+def columns() -> TransactionColumns:
+    return TransactionColumns.from_pages([_page(SPLITS[:3]), _page(SPLITS[3:])])
+
+
+class TestTransactionColumns:
+    """Tests for building, filtering and grouping columns."""
+
+    def test_row_round_trip(self, columns: TransactionColumns) -> None:
+        """Rows decode back to the original values."""
+        assert len(columns) == 5
+        assert columns.row(1) == {
+            "group_id": 2, "journal_id": 2, "date": "2024-01-17", "amount": "20.20",
+            "source_id": 1, "destination_id": 5, "category_id": 9, "budget_id": -1,
+            "type": "withdrawal", "currency_code": "EUR", "description": "Purchase 2",
+            "source_name": "Checking", "destination_name": "Shop", "category_name": "Groceries", "budget_name": None,
+            "tags": ["food", "weekly"],
+        }
+
+    def test_filter(self, columns: TransactionColumns) -> None:
+        """Filters combine and compare names case-insensitively."""
+        selected = columns.filter(start="2024-01-10", type="withdrawal", category="groceries")
+        assert [selected.row(index)["journal_id"] for index in range(len(selected))] == [2, 4]
+        assert len(columns.filter(tag="FOOD")) == 2
+        assert len(columns.filter(account="checking")) == 5
+        assert len(columns.filter(end="2024-01-03")) == 1
+
+    def test_group_sum_matches_sql_aggregate(self, columns: TransactionColumns) -> None:
+        """Grouping in memory gives the same rows as the SQLite aggregation."""
+        store = LocalStore()
+        store.upsert_groups(_page(SPLITS)["data"])
+
+        for by, period in (("category", "month"), ("tag", None), ("account", "week"), ("counterparty", "year")):
+            expected = aggregate(store, group_by=[by], period=period)["data"]
+            assert columns.filter(type="withdrawal").group_sum(by, period) == expected
+
+    def test_group_sum_without_key(self, columns: TransactionColumns) -> None:
+        """Grouping by period only sums every split of the period."""
+        assert columns.group_sum(None, "quarter") == [
+            {"period": "2024-Q1", "currency_code": "EUR", "total": "1035.60", "count": 5},
+        ]
+
+    def test_invalid_group(self, columns: TransactionColumns) -> None:
+        """Unknown keys and periods are rejected."""
+        with pytest.raises(ValidationError):
+            columns.group_sum("payee")
+        with pytest.raises(ValidationError):
+            columns.group_sum("category", "decade")
+
+    def test_zero_decimal_currency(self) -> None:
+        """Currencies without minor units keep zero decimal places."""
+        split = {**_split(1, "2024-01-05", "1500", "Groceries"), "currency_code": "JPY", "currency_decimal_places": 0}
+        columns = TransactionColumns.from_pages([_page([split])])
+
+        assert columns.row(0)["amount"] == "1500"
+        assert columns.group_sum("category") == [
+            {"category": "Groceries", "currency_code": "JPY", "total": "1500", "count": 1},
+        ]
+
+    def test_compact_per_split(self) -> None:
+        """Repeated strings are interned, keeping each split under 100 bytes."""
+        page = _page([_split(index, "2024-01-01", "1.00", "Groceries", tags=["food"]) for index in range(1, 501)])
+        columns = TransactionColumns.from_pages([page])
+
+        assert columns.nbytes() / len(columns) < 100
+        assert len(columns.pools["description"].values) == 500
+        assert columns.pools["category_name"].values == ["Groceries"]
+
+
+async def test_load_transaction_columns_streams_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Transactions are streamed page by page into the container."""
+    pages = {1: _page(SPLITS[:3]), 2: _page(SPLITS[3:])}
+
+    def _get(path: str, params: Dict[str, Any]) -> Mock:
+        page = {**pages[params["page"]], "meta": {"pagination": {"total_pages": 2}}}
+        response = Mock(spec=httpx.Response)
+        response.is_error = False
+        response.content = json.dumps(page).encode()
+        return response
+
+    client = AsyncMock()
+    client.get.side_effect = _get
+    monkeypatch.setattr(core_transactions, "client", client)
+
+    columns = await core_transactions.load_transaction_columns(TransactionListRequest(start="2024-01-01"))
+
+    assert len(columns) == 5
+    assert client.get.call_args_list[0].kwargs["params"] == {"start": "2024-01-01", "page": 1}
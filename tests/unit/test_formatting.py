@@ -0,0 +1,106 @@
+"""Unit tests for tabular output formats."""
+
+import json
+from typing import Any, Dict
+
+import pytest
+
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.tools.formatting import flatten_rows, format_result, pop_output_format
+from firefly_mcp.tools.registry import EntityType, Registry, RegistryConfig, create_provider_from_config
+
+
+def _transaction_page(groups: int = 2) -> Dict[str, Any]:
+    return {
+        "data": [
+            {
+                "type": "transactions",
+                "id": str(group),
+                "attributes": {
+                    "group_title": f"Group {group}",
+                    "transactions": [
+                        {"date": "2024-01-01", "amount": "12.50", "description": "Groceries",
+                         "category_name": "Food", "tags": ["weekly", "food"], "reconciled": False},
+                        {"date": "2024-01-01", "amount": "3.00", "description": "Bag",
+                         "category_name": None, "tags": [], "reconciled": True},
+                    ],
+                },
+            }
+            for group in range(1, groups + 1)
+        ],
+        "meta": {"pagination": {"total": groups}},
+    }
+
+
+class TestFlatten:
+    """Tests for flattening JSON:API payloads into rows."""
+
+    def test_one_row_per_split(self) -> None:
+        """Transaction groups produce one row per split with group columns repeated."""
+        columns, rows = flatten_rows(_transaction_page())
+
+        assert columns[:3] == ["id", "group_title", "date"]
+        assert len(rows) == 4
+        assert rows[1] == {"id": "1", "group_title": "Group 1", "date": "2024-01-01", "amount": "3.00",
+                           "description": "Bag", "category_name": None, "tags": [], "reconciled": True}
+
+    def test_nested_objects_use_dotted_columns(self) -> None:
+        """Nested objects become dotted column names."""
+        page = {"data": [{"id": "1", "attributes": {"name": "Checking", "meta": {"iban": "X"}}}]}
+
+        assert flatten_rows(page)[1] == [{"id": "1", "name": "Checking", "meta.iban": "X"}]
+
+
+class TestFormatResult:
+    """Tests for format_result."""
+
+    def test_columnar(self) -> None:
+        """Columnar output holds one array per column and keeps pagination meta."""
+        result = format_result(_transaction_page(), "columnar")
+
+        assert result["count"] == 4
+        assert result["columns"]["amount"] == ["12.50", "3.00", "12.50", "3.00"]
+        assert result["meta"] == {"pagination": {"total": 2}}
+
+    def test_csv(self) -> None:
+        """CSV output has a header row, joined lists and empty cells for nulls."""
+        lines = format_result(_transaction_page(1), "csv")["csv"].splitlines()
+
+        assert lines[0] == "id,group_title,date,amount,description,category_name,tags,reconciled"
+        assert lines[1] == "1,Group 1,2024-01-01,12.50,Groceries,Food,weekly;food,false"
+        assert lines[2] == "1,Group 1,2024-01-01,3.00,Bag,,,true"
+
+    def test_compact_formats_are_smaller(self) -> None:
+        """Tabular formats are several times smaller than nested JSON."""
+        page = _transaction_page(50)
+        nested = len(json.dumps(page))
+
+        assert len(json.dumps(format_result(page, "csv"))) * 3 < nested
+        assert len(json.dumps(format_result(page, "columnar"))) * 2 < nested
+
+    def test_invalid_format_rejected(self) -> None:
+        """Unknown formats raise a validation error."""
+        with pytest.raises(ValidationError):
+            pop_output_format({"output_format": "xml"})
+
+
+class TestRegistryOutputFormat:
+    """Tests for the ``output_format`` option in the registry."""
+
+    async def test_list_operation_formats_result(self) -> None:
+        """List operations render the requested format after field projection."""
+        async def list_transactions(_: Any) -> Dict[str, Any]:
+            return _transaction_page(1)
+
+        registry = Registry(RegistryConfig(enabled_entities={EntityType.TRANSACTION}))
+        registry.register_provider(create_provider_from_config(EntityType.TRANSACTION, {
+            "list": {"description": "List", "request_model": None, "response_model": None,
+                     "core_function": list_transactions, "tags": {"read", "list"}},
+        }))
+
+        result = await registry.execute_operation(
+            "transaction", "list", {"fields": ["date", "amount"], "output_format": "csv"}
+        )
+
+        assert result["csv"].splitlines() == ["id,date,amount", "1,2024-01-01,12.50", "1,2024-01-01,3.00"]
+        assert "output_format" in registry.get_operation_schema("transaction", "list")["properties"]
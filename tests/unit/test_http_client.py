@@ -0,0 +1,134 @@
+"""Unit tests for the shared HTTP helpers."""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from firefly_mcp.lib.exceptions import FireflyAPIError
+from firefly_mcp.lib.json_codec import CODECS, get_codec
+from firefly_mcp.lib.http_client import _in_flight, get_json
+
+
+def _slow_client(calls: List[Dict[str, Any]], status_code: int = 200) -> AsyncMock:
+    """Client mock whose GETs take a moment, so concurrent calls overlap."""
+    async def _get(path: str, params: Dict[str, Any] = None) -> Mock:
+        calls.append({"path": path, "params": params})
+        await asyncio.sleep(0.01)
+        response = Mock(spec=httpx.Response)
+        response.is_error = status_code >= 400
+        response.status_code = status_code
+        response.text = "error"
+        response.content = json.dumps({"data": [], "path": path}).encode()
+        return response
+
+    client = AsyncMock()
+    client.get.side_effect = _get
+    return client
+
+
+class TestSingleFlight:
+    """Tests for request coalescing in get_json."""
+
+    async def test_identical_concurrent_gets_share_one_request(self) -> None:
+        """Concurrent identical GETs hit the API once and share the result."""
+        calls: List[Dict[str, Any]] = []
+        client = _slow_client(calls)
+
+        results = await asyncio.gather(*(
+            get_json(client, "/accounts", {"type": "asset", "page": 1}) for _ in range(5)
+        ), get_json(client, "/accounts", {"page": 1, "type": "asset"}))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert not _in_flight
+
+    async def test_different_requests_not_coalesced(self) -> None:
+        """Different paths or parameters are fetched separately."""
+        calls: List[Dict[str, Any]] = []
+        client = _slow_client(calls)
+
+        await asyncio.gather(
+            get_json(client, "/accounts", {"type": "asset"}),
+            get_json(client, "/accounts", {"type": "expense"}),
+            get_json(client, "/budgets"),
+        )
+
+        assert len(calls) == 3
+
+    async def test_sequential_gets_not_coalesced(self) -> None:
+        """Only in-flight requests are shared; completed ones are not reused."""
+        calls: List[Dict[str, Any]] = []
+        client = _slow_client(calls)
+
+        await get_json(client, "/budgets")
+        await get_json(client, "/budgets")
+
+        assert len(calls) == 2
+
+    async def test_error_propagates_to_all_waiters(self) -> None:
+        """Every coalesced caller receives the API error."""
+        calls: List[Dict[str, Any]] = []
+        client = _slow_client(calls, status_code=500)
+
+        results = await asyncio.gather(
+            get_json(client, "/budgets"), get_json(client, "/budgets"), return_exceptions=True
+        )
+
+        assert len(calls) == 1
+        assert all(isinstance(result, FireflyAPIError) for result in results)
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self) -> None:
+        """Cancelling one waiter leaves the request running for the others."""
+        calls: List[Dict[str, Any]] = []
+        client = _slow_client(calls)
+
+        first = asyncio.ensure_future(get_json(client, "/tags"))
+        second = asyncio.ensure_future(get_json(client, "/tags"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == {"data": [], "path": "/tags"}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_invalidation_detaches_in_flight_request(self) -> None:
+        """A GET issued after a write does not join a GET that started before it."""
+        from firefly_mcp.core.cache import invalidate_paths
+
+        calls: List[Dict[str, Any]] = []
+        client = _slow_client(calls)
+
+        before = asyncio.ensure_future(get_json(client, "/budgets/1/limits"))
+        await asyncio.sleep(0)
+        invalidate_paths(["/budgets/{id}/limits"], {"id": "1"})
+        after = asyncio.ensure_future(get_json(client, "/budgets/1/limits"))
+        await asyncio.gather(before, after)
+
+        assert len(calls) == 2
+        assert not _in_flight
+
+
+class TestJsonCodec:
+    """Tests for the pluggable JSON codec."""
+
+    @pytest.mark.parametrize("name", sorted(CODECS))
+    def test_codecs_round_trip(self, name: str) -> None:
+        """Every available codec decodes bytes and encodes compact UTF-8."""
+        codec = get_codec(name)
+        payload = {"data": [{"id": "1", "attributes": {"amount": "12.50", "currency_symbol": "€", "tags": []}}]}
+
+        assert codec.loads(codec.dumps(payload)) == payload
+        assert codec.loads(json.dumps(payload).encode()) == payload
+
+    def test_auto_prefers_fast_codec(self) -> None:
+        """``auto`` never falls back to the stdlib decoder."""
+        assert get_codec("auto").name in ("orjson", "pydantic")
+
+    def test_unknown_codec_rejected(self) -> None:
+        """Unknown codec names raise."""
+        with pytest.raises(ValueError):
+            get_codec("simplejson")
@@ -0,0 +1,256 @@
+"""Unit tests for the local transaction mirror and its incremental sync."""
+
+import json
+import math
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from firefly_mcp.local.store import LocalStore, from_minor_units, to_minor_units
+from firefly_mcp.core.cache import invalidate_paths
+from firefly_mcp.local import store as store_module
+from firefly_mcp.local.sync import ensure_synced, sync_store
+
+
+def _group(group_id: int, day: str, amount: str = "10.00", updated_at: str = "2024-01-01T00:00:00+00:00",
+           tags: List[str] = ()) -> Dict[str, Any]:
+    return {
+        "type": "transactions",
+        "id": str(group_id),
+        "attributes": {
+            "group_title": None,
+            "updated_at": updated_at,
+            "transactions": [
+                {"transaction_journal_id": f"{group_id}0", "type": "withdrawal", "date": f"{day}T12:00:00+01:00",
+                 "amount": amount, "currency_code": "EUR", "currency_decimal_places": 2,
+                 "description": f"Groceries {group_id}", "category_id": "3", "category_name": "Groceries",
+                 "source_id": "1", "source_name": "Checking", "tags": list(tags)},
+            ],
+        },
+    }
+
+
+class FakeFirefly:
+    """Serves paginated ``/transactions`` (filtered by ``start``), single groups and reference lists."""
+
+    def __init__(self, groups: List[Dict[str, Any]]):
+        self.groups = {group["id"]: group for group in groups}
+        self.requests: List[Dict[str, Any]] = []
+        self.client = AsyncMock()
+        self.client.get.side_effect = self._get
+
+    def _get(self, path: str, params: Dict[str, Any]) -> Mock:
+        self.requests.append({"path": path, **(params or {})})
+        if path.startswith("/transactions/"):
+            group = self.groups.get(path.rsplit("/", 1)[1])
+            response = Mock(spec=httpx.Response)
+            response.is_error = group is None
+            response.status_code = 200 if group else 404
+            response.content = json.dumps({"data": group}).encode()
+            return response
+        if path == "/transactions":
+            start = params.get("start", "")
+            items = sorted(
+                (group for group in self.groups.values() if group["attributes"]["transactions"][0]["date"][:10] >= start),
+                key=lambda group: int(group["id"]),
+            )
+        else:
+            items = [{"type": path[1:], "id": "1", "attributes": {"name": f"{path[1:]} one"}}]
+        per_page, page = int(params.get("limit") or 50), int(params.get("page") or 1)
+        response = Mock(spec=httpx.Response)
+        response.is_error = False
+        response.content = json.dumps({
+            "data": items[(page - 1) * per_page:page * per_page],
+            "meta": {"pagination": {"total": len(items), "per_page": per_page, "current_page": page,
+                                    "total_pages": max(1, math.ceil(len(items) / per_page))}},
+        }).encode()
+        return response
+
+
+class TestMinorUnits:
+    """Tests for exact amount conversion."""
+
+    def test_round_trip(self) -> None:
+        """Amounts convert to integer minor units and back without float error."""
+        assert to_minor_units("12.50", 2) == 1250
+        assert to_minor_units("0.1", 2) + to_minor_units("0.2", 2) == 30
+        assert to_minor_units("1000", 0) == 1000
+        assert to_minor_units(None, 2) is None
+        assert from_minor_units(1250, 2) == "12.50"
+
+    def test_zero_decimal_currency(self) -> None:
+        """Currencies without minor units keep zero decimal places."""
+        group = _group(1, "2024-01-05", amount="1500")
+        group["attributes"]["transactions"][0].update(
+            currency_code="JPY", currency_decimal_places=0, foreign_amount="9.99", foreign_currency_decimal_places=2
+        )
+        store = LocalStore()
+        store.upsert_groups([group])
+
+        assert store.query("SELECT amount, decimal_places, foreign_amount FROM splits") == [(1500, 0, 999)]
+        assert from_minor_units(1500, 0) == "1500"
+
+
+class TestLocalSync:
+    """Tests for full and incremental syncs."""
+
+    async def test_full_sync_mirrors_transactions_and_entities(self) -> None:
+        """A first sync stores every split and the reference entities."""
+        firefly = FakeFirefly([_group(i, f"2024-01-{i:02d}", tags=["weekly"]) for i in range(1, 6)])
+        store = LocalStore()
+
+        result = await sync_store(firefly.client, store, today=date(2024, 2, 1))
+
+        assert result["mode"] == "full"
+        assert result["groups_fetched"] == result["groups_changed"] == 5
+        assert result["entities"] == {"account": 1, "category": 1, "budget": 1, "tag": 1}
+        assert store.query("SELECT SUM(amount), COUNT(*) FROM splits") == [(5000, 5)]
+        assert store.query("SELECT COUNT(*) FROM split_tags WHERE tag = 'weekly'") == [(5,)]
+        assert store.summary()["first_date"] == "2024-01-01"
+
+    async def test_incremental_sync_fetches_recent_window(self) -> None:
+        """Later syncs only fetch the lookback window and apply updates and deletions there."""
+        firefly = FakeFirefly([_group(1, "2023-06-01"), _group(2, "2024-01-20"), _group(3, "2024-01-25")])
+        store = LocalStore()
+        await sync_store(firefly.client, store, today=date(2024, 2, 1))
+
+        firefly.groups["2"] = _group(2, "2024-01-20", amount="99.99", updated_at="2024-02-02T00:00:00+00:00")
+        del firefly.groups["3"]
+        firefly.groups["4"] = _group(4, "2024-02-03")
+        firefly.requests.clear()
+        result = await sync_store(firefly.client, store, lookback_days=30, today=date(2024, 2, 5))
+
+        assert result["mode"] == "incremental"
+        assert result["window_start"] == "2024-01-02"
+        assert {request.get("start") for request in firefly.requests if request["path"] == "/transactions"} == {"2024-01-02"}
+        assert (result["groups_fetched"], result["groups_changed"], result["groups_deleted"]) == (2, 2, 1)
+        assert store.query("SELECT group_id, amount FROM splits ORDER BY group_id") == [("1", 1000), ("2", 9999), ("4", 1000)]
+
+    async def test_group_moved_before_window_is_kept(self) -> None:
+        """Groups re-dated before the window are re-fetched and kept unless they now predate the mirror."""
+        firefly = FakeFirefly([_group(1, "2024-01-28"), _group(2, "2024-01-25"), _group(3, "2024-01-30")])
+        store = LocalStore()
+        await sync_store(firefly.client, store, start="2024-01-01", today=date(2024, 2, 1))
+
+        firefly.groups["1"] = _group(1, "2024-01-05", updated_at="2024-02-02T00:00:00+00:00")
+        firefly.groups["3"] = _group(3, "2023-11-01", updated_at="2024-02-02T00:00:00+00:00")
+        del firefly.groups["2"]
+        result = await sync_store(firefly.client, store, lookback_days=10, today=date(2024, 2, 3))
+
+        assert (result["groups_changed"], result["groups_deleted"]) == (1, 2)
+        assert result["window_start"] == "2024-01-22"
+        assert store.query("SELECT group_id, date FROM splits") == [("1", "2024-01-05")]
+
+    async def test_incremental_sync_is_promoted_to_full_reconcile(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Edits and deletions dated before the window are picked up by the periodic full sync."""
+        monkeypatch.setattr("firefly_mcp.local.sync.RECONCILE_DAYS", 7)
+        firefly = FakeFirefly([_group(1, "2023-06-01"), _group(2, "2023-07-01")])
+        store = LocalStore()
+        await sync_store(firefly.client, store, today=date(2024, 2, 1))
+        firefly.groups["1"] = _group(1, "2023-06-01", amount="5.00", updated_at="2024-02-02T00:00:00+00:00")
+        del firefly.groups["2"]
+
+        incremental = await sync_store(firefly.client, store, today=date(2024, 2, 7))
+        assert (incremental["mode"], incremental["groups_changed"], incremental["groups_deleted"]) == ("incremental", 0, 0)
+
+        reconciled = await sync_store(firefly.client, store, today=date(2024, 2, 8))
+        assert (reconciled["mode"], reconciled["groups_changed"], reconciled["groups_deleted"]) == ("full", 1, 1)
+        assert store.query("SELECT group_id, amount FROM splits") == [("1", 500)]
+
+    async def test_store_writes_run_off_the_event_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Batches are written from a worker thread rather than the event loop thread."""
+        firefly = FakeFirefly([_group(1, "2024-01-10")])
+        store = LocalStore()
+        threads = []
+        upsert_groups = store.upsert_groups
+
+        def recording_upsert(groups: List[Dict[str, Any]]) -> int:
+            threads.append(threading.get_ident())
+            return upsert_groups(groups)
+
+        monkeypatch.setattr(store, "upsert_groups", recording_upsert)
+        await sync_store(firefly.client, store, today=date(2024, 1, 11))
+
+        assert threads and threading.get_ident() not in threads
+
+    async def test_unchanged_groups_not_rewritten(self) -> None:
+        """Groups with an unchanged ``updated_at`` are skipped."""
+        firefly = FakeFirefly([_group(i, "2024-01-10") for i in range(1, 4)])
+        store = LocalStore()
+        await sync_store(firefly.client, store, today=date(2024, 1, 11))
+
+        result = await sync_store(firefly.client, store, today=date(2024, 1, 12))
+
+        assert result["groups_fetched"] == 3
+        assert result["groups_changed"] == 0
+
+    async def test_full_sync_respects_start(self, tmp_path: Any) -> None:
+        """A full sync from ``start`` keeps that bound for later syncs and persists to disk."""
+        firefly = FakeFirefly([_group(1, "2020-01-01"), _group(2, "2024-01-10")])
+        path = str(tmp_path / "mirror.db")
+        await sync_store(firefly.client, LocalStore(path), start="2024-01-01", today=date(2024, 1, 11))
+
+        reopened = LocalStore(path)
+        result = await sync_store(firefly.client, reopened, lookback_days=3650, today=date(2024, 1, 12))
+
+        assert result["window_start"] == "2024-01-01"
+        assert reopened.query("SELECT group_id FROM splits") == [("2",)]
+
+
+class TestEnsureSynced:
+    """Tests for syncing before operations that read the mirror."""
+
+    @staticmethod
+    def _synced(store: LocalStore, seconds_ago: float) -> None:
+        synced_at = datetime.now(timezone.utc) - timedelta(seconds=seconds_ago)
+        store.set_state("transactions", {"synced_on": synced_at.date().isoformat(),
+                                          "synced_at": synced_at.isoformat(timespec="seconds"),
+                                          "start": None, "reconciled_on": synced_at.date().isoformat()})
+
+    async def test_recent_clean_mirror_is_not_synced(self) -> None:
+        """A recently synced mirror without local writes is used as is."""
+        firefly = FakeFirefly([_group(1, "2024-01-01")])
+        store = LocalStore()
+        self._synced(store, seconds_ago=10)
+
+        await ensure_synced(firefly.client, store)
+
+        assert firefly.requests == []
+
+    async def test_old_mirror_is_synced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A mirror older than the maximum age is synced first."""
+        monkeypatch.setattr("firefly_mcp.local.sync.MAX_AGE_SECONDS", 60.0)
+        firefly = FakeFirefly([_group(1, "2024-01-01")])
+        store = LocalStore()
+        self._synced(store, seconds_ago=120)
+
+        state = await ensure_synced(firefly.client, store)
+
+        assert any(request["path"] == "/transactions" for request in firefly.requests)
+        assert datetime.fromisoformat(state["synced_at"]) > datetime.now(timezone.utc) - timedelta(seconds=60)
+
+    async def test_transaction_write_marks_mirror_dirty(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Invalidating transaction paths after a write makes the next read sync first."""
+        firefly = FakeFirefly([_group(1, "2024-01-01")])
+        store = LocalStore()
+        self._synced(store, seconds_ago=10)
+        monkeypatch.setattr(store_module, "_store", store)
+
+        invalidate_paths(["/accounts*"])
+        assert not store.dirty
+        invalidate_paths(["/transactions*"])
+        assert store.dirty
+
+        await ensure_synced(firefly.client, store)
+        assert any(request["path"] == "/transactions" for request in firefly.requests)
+        assert not store.dirty
+
+
+@pytest.mark.parametrize("places,amount,expected", [(2, "-3.005", -300), (3, "1.2345", 1234), (0, "7", 7)])
+def test_minor_units_rounding(places: int, amount: str, expected: int) -> None:
+    """Conversion rounds half to even at the currency's precision."""
+    assert to_minor_units(amount, places) == expected
@@ -0,0 +1,63 @@
+"""Unit tests for the lazily loaded generated models."""
+
+import subprocess
+import sys
+
+from pydantic import BaseModel
+
+from firefly_mcp.models import model, requests
+
+
+class TestLazyModels:
+    """Tests for the per-family model split."""
+
+    def test_every_model_resolves(self) -> None:
+        """Each indexed name resolves to the class defined in its family module."""
+        for name, family in model.MODEL_MODULES.items():
+            cls = getattr(model, name)
+            assert cls.__name__ == name
+            assert cls.__module__ == f"firefly_mcp.models.generated.{family}"
+
+    def test_models_validate_across_modules(self) -> None:
+        """Models referencing classes from the common module are fully built."""
+        account = model.AccountSingle.model_validate({
+            "data": {"type": "accounts", "id": "1", "attributes": {"name": "Checking", "type": "asset"}}
+        })
+        assert isinstance(account.data.attributes, BaseModel)
+
+    def test_only_used_families_are_imported(self) -> None:
+        """Importing one model does not load unrelated families."""
+        code = (
+            "import sys\n"
+            "from firefly_mcp.models.model import TagArray\n"
+            "loaded = {m.rsplit('.', 1)[1] for m in sys.modules if m.startswith('firefly_mcp.models.generated.')}\n"
+            "print(','.join(sorted(loaded)))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert output.strip().split(",") == ["common", "tag"]
+
+
+class TestLazyRequestModels:
+    """Tests for the per-family request model split."""
+
+    def test_every_request_model_resolves(self) -> None:
+        """Each indexed name resolves to the class defined in its family module."""
+        for name, family in requests.REQUEST_MODULES.items():
+            cls = getattr(requests, name)
+            assert cls.__name__ == name
+            assert cls.__module__ == f"firefly_mcp.models.requests.{family}"
+
+    def test_single_entity_import_loads_only_its_families(self) -> None:
+        """Importing one entity's request models leaves other generated families unloaded."""
+        code = (
+            "import sys\n"
+            "from firefly_mcp.models.requests import TagListRequest, TagUpdateRequest\n"
+            "loaded = {m for m in sys.modules if m.startswith('firefly_mcp.models.')}\n"
+            "print(','.join(sorted(m.rsplit('.', 1)[1] for m in loaded if '.generated.' in m)))\n"
+            "print(','.join(sorted(m.rsplit('.', 1)[1] for m in loaded if '.requests.' in m)))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        generated, request_modules = output.strip().splitlines()
+
+        assert generated == "common,tag"
+        assert request_modules == "common,tag"
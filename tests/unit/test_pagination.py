@@ -0,0 +1,180 @@
+"""Unit tests for transparent auto-pagination."""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from firefly_mcp.core.pagination import fetch_all_pages, fetch_list
+from firefly_mcp.lib.env import parse_int_env
+from firefly_mcp.models.model import AccountArray
+
+
+def _page(page: int, per_page: int, total: int) -> Dict[str, Any]:
+    start = (page - 1) * per_page
+    ids = range(start + 1, min(start + per_page, total) + 1)
+    data: List[Dict[str, Any]] = [
+        {"type": "accounts", "id": str(i), "attributes": {"name": f"Account {i}", "type": "asset"}}
+        for i in ids
+    ]
+    return {
+        "data": data,
+        "meta": {"pagination": {
+            "total": total,
+            "count": len(data),
+            "per_page": per_page,
+            "current_page": page,
+            "total_pages": (total + per_page - 1) // per_page,
+        }},
+    }
+
+
+@pytest.fixture
+def paged_client():
+    """Client mock serving 5 pages of 2 accounts (9 in total)."""
+    def _get(path: str, params: Dict[str, Any]) -> Mock:
+        response = Mock(spec=httpx.Response)
+        response.is_error = False
+        response.content = json.dumps(_page(params.get("page", 1), per_page=2, total=9)).encode()
+        return response
+
+    client = AsyncMock()
+    client.get.side_effect = _get
+    return client
+
+
+class TestFetchList:
+    """Tests for fetch_list."""
+
+    async def test_single_page_without_controls(self, paged_client: AsyncMock) -> None:
+        """Without fetch_all/max_items the request is passed through unchanged."""
+        result = await fetch_list(paged_client, "/accounts", {"type": "asset", "fetch_all": False}, AccountArray)
+
+        assert len(result.data) == 2
+        paged_client.get.assert_called_once_with("/accounts", params={"type": "asset"})
+
+    async def test_fetch_all_merges_pages_in_order(self, paged_client: AsyncMock) -> None:
+        """All pages are fetched and merged into one array."""
+        result = await fetch_list(paged_client, "/accounts", {"type": "asset", "fetch_all": True}, AccountArray)
+
+        assert [account.id for account in result.data] == [str(i) for i in range(1, 10)]
+        assert result.meta.pagination is not None
+        assert result.meta.pagination.count == 9
+        assert paged_client.get.call_count == 5
+        requested_pages = sorted(call.kwargs["params"]["page"] for call in paged_client.get.call_args_list)
+        assert requested_pages == [1, 2, 3, 4, 5]
+
+    async def test_max_items_limits_pages_and_items(self, paged_client: AsyncMock) -> None:
+        """Only the pages needed for max_items are fetched."""
+        result = await fetch_list(paged_client, "/accounts", {"max_items": 3}, AccountArray)
+
+        assert [account.id for account in result.data] == ["1", "2", "3"]
+        assert paged_client.get.call_count == 2
+
+    async def test_fetch_all_starts_at_requested_page(self, paged_client: AsyncMock) -> None:
+        """An explicit page is used as the first page of the scan."""
+        payload = await fetch_all_pages(paged_client, "/accounts", {"page": 4}, concurrency=1)
+
+        assert [item["id"] for item in payload["data"]] == ["7", "8", "9"]
+
+
+def _transaction_page(page: int, per_page: int, total: int) -> Dict[str, Any]:
+    payload = _page(page, per_page, total)
+    payload["data"] = [
+        {
+            "type": "transactions",
+            "id": item["id"],
+            "attributes": {"transactions": [{
+                "type": "withdrawal",
+                "date": "2024-01-01T00:00:00+00:00",
+                "amount": "1.00",
+                "description": f"Transaction {item['id']}",
+                "source_id": "1",
+                "destination_id": "2",
+            }]},
+            "links": {"self": f"https://demo.firefly-iii.org/api/v1/transactions/{item['id']}"},
+        }
+        for item in payload["data"]
+    ]
+    return payload
+
+
+class TestIterTransactions:
+    """Tests for the streaming iterator API."""
+
+    @pytest.fixture
+    def transaction_client(self, monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+        def _get(path: str, params: Dict[str, Any]) -> Mock:
+            response = Mock(spec=httpx.Response)
+            response.is_error = False
+            response.content = json.dumps(_transaction_page(params["page"], per_page=2, total=5)).encode()
+            return response
+
+        client = AsyncMock()
+        client.get.side_effect = _get
+        monkeypatch.setattr("firefly_mcp.core.transactions.client", client)
+        return client
+
+    async def test_yields_every_transaction_across_pages(self, transaction_client: AsyncMock) -> None:
+        """All pages are walked and yielded as TransactionRead items."""
+        from firefly_mcp.core.transactions import iter_transactions
+        from firefly_mcp.models.model import TransactionRead
+        from firefly_mcp.models.requests import TransactionListRequest
+
+        items = [item async for item in iter_transactions(TransactionListRequest(start="2024-01-01"))]
+
+        assert all(isinstance(item, TransactionRead) for item in items)
+        assert [item.id for item in items] == ["1", "2", "3", "4", "5"]
+        assert transaction_client.get.call_count == 3
+        assert transaction_client.get.call_args_list[0].kwargs["params"] == {"start": "2024-01-01", "page": 1}
+
+    async def test_stopping_early_skips_remaining_pages(self, transaction_client: AsyncMock) -> None:
+        """Closing the iterator after the first page requests only the prefetched next page."""
+        from firefly_mcp.core.transactions import iter_transactions
+        from firefly_mcp.models.requests import TransactionListRequest
+
+        iterator = iter_transactions(TransactionListRequest())
+        first = await anext(iterator)
+        await asyncio.sleep(0.01)  # let the prefetch of page 2 start
+        await iterator.aclose()
+
+        assert first.id == "1"
+        assert [call.kwargs["params"]["page"] for call in transaction_client.get.call_args_list] == [1, 2]
+
+    async def test_concurrent_identical_scans_share_page_requests(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Two scans of the same query fetch each page once; other parameters are fetched separately."""
+        from firefly_mcp.core.transactions import iter_transactions
+        from firefly_mcp.models.requests import TransactionListRequest
+
+        async def _get(path: str, params: Dict[str, Any]) -> Mock:
+            await asyncio.sleep(0.01)
+            response = Mock(spec=httpx.Response)
+            response.is_error = False
+            response.content = json.dumps(_transaction_page(params["page"], per_page=2, total=5)).encode()
+            return response
+
+        client = AsyncMock()
+        client.get.side_effect = _get
+        monkeypatch.setattr("firefly_mcp.core.transactions.client", client)
+
+        async def _scan(request: TransactionListRequest) -> List[str]:
+            return [item.id async for item in iter_transactions(request)]
+
+        same = await asyncio.gather(*(_scan(TransactionListRequest(start="2024-01-01")) for _ in range(2)))
+        assert same == [["1", "2", "3", "4", "5"]] * 2
+        assert client.get.call_count == 3
+
+        client.get.reset_mock()
+        await asyncio.gather(_scan(TransactionListRequest(start="2024-01-01")), _scan(TransactionListRequest(start="2024-02-01")))
+        assert client.get.call_count == 6
+
+
+@pytest.mark.parametrize("raw, expected", [("", 4), ("6", 6), ("four", 4), ("0", 4), ("-2", 4)])
+def test_concurrency_env_is_parsed_safely(monkeypatch: pytest.MonkeyPatch, raw: str, expected: int) -> None:
+    """Malformed or non-positive FIREFLY_PAGINATION_CONCURRENCY values fall back to the default."""
+    monkeypatch.setenv("FIREFLY_PAGINATION_CONCURRENCY", raw)
+
+    assert parse_int_env("FIREFLY_PAGINATION_CONCURRENCY", 4) == expected
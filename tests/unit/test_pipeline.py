@@ -0,0 +1,103 @@
+"""Unit tests for operation pipelines."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel
+
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.tools.pipeline import plan_waves, resolve_reference
+from firefly_mcp.tools.registry import EntityType, Registry, RegistryConfig, create_provider_from_config
+
+
+class _Request(BaseModel):
+    id: str = ""
+    ids: List[str] = []
+    type: str = ""
+
+
+class TestReferences:
+    """Tests for reference resolution and planning."""
+
+    def test_resolve_paths(self) -> None:
+        """Field, index and wildcard segments are supported."""
+        results = {0: {"data": [{"id": "1", "attributes": {"name": "A"}}, {"id": "2", "attributes": {"name": "B"}}]}}
+
+        assert resolve_reference("$steps[0].data[1].id", results) == "2"
+        assert resolve_reference("$steps[0].data[*].id", results) == ["1", "2"]
+        assert resolve_reference("$steps[0].data[*].attributes.name", results) == ["A", "B"]
+        with pytest.raises(ValidationError):
+            resolve_reference("$steps[0].data[5].id", results)
+
+    def test_plan_waves(self) -> None:
+        """Independent steps share a wave; dependents follow their inputs."""
+        steps = [
+            {"entity": "account", "operation": "list"},
+            {"entity": "tag", "operation": "list"},
+            {"entity": "account", "operation": "get", "params": {"id": "$steps[0].data[0].id"}},
+            {"entity": "tag", "operation": "get", "params": {"id": "$steps[2].data.id", "x": ["$steps[1].data"]}},
+        ]
+
+        assert plan_waves(steps) == [[0, 1], [2], [3]]
+
+    def test_forward_reference_rejected(self) -> None:
+        """Steps can only reference earlier steps."""
+        with pytest.raises(ValidationError):
+            plan_waves([{"entity": "account", "operation": "get", "params": {"id": "$steps[0].data"}}])
+
+
+class TestExecutePipeline:
+    """Tests for Registry.execute_pipeline."""
+
+    @pytest.fixture
+    def registry(self) -> Registry:
+        async def list_accounts(request: _Request) -> Dict[str, Any]:
+            await asyncio.sleep(0.01)
+            return {"data": [{"id": "7"}, {"id": "8"}]}
+
+        async def get_account(request: _Request) -> Dict[str, Any]:
+            if request.id == "404":
+                raise RuntimeError("not found")
+            return {"data": {"id": request.id}}
+
+        async def tag_accounts(request: _Request) -> Dict[str, Any]:
+            return {"tagged": request.ids}
+
+        registry = Registry(RegistryConfig(enabled_entities={EntityType.ACCOUNT}))
+        registry.register_provider(create_provider_from_config(EntityType.ACCOUNT, {
+            name: {"description": name, "request_model": _Request, "response_model": None, "core_function": fn}
+            for name, fn in {"list": list_accounts, "get": get_account, "tag": tag_accounts}.items()
+        }))
+        return registry
+
+    async def test_chained_steps(self, registry: Registry) -> None:
+        """Later steps receive data from earlier results; only the last result is returned."""
+        outcome = await registry.execute_pipeline([
+            {"entity": "account", "operation": "list", "params": {"type": "asset"}},
+            {"entity": "account", "operation": "tag", "params": {"ids": "$steps[0].data[*].id"}},
+        ])
+
+        assert outcome["waves"] == [[0], [1]]
+        assert outcome["steps"][0] == {"step": 0, "entity": "account", "operation": "list", "status": "ok"}
+        assert outcome["steps"][1]["result"] == {"tagged": ["7", "8"]}
+
+    async def test_failure_skips_dependents_only(self, registry: Registry) -> None:
+        """A failed step fails its dependents but not independent steps."""
+        outcome = await registry.execute_pipeline([
+            {"entity": "account", "operation": "get", "params": {"id": "404"}},
+            {"entity": "account", "operation": "list"},
+            {"entity": "account", "operation": "tag", "params": {"ids": ["$steps[0].data.id"]}},
+        ], return_steps=[1, 2])
+
+        assert "not found" in outcome["steps"][0]["error"]
+        assert outcome["steps"][1]["result"] == {"data": [{"id": "7"}, {"id": "8"}]}
+        assert outcome["steps"][2]["error"].startswith("Skipped")
+
+    async def test_unknown_return_steps_rejected(self, registry: Registry) -> None:
+        """return_steps entries that do not name a step fail before any step runs."""
+        with pytest.raises(ValidationError, match=r"unknown step\(s\) \[-1, 2\]"):
+            await registry.execute_pipeline([
+                {"entity": "account", "operation": "list"},
+                {"entity": "account", "operation": "get", "params": {"id": "1"}},
+            ], return_steps=[1, 2, -1])
@@ -0,0 +1,88 @@
+"""Unit tests for sparse field projection."""
+
+from typing import Any, Dict
+
+import pytest
+
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.tools.projection import pop_fields, project
+from firefly_mcp.tools.registry import EntityType, Registry, RegistryConfig, create_provider_from_config
+
+TRANSACTION_PAGE: Dict[str, Any] = {
+    "data": [
+        {
+            "type": "transactions",
+            "id": "1",
+            "links": {"self": "https://firefly.test/transactions/1"},
+            "attributes": {
+                "user": "1",
+                "group_title": None,
+                "transactions": [
+                    {"date": "2024-01-01", "amount": "12.50", "description": "Groceries",
+                     "category_name": "Food", "tags": ["weekly"], "notes": None},
+                ],
+            },
+        }
+    ],
+    "meta": {"pagination": {"total": 1}},
+}
+
+
+class TestProject:
+    """Tests for project()."""
+
+    def test_projects_split_fields(self) -> None:
+        """Split attributes are kept inside their split list; the rest is dropped."""
+        projected = project(TRANSACTION_PAGE, ["date", "amount"])
+
+        assert projected["data"] == [{
+            "type": "transactions",
+            "id": "1",
+            "attributes": {"transactions": [{"date": "2024-01-01", "amount": "12.50"}]},
+        }]
+        assert projected["meta"] == TRANSACTION_PAGE["meta"]
+
+    def test_projects_single_resource_without_mutating(self) -> None:
+        """Single results are projected and the input payload is left intact."""
+        payload = {"data": {"type": "accounts", "id": "2", "attributes": {"name": "Checking", "iban": "X"}}}
+
+        assert project(payload, ["name"])["data"] == {"type": "accounts", "id": "2", "attributes": {"name": "Checking"}}
+        assert payload["data"]["attributes"] == {"name": "Checking", "iban": "X"}
+
+    def test_pop_fields(self) -> None:
+        """Comma-separated strings are accepted; invalid values are rejected."""
+        params = {"fields": "date, amount", "limit": 5}
+
+        assert pop_fields(params) == ({"limit": 5}, ["date", "amount"])
+        assert params == {"fields": "date, amount", "limit": 5}
+        with pytest.raises(ValidationError):
+            pop_fields({"fields": 3})
+
+
+class TestRegistryProjection:
+    """Tests for the ``fields`` option in the registry."""
+
+    @pytest.fixture
+    def registry(self) -> Registry:
+        async def list_transactions(_: Any) -> Dict[str, Any]:
+            return TRANSACTION_PAGE
+
+        registry = Registry(RegistryConfig(enabled_entities={EntityType.TRANSACTION}))
+        registry.register_provider(create_provider_from_config(EntityType.TRANSACTION, {
+            "list": {"description": "List", "request_model": None, "response_model": None,
+                     "core_function": list_transactions, "tags": {"read", "list"}},
+            "delete": {"description": "Delete", "request_model": None, "response_model": None,
+                       "core_function": list_transactions, "tags": {"write"}},
+        }))
+        return registry
+
+    async def test_fields_applied_to_reads(self, registry: Registry) -> None:
+        """Read operations return only the requested attributes."""
+        result = await registry.execute_operation("transaction", "list", {"fields": ["description"]})
+
+        assert result["data"][0]["attributes"] == {"transactions": [{"description": "Groceries"}]}
+
+    def test_schema_advertises_fields_for_reads_only(self, registry: Registry) -> None:
+        """Only read operations get the ``fields`` parameter in their schema."""
+        assert "fields" in registry.get_operation_schema("transaction", "list")["properties"]
+        assert "fields" not in registry.get_operation_schema("transaction", "delete")["properties"]
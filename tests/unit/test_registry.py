@@ -0,0 +1,385 @@
+"""Unit tests for the operation registry."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from firefly_mcp.core.passthrough import to_model
+from firefly_mcp.tools.registry import (
+    EntityType,
+    Registry,
+    RegistryConfig,
+    SchemaConverter,
+    create_provider_from_config,
+    get_type_adapter,
+)
+
+
+def _make_registry(operations: Dict[str, Dict[str, Any]]) -> Registry:
+    registry = Registry(RegistryConfig(enabled_entities={EntityType.ACCOUNT}))
+    registry.register_provider(create_provider_from_config(EntityType.ACCOUNT, operations))
+    return registry
+
+
+class TestExecuteOperation:
+    """Tests for Registry.execute_operation."""
+
+    async def test_concurrent_calls_overlap(self) -> None:
+        """Slow async core functions should not serialize concurrent calls."""
+        async def slow_list(_: Any) -> Dict[str, Any]:
+            await asyncio.sleep(0.2)
+            return {"data": []}
+
+        registry = _make_registry({
+            "list": {
+                "description": "Slow list",
+                "request_model": None,
+                "response_model": None,
+                "core_function": slow_list,
+            }
+        })
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(registry.execute_operation("account", "list") for _ in range(5)))
+        elapsed = time.perf_counter() - started
+
+        assert results == [{"data": []}] * 5
+        assert elapsed < 0.6
+
+    async def test_sync_core_function_still_supported(self) -> None:
+        """Plain callables are executed and their result returned."""
+        registry = _make_registry({
+            "list": {
+                "description": "Sync list",
+                "request_model": None,
+                "response_model": None,
+                "core_function": lambda _: {"data": [1]},
+            }
+        })
+
+        assert await registry.execute_operation("account", "list") == {"data": [1]}
+
+
+class TestBoundedExecutor:
+    """Tests for the executor used to offload synchronous core functions."""
+
+    async def test_sync_call_does_not_block_event_loop(self) -> None:
+        """A blocking core function runs off-loop and is tracked in the stats."""
+        def blocking_list(_: Any) -> Dict[str, Any]:
+            time.sleep(0.2)
+            return {"data": []}
+
+        registry = _make_registry({
+            "list": {
+                "description": "Blocking list",
+                "request_model": None,
+                "response_model": None,
+                "core_function": blocking_list,
+            }
+        })
+
+        task = asyncio.create_task(registry.execute_operation("account", "list"))
+        loop_started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        assert time.perf_counter() - loop_started < 0.1
+        assert await task == {"data": []}
+
+        stats = registry.get_stats()["executors"]["account"]
+        assert stats["submitted"] == 1
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+
+    async def test_pool_size_bounds_parallelism(self) -> None:
+        """Work beyond the pool size waits in the queue."""
+        registry = Registry(RegistryConfig(
+            enabled_entities={EntityType.ACCOUNT},
+            entity_executor_workers={EntityType.ACCOUNT: 1},
+        ))
+        executor = registry.get_executor(EntityType.ACCOUNT)
+
+        await asyncio.gather(*(executor.run(time.sleep, 0.05) for _ in range(3)))
+
+        stats = executor.stats()
+        assert stats["max_workers"] == 1
+        assert stats["completed"] == 3
+        assert stats["max_wait_ms"] >= 50
+
+    async def test_shutdown_waits_for_running_work(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Shutting down lets running calls finish and then rejects new work."""
+        from firefly_mcp.tools import executor as executor_module
+
+        monkeypatch.setattr(executor_module, "_live_executors", weakref.WeakSet())
+        executor = executor_module.BoundedExecutor("test", 1)
+        task = asyncio.create_task(executor.run(time.sleep, 0.05))
+        await asyncio.sleep(0.01)
+
+        assert await asyncio.to_thread(executor_module.shutdown_executors) == 1
+        await task
+        assert executor.stats()["completed"] == 1
+        with pytest.raises(RuntimeError):
+            await executor.run(time.sleep, 0)
+
+    def test_worker_config_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Global and per-entity pool sizes are read from the environment."""
+        monkeypatch.setenv("FIREFLY_EXECUTOR_WORKERS", "2")
+        monkeypatch.setenv("FIREFLY_EXECUTOR_WORKERS_TRANSACTION", "8")
+
+        config = RegistryConfig.from_environment()
+
+        assert config.workers_for(EntityType.ACCOUNT) == 2
+        assert config.workers_for(EntityType.TRANSACTION) == 8
+
+
+class _GetRequest(BaseModel):
+    id: str = ""
+
+
+class TestExecuteBatch:
+    """Tests for Registry.execute_batch."""
+
+    async def test_results_in_order_with_errors(self) -> None:
+        """Per-item results keep request order; failures do not abort the batch."""
+        async def get(request: _GetRequest) -> Dict[str, Any]:
+            await asyncio.sleep(0.05 if request.id == "1" else 0)
+            if request.id == "2":
+                raise RuntimeError("not found")
+            return {"data": {"id": request.id}}
+
+        registry = _make_registry({
+            "get": {"description": "Get", "request_model": _GetRequest, "response_model": None, "core_function": get}
+        })
+
+        results = await registry.execute_batch([
+            {"entity": "account", "operation": "get", "params": {"id": "1"}},
+            {"entity": "account", "operation": "get", "params": {"id": "2"}},
+            {"entity": "account", "operation": "missing"},
+            {"operation": "get"},
+            {"entity": "account", "operation": "get", "params": {"id": "3"}},
+        ])
+
+        assert results[0]["result"] == {"data": {"id": "1"}}
+        assert "not found" in results[1]["error"]
+        assert "missing" in results[2]["error"]
+        assert "error" in results[3]
+        assert results[4]["result"] == {"data": {"id": "3"}}
+
+    async def test_concurrency_limit(self) -> None:
+        """No more than ``concurrency`` items run at the same time."""
+        running = 0
+        peak = 0
+
+        async def get(_: Any) -> Dict[str, Any]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {}
+
+        registry = _make_registry({
+            "get": {"description": "Get", "request_model": None, "response_model": None, "core_function": get}
+        })
+
+        await registry.execute_batch([{"entity": "account", "operation": "get"}] * 10, concurrency=3)
+
+        assert peak == 3
+
+    async def test_invalid_concurrency_is_rejected_or_clamped(self) -> None:
+        """The tool schema requires concurrency >= 1; direct callers are clamped to one."""
+        from fastmcp import FastMCP
+        from firefly_mcp.tools.registry import _register_consolidated_tools
+
+        registry = _make_registry({
+            "get": {"description": "Get", "request_model": None, "response_model": None, "core_function": lambda _: {}}
+        })
+        mcp = FastMCP("test")
+        _register_consolidated_tools(mcp, registry)
+        tool = await mcp.get_tool("firefly_batch_execute")
+
+        assert "minimum" in str(tool.parameters["properties"]["concurrency"])
+        results = await registry.execute_batch([{"entity": "account", "operation": "get"}] * 2, concurrency=-1)
+        assert [result["result"] for result in results] == [{}, {}]
+
+
+class TestSchemaCache:
+    """Tests for precomputed operation schemas."""
+
+    _OPERATIONS = {
+        "get": {"description": "Get", "request_model": _GetRequest, "response_model": None, "core_function": lambda _: {}}
+    }
+
+    def test_schema_built_once_at_registration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Schemas are generated during registration and served from memory."""
+        calls = []
+        original = _GetRequest.model_json_schema.__func__
+
+        def counting(cls: Any, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+            calls.append(cls)
+            return original(cls, *args, **kwargs)
+
+        monkeypatch.setattr(_GetRequest, "model_json_schema", classmethod(counting))
+        registry = _make_registry(self._OPERATIONS)
+        first = registry.get_operation_schema("account", "get")
+        second = registry.get_operation_schema("account", "get")
+
+        assert len(calls) == 1
+        assert first is second
+        assert "id" in first["properties"]
+
+    def test_schema_cache_file_reused(self, tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A second registry loads schemas from the cache file instead of rebuilding."""
+        path = str(tmp_path / "schemas.json")
+        config = RegistryConfig(enabled_entities={EntityType.ACCOUNT}, schema_cache_path=path)
+        registry = Registry(config)
+        registry.register_provider(create_provider_from_config(EntityType.ACCOUNT, self._OPERATIONS))
+        registry.save_schema_cache()
+        expected = registry.get_operation_schema("account", "get")
+
+        def fail(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            raise AssertionError("schema should come from the cache file")
+
+        monkeypatch.setattr(_GetRequest, "model_json_schema", classmethod(fail))
+        reloaded = Registry(config)
+        reloaded.register_provider(create_provider_from_config(EntityType.ACCOUNT, self._OPERATIONS))
+
+        assert reloaded.get_operation_schema("account", "get") == expected
+
+    def test_cached_schema_follows_operation_tags(self, tmp_path: Any) -> None:
+        """A cached schema is rebuilt when the tags adding registry parameters change."""
+        config = RegistryConfig(enabled_entities={EntityType.ACCOUNT}, schema_cache_path=str(tmp_path / "schemas.json"))
+        registry = Registry(config)
+        registry.register_provider(create_provider_from_config(
+            EntityType.ACCOUNT, {"get": {**self._OPERATIONS["get"], "tags": {"read", "list"}}}
+        ))
+        registry.save_schema_cache()
+        assert {"fields", "output_format"} <= set(registry.get_operation_schema("account", "get")["properties"])
+
+        reloaded = Registry(config)
+        reloaded.register_provider(create_provider_from_config(EntityType.ACCOUNT, self._OPERATIONS))
+
+        assert set(reloaded.get_operation_schema("account", "get")["properties"]) == {"id"}
+
+    def test_cached_schema_follows_resolve_ids(self, tmp_path: Any) -> None:
+        """A cached schema is rebuilt when the fields accepting names change."""
+        config = RegistryConfig(enabled_entities={EntityType.ACCOUNT}, schema_cache_path=str(tmp_path / "schemas.json"))
+        registry = Registry(config)
+        registry.register_provider(create_provider_from_config(EntityType.ACCOUNT, self._OPERATIONS))
+        registry.save_schema_cache()
+
+        reloaded = Registry(config)
+        reloaded.register_provider(create_provider_from_config(
+            EntityType.ACCOUNT, {"get": {**self._OPERATIONS["get"], "resolve_ids": {"id": "account"}}}
+        ))
+
+        assert reloaded.get_operation_schema("account", "get")["properties"]["id"]["description"].endswith("or its exact name")
+
+    def test_stale_cache_file_ignored(self, tmp_path: Any) -> None:
+        """A cache file written for different model sources is rebuilt."""
+        path = tmp_path / "schemas.json"
+        path.write_text('{"fingerprint": "old", "schemas": {"account.get": {"model": "x", "schema": {}}}}')
+        registry = Registry(RegistryConfig(enabled_entities={EntityType.ACCOUNT}, schema_cache_path=str(path)))
+        registry.register_provider(create_provider_from_config(EntityType.ACCOUNT, self._OPERATIONS))
+
+        assert "id" in registry.get_operation_schema("account", "get")["properties"]
+
+
+class TestSchemaConverter:
+    """Tests for SchemaConverter validation."""
+
+    def test_type_adapter_reused(self) -> None:
+        """Non-BaseModel request types compile their adapter once."""
+        assert get_type_adapter(List[int]) is get_type_adapter(List[int])
+        assert SchemaConverter.validate_request(["1", 2], List[int]) == [1, 2]
+
+
+class TestLoadProviders:
+    """Tests for lazy provider loading in tools.main."""
+
+    def test_only_enabled_providers_imported(self) -> None:
+        """Disabled entities never import their tool, core or generated model modules."""
+        code = (
+            "import sys\n"
+            "from firefly_mcp.tools.main import PROVIDER_PATHS, load_providers\n"
+            "from firefly_mcp.tools.registry import EntityType\n"
+            "providers = load_providers({EntityType.ACCOUNT, EntityType.TAG})\n"
+            "print(','.join(p.entity_type.value for p in providers))\n"
+            "modules = {path.split(':')[0] for path in PROVIDER_PATHS.values()}\n"
+            "print(','.join(sorted(m for m in sys.modules if m in modules)))\n"
+            "print(','.join(sorted(m.rsplit('.', 1)[1] for m in sys.modules if '.models.generated.' in m)))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        entities, modules, generated = output.strip().splitlines()
+
+        assert entities == "account,tag"
+        assert modules == "firefly_mcp.tools.accounts,firefly_mcp.tools.tags"
+        # Accounts return their transactions, attachments and piggy banks.
+        assert generated.split(",") == ["account", "attachment", "common", "piggy_bank", "tag", "transaction"]
+
+    def test_fewer_entities_start_faster(self) -> None:
+        """Building the server for one entity takes less time than for all of them."""
+        code = (
+            "import time\n"
+            "import fastmcp.server.server, griffe, httpx\n"
+            "started = time.perf_counter()\n"
+            "import firefly_mcp.main\n"
+            "print(time.perf_counter() - started)\n"
+        )
+
+        def startup(entities: str) -> float:
+            env = {**os.environ, "FIREFLY_ENABLED_ENTITIES": entities}
+            return min(
+                float(subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout)
+                for _ in range(3)
+            )
+
+        assert startup("account") < startup("all")
+
+
+class _Item(BaseModel):
+    id: str
+    note: Optional[str] = None
+
+
+class TestPassthroughReads:
+    """Tests for raw-JSON passthrough of read operations."""
+
+    PAYLOAD = {"id": "1", "extra": "kept"}
+
+    def _registry(self, enabled: bool) -> Registry:
+        async def get(_: Any) -> Any:
+            return to_model(_Item, self.PAYLOAD)
+
+        def sync_get(_: Any) -> Any:
+            return to_model(_Item, self.PAYLOAD)
+
+        operations = {
+            "get": {"description": "Get", "request_model": None, "response_model": None,
+                    "core_function": get, "tags": {"read"}},
+            "sync_get": {"description": "Get", "request_model": None, "response_model": None,
+                         "core_function": sync_get, "tags": {"read"}},
+            "update": {"description": "Update", "request_model": None, "response_model": None,
+                       "core_function": get, "tags": {"write"}},
+        }
+        registry = Registry(RegistryConfig(enabled_entities={EntityType.ACCOUNT}, passthrough_reads=enabled))
+        registry.register_provider(create_provider_from_config(EntityType.ACCOUNT, operations))
+        return registry
+
+    async def test_disabled_validates(self) -> None:
+        """By default read payloads are validated and dumped."""
+        registry = self._registry(enabled=False)
+        assert await registry.execute_operation("account", "get") == {"id": "1", "note": None}
+
+    async def test_enabled_returns_raw_json_for_reads(self) -> None:
+        """Reads return the decoded JSON untouched, also from sync core functions."""
+        registry = self._registry(enabled=True)
+
+        assert await registry.execute_operation("account", "get") is self.PAYLOAD
+        assert await registry.execute_operation("account", "sync_get") is self.PAYLOAD
+        assert await registry.execute_operation("account", "update") == {"id": "1", "note": None}
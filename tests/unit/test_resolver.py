@@ -0,0 +1,197 @@
+"""Unit tests for name to ID resolution."""
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from firefly_mcp.core import resolver
+from firefly_mcp.core.cache import reference_cache
+from firefly_mcp.core.resolver import NameEntry, NameIndex, get_name_index, resolve_id, resolve_names
+from firefly_mcp.lib.exceptions import FireflyAPIError, RegistryError, ValidationError
+from firefly_mcp.models.requests import AccountGetRequest, NameResolveRequest
+from firefly_mcp.tools.accounts import ACCOUNT_OPERATIONS
+from firefly_mcp.tools.registry import EntityType, Registry, RegistryConfig, create_provider_from_config
+
+ACCOUNTS = [
+    ("1", "Checking", "asset"),
+    ("2", "Savings Account", "asset"),
+    ("3", "Café Central", "expense"),
+    ("4", "Shop", "expense"),
+    ("5", "Shop", "revenue"),
+]
+
+
+@pytest.fixture
+def accounts() -> List[Any]:
+    """Mutable list of (id, name, type) served by the fake API."""
+    return list(ACCOUNTS)
+
+
+@pytest.fixture
+def api(monkeypatch: pytest.MonkeyPatch, accounts: List[Any]) -> AsyncMock:
+    """Client mock serving ``accounts`` on /accounts."""
+    def _get(path: str, params: Dict[str, Any]) -> Mock:
+        response = Mock(spec=httpx.Response)
+        response.is_error = False
+        response.content = json.dumps({
+            "data": [{"id": id, "attributes": {"name": name, "type": type}} for id, name, type in accounts],
+            "meta": {"pagination": {"total_pages": 1}},
+        }).encode()
+        return response
+
+    client = AsyncMock()
+    client.get.side_effect = _get
+    monkeypatch.setattr(resolver, "client", client)
+    return client
+
+
+class TestNameIndex:
+    """Tests for NameIndex lookups."""
+
+    def test_exact_ignores_case_accents_and_spacing(self) -> None:
+        """Exact lookups normalize both sides."""
+        index = NameIndex(NameEntry(id, name, type) for id, name, type in ACCOUNTS)
+
+        assert [entry.id for entry in index.exact("  cafe   CENTRAL ")] == ["3"]
+        assert [entry.id for entry in index.exact("shop")] == ["4", "5"]
+        assert index.exact("Check") == []
+
+    def test_fuzzy_ranking(self) -> None:
+        """Exact matches come first, near misses follow by trigram similarity."""
+        index = NameIndex(NameEntry(id, name, type) for id, name, type in ACCOUNTS)
+
+        assert [(entry.id, score) for entry, score in index.search("savings")] == [("2", 0.5)]
+        assert [entry.id for entry, _ in index.search("chekcing")] == ["1"]
+        assert index.search("checking")[0][1] == 1.0
+        assert index.search("zzz") == []
+
+
+class TestResolveId:
+    """Tests for resolving names used in place of IDs."""
+
+    async def test_ids_pass_through(self, api: AsyncMock) -> None:
+        """Numeric values are IDs without building an index."""
+        assert await resolve_id("account", "2") == "2"
+        assert await resolve_id("account", "42") == "42"
+        assert api.get.call_count == 0
+
+    async def test_numeric_names(self, api: AsyncMock, accounts: List[Any]) -> None:
+        """A fresh index resolves digits matching no ID but a name; existing IDs win."""
+        accounts.extend([("8", "2024", "asset"), ("9", "1", "expense")])
+        assert await resolve_id("account", "2024") == "2024"
+
+        await get_name_index("account")
+        assert await resolve_id("account", "2024") == "8"
+        assert await resolve_id("account", "1") == "1"
+        reference_cache.invalidate("/accounts*")
+        assert await resolve_id("account", "2024") == "2024"
+        assert api.get.call_count == 1
+
+    async def test_name_is_resolved_from_cached_index(self, api: AsyncMock) -> None:
+        """The index is built once and reused."""
+        assert await resolve_id("account", "checking") == "1"
+        assert await resolve_id("account", "Savings account") == "2"
+        assert api.get.call_count == 1
+
+    async def test_ambiguous_and_unknown_names(self, api: AsyncMock) -> None:
+        """Ambiguous names list the candidates; typos only produce suggestions."""
+        with pytest.raises(ValidationError, match=r"4 \(expense\), 5 \(revenue\)"):
+            await resolve_id("account", "Shop")
+        with pytest.raises(ValidationError, match="did you mean 'Checking'"):
+            await resolve_id("account", "Chekcing")
+
+    async def test_index_follows_writes_and_misses(
+        self, api: AsyncMock, accounts: List[Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Invalidations rebuild the index; an old index is refreshed once on a miss."""
+        now = [1000.0]
+        monkeypatch.setattr("firefly_mcp.core.resolver.time.monotonic", lambda: now[0])
+        monkeypatch.setattr("firefly_mcp.core.cache.time.monotonic", lambda: now[0])
+        await get_name_index("account")
+
+        accounts.append(("6", "Holiday Fund", "asset"))
+        reference_cache.invalidate("/accounts*")
+        assert await resolve_id("account", "holiday fund") == "6"
+
+        accounts.append(("7", "Brokerage", "asset"))
+        with pytest.raises(ValidationError):
+            await resolve_id("account", "Brokerage")
+        now[0] += resolver.MISS_REFRESH_SECONDS
+        assert await resolve_id("account", "Brokerage") == "7"
+        assert api.get.call_count == 3
+
+
+async def test_resolve_operation(api: AsyncMock) -> None:
+    """The resolve operation returns scored matches with account types."""
+    response = await resolve_names("account", NameResolveRequest(name="shop", min_score=0.5))
+
+    assert response.data == [
+        {"id": "4", "name": "Shop", "type": "expense", "score": 1.0, "exact": True},
+        {"id": "5", "name": "Shop", "type": "revenue", "score": 1.0, "exact": True},
+    ]
+    assert response.meta == {"entity": "account", "query": "shop", "indexed": 5}
+
+
+async def test_registry_resolves_declared_fields(api: AsyncMock) -> None:
+    """Operations declaring ``resolve_ids`` accept names and advertise it in their schema."""
+    received: List[AccountGetRequest] = []
+
+    async def get_account(request: AccountGetRequest) -> Dict[str, Any]:
+        received.append(request)
+        return {"data": {"id": request.id}}
+
+    registry = Registry(RegistryConfig(enabled_entities={EntityType.ACCOUNT}))
+    registry.register_provider(create_provider_from_config(
+        EntityType.ACCOUNT, {"get": {**ACCOUNT_OPERATIONS["get"], "core_function": get_account}}
+    ))
+
+    await registry.execute_operation("account", "get", {"id": "Café central"})
+    await registry.execute_operation("account", "get", {"id": "2"})
+
+    assert [request.id for request in received] == ["3", "2"]
+    schema = registry._build_schema(registry.get_provider(EntityType.ACCOUNT).get_operation("get"))
+    assert schema["properties"]["id"]["description"].endswith("or its exact name")
+
+
+async def test_get_by_id_skips_the_index(api: AsyncMock, monkeypatch: pytest.MonkeyPatch,
+                                         sample_account_data: Dict[str, Any]) -> None:
+    """``account.get`` by ID makes exactly one request and never lists accounts."""
+    response = Mock(spec=httpx.Response)
+    response.is_error = False
+    response.content = json.dumps(sample_account_data).encode()
+    accounts_client = AsyncMock()
+    accounts_client.get.return_value = response
+    monkeypatch.setattr("firefly_mcp.core.accounts.client", accounts_client)
+    registry = Registry(RegistryConfig(enabled_entities={EntityType.ACCOUNT}))
+    registry.register_provider(create_provider_from_config(EntityType.ACCOUNT, ACCOUNT_OPERATIONS))
+
+    await registry.execute_operation("account", "get", {"id": "7"})
+
+    assert [call.args[0] for call in accounts_client.get.call_args_list] == ["/accounts/7"]
+    assert api.get.call_count == 0
+
+
+async def test_unknown_numeric_id_is_retried_as_name(api: AsyncMock, accounts: List[Any]) -> None:
+    """Digits Firefly III answers 404 for are looked up as a name and the call retried."""
+    accounts.append(("8", "2024", "asset"))
+    requested: List[str] = []
+
+    async def get_account(request: AccountGetRequest) -> Dict[str, Any]:
+        requested.append(request.id)
+        if request.id not in {id for id, _, _ in accounts}:
+            raise FireflyAPIError(404, "Resource not found")
+        return {"data": {"id": request.id}}
+
+    registry = Registry(RegistryConfig(enabled_entities={EntityType.ACCOUNT}))
+    registry.register_provider(create_provider_from_config(
+        EntityType.ACCOUNT, {"get": {**ACCOUNT_OPERATIONS["get"], "core_function": get_account}}
+    ))
+
+    await registry.execute_operation("account", "get", {"id": "2024"})
+    with pytest.raises(RegistryError, match="404"):
+        await registry.execute_operation("account", "get", {"id": "99"})
+
+    assert requested == ["2024", "8", "99"]
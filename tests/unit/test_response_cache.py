@@ -0,0 +1,242 @@
+"""Unit tests for the persistent HTTP response cache."""
+
+import threading
+from pathlib import Path
+from typing import Any, List
+
+import httpx
+import pytest
+
+from firefly_mcp.lib.response_cache import CachingTransport, MemoryResponseStore, SQLiteResponseStore, StoredResponse
+
+
+def _stored(body: bytes, stored_at: float = 0.0) -> StoredResponse:
+    return StoredResponse(body=body, content_type="application/json", etag=None, last_modified=None, stored_at=stored_at)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SQLiteResponseStore:
+    """Response store backed by a temporary SQLite file."""
+    store = SQLiteResponseStore(str(tmp_path / "responses.sqlite"), max_bytes=1024)
+    yield store
+    store.close()
+
+
+def _client(store: SQLiteResponseStore, calls: List[httpx.Request], ttl: float = 300) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"data": [], "path": request.url.path}, headers={"ETag": '"v1"'})
+
+    transport = CachingTransport(httpx.MockTransport(handler), store, ttl=ttl, base_path="/api/v1")
+    return httpx.AsyncClient(base_url="https://firefly.test/api/v1", transport=transport,
+                             headers={"Authorization": "Bearer token"})
+
+
+class TestSQLiteResponseStore:
+    """Tests for SQLiteResponseStore."""
+
+    def test_evicts_least_recently_used(self, store: SQLiteResponseStore) -> None:
+        """Entries are evicted by last access once the size budget is exceeded."""
+        store.put("a", "/accounts", _stored(b"a" * 400))
+        store.put("b", "/tags", _stored(b"b" * 400))
+        store.get("a")
+        store.put("c", "/bills", _stored(b"c" * 400))
+
+        assert store.get("a") is not None
+        assert store.get("b") is None
+        assert store.get("c") is not None
+        assert store.total_bytes() <= 1024
+        assert store.stats.evictions == 1
+
+    def test_total_size_tracked_without_summing(self, store: SQLiteResponseStore, tmp_path: Path) -> None:
+        """The running size total follows replacements, invalidations and evictions, and survives reopening."""
+        store.put("a", "/accounts", _stored(b"a" * 300))
+        store.put("a", "/accounts", _stored(b"a" * 100))
+        store.put("b", "/tags", _stored(b"b" * 500))
+        store.put("c", "/bills", _stored(b"c" * 500))
+        assert store.total_bytes() == 1000
+        store.invalidate("/tags")
+
+        assert store.total_bytes() == store._db.execute("SELECT SUM(size) FROM responses").fetchone()[0] == 500
+        reopened = SQLiteResponseStore(str(tmp_path / "responses.sqlite"))
+        assert reopened.total_bytes() == 500
+        reopened.close()
+
+    def test_invalidate_prefix(self, store: SQLiteResponseStore) -> None:
+        """A trailing ``*`` drops every path with that prefix."""
+        store.put("a", "/accounts/1", _stored(b"1"))
+        store.put("b", "/accounts/1/transactions", _stored(b"2"))
+        store.put("c", "/tags", _stored(b"3"))
+
+        assert store.invalidate("/accounts/1") == 1
+        assert store.invalidate("/accounts*") == 1
+        assert store.get("c") is not None
+
+    def test_survives_reopen(self, tmp_path: Path) -> None:
+        """Entries persist across store instances, i.e. across sessions."""
+        path = str(tmp_path / "responses.sqlite")
+        first = SQLiteResponseStore(path)
+        first.put("a", "/accounts", _stored(b"{}"))
+        first.close()
+
+        second = SQLiteResponseStore(path)
+        assert second.get("a").body == b"{}"
+        second.close()
+
+
+class TestMemoryResponseStore:
+    """Tests for MemoryResponseStore."""
+
+    def test_evicts_and_invalidates(self) -> None:
+        """Size-bounded LRU eviction and prefix invalidation."""
+        store = MemoryResponseStore(max_bytes=1000)
+        store.put("a", "/accounts/1", _stored(b"a" * 400))
+        store.put("b", "/accounts/2", _stored(b"b" * 400))
+        store.get("a")
+        store.put("c", "/tags", _stored(b"c" * 400))
+
+        assert store.get("b") is None
+        assert store.total_bytes() == 800
+        assert store.invalidate("/accounts*") == 1
+        assert store.summary()["entries"] == 1
+
+
+class TestCachingTransport:
+    """Tests for CachingTransport."""
+
+    async def test_fresh_entry_served_from_store(self, store: SQLiteResponseStore) -> None:
+        """A repeated GET within the TTL does not reach the network."""
+        calls: List[httpx.Request] = []
+        async with _client(store, calls) as client:
+            first = await client.get("/accounts", params={"type": "asset"})
+            second = await client.get("/accounts", params={"type": "asset"})
+
+        assert len(calls) == 1
+        assert first.json() == second.json() == {"data": [], "path": "/api/v1/accounts"}
+        assert second.headers["etag"] == '"v1"'
+        assert store.stats.hits == 1
+
+    async def test_store_calls_run_off_the_event_loop(self, store: SQLiteResponseStore, monkeypatch: pytest.MonkeyPatch) -> None:
+        """SQLite reads and writes run on the transport's worker thread, not the event loop thread."""
+        threads = set()
+        for name in ("get", "put"):
+            method = getattr(store, name)
+
+            def recording(*args: Any, method: Any = method) -> Any:
+                threads.add(threading.get_ident())
+                return method(*args)
+
+            monkeypatch.setattr(store, name, recording)
+        calls: List[httpx.Request] = []
+        async with _client(store, calls) as client:
+            await client.get("/accounts")
+            await client.get("/accounts")
+
+        assert len(calls) == 1
+        assert len(threads) == 1 and threading.get_ident() not in threads
+
+    async def test_expired_entry_refetched(self, store: SQLiteResponseStore) -> None:
+        """Entries older than the TTL are fetched again."""
+        calls: List[httpx.Request] = []
+        async with _client(store, calls, ttl=0) as client:
+            await client.get("/accounts")
+            await client.get("/accounts")
+
+        assert len(calls) == 2
+
+    async def test_writes_bypass_store(self, store: SQLiteResponseStore) -> None:
+        """Non-GET requests are never cached."""
+        calls: List[httpx.Request] = []
+        async with _client(store, calls) as client:
+            await client.post("/accounts", json={"name": "x"})
+            await client.post("/accounts", json={"name": "x"})
+            assert store.summary()["entries"] == 0
+
+        assert len(calls) == 2
+
+    async def test_paths_stored_relative_to_base(self, store: SQLiteResponseStore) -> None:
+        """Stored paths match the patterns used by write invalidation."""
+        calls: List[httpx.Request] = []
+        async with _client(store, calls) as client:
+            await client.get("/accounts/1")
+            assert store.invalidate("/accounts/1") == 1
+
+
+class TestConditionalRequests:
+    """Tests for ETag / Last-Modified revalidation."""
+
+    @staticmethod
+    def _client(store, calls: List[httpx.Request], changed: List[bool]) -> httpx.AsyncClient:
+        body = b'{"data": [1, 2, 3]}'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if request.headers.get("if-none-match") == '"v1"' and not changed[0]:
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            etag = '"v2"' if changed[0] else '"v1"'
+            return httpx.Response(200, content=body, headers={
+                "ETag": etag, "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT", "Content-Type": "application/json",
+            })
+
+        transport = CachingTransport(httpx.MockTransport(handler), store, ttl=0)
+        return httpx.AsyncClient(base_url="https://firefly.test", transport=transport)
+
+    async def test_not_modified_serves_stored_body(self) -> None:
+        """A 304 answer returns the stored body as a 200 and counts saved bytes."""
+        store = MemoryResponseStore()
+        calls: List[httpx.Request] = []
+        async with self._client(store, calls, [False]) as client:
+            first = await client.get("/accounts")
+            second = await client.get("/accounts")
+
+        assert "if-none-match" not in calls[0].headers
+        assert calls[1].headers["if-none-match"] == '"v1"'
+        assert calls[1].headers["if-modified-since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert second.status_code == 200
+        assert second.json() == first.json() == {"data": [1, 2, 3]}
+        assert store.stats.not_modified == 1
+        assert store.stats.bytes_saved == len(b'{"data": [1, 2, 3]}')
+
+    async def test_changed_resource_replaces_entry(self) -> None:
+        """A full 200 answer to a conditional request updates the validators."""
+        store = MemoryResponseStore()
+        calls: List[httpx.Request] = []
+        changed = [False]
+        async with self._client(store, calls, changed) as client:
+            await client.get("/accounts")
+            changed[0] = True
+            await client.get("/accounts")
+            await client.get("/accounts")
+
+        assert calls[2].headers["if-none-match"] == '"v2"'
+        assert store.stats.not_modified == 0
+        assert store.stats.revalidations == 2
+
+
+def test_json_codec_falls_back_on_bad_env(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    """An unknown codec name is logged and replaced by the automatic choice."""
+    from firefly_mcp.lib import json_codec
+
+    monkeypatch.setenv("FIREFLY_JSON_CODEC", "fast")
+
+    assert json_codec.codec_from_environment() == json_codec.get_codec("auto")
+    assert "Unknown or unavailable JSON codec 'fast'" in caplog.text
+    with pytest.raises(ValueError):
+        json_codec.get_codec("fast")
+
+
+def test_transport_settings_fall_back_on_bad_env(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    """Malformed cache size and TTL values are logged and replaced by the defaults."""
+    from firefly_mcp.lib import http_client
+
+    monkeypatch.setattr(http_client, "response_store", http_client.response_store)
+    monkeypatch.delenv("FIREFLY_HTTP_CACHE_PATH", raising=False)
+    monkeypatch.setenv("FIREFLY_HTTP_CACHE_MAX_BYTES", "64MB")
+    monkeypatch.setenv("FIREFLY_HTTP_CACHE_TTL", "five minutes")
+
+    transport = http_client.create_transport()
+
+    assert isinstance(transport, CachingTransport)
+    assert http_client.response_store.max_bytes == 64 * 1024 * 1024
+    assert transport.ttl == 0.0
+    assert "FIREFLY_HTTP_CACHE_MAX_BYTES" in caplog.text and "FIREFLY_HTTP_CACHE_TTL" in caplog.text
@@ -0,0 +1,108 @@
+"""Unit tests for full-text search over the local transaction mirror."""
+
+from typing import Any, Dict
+
+import pytest
+
+from firefly_mcp.core import transactions as core_transactions
+from firefly_mcp.lib.exceptions import ValidationError
+from firefly_mcp.local.search import match_expression, search
+from firefly_mcp.local.store import LocalStore
+from firefly_mcp.models.requests import TransactionSearchLocalRequest
+
+
+def _group(group_id: int, day: str, description: str, notes: str | None = None, destination: str = "Shop",
+           updated_at: str = "1") -> Dict[str, Any]:
+    return {
+        "id": str(group_id),
+        "attributes": {
+            "updated_at": updated_at,
+            "transactions": [{
+                "transaction_journal_id": str(group_id), "type": "withdrawal", "date": f"{day}T10:00:00+00:00",
+                "amount": "15.99", "currency_code": "EUR", "currency_decimal_places": 2, "description": description,
+                "notes": notes, "source_name": "Checking", "destination_name": destination, "tags": [],
+            }],
+        },
+    }
+
+
+@pytest.fixture
+def store() -> LocalStore:
+    store = LocalStore()
+    store.upsert_groups([
+        _group(1, "2024-01-05", "Monthly subscription", notes="paid for netflix family"),
+        _group(2, "2024-02-05", "Netflix subscription", destination="Netflix International"),
+        _group(3, "2024-02-06", "Coffee at Café Central"),
+        _group(4, "2024-03-01", "Groceries"),
+    ])
+    return store
+
+
+class TestSearch:
+    """Tests for local search."""
+
+    def test_bm25_ranks_description_above_notes(self, store: LocalStore) -> None:
+        """Matches in description and counterparty outrank matches in notes."""
+        result = search(store, "netflix")
+
+        assert [row["journal_id"] for row in result["data"]] == ["2", "1"]
+        assert result["data"][0]["score"] > result["data"][1]["score"]
+        assert result["data"][0]["amount"] == "15.99"
+        assert result["meta"]["ranking"] == "bm25"
+
+    def test_prefix_and_diacritics(self, store: LocalStore) -> None:
+        """Word prefixes match and accents are ignored."""
+        assert [row["journal_id"] for row in search(store, "netfl subscr")["data"]] == ["2", "1"]
+        assert [row["journal_id"] for row in search(store, "cafe")["data"]] == ["3"]
+
+    def test_filters_and_limit(self, store: LocalStore) -> None:
+        """Date filters and the limit apply to the ranked results."""
+        assert [row["journal_id"] for row in search(store, "subscription", start="2024-02-01")["data"]] == ["2"]
+        assert len(search(store, "subscription", limit=1)["data"]) == 1
+
+    def test_operators_in_input_are_literal(self, store: LocalStore) -> None:
+        """FTS5 syntax in user input cannot break the query."""
+        assert search(store, 'netflix OR "groceries" NOT*')["data"] == []
+        with pytest.raises(ValidationError):
+            match_expression("?!")
+
+    def test_index_follows_updates(self, store: LocalStore) -> None:
+        """Rewritten and deleted groups are reflected in the index."""
+        store.upsert_groups([_group(4, "2024-03-01", "Spotify premium", updated_at="2")])
+        store.delete_groups_missing("2024-02-06", {"4"})
+
+        assert [row["journal_id"] for row in search(store, "spotify")["data"]] == ["4"]
+        assert search(store, "groceries")["data"] == []
+        assert search(store, "cafe")["data"] == []
+
+    def test_index_built_for_existing_database(self, tmp_path: Any) -> None:
+        """A mirror file created without the index is indexed when reopened."""
+        path = str(tmp_path / "mirror.db")
+        store = LocalStore(path)
+        store.upsert_groups([_group(1, "2024-01-01", "Netflix")])
+        store._db.executescript("DROP TRIGGER splits_fts_insert; DROP TRIGGER splits_fts_delete; DROP TABLE splits_fts;")
+        store.close()
+
+        assert [row["journal_id"] for row in search(LocalStore(path), "netflix")["data"]] == ["1"]
+
+    def test_like_fallback(self, store: LocalStore) -> None:
+        """Without FTS5 every word is matched with LIKE and results are newest first."""
+        store.fts = False
+
+        result = search(store, "netflix")
+
+        assert [row["journal_id"] for row in result["data"]] == ["2", "1"]
+        assert result["meta"]["ranking"] == "date"
+        assert result["data"][0]["score"] is None
+
+
+async def test_search_local_operation(store: LocalStore, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The operation searches the synced mirror."""
+    store.set_state("transactions", {"synced_on": "2024-03-02", "synced_at": "2024-03-02T00:00:00+00:00", "start": None})
+    monkeypatch.setattr(core_transactions, "get_local_store", lambda: store)
+    monkeypatch.setattr("firefly_mcp.local.sync.MAX_AGE_SECONDS", float("inf"))
+
+    response = await core_transactions.search_local_transactions(TransactionSearchLocalRequest(query="coffee"))
+
+    assert [row["description"] for row in response.data] == ["Coffee at Café Central"]
+    assert response.meta["synced_at"] == "2024-03-02T00:00:00+00:00"